@@ -0,0 +1,295 @@
+"""
+Benchmark: Endpoints Calientes por Tamaño de Dataset
+Sistema de Seguimiento de Alumnos
+
+Carga un dataset sintético de un tamaño dado (small / medium / large) y
+recorre en proceso, vía ASGI, las rutas que más usa el frontend:
+- GET  /api/alertas/
+- GET  /api/cursos/con-stats
+- GET  /api/alumnos/ (listado paginado y búsqueda)
+- POST /api/asistencias/ (escrituras)
+- GET  /api/entregas/tp/{tp_id}
+
+Por ruta registra percentiles de latencia, consultas SQL por request (del
+header X-Query-Count) y el pico de RSS del proceso, y escribe un reporte JSON (claves ordenadas) para
+comparar entre commits. Cada cambio de performance debería acompañarse con
+el reporte de antes y de después.
+
+Necesita PostgreSQL (DATABASE_URL / POSTGRES_URL). ¡Provisionar BORRA todos
+los datos de esa base!
+
+Uso:
+    python benchmarks/bench_endpoints.py --tier small --json antes.json
+    python benchmarks/bench_endpoints.py --tier small --json despues.json --comparar antes.json
+    python benchmarks/bench_endpoints.py --tier medium --sin-provisionar --rutas alertas con_stats
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Agregar el directorio raíz al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Un solo proceso: la escucha de invalidaciones entre workers no hace falta
+os.environ.setdefault("INVALIDACION_CACHE", "0")
+# Las consultas por request se leen del header X-Query-Count
+os.environ["INSTRUMENTACION"] = "1"
+# Un mal plan corta la corrida con error en vez de colgarla
+os.environ.setdefault("DB_STATEMENT_TIMEOUT_MS", "60000")
+
+from cliente_asgi import ClienteASGI
+from src.infrastructure.database import connection
+from src.infrastructure.database.generador_datos import ParametrosDataset, generar_dataset
+
+
+# Tamaños de dataset: ~2 cursos por alumno y 16 clases por curso
+TIERS: Dict[str, ParametrosDataset] = {
+    "small": ParametrosDataset(cohortes=2, alumnos=100, cursos=4),
+    "medium": ParametrosDataset(cohortes=5, alumnos=5000, cursos=10),
+    "large": ParametrosDataset(cohortes=20, alumnos=50000, cursos=40, anio_inicial=2000),
+}
+
+
+# ============================================================================
+# Medición
+# ============================================================================
+
+def percentil(valores: List[float], p: float) -> float:
+    """Percentil por rango más cercano (valores ya ordenados)"""
+    if not valores:
+        return 0.0
+    indice = max(0, min(len(valores) - 1, math.ceil(p / 100 * len(valores)) - 1))
+    return valores[indice]
+
+
+def rss_pico_mb() -> float:
+    # ru_maxrss está en KB en Linux (en bytes en macOS)
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(pico / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+Request = Tuple[str, str, Any]
+
+
+async def medir_ruta(
+    cliente: ClienteASGI,
+    generar: Callable[[int], Request],
+    iteraciones: int,
+    calentamiento: int
+) -> Dict[str, Any]:
+    """Ejecuta la ruta 'iteraciones' veces (más el calentamiento) y resume las mediciones"""
+    for i in range(calentamiento):
+        await cliente.request(*generar(-1 - i))
+
+    duraciones, consultas, errores = [], [], 0
+    for i in range(iteraciones):
+        metodo, ruta, cuerpo = generar(i)
+        inicio = time.perf_counter()
+        respuesta = await cliente.request(metodo, ruta, cuerpo)
+        duraciones.append((time.perf_counter() - inicio) * 1000)
+        consultas.append(int(respuesta.headers.get("x-query-count", 0)))
+        if respuesta.status >= 400:
+            errores += 1
+
+    duraciones.sort()
+    return {
+        "iteraciones": iteraciones,
+        "errores": errores,
+        "p50_ms": round(percentil(duraciones, 50), 2),
+        "p90_ms": round(percentil(duraciones, 90), 2),
+        "p95_ms": round(percentil(duraciones, 95), 2),
+        "p99_ms": round(percentil(duraciones, 99), 2),
+        "max_ms": round(duraciones[-1], 2) if duraciones else 0.0,
+        "media_ms": round(sum(duraciones) / len(duraciones), 2) if duraciones else 0.0,
+        "consultas_por_request": round(sum(consultas) / len(consultas), 1) if consultas else 0.0,
+        "consultas_max": max(consultas) if consultas else 0,
+        "rss_pico_mb": rss_pico_mb(),
+    }
+
+
+# ============================================================================
+# Preparación
+# ============================================================================
+
+async def provisionar(cliente: ClienteASGI, parametros: ParametrosDataset) -> Dict[str, Any]:
+    """
+    Crea el schema, vacía la base y carga el dataset del tier.
+
+    generar_dataset() termina con ANALYZE: las rutas se miden con las
+    estadísticas del dataset cargado, no con las de la base vacía.
+    """
+    connection.inicializar_base_de_datos()
+    respuesta = await cliente.request("DELETE", "/api/clear-all")
+    if respuesta.status != 200 or respuesta.json().get("status") != "success":
+        raise RuntimeError(f"No se pudo vaciar la base: {respuesta.body[:300]!r}")
+
+    conexion = connection.crear_conexion()
+    try:
+        return generar_dataset(conexion, parametros)
+    finally:
+        conexion.close()
+
+
+async def preparar_contexto(cliente: ClienteASGI) -> Dict[str, Any]:
+    """IDs que necesitan las rutas: un curso con alumnos, un TP, un apellido y una clase nueva"""
+    cursos = (await cliente.request("GET", "/api/cursos/")).json()["cursos"]
+    for curso in cursos:
+        inscriptos = (await cliente.request("GET", f"/api/inscripciones/curso/{curso['id']}")).json()
+        tps = (await cliente.request("GET", f"/api/tps/curso/{curso['id']}")).json()
+        if inscriptos and tps:
+            break
+    else:
+        raise RuntimeError("No hay cursos con alumnos y TPs: provisionar primero")
+
+    clases = (await cliente.request("GET", f"/api/clases/curso/{curso['id']}")).json()
+    numero = max((c["numero_clase"] for c in clases), default=0) + 1
+    clase = await cliente.request("POST", "/api/clases/", {
+        "curso_id": curso["id"],
+        "numero_clase": numero,
+        "fecha": date.today().isoformat(),
+        "tema": "Clase de benchmark",
+    })
+    if clase.status != 201:
+        raise RuntimeError(f"No se pudo crear la clase de benchmark: {clase.body[:300]!r}")
+
+    primero = (await cliente.request("GET", "/api/alumnos/?limite=1")).json()["alumnos"]
+    return {
+        "curso_id": curso["id"],
+        "tp_id": tps[0]["id"],
+        "clase_nueva_id": clase.json()["id"],
+        "alumnos_inscriptos": [i["alumno_id"] for i in inscriptos],
+        "apellido": primero[0]["apellido"] if primero else "Pérez",
+    }
+
+
+def rutas(contexto: Dict[str, Any]) -> Dict[str, Tuple[Callable[[int], Request], bool]]:
+    """nombre -> (generador de requests, es_escritura)"""
+    inscriptos = contexto["alumnos_inscriptos"]
+    return {
+        "alertas": (lambda i: ("GET", "/api/alertas/", None), False),
+        "con_stats": (lambda i: ("GET", "/api/cursos/con-stats", None), False),
+        "alumnos_listado": (lambda i: ("GET", f"/api/alumnos/?limite=50&offset={max(i, 0) * 50 % 1000}", None), False),
+        "alumnos_busqueda": (lambda i: ("GET", f"/api/alumnos/?buscar={contexto['apellido']}", None), False),
+        "asistencia_escritura": (
+            lambda i: ("POST", "/api/asistencias/", {
+                "alumno_id": inscriptos[i],
+                "clase_id": contexto["clase_nueva_id"],
+                "estado": "Presente",
+            }),
+            True
+        ),
+        "entregas_por_tp": (lambda i: ("GET", f"/api/entregas/tp/{contexto['tp_id']}", None), False),
+    }
+
+
+# ============================================================================
+# Reporte
+# ============================================================================
+
+def commit_actual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def imprimir_resultados(resultados: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{'Ruta':22} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'consultas':>10} {'errores':>8} {'RSS MB':>8}")
+    for nombre, r in resultados.items():
+        print(f"{nombre:22} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['p99_ms']:>9} "
+              f"{r['consultas_por_request']:>10} {r['errores']:>8} {r['rss_pico_mb']:>8}")
+
+
+def imprimir_comparacion(anterior: Dict[str, Any], actual: Dict[str, Any]) -> None:
+    print(f"\n📊 Comparación con {anterior.get('commit') or 'reporte anterior'} → {actual.get('commit') or 'actual'}")
+    print(f"{'Ruta':22} {'p50 antes':>10} {'p50 ahora':>10} {'x':>6} {'consultas':>16}")
+    for nombre, r in actual["rutas"].items():
+        previo = anterior.get("rutas", {}).get(nombre)
+        if not previo:
+            continue
+        factor = round(previo["p50_ms"] / r["p50_ms"], 2) if r["p50_ms"] else float("inf")
+        consultas = f"{previo['consultas_por_request']} → {r['consultas_por_request']}"
+        print(f"{nombre:22} {previo['p50_ms']:>10} {r['p50_ms']:>10} {factor:>6} {consultas:>16}")
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    from src.presentation.api.main import app
+
+    parametros = TIERS[args.tier]
+    cliente = ClienteASGI(app)
+    provision = None
+    if not args.sin_provisionar:
+        print(f"🧪 Provisionando tier '{args.tier}' ({parametros.alumnos} alumnos)...")
+        provision = await provisionar(cliente, parametros)
+        print(f"   listo en {provision['segundos']} s ({provision['asistencias']} asistencias)")
+
+    contexto = await preparar_contexto(cliente)
+    resultados = {}
+    for nombre, (generar, es_escritura) in rutas(contexto).items():
+        if args.rutas and nombre not in args.rutas:
+            continue
+        iteraciones = args.iteraciones
+        if es_escritura:
+            # Una escritura por alumno inscripto (no se repite el par alumno-clase)
+            iteraciones = min(iteraciones, len(contexto["alumnos_inscriptos"]))
+        print(f"⏱️  {nombre} ({iteraciones} iteraciones)...")
+        resultados[nombre] = await medir_ruta(
+            cliente, generar, iteraciones, 0 if es_escritura else args.calentamiento
+        )
+
+    return {
+        "tier": args.tier,
+        "parametros": asdict(parametros),
+        "provision": provision,
+        "commit": commit_actual(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "rutas": resultados,
+    }
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Benchmark de endpoints por tamaño de dataset")
+    parser.add_argument("--tier", choices=sorted(TIERS), default="small")
+    parser.add_argument("--iteraciones", type=int, default=50, help="Requests medidos por ruta")
+    parser.add_argument("--calentamiento", type=int, default=3, help="Requests sin medir antes de cada ruta")
+    parser.add_argument("--rutas", nargs="*", help="Medir solo estas rutas")
+    parser.add_argument("--sin-provisionar", action="store_true", help="Usar los datos que ya hay en la base")
+    parser.add_argument("--json", type=str, default=None, help="Ruta donde guardar el reporte JSON")
+    parser.add_argument("--comparar", type=str, default=None, help="Reporte JSON anterior para comparar")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"⏱️  Benchmark de endpoints (tier {args.tier})")
+    print("=" * 70)
+
+    reporte = asyncio.run(ejecutar(args))
+    imprimir_resultados(reporte["rutas"])
+
+    if args.comparar:
+        anterior = json.loads(Path(args.comparar).read_text(encoding="utf-8"))
+        imprimir_comparacion(anterior, reporte)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(reporte, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"\n💾 Reporte guardado en: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
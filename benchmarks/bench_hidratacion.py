@@ -0,0 +1,158 @@
+"""
+Benchmark: Hidratación de Entidades de Dominio
+Sistema de Seguimiento de Alumnos
+
+Mide, para cada entidad de src/domain/entities:
+- Velocidad de hidratación (filas/segundo) por el constructor validado
+  (__post_init__) y por el camino rápido from_row
+- Memoria por instancia con slots=True frente a una copia equivalente
+  sin slots (con __dict__ por instancia)
+
+No necesita base de datos: las filas se generan con la misma forma
+(tuplas en orden de columnas) que devuelve pg8000.
+
+Uso:
+    python benchmarks/bench_hidratacion.py
+    python benchmarks/bench_hidratacion.py --filas 50000 --json bench_hidratacion.json
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.domain.entities.alumno import Alumno
+from src.domain.entities.clase import Clase
+from src.domain.entities.curso import Curso
+from src.domain.entities.entrega_tp import EntregaTP
+from src.domain.entities.inscripcion import Inscripcion
+from src.domain.entities.registro_asistencia import RegistroAsistencia
+from src.domain.entities.registro_participacion import RegistroParticipacion
+from src.domain.entities.trabajo_practico import TrabajoPractico
+
+
+AHORA = datetime(2024, 5, 1, 10, 30)
+HOY = date(2024, 5, 1)
+
+# Generadores de filas con el mismo orden de columnas que los SELECT de los repositorios
+GENERADORES = {
+    Alumno: lambda i: (i, f"Nombre{i}", f"Apellido{i}", str(10000000 + i), f"alumno{i}@example.com", 2024, AHORA),
+    Curso: lambda i: (i, f"Materia {i}", 2024, 1 + i % 2, "Prof. García", AHORA),
+    Clase: lambda i: (i, 1 + i % 40, HOY, 1 + i, f"Tema {i}", AHORA),
+    Inscripcion: lambda i: (i, 1 + i, 1 + i % 40, AHORA),
+    RegistroAsistencia: lambda i: (i, 1 + i, 1 + i % 500, ("Presente", "Ausente", "Tardanza", "Justificada")[i % 4], AHORA),
+    RegistroParticipacion: lambda i: (i, 1 + i, 1 + i % 500, ("Ninguna", "Baja", "Media", "Alta")[i % 4], None, AHORA),
+    TrabajoPractico: lambda i: (i, 1 + i % 40, f"TP {i}", "Descripción", HOY, AHORA),
+    EntregaTP: lambda i: (i, 1 + i % 200, 1 + i, HOY, True, False, "entregado", 7.5, None, AHORA),
+}
+
+
+# Orden de columnas de cada fila (coincide con el orden de campos de from_row)
+COLUMNAS = {
+    Alumno: ['id', 'nombre', 'apellido', 'dni', 'email', 'cohorte', 'fecha_creacion'],
+    Curso: ['id', 'nombre_materia', 'anio', 'cuatrimestre', 'docente_responsable', 'fecha_creacion'],
+    Clase: ['id', 'curso_id', 'fecha', 'numero_clase', 'tema', 'fecha_creacion'],
+    Inscripcion: ['id', 'alumno_id', 'curso_id', 'fecha_inscripcion'],
+    RegistroAsistencia: ['id', 'alumno_id', 'clase_id', 'estado', 'fecha_registro'],
+    RegistroParticipacion: ['id', 'alumno_id', 'clase_id', 'nivel', 'comentario', 'fecha_registro'],
+    TrabajoPractico: ['id', 'curso_id', 'titulo', 'descripcion', 'fecha_entrega', 'fecha_creacion'],
+    EntregaTP: ['id', 'trabajo_practico_id', 'alumno_id', 'fecha_entrega_real', 'entregado',
+                'es_tardia', 'estado', 'nota', 'observaciones', 'fecha_registro'],
+}
+
+
+def _por_constructor(cls):
+    """Construye desde la fila con el constructor validado (camino anterior a from_row)"""
+    columnas = COLUMNAS[cls]
+    return lambda row: cls(**dict(zip(columnas, row)))
+
+
+def _clase_sin_slots(cls):
+    """Crea una dataclass equivalente a cls pero sin slots (para comparar memoria)"""
+    return dataclasses.make_dataclass(
+        f"{cls.__name__}SinSlots",
+        [(f.name, f.type, dataclasses.field(default=f.default)) for f in dataclasses.fields(cls)]
+    )
+
+
+def medir_tasa(funcion, filas) -> float:
+    """Devuelve filas/segundo hidratando todas las filas con la función dada"""
+    inicio = time.perf_counter()
+    for row in filas:
+        funcion(row)
+    duracion = time.perf_counter() - inicio
+    return len(filas) / duracion if duracion > 0 else float('inf')
+
+
+def medir_memoria(funcion, filas) -> float:
+    """Devuelve los bytes promedio por instancia retenida"""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    instancias = [funcion(row) for row in filas]
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Restar el costo de la lista contenedora (un puntero por elemento)
+    total = despues - antes - sys.getsizeof(instancias)
+    del instancias
+    return total / len(filas)
+
+
+def ejecutar(cantidad_filas: int) -> dict:
+    """Ejecuta el benchmark para todas las entidades y devuelve los resultados"""
+    resultados = {}
+
+    for cls, generar in GENERADORES.items():
+        filas = [generar(i + 1) for i in range(cantidad_filas)]
+        sin_slots = _clase_sin_slots(cls)
+        columnas = COLUMNAS[cls]
+
+        tasa_validada = medir_tasa(_por_constructor(cls), filas)
+        tasa_rapida = medir_tasa(cls.from_row, filas)
+
+        memoria_slots = medir_memoria(cls.from_row, filas)
+        memoria_sin_slots = medir_memoria(lambda row: sin_slots(**dict(zip(columnas, row))), filas)
+
+        resultados[cls.__name__] = {
+            "filas_por_seg_validado": round(tasa_validada),
+            "filas_por_seg_from_row": round(tasa_rapida),
+            "aceleracion": round(tasa_rapida / tasa_validada, 2),
+            "bytes_por_instancia_slots": round(memoria_slots, 1),
+            "bytes_por_instancia_sin_slots": round(memoria_sin_slots, 1),
+        }
+
+    return resultados
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Benchmark de hidratación de entidades")
+    parser.add_argument("--filas", type=int, default=20000, help="Filas a hidratar por entidad")
+    parser.add_argument("--json", type=str, default=None, help="Ruta donde guardar el reporte JSON")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"⏱️  Benchmark de hidratación ({args.filas} filas por entidad)")
+    print("=" * 70)
+
+    resultados = ejecutar(args.filas)
+
+    print(f"\n{'Entidad':24} {'validado/s':>12} {'from_row/s':>12} {'x':>6} {'B slots':>9} {'B dict':>9}")
+    for nombre, r in resultados.items():
+        print(f"{nombre:24} {r['filas_por_seg_validado']:>12} {r['filas_por_seg_from_row']:>12} "
+              f"{r['aceleracion']:>6} {r['bytes_por_instancia_slots']:>9} {r['bytes_por_instancia_sin_slots']:>9}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(resultados, indent=2), encoding="utf-8")
+        print(f"\n💾 Reporte guardado en: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
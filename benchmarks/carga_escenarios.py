@@ -0,0 +1,504 @@
+"""
+Prueba de Carga por Escenarios
+Sistema de Seguimiento de Alumnos
+
+Simula muchos docentes usando la SPA a la vez contra un servidor uvicorn
+local: cada docente virtual repite los flujos reales de public/app.js, con
+pausas entre acciones, durante un tiempo fijo. Los escenarios son:
+- dashboard: abrir el inicio (GET /cursos/con-stats y /clases/recientes)
+- asistencia: registrar una clase completa (buscar las clases del curso,
+  crear la nueva, cargar TPs, inscriptos y alumnos, y marcar la asistencia
+  de cada inscripto, corrigiendo algunas con PUT)
+- calificar_tp: ver las entregas de un TP y guardar las notas del curso en
+  una carga masiva
+- alertas: abrir la pantalla de alertas
+- busqueda: tipear un apellido en el buscador (una request por tecla)
+
+Por escenario reporta flujos por segundo y percentiles de latencia del
+flujo completo (lo que espera el docente, sin contar sus pausas) y de cada
+request. Termina con código 1 si hubo requests con error o si algún
+escenario no completó ningún flujo, y con --comparar también si el p95 de
+algún escenario empeora, o su throughput cae, más que --umbral por ciento.
+
+Decisión de diseño: Servidor real y no ClienteASGI
+- bench_endpoints.py mide la app sola, una request a la vez. Acá interesa
+  la concurrencia: el threadpool de FastAPI, las conexiones a la base y los
+  workers de uvicorn compiten como en producción
+- Los datos tienen que estar cargados (--provisionar usa el generador de
+  bench_endpoints.py sobre la misma base que usa el servidor)
+- El número de clase lo elige el script (el mayor visto + 1, sin repetir
+  entre docentes del mismo curso): dos docentes no chocan por la misma
+  clase, que en la SPA tampoco pasa
+
+Necesita httpx y, para --iniciar-servidor, uvicorn
+(pip install -r benchmarks/requirements.txt).
+
+Uso:
+    python benchmarks/carga_escenarios.py --iniciar-servidor --docentes 50 --duracion 60 --json antes.json
+    python benchmarks/carga_escenarios.py --url http://127.0.0.1:8000 --json despues.json --comparar antes.json
+    python benchmarks/carga_escenarios.py --iniciar-servidor --provisionar medium --escenarios dashboard alertas
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+# Agregar el directorio raíz al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    import httpx
+except ImportError:
+    print("❌ Este script necesita httpx: pip install -r benchmarks/requirements.txt")
+    sys.exit(1)
+
+from bench_endpoints import TIERS, commit_actual, percentil
+
+
+# Peso de cada escenario en la mezcla: de cada 100 flujos, cuántos son de cada tipo
+ESCENARIOS: Dict[str, int] = {
+    "dashboard": 35,
+    "alertas": 20,
+    "busqueda": 25,
+    "asistencia": 10,
+    "calificar_tp": 10,
+}
+
+ESTADOS_ASISTENCIA = ("Presente", "Presente", "Presente", "Ausente", "Tardanza")
+ESTADOS_ENTREGA = ("entregado", "entregado", "entregado", "no_entregado")
+
+
+# ============================================================================
+# Medición
+# ============================================================================
+
+class Estadisticas:
+    """Mediciones de un escenario"""
+
+    def __init__(self):
+        self.flujos: List[float] = []
+        self.requests: List[float] = []
+        self.errores = 0
+        self.ejemplos_error: List[str] = []
+
+    def resumen(self, segundos: float) -> Dict[str, Any]:
+        flujos = sorted(self.flujos)
+        requests = sorted(self.requests)
+        return {
+            "flujos": len(flujos),
+            "flujos_por_segundo": round(len(flujos) / segundos, 2) if segundos else 0.0,
+            "requests": len(requests),
+            "errores": self.errores,
+            "ejemplos_error": self.ejemplos_error,
+            "flujo_p50_ms": round(percentil(flujos, 50), 1),
+            "flujo_p95_ms": round(percentil(flujos, 95), 1),
+            "flujo_p99_ms": round(percentil(flujos, 99), 1),
+            "request_p50_ms": round(percentil(requests, 50), 1),
+            "request_p95_ms": round(percentil(requests, 95), 1),
+            "request_p99_ms": round(percentil(requests, 99), 1),
+            "request_max_ms": round(requests[-1], 1) if requests else 0.0,
+        }
+
+
+class Docente:
+    """
+    Un docente virtual: ejecuta flujos y mide cada request.
+
+    Las pausas (el docente leyendo o tipeando) no se suman a la duración
+    del flujo.
+    """
+
+    def __init__(self, cliente: httpx.AsyncClient, contexto: Dict[str, Any], pausa: float, azar: random.Random):
+        self.cliente = cliente
+        self.contexto = contexto
+        self.pausa = pausa
+        self.azar = azar
+        self.estadisticas: Optional[Estadisticas] = None
+        self.espera = 0.0
+
+    async def request(self, metodo: str, ruta: str, cuerpo: Any = None) -> Any:
+        inicio = time.perf_counter()
+        try:
+            respuesta = await self.cliente.request(metodo, ruta, json=cuerpo)
+            error = f"{metodo} {ruta} → {respuesta.status_code}" if respuesta.status_code >= 400 else None
+        except httpx.HTTPError as e:
+            respuesta, error = None, f"{metodo} {ruta} → {type(e).__name__}"
+        duracion = (time.perf_counter() - inicio) * 1000
+        self.espera += duracion
+
+        if self.estadisticas is not None:
+            self.estadisticas.requests.append(duracion)
+            if error:
+                self.estadisticas.errores += 1
+                if len(self.estadisticas.ejemplos_error) < 5:
+                    self.estadisticas.ejemplos_error.append(error)
+        if error or respuesta.status_code == 204:
+            return None
+        return respuesta.json()
+
+    async def pensar(self, factor: float = 1.0) -> None:
+        await asyncio.sleep(self.pausa * factor * self.azar.uniform(0.5, 1.5))
+
+    async def ejecutar(self, flujo: Callable[["Docente"], Awaitable[None]], estadisticas: Optional[Estadisticas]) -> None:
+        """Corre un flujo; con estadisticas=None (calentamiento) no registra nada"""
+        self.estadisticas = estadisticas
+        self.espera = 0.0
+        await flujo(self)
+        if estadisticas is not None:
+            estadisticas.flujos.append(self.espera)
+
+
+# ============================================================================
+# Escenarios (mismo orden de requests que public/app.js)
+# ============================================================================
+
+async def dashboard(docente: Docente) -> None:
+    # loadDashboardData() y cargarUltimasClases() salen juntas al abrir la página
+    inicio = time.perf_counter()
+    espera_previa = docente.espera
+    await asyncio.gather(
+        docente.request("GET", "/api/cursos/con-stats"),
+        docente.request("GET", "/api/clases/recientes?limite=10"),
+    )
+    # En paralelo el docente espera la más lenta, no la suma
+    docente.espera = espera_previa + (time.perf_counter() - inicio) * 1000
+
+
+async def alertas(docente: Docente) -> None:
+    await docente.request("GET", "/api/alertas/")
+
+
+async def busqueda(docente: Docente) -> None:
+    apellido = docente.azar.choice(docente.contexto["apellidos"])
+    for largo in range(1, min(len(apellido), 6) + 1):
+        await docente.request("GET", "/api/alumnos/?" + urlencode({"buscar": apellido[:largo]}))
+        await docente.pensar(0.2)
+
+
+async def asistencia(docente: Docente) -> None:
+    curso = docente.azar.choice(docente.contexto["cursos"])
+    curso_id = curso["id"]
+
+    # iniciarRegistroClase(): clases del curso para calcular el número de la nueva
+    clases = await docente.request("GET", f"/api/clases/curso/{curso_id}") or []
+    ultimos = docente.contexto["ultimo_numero_clase"]
+    numero = max([c["numero_clase"] for c in clases] + [ultimos.get(curso_id, 0)]) + 1
+    ultimos[curso_id] = numero
+    clase = await docente.request("POST", "/api/clases/", {
+        "curso_id": curso_id,
+        "fecha": date.today().isoformat(),
+        "numero_clase": numero,
+        "tema": "Clase de prueba de carga",
+    })
+    if clase is None:
+        return
+
+    # cargarTPsParaRegistro() y cargarAlumnosParaRegistro()
+    await docente.request("GET", f"/api/tps/curso/{curso_id}")
+    inscriptos = await docente.request("GET", f"/api/inscripciones/curso/{curso_id}") or []
+    await docente.request("GET", "/api/alumnos/")
+
+    # marcarAsistencia(): se guarda al hacer clic en cada alumno
+    registradas = []
+    for inscripcion in inscriptos:
+        await docente.pensar(0.1)
+        registro = await docente.request("POST", "/api/asistencias/", {
+            "alumno_id": inscripcion["alumno_id"],
+            "clase_id": clase["id"],
+            "estado": docente.azar.choice(ESTADOS_ASISTENCIA),
+        })
+        if registro is not None:
+            registradas.append(registro["id"])
+
+    # Algunas correcciones (clic sobre un estado ya guardado)
+    for asistencia_id in docente.azar.sample(registradas, k=len(registradas) // 10):
+        await docente.pensar(0.1)
+        await docente.request("PUT", f"/api/asistencias/{asistencia_id}", {"estado": "Tardanza"})
+
+
+async def calificar_tp(docente: Docente) -> None:
+    curso = docente.azar.choice(docente.contexto["cursos"])
+    tps = await docente.request("GET", f"/api/tps/curso/{curso['id']}") or []
+    if not tps:
+        return
+    tp = docente.azar.choice(tps)
+    await docente.request("GET", f"/api/entregas/tp/{tp['id']}")
+    await docente.pensar(2.0)
+
+    filas = []
+    for alumno_id in curso["alumnos"][:500]:
+        estado = docente.azar.choice(ESTADOS_ENTREGA)
+        filas.append({
+            "alumno_id": alumno_id,
+            "estado": estado,
+            "nota": docente.azar.randint(4, 10) if estado == "entregado" else None,
+        })
+    if filas:
+        await docente.request("POST", f"/api/entregas/tp/{tp['id']}/bulk", filas)
+
+
+FLUJOS: Dict[str, Callable[[Docente], Awaitable[None]]] = {
+    "dashboard": dashboard,
+    "alertas": alertas,
+    "busqueda": busqueda,
+    "asistencia": asistencia,
+    "calificar_tp": calificar_tp,
+}
+
+
+# ============================================================================
+# Preparación
+# ============================================================================
+
+async def preparar_contexto(cliente: httpx.AsyncClient) -> Dict[str, Any]:
+    """Cursos con alumnos inscriptos y apellidos para el buscador"""
+    cursos = []
+    for curso in (await cliente.get("/api/cursos/")).json()["cursos"]:
+        inscriptos = (await cliente.get(f"/api/inscripciones/curso/{curso['id']}")).json()
+        if inscriptos:
+            cursos.append({"id": curso["id"], "alumnos": [i["alumno_id"] for i in inscriptos]})
+    if not cursos:
+        raise RuntimeError("No hay cursos con alumnos inscriptos: usar --provisionar o cargar datos")
+
+    alumnos = (await cliente.get("/api/alumnos/?limite=100")).json()["alumnos"]
+    return {
+        "cursos": cursos,
+        "apellidos": sorted({a["apellido"] for a in alumnos}) or ["Pérez"],
+        "ultimo_numero_clase": {},
+    }
+
+
+async def provisionar_dataset(tier: str) -> None:
+    """Carga el dataset del tier en la base configurada (la misma que usa el servidor)"""
+    os.environ.setdefault("INVALIDACION_CACHE", "0")
+    from bench_endpoints import provisionar
+    from cliente_asgi import ClienteASGI
+    from src.presentation.api.main import app
+
+    print(f"🧪 Provisionando tier '{tier}' ({TIERS[tier].alumnos} alumnos)...")
+    provision = await provisionar(ClienteASGI(app), TIERS[tier])
+    print(f"   listo en {provision['segundos']} s")
+
+
+def iniciar_servidor(puerto: int, workers: int) -> subprocess.Popen:
+    """uvicorn en un proceso aparte; espera a que /api/health responda"""
+    proceso = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.presentation.api.main:app",
+         "--host", "127.0.0.1", "--port", str(puerto), "--workers", str(workers), "--log-level", "warning"],
+        cwd=project_root,
+    )
+    url = f"http://127.0.0.1:{puerto}/api/health"
+    limite = time.monotonic() + 30
+    try:
+        while time.monotonic() < limite:
+            if proceso.poll() is not None:
+                raise RuntimeError(f"uvicorn terminó al iniciar (código {proceso.returncode})")
+            try:
+                if httpx.get(url, timeout=1).status_code == 200:
+                    return proceso
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError("uvicorn no respondió en 30 s")
+    except BaseException:
+        detener_servidor(proceso)
+        raise
+
+
+def detener_servidor(proceso: subprocess.Popen, timeout: float = 10.0) -> None:
+    """SIGTERM y, si uvicorn no termina en 'timeout' segundos, SIGKILL"""
+    if proceso.poll() is not None:
+        return
+    proceso.terminate()
+    try:
+        proceso.wait(timeout)
+    except subprocess.TimeoutExpired:
+        print(f"⚠️ uvicorn no terminó en {timeout:g} s: se fuerza el cierre")
+        proceso.kill()
+        proceso.wait()
+
+
+# ============================================================================
+# Ejecución
+# ============================================================================
+
+async def docente_virtual(
+    numero: int,
+    cliente: httpx.AsyncClient,
+    contexto: Dict[str, Any],
+    args: argparse.Namespace,
+    estadisticas: Dict[str, Estadisticas],
+    inicio_medicion: float,
+    fin: float
+) -> None:
+    azar = random.Random(args.semilla + numero)
+    docente = Docente(cliente, contexto, args.pausa, azar)
+    nombres = list(estadisticas)
+    pesos = [ESCENARIOS[nombre] for nombre in nombres]
+
+    # Arranques escalonados: los docentes no llegan todos en el mismo milisegundo
+    await asyncio.sleep(azar.uniform(0, args.pausa))
+    while time.monotonic() < fin:
+        nombre = azar.choices(nombres, weights=pesos)[0]
+        midiendo = time.monotonic() >= inicio_medicion
+        await docente.ejecutar(FLUJOS[nombre], estadisticas[nombre] if midiendo else None)
+        await docente.pensar()
+
+
+async def ejecutar(args: argparse.Namespace) -> Dict[str, Any]:
+    limites = httpx.Limits(max_connections=args.docentes, max_keepalive_connections=args.docentes)
+    async with httpx.AsyncClient(base_url=args.url, limits=limites, timeout=args.timeout) as cliente:
+        contexto = await preparar_contexto(cliente)
+        print(f"👩‍🏫 {args.docentes} docentes, {len(contexto['cursos'])} cursos, "
+              f"{args.duracion} s (+{args.calentamiento} s de calentamiento)")
+
+        estadisticas = {nombre: Estadisticas() for nombre in args.escenarios}
+        inicio_medicion = time.monotonic() + args.calentamiento
+        fin = inicio_medicion + args.duracion
+        await asyncio.gather(*(
+            docente_virtual(i, cliente, contexto, args, estadisticas, inicio_medicion, fin)
+            for i in range(args.docentes)
+        ))
+        # Los flujos en curso al llegar 'fin' terminan igual: se divide por el tiempo real
+        segundos = time.monotonic() - inicio_medicion
+
+    escenarios = {nombre: e.resumen(segundos) for nombre, e in estadisticas.items()}
+    total_requests = sum(e["requests"] for e in escenarios.values())
+    return {
+        "url": args.url,
+        "docentes": args.docentes,
+        "duracion_s": round(segundos, 1),
+        "pausa_s": args.pausa,
+        "workers": args.workers if args.iniciar_servidor else None,
+        "commit": commit_actual(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "requests_por_segundo": round(total_requests / segundos, 1) if segundos else 0.0,
+        "errores": sum(e["errores"] for e in escenarios.values()),
+        "escenarios": escenarios,
+    }
+
+
+# ============================================================================
+# Reporte
+# ============================================================================
+
+def imprimir_resultados(reporte: Dict[str, Any]) -> None:
+    print(f"\n{'Escenario':14} {'flujos/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'req p95':>9} {'requests':>9} {'errores':>8}")
+    for nombre, e in reporte["escenarios"].items():
+        print(f"{nombre:14} {e['flujos_por_segundo']:>9} {e['flujo_p50_ms']:>9} {e['flujo_p95_ms']:>9} "
+              f"{e['flujo_p99_ms']:>9} {e['request_p95_ms']:>9} {e['requests']:>9} {e['errores']:>8}")
+    print(f"\n   {reporte['requests_por_segundo']} requests/s en total, {reporte['errores']} errores")
+    for nombre, e in reporte["escenarios"].items():
+        for ejemplo in e["ejemplos_error"]:
+            print(f"   ⚠️ {nombre}: {ejemplo}")
+
+
+def problemas(reporte: Dict[str, Any]) -> List[str]:
+    """Errores o escenarios sin ningún flujo completo: la medición no sirve"""
+    fallas = []
+    if reporte["errores"]:
+        fallas.append(f"{reporte['errores']} requests con error")
+    for nombre, e in reporte["escenarios"].items():
+        if not e["flujos"]:
+            fallas.append(f"{nombre}: ningún flujo completo")
+    return fallas
+
+
+def regresiones(anterior: Dict[str, Any], actual: Dict[str, Any], umbral: float) -> List[str]:
+    """Escenarios cuyo p95 creció, o cuyo throughput cayó, más de 'umbral' por ciento"""
+    fallas = []
+    for nombre, e in actual["escenarios"].items():
+        previo = anterior.get("escenarios", {}).get(nombre)
+        if not previo or not e["flujos"]:
+            continue
+        if previo["flujo_p95_ms"] and e["flujo_p95_ms"] > previo["flujo_p95_ms"] * (1 + umbral / 100):
+            fallas.append(f"{nombre}: p95 {previo['flujo_p95_ms']} → {e['flujo_p95_ms']} ms")
+        if e["flujos_por_segundo"] < previo["flujos_por_segundo"] * (1 - umbral / 100):
+            fallas.append(f"{nombre}: {previo['flujos_por_segundo']} → {e['flujos_por_segundo']} flujos/s")
+    return fallas
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Prueba de carga con los flujos de la SPA")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Servidor a probar")
+    parser.add_argument("--iniciar-servidor", action="store_true", help="Levantar uvicorn en --url (solo host local)")
+    parser.add_argument("--workers", type=int, default=1, help="Workers de uvicorn con --iniciar-servidor")
+    parser.add_argument("--provisionar", choices=sorted(TIERS), default=None,
+                        help="Cargar el dataset del tier antes (¡BORRA la base!)")
+    parser.add_argument("--docentes", type=int, default=20, help="Docentes virtuales concurrentes")
+    parser.add_argument("--duracion", type=float, default=60.0, help="Segundos de medición")
+    parser.add_argument("--calentamiento", type=float, default=5.0, help="Segundos iniciales sin medir")
+    parser.add_argument("--pausa", type=float, default=1.0, help="Segundos que piensa un docente entre acciones")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Timeout por request (segundos)")
+    parser.add_argument("--escenarios", nargs="*", choices=list(ESCENARIOS), default=list(ESCENARIOS))
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--json", type=str, default=None, help="Ruta donde guardar el reporte JSON")
+    parser.add_argument("--comparar", type=str, default=None, help="Reporte JSON anterior para comparar")
+    parser.add_argument("--umbral", type=float, default=20.0, help="Regresión tolerada en por ciento")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🏋️  Prueba de carga por escenarios")
+    print("=" * 70)
+
+    # Un SIGTERM (ej: timeout de CI) pasa por los finally: no queda un uvicorn huérfano
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(128 + signal.SIGTERM))
+
+    # Antes de levantar el servidor: arranca con las cachés vacías
+    if args.provisionar:
+        asyncio.run(provisionar_dataset(args.provisionar))
+
+    servidor = None
+    try:
+        if args.iniciar_servidor:
+            puerto = httpx.URL(args.url).port or 8000
+            servidor = iniciar_servidor(puerto, args.workers)
+        reporte = asyncio.run(ejecutar(args))
+    finally:
+        if servidor is not None:
+            detener_servidor(servidor)
+
+    imprimir_resultados(reporte)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(reporte, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"\n💾 Reporte guardado en: {args.json}")
+
+    fallas = problemas(reporte)
+    if fallas:
+        print("\n❌ Corrida inválida:")
+        for falla in fallas:
+            print(f"   - {falla}")
+
+    if args.comparar:
+        anterior = json.loads(Path(args.comparar).read_text(encoding="utf-8"))
+        fallas_comparacion = regresiones(anterior, reporte, args.umbral)
+        print(f"\n📊 Comparación con {anterior.get('commit') or 'reporte anterior'} (umbral {args.umbral}%)")
+        if fallas_comparacion:
+            print("❌ Regresiones:")
+            for falla in fallas_comparacion:
+                print(f"   - {falla}")
+        else:
+            print("✅ Sin regresiones")
+        fallas += fallas_comparacion
+
+    if fallas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Cliente ASGI en Proceso
+Sistema de Seguimiento de Alumnos
+
+Llama a la app de FastAPI directamente por la interfaz ASGI, sin servidor
+ni sockets: mide lo que cuesta la app (middlewares, routers, servicios,
+BD) y no la red. Sin dependencias externas (no hace falta httpx).
+
+Uso:
+    cliente = ClienteASGI(app)
+    respuesta = await cliente.request("GET", "/api/alumnos/?limite=50")
+    respuesta.status, respuesta.headers["x-query-count"], respuesta.json()
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass
+class RespuestaASGI:
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class ClienteASGI:
+    """Ejecuta requests HTTP contra una app ASGI en el mismo proceso"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(
+        self,
+        metodo: str,
+        ruta: str,
+        json_body: Any = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> RespuestaASGI:
+        partes = urlsplit(ruta)
+        cuerpo = json.dumps(json_body).encode() if json_body is not None else b""
+        encabezados = {"host": "benchmark", **{k.lower(): v for k, v in (headers or {}).items()}}
+        if json_body is not None:
+            encabezados["content-type"] = "application/json"
+        encabezados["content-length"] = str(len(cuerpo))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": metodo.upper(),
+            "scheme": "http",
+            "path": partes.path,
+            "raw_path": partes.path.encode(),
+            "query_string": partes.query.encode(),
+            "root_path": "",
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in encabezados.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("benchmark", 80),
+        }
+
+        enviado = False
+        respuesta = RespuestaASGI(status=0)
+        partes_cuerpo = []
+
+        async def receive():
+            nonlocal enviado
+            if not enviado:
+                enviado = True
+                return {"type": "http.request", "body": cuerpo, "more_body": False}
+            return {"type": "http.disconnect"}
+
+        async def send(mensaje):
+            if mensaje["type"] == "http.response.start":
+                respuesta.status = mensaje["status"]
+                respuesta.headers = {
+                    k.decode("latin-1").lower(): v.decode("latin-1") for k, v in mensaje.get("headers", [])
+                }
+            elif mensaje["type"] == "http.response.body":
+                partes_cuerpo.append(mensaje.get("body", b""))
+
+        await self.app(scope, receive, send)
+        respuesta.body = b"".join(partes_cuerpo)
+        return respuesta
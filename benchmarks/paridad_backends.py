@@ -0,0 +1,618 @@
+"""
+Paridad y Rendimiento entre Backends
+Sistema de Seguimiento de Alumnos
+
+Corre el mismo guion de operaciones contra cada backend de persistencia
+(memoria, sqlite, postgres) usando los repositorios directamente, y:
+- verifica que todos devuelvan lo mismo (resultados, orden y excepciones
+  de dominio); cualquier diferencia hace fallar el script (código 1)
+- mide cada operación (mediana de --repeticiones para las lecturas) y
+  arma una tabla comparativa por backend
+
+El guion cubre todos los métodos de los repositorios: altas, duplicados,
+cargas masivas, upserts, cascadas y export.
+
+Decisión de diseño: Un proceso por backend
+- DB_BACKEND se lee al importar src: cada backend corre en un proceso
+  hijo propio con su entorno, y el padre solo compara los JSON que dejan
+- Los ids dependen del backend (secuencias de PostgreSQL que no se
+  reinician, huecos): se comparan por alias (alumno#1, clase#3, ...) en
+  el orden en que aparecen, junto con las FKs
+- Las fechas de alta (fecha_creacion, fecha_registro, ...) no se comparan:
+  las pone cada backend con su reloj
+- Se usan los repositorios sin caches ni servicios: interesa el contrato
+  de persistencia, no la API
+- Los nombres del guion son ASCII: el orden de textos con acentos depende
+  del collation de PostgreSQL, y SQLite compara bytes
+
+Por defecto corre memoria y sqlite (sobre un archivo temporal). postgres
+solo si se pide, contra POSTGRES_URL / DATABASE_URL: ¡BORRA todos los datos!
+
+Uso:
+    python benchmarks/paridad_backends.py
+    python benchmarks/paridad_backends.py --backends memoria sqlite postgres --json paridad.json
+    python benchmarks/paridad_backends.py --repeticiones 20 --comparar paridad.json --umbral 30
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Agregar el directorio raíz al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+BACKENDS = ("memoria", "sqlite", "postgres")
+
+# Tablas en orden de borrado (hijas primero)
+TABLAS = (
+    "entrega_tp", "registro_participacion", "registro_asistencia", "inscripcion",
+    "trabajo_practico", "clase", "curso", "alumno",
+)
+
+# Entidad -> tabla de su id; columna FK -> tabla referenciada
+TABLA_POR_ENTIDAD = {
+    "Alumno": "alumno",
+    "Curso": "curso",
+    "Inscripcion": "inscripcion",
+    "Clase": "clase",
+    "RegistroAsistencia": "registro_asistencia",
+    "RegistroParticipacion": "registro_participacion",
+    "TrabajoPractico": "trabajo_practico",
+    "EntregaTP": "entrega_tp",
+}
+TABLA_POR_FK = {
+    "alumno_id": "alumno",
+    "curso_id": "curso",
+    "clase_id": "clase",
+    "trabajo_practico_id": "trabajo_practico",
+}
+TABLA_POR_EXPORT = {
+    "asistencias": "registro_asistencia",
+    "participaciones": "registro_participacion",
+    "entregas": "entrega_tp",
+}
+
+# Generadas por cada backend: no forman parte del contrato
+IGNORADOS = {"fecha_creacion", "fecha_registro", "fecha_inscripcion"}
+
+
+# ============================================================================
+# Proceso hijo: un backend
+# ============================================================================
+
+class Corrida:
+    """Ejecuta operaciones, normaliza sus resultados y toma los tiempos"""
+
+    def __init__(self, repeticiones: int):
+        self.repeticiones = repeticiones
+        self.resultados: Dict[str, Any] = {}
+        self.tiempos: Dict[str, float] = {}
+        self._alias: Dict[tuple, str] = {}
+        self._contadores: Dict[str, int] = {}
+
+    def alias(self, tabla: str, id: Optional[int]) -> Optional[str]:
+        if id is None:
+            return None
+        clave = (tabla, id)
+        if clave not in self._alias:
+            self._contadores[tabla] = self._contadores.get(tabla, 0) + 1
+            self._alias[clave] = f"{tabla}#{self._contadores[tabla]}"
+        return self._alias[clave]
+
+    def normalizar(self, valor: Any) -> Any:
+        if isinstance(valor, Enum):
+            return valor.value
+        if isinstance(valor, (datetime, date)):
+            return valor.isoformat()
+        if isinstance(valor, float):
+            return round(valor, 4)
+        if isinstance(valor, dict):
+            return {str(k): self.normalizar(v) for k, v in valor.items()}
+        if isinstance(valor, (list, tuple, set, frozenset)):
+            return [self.normalizar(v) for v in valor]
+        tabla = TABLA_POR_ENTIDAD.get(type(valor).__name__)
+        if tabla is not None:
+            fila = {}
+            for campo in type(valor).__slots__:
+                if campo in IGNORADOS:
+                    continue
+                dato = getattr(valor, campo)
+                if campo == "id":
+                    fila[campo] = self.alias(tabla, dato)
+                elif campo in TABLA_POR_FK:
+                    fila[campo] = self.alias(TABLA_POR_FK[campo], dato)
+                else:
+                    fila[campo] = self.normalizar(dato)
+            return fila
+        return valor
+
+    def _ejecutar(self, nombre: str, veces: int, fn: Callable, args: tuple,
+                  ordenado: bool, normalizar: Optional[Callable]) -> Any:
+        if nombre in self.resultados:
+            raise ValueError(f"Operación repetida en el guion: {nombre}")
+
+        duraciones = []
+        resultado = None
+        for _ in range(veces):
+            inicio = time.perf_counter()
+            try:
+                valor = fn(*args)
+            except Exception as e:
+                # Las excepciones también son parte del contrato
+                valor = e
+            duraciones.append((time.perf_counter() - inicio) * 1000)
+            if resultado is None:
+                resultado = valor
+
+        if isinstance(resultado, Exception):
+            self.resultados[nombre] = {"excepcion": type(resultado).__name__}
+        else:
+            normalizado = normalizar(resultado) if normalizar else self.normalizar(resultado)
+            if not ordenado and isinstance(normalizado, list):
+                normalizado = sorted(normalizado, key=lambda v: json.dumps(v, sort_keys=True))
+            self.resultados[nombre] = normalizado
+        self.tiempos[nombre] = round(statistics.median(duraciones), 4)
+        return None if isinstance(resultado, Exception) else resultado
+
+    def escribir(self, nombre: str, fn: Callable, *args, ordenado: bool = True,
+                 normalizar: Optional[Callable] = None) -> Any:
+        """Una sola vez: repetirla cambiaría el estado"""
+        return self._ejecutar(nombre, 1, fn, args, ordenado, normalizar)
+
+    def leer(self, nombre: str, fn: Callable, *args, ordenado: bool = True,
+             normalizar: Optional[Callable] = None) -> Any:
+        return self._ejecutar(nombre, self.repeticiones, fn, args, ordenado, normalizar)
+
+
+def guion(c: Corrida) -> None:
+    """Las mismas operaciones, en el mismo orden, para todos los backends"""
+    from src.infrastructure.database.connection import crear_conexion, get_db_connection
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.repositories.base.export_repository_base import COLUMNAS_EXPORT
+    from src.domain.entities.alumno import Alumno
+    from src.domain.entities.curso import Curso
+    from src.domain.entities.inscripcion import Inscripcion
+    from src.domain.entities.clase import Clase
+    from src.domain.entities.registro_asistencia import RegistroAsistencia
+    from src.domain.entities.registro_participacion import RegistroParticipacion
+    from src.domain.entities.trabajo_practico import TrabajoPractico
+    from src.domain.entities.entrega_tp import EntregaTP
+    from src.domain.value_objects.enums import EstadoAsistencia, NivelParticipacion
+
+    conexion = get_db_connection()
+    alumnos = crear_repositorio("alumno", conexion)
+    cursos = crear_repositorio("curso", conexion)
+    inscripciones = crear_repositorio("inscripcion", conexion)
+    clases = crear_repositorio("clase", conexion)
+    asistencias = crear_repositorio("asistencia", conexion)
+    participaciones = crear_repositorio("participacion", conexion)
+    tps = crear_repositorio("tp", conexion)
+    entregas = crear_repositorio("entrega", conexion)
+    NO_EXISTE = 10 ** 9
+
+    # --- Cursos: mismo año/cuatrimestre y mismo nombre para probar el desempate
+    datos_cursos = [
+        ("Programacion I", 2024, 1, "Garcia"),
+        ("Algebra", 2024, 1, "Lopez"),
+        ("Programacion I", 2024, 1, "Perez"),
+        ("Base de Datos", 2023, 2, "Garcia"),
+        ("Redes", 2024, 2, "Suarez"),
+    ]
+    curso = []
+    for i, (materia, anio, cuatrimestre, docente) in enumerate(datos_cursos):
+        curso.append(c.escribir(f"curso.crear[{i}]", cursos.crear, Curso(materia, anio, cuatrimestre, docente)))
+    c.leer("curso.obtener_por_id", cursos.obtener_por_id, curso[0].id)
+    c.leer("curso.obtener_por_id[inexistente]", cursos.obtener_por_id, NO_EXISTE)
+    c.leer("curso.obtener_por_ids", cursos.obtener_por_ids, [curso[1].id, curso[3].id, NO_EXISTE],
+           normalizar=lambda d: sorted((c.normalizar(v) for v in d.values()), key=lambda v: v["id"]))
+    c.leer("curso.obtener_todos", cursos.obtener_todos)
+    c.leer("curso.obtener_todos[pagina]", cursos.obtener_todos, 2, 1)
+    c.leer("curso.buscar_por_anio_y_cuatrimestre", cursos.buscar_por_anio_y_cuatrimestre, 2024, 1)
+    c.escribir("curso.actualizar", cursos.actualizar,
+               Curso("Redes II", 2024, 2, "Suarez", id=curso[4].id))
+    c.escribir("curso.actualizar[inexistente]", cursos.actualizar,
+               Curso("Nada", 2024, 2, "Nadie", id=NO_EXISTE))
+
+    # --- Alumnos: apellidos y nombres repetidos para el desempate por id
+    datos_alumnos = [
+        ("Ana", "Gomez", "30000001", 2024),
+        ("Bruno", "Diaz", "30000002", 2024),
+        ("Ana", "Gomez", "30000003", 2024),
+        ("Carla", "Alvarez", "30000004", 2023),
+        ("Diego", "Benitez", "30000005", 2024),
+        ("Elena", "Diaz", "30000006", 2023),
+    ]
+    alumno = []
+    for i, (nombre, apellido, dni, cohorte) in enumerate(datos_alumnos):
+        alumno.append(c.escribir(f"alumno.crear[{i}]", alumnos.crear,
+                                 Alumno(nombre, apellido, dni, f"a{dni}@mail.com", cohorte)))
+    c.escribir("alumno.crear[dni_duplicado]", alumnos.crear,
+               Alumno("Otro", "Gomez", "30000001", "otro@mail.com", 2024))
+    lote = [
+        Alumno("Fabian", "Castro", "30000007", "f@mail.com", 2024),
+        Alumno("Ana Maria", "Gomez", "30000001", "nuevo@mail.com", 2022),
+    ]
+    c.escribir("alumno.crear_lote", alumnos.crear_lote, lote, False)
+    lote = [
+        Alumno("Gabriela", "Rios", "30000008", "g@mail.com", 2024),
+        Alumno("Ana Maria", "Gomez", "30000001", "nuevo@mail.com", 2024),
+    ]
+    c.escribir("alumno.crear_lote[actualizar]", alumnos.crear_lote, lote, True)
+    c.leer("alumno.obtener_por_id", alumnos.obtener_por_id, alumno[0].id)
+    c.leer("alumno.obtener_por_id[inexistente]", alumnos.obtener_por_id, NO_EXISTE)
+    c.leer("alumno.obtener_por_ids", alumnos.obtener_por_ids, [alumno[2].id, alumno[0].id, NO_EXISTE],
+           normalizar=lambda d: sorted((c.normalizar(v) for v in d.values()), key=lambda v: v["id"]))
+    c.leer("alumno.obtener_por_dni", alumnos.obtener_por_dni, "30000004")
+    c.leer("alumno.obtener_por_dni[inexistente]", alumnos.obtener_por_dni, "99999999")
+    c.leer("alumno.obtener_todos", alumnos.obtener_todos)
+    c.leer("alumno.obtener_todos[pagina]", alumnos.obtener_todos, 3, 2)
+    c.leer("alumno.buscar_por_nombre", alumnos.buscar_por_nombre, "AZ")
+    c.leer("alumno.obtener_por_cohorte", alumnos.obtener_por_cohorte, 2024)
+    c.escribir("alumno.actualizar", alumnos.actualizar,
+               Alumno("Bruno", "Diaz", "30000002", "bruno@mail.com", 2023, id=alumno[1].id))
+    c.escribir("alumno.actualizar[dni_duplicado]", alumnos.actualizar,
+               Alumno("Bruno", "Diaz", "30000003", "bruno@mail.com", 2023, id=alumno[1].id))
+    c.leer("alumno.contar_total", alumnos.contar_total)
+
+    # --- Inscripciones
+    inscripcion = []
+    pares = [(0, 0), (1, 0), (2, 0), (3, 0), (0, 1), (4, 1)]
+    for i, (a, k) in enumerate(pares):
+        inscripcion.append(c.escribir(f"inscripcion.crear[{i}]", inscripciones.crear,
+                                      Inscripcion(alumno[a].id, curso[k].id)))
+    c.escribir("inscripcion.crear[duplicada]", inscripciones.crear, Inscripcion(alumno[0].id, curso[0].id))
+    c.leer("inscripcion.obtener_por_id", inscripciones.obtener_por_id, inscripcion[0].id)
+    c.leer("inscripcion.obtener_por_alumno", inscripciones.obtener_por_alumno, alumno[0].id, ordenado=False)
+    c.leer("inscripcion.obtener_por_curso", inscripciones.obtener_por_curso, curso[0].id, ordenado=False)
+    c.leer("inscripcion.existe", inscripciones.existe, alumno[0].id, curso[0].id)
+    c.leer("inscripcion.existe[no]", inscripciones.existe, alumno[5].id, curso[0].id)
+    c.leer("inscripcion.obtener_alumno_ids_por_curso", inscripciones.obtener_alumno_ids_por_curso,
+           curso[0].id, ordenado=False, normalizar=lambda ids: [c.alias("alumno", id) for id in ids])
+    c.leer("inscripcion.filtrar_inscriptos", inscripciones.filtrar_inscriptos,
+           curso[0].id, [alumno[0].id, alumno[4].id, NO_EXISTE],
+           normalizar=lambda ids: sorted(c.alias("alumno", id) for id in ids))
+
+    def pares_creados(resultado):
+        candidatos, creados = resultado
+        return {
+            "candidatos": candidatos,
+            "creados": sorted([c.alias("alumno", a), c.alias("curso", k)] for a, k in creados),
+        }
+
+    c.escribir("inscripcion.inscribir_pares", inscripciones.inscribir_pares,
+               [(alumno[5].id, curso[1].id), (alumno[0].id, curso[0].id), (alumno[5].id, curso[1].id),
+                (NO_EXISTE, curso[1].id), (alumno[1].id, NO_EXISTE)],
+               normalizar=pares_creados)
+    c.escribir("inscripcion.inscribir_cohorte", inscripciones.inscribir_cohorte,
+               2024, [curso[2].id, curso[0].id, NO_EXISTE], normalizar=pares_creados)
+    c.escribir("inscripcion.eliminar", inscripciones.eliminar, inscripcion[5].id)
+    c.escribir("inscripcion.eliminar[inexistente]", inscripciones.eliminar, NO_EXISTE)
+
+    # --- Clases
+    clase = []
+    fechas = [date(2024, 3, 4), date(2024, 3, 11), date(2024, 3, 18)]
+    for k in (0, 1):
+        for n, fecha in enumerate(fechas, start=1):
+            clase.append(c.escribir(f"clase.crear[{k}.{n}]", clases.crear,
+                                    Clase(curso[k].id, fecha, n, f"Tema {n}")))
+    c.escribir("clase.crear[numero_duplicado]", clases.crear, Clase(curso[0].id, date(2024, 4, 1), 1, "Otra"))
+    c.leer("clase.obtener_por_id", clases.obtener_por_id, clase[0].id)
+    c.leer("clase.obtener_por_ids", clases.obtener_por_ids, [clase[4].id, clase[1].id],
+           normalizar=lambda d: sorted((c.normalizar(v) for v in d.values()), key=lambda v: v["id"]))
+    c.leer("clase.obtener_por_curso", clases.obtener_por_curso, curso[0].id)
+    c.leer("clase.obtener_por_fecha", clases.obtener_por_fecha, curso[0].id, fechas[1])
+    c.leer("clase.obtener_por_fecha[inexistente]", clases.obtener_por_fecha, curso[0].id, date(2020, 1, 1))
+    c.escribir("clase.actualizar", clases.actualizar,
+               Clase(curso[0].id, fechas[2], 3, "Tema 3 revisado", id=clase[2].id))
+
+    # --- Asistencias
+    estados = [EstadoAsistencia.PRESENTE, EstadoAsistencia.AUSENTE, EstadoAsistencia.TARDANZA]
+    asistencia = []
+    for j, k in enumerate((0, 1, 2)):
+        for i, a in enumerate((0, 1, 2, 3)):
+            asistencia.append(c.escribir(f"asistencia.crear[{k}.{a}]", asistencias.crear,
+                                         RegistroAsistencia(alumno[a].id, clase[k].id, estados[(i + j) % 3])))
+    c.escribir("asistencia.crear[duplicada]", asistencias.crear,
+               RegistroAsistencia(alumno[0].id, clase[0].id, EstadoAsistencia.AUSENTE))
+    c.leer("asistencia.obtener_por_id", asistencias.obtener_por_id, asistencia[0].id)
+    c.leer("asistencia.obtener_por_clase", asistencias.obtener_por_clase, clase[0].id, ordenado=False)
+    c.leer("asistencia.obtener_por_alumno_y_curso", asistencias.obtener_por_alumno_y_curso,
+           alumno[1].id, curso[0].id)
+    c.leer("asistencia.existe", asistencias.existe, alumno[0].id, clase[0].id)
+    c.leer("asistencia.existe[no]", asistencias.existe, alumno[5].id, clase[0].id)
+    c.escribir("asistencia.actualizar", asistencias.actualizar,
+               RegistroAsistencia(alumno[1].id, clase[0].id, EstadoAsistencia.JUSTIFICADA, id=asistencia[1].id))
+    c.leer("asistencia.obtener_por_id[actualizada]", asistencias.obtener_por_id, asistencia[1].id)
+    c.escribir("asistencia.eliminar", asistencias.eliminar, asistencia[11].id)
+    c.leer("clase.obtener_recientes", clases.obtener_recientes, 4)
+    c.leer("clase.obtener_recientes[docente]", clases.obtener_recientes, 10, "garc")
+
+    # --- Participaciones
+    participacion = []
+    for i, (a, nivel) in enumerate(((0, NivelParticipacion.ALTA), (1, NivelParticipacion.BAJA))):
+        participacion.append(c.escribir(f"participacion.crear[{i}]", participaciones.crear,
+                                        RegistroParticipacion(alumno[a].id, clase[0].id, nivel, "ok")))
+    c.escribir("participacion.crear_lote", participaciones.crear_lote, clase[1].id, [
+        RegistroParticipacion(alumno[a].id, clase[1].id, NivelParticipacion.MEDIA, None) for a in (0, 1, 2)
+    ])
+    c.escribir("participacion.crear_lote[reemplazar]", participaciones.crear_lote, clase[1].id, [
+        RegistroParticipacion(alumno[a].id, clase[1].id, NivelParticipacion.ALTA, "bien") for a in (2, 3)
+    ], True)
+    c.leer("participacion.obtener_por_id", participaciones.obtener_por_id, participacion[0].id)
+    c.leer("participacion.obtener_por_clase", participaciones.obtener_por_clase, clase[1].id, ordenado=False)
+    c.leer("participacion.obtener_por_alumno_y_curso", participaciones.obtener_por_alumno_y_curso,
+           alumno[2].id, curso[0].id)
+    c.escribir("participacion.actualizar", participaciones.actualizar,
+               RegistroParticipacion(alumno[1].id, clase[0].id, NivelParticipacion.NINGUNA, "sin participar",
+                                     id=participacion[1].id))
+    c.leer("participacion.obtener_por_id[actualizada]", participaciones.obtener_por_id, participacion[1].id)
+    c.escribir("participacion.eliminar", participaciones.eliminar, participacion[0].id)
+
+    # --- Trabajos prácticos: dos con la misma fecha para el desempate
+    datos_tps = [
+        (0, "TP Final", date(2024, 6, 30)),
+        (0, "TP 2", date(2024, 4, 15)),
+        (0, "TP 1", date(2024, 4, 1)),
+        (0, "TP 1 bis", date(2024, 4, 1)),
+        (1, "TP Unico", date(2024, 5, 1)),
+    ]
+    tp = []
+    for i, (k, titulo, fecha) in enumerate(datos_tps):
+        tp.append(c.escribir(f"tp.crear[{i}]", tps.crear, TrabajoPractico(curso[k].id, titulo, fecha, "desc")))
+    c.leer("tp.obtener_por_id", tps.obtener_por_id, tp[0].id)
+    c.leer("tp.obtener_por_ids", tps.obtener_por_ids, [tp[3].id, tp[1].id],
+           normalizar=lambda d: sorted((c.normalizar(v) for v in d.values()), key=lambda v: v["id"]))
+    c.leer("tp.obtener_por_curso", tps.obtener_por_curso, curso[0].id)
+    c.leer("tp.obtener_todos", tps.obtener_todos)
+    c.escribir("tp.actualizar", tps.actualizar,
+               TrabajoPractico(curso[1].id, "TP Unico (v2)", date(2024, 5, 8), None, id=tp[4].id))
+
+    # --- Entregas: el upsert conserva el id
+    entrega = []
+    for i, (t, a) in enumerate(((2, 0), (2, 1), (1, 0), (0, 0))):
+        entrega.append(c.escribir(f"entrega.crear_o_actualizar[{i}]", entregas.crear_o_actualizar,
+                                  EntregaTP(tp[t].id, alumno[a].id, date(2024, 4, 1), True, False,
+                                            "entregado", 7.5, "bien")))
+    c.escribir("entrega.crear_o_actualizar[existente]", entregas.crear_o_actualizar,
+               EntregaTP(tp[2].id, alumno[0].id, date(2024, 4, 3), True, True, "tarde", 6.0, "tarde"))
+    c.escribir("entrega.crear_o_actualizar_lote", entregas.crear_o_actualizar_lote, [
+        EntregaTP(tp[2].id, alumno[1].id, None, False, False, "no_entregado", None, None),
+        EntregaTP(tp[2].id, alumno[2].id, date(2024, 4, 1), True, False, "entregado", 9.0, None),
+        EntregaTP(tp[3].id, alumno[0].id, date(2024, 4, 1), True, False, "entregado", 8.25, "ok"),
+    ])
+    c.leer("entrega.obtener_por_id", entregas.obtener_por_id, entrega[0].id)
+    c.leer("entrega.obtener_por_tp", entregas.obtener_por_tp, tp[2].id, ordenado=False)
+    c.leer("entrega.obtener_por_alumno_y_tp", entregas.obtener_por_alumno_y_tp, alumno[0].id, tp[2].id)
+    c.leer("entrega.obtener_por_alumno_y_tp[inexistente]", entregas.obtener_por_alumno_y_tp,
+           alumno[5].id, tp[2].id)
+    c.leer("entrega.obtener_por_alumno_y_curso", entregas.obtener_por_alumno_y_curso, alumno[0].id, curso[0].id)
+    c.escribir("entrega.eliminar", entregas.eliminar, entrega[2].id)
+
+    # --- Export: conexión propia, como en el router
+    conexion_export = crear_conexion()
+    try:
+        exportador = crear_repositorio("export", conexion_export)
+        for tabla, columnas in COLUMNAS_EXPORT.items():
+            def filas_export(filas, tabla=tabla, columnas=columnas):
+                normalizadas = []
+                for fila in filas:
+                    registro = {}
+                    for columna, dato in zip(columnas, fila):
+                        if columna in IGNORADOS:
+                            continue
+                        if columna == "id":
+                            registro[columna] = c.alias(TABLA_POR_EXPORT[tabla], dato)
+                        elif columna in TABLA_POR_FK:
+                            registro[columna] = c.alias(TABLA_POR_FK[columna], dato)
+                        else:
+                            registro[columna] = c.normalizar(dato)
+                    normalizadas.append(registro)
+                return normalizadas
+
+            c.leer(f"export.{tabla}", lambda curso_id, tabla=tabla: list(exportador.iterar_filas(curso_id, tabla, 2)),
+                   curso[0].id, normalizar=filas_export)
+    finally:
+        conexion_export.close()
+
+    # --- Bajas en cascada
+    c.escribir("clase.eliminar", clases.eliminar, clase[0].id)
+    c.leer("asistencia.obtener_por_clase[cascada]", asistencias.obtener_por_clase, clase[0].id)
+    c.escribir("tp.eliminar", tps.eliminar, tp[2].id)
+    c.leer("entrega.obtener_por_tp[cascada]", entregas.obtener_por_tp, tp[2].id)
+    c.escribir("alumno.eliminar", alumnos.eliminar, alumno[1].id)
+    c.leer("inscripcion.obtener_por_alumno[cascada]", inscripciones.obtener_por_alumno, alumno[1].id)
+    c.escribir("alumno.eliminar[inexistente]", alumnos.eliminar, NO_EXISTE)
+    c.escribir("curso.eliminar", cursos.eliminar, curso[0].id)
+    c.leer("clase.obtener_por_curso[cascada]", clases.obtener_por_curso, curso[0].id)
+    c.leer("inscripcion.obtener_por_curso[cascada]", inscripciones.obtener_por_curso, curso[0].id)
+    c.leer("tp.obtener_todos[final]", tps.obtener_todos)
+    c.leer("alumno.contar_total[final]", alumnos.contar_total)
+
+
+def preparar_base(backend: str) -> None:
+    """Schema creado y tablas vacías (memoria arranca vacía en cada proceso)"""
+    if backend == "memoria":
+        return
+    from src.infrastructure.database.connection import get_db_connection, inicializar_base_de_datos
+
+    inicializar_base_de_datos()
+    conexion = get_db_connection()
+    cursor = conexion.cursor()
+    try:
+        for tabla in TABLAS:
+            cursor.execute(f"DELETE FROM {tabla}")
+        conexion.commit()
+    finally:
+        cursor.close()
+
+
+def correr_hijo(backend: str, salida: str, repeticiones: int) -> None:
+    preparar_base(backend)
+    corrida = Corrida(repeticiones)
+    guion(corrida)
+    Path(salida).write_text(json.dumps({
+        "resultados": corrida.resultados,
+        "tiempos": corrida.tiempos,
+    }), encoding="utf-8")
+
+
+# ============================================================================
+# Proceso padre: comparación
+# ============================================================================
+
+def correr_backend(backend: str, repeticiones: int, directorio: str) -> Dict[str, Any]:
+    entorno = dict(os.environ, DB_BACKEND=backend, PYTHONIOENCODING="utf-8")
+    if backend == "sqlite":
+        entorno["SQLITE_PATH"] = os.path.join(directorio, "paridad.db")
+    salida = os.path.join(directorio, f"{backend}.json")
+
+    print(f"⏱️  {backend}...")
+    inicio = time.perf_counter()
+    proceso = subprocess.run(
+        [sys.executable, __file__, "--backend-hijo", backend, "--salida", salida,
+         "--repeticiones", str(repeticiones)],
+        env=entorno, cwd=project_root, capture_output=True, text=True
+    )
+    if proceso.returncode != 0:
+        print(proceso.stdout)
+        print(proceso.stderr)
+        raise RuntimeError(f"El backend {backend} terminó con código {proceso.returncode}")
+    print(f"   listo en {time.perf_counter() - inicio:.1f} s")
+    return json.loads(Path(salida).read_text(encoding="utf-8"))
+
+
+def diferencias(corridas: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Operaciones cuyo resultado no coincide con el del primer backend"""
+    referencia, *otros = corridas
+    esperado = corridas[referencia]["resultados"]
+    encontradas = []
+    for backend in otros:
+        obtenido = corridas[backend]["resultados"]
+        for nombre in esperado.keys() | obtenido.keys():
+            if esperado.get(nombre) != obtenido.get(nombre):
+                encontradas.append({
+                    "operacion": nombre,
+                    "backend": backend,
+                    referencia: esperado.get(nombre),
+                    "obtenido": obtenido.get(nombre),
+                })
+    return sorted(encontradas, key=lambda d: (d["operacion"], d["backend"]))
+
+
+def imprimir_resultados(reporte: Dict[str, Any]) -> None:
+    backends = reporte["backends"]
+    print(f"\n{'Operación':52} " + " ".join(f"{b + ' ms':>12}" for b in backends) + f" {'igual':>6}")
+    distintas = {d["operacion"] for d in reporte["diferencias"]}
+    for nombre, tiempos in reporte["operaciones"].items():
+        marca = "❌" if nombre in distintas else "✓"
+        print(f"{nombre:52} " + " ".join(f"{tiempos.get(b, 0):>12.3f}" for b in backends) + f" {marca:>6}")
+    print(f"{'TOTAL':52} " + " ".join(f"{reporte['totales_ms'][b]:>12.2f}" for b in backends))
+
+    for d in reporte["diferencias"]:
+        referencia = backends[0]
+        print(f"\n   ⚠️ {d['operacion']} ({d['backend']} vs {referencia}):")
+        print(f"      {referencia}: {json.dumps(d[referencia], ensure_ascii=False)[:300]}")
+        print(f"      {d['backend']}: {json.dumps(d['obtenido'], ensure_ascii=False)[:300]}")
+
+
+def regresiones(anterior: Dict[str, Any], actual: Dict[str, Any], umbral: float) -> List[str]:
+    """Backends cuyo total, u operaciones de al menos 1 ms, empeoraron más de 'umbral' por ciento"""
+    fallas = []
+    for backend, total in actual["totales_ms"].items():
+        previo = anterior.get("totales_ms", {}).get(backend)
+        if previo and total > previo * (1 + umbral / 100):
+            fallas.append(f"{backend} (total): {previo} → {total} ms")
+    for nombre, tiempos in actual["operaciones"].items():
+        previos = anterior.get("operaciones", {}).get(nombre, {})
+        for backend, ms in tiempos.items():
+            # Debajo de 1 ms el ruido supera cualquier umbral razonable
+            previo = previos.get(backend)
+            if previo and previo >= 1 and ms > previo * (1 + umbral / 100):
+                fallas.append(f"{nombre} [{backend}]: {previo} → {ms} ms")
+    return fallas
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Paridad y rendimiento de los backends de persistencia")
+    parser.add_argument("--backends", nargs="*", choices=BACKENDS, default=["memoria", "sqlite"],
+                        help="Backends a comparar (el primero es la referencia)")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Repeticiones de cada lectura")
+    parser.add_argument("--json", type=str, default=None, help="Ruta donde guardar el reporte JSON")
+    parser.add_argument("--comparar", type=str, default=None, help="Reporte JSON anterior para comparar")
+    parser.add_argument("--umbral", type=float, default=20.0, help="Regresión tolerada en por ciento")
+    parser.add_argument("--backend-hijo", choices=BACKENDS, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--salida", type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend_hijo:
+        correr_hijo(args.backend_hijo, args.salida, args.repeticiones)
+        return
+
+    print("=" * 70)
+    print("⚖️  Paridad entre backends: " + ", ".join(args.backends))
+    print("=" * 70)
+    if "postgres" in args.backends:
+        print("⚠️ postgres: se BORRAN todos los datos de POSTGRES_URL / DATABASE_URL")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        corridas = {b: correr_backend(b, args.repeticiones, directorio) for b in args.backends}
+
+    from bench_endpoints import commit_actual
+
+    operaciones = {
+        nombre: {b: corridas[b]["tiempos"].get(nombre, 0.0) for b in args.backends}
+        for nombre in corridas[args.backends[0]]["tiempos"]
+    }
+    reporte = {
+        "commit": commit_actual(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "repeticiones": args.repeticiones,
+        "backends": args.backends,
+        "operaciones": operaciones,
+        "totales_ms": {b: round(sum(corridas[b]["tiempos"].values()), 2) for b in args.backends},
+        "diferencias": diferencias(corridas) if len(args.backends) > 1 else [],
+    }
+
+    imprimir_resultados(reporte)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(reporte, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"\n💾 Reporte guardado en: {args.json}")
+
+    fallo = False
+    if reporte["diferencias"]:
+        print(f"\n❌ {len(reporte['diferencias'])} operaciones con resultados distintos")
+        fallo = True
+    else:
+        print(f"\n✅ {len(operaciones)} operaciones con resultados idénticos")
+
+    if args.comparar:
+        anterior = json.loads(Path(args.comparar).read_text(encoding="utf-8"))
+        fallas = regresiones(anterior, reporte, args.umbral)
+        print(f"\n📊 Comparación con {anterior.get('commit') or 'reporte anterior'} (umbral {args.umbral}%)")
+        if fallas:
+            print("❌ Regresiones:")
+            for falla in fallas:
+                print(f"   - {falla}")
+            fallo = True
+        else:
+            print("✅ Sin regresiones")
+
+    if fallo:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
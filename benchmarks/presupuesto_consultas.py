@@ -0,0 +1,157 @@
+"""
+Presupuesto de Consultas por Ruta
+Sistema de Seguimiento de Alumnos
+
+Verifica que cada ruta de listado y del dashboard ejecute como máximo una
+cantidad fija de sentencias SQL (header X-Query-Count), con 1 curso y con
+50 cursos. Si una ruta vuelve a consultar por fila (un bucle N+1 como el de
+la vieja verificar_ausencias_consecutivas de alertas), el conteo crece con
+el dataset y el script termina con código 1.
+
+Cada ruta se mide en frío (cachés vacías): el presupuesto es el peor caso.
+Las consultas fijas de toda request (las versiones del ETag) también
+cuentan.
+
+Necesita PostgreSQL (DATABASE_URL / POSTGRES_URL). ¡BORRA todos los datos
+de esa base! Cada sentencia tiene un statement_timeout de 10 s
+(DB_STATEMENT_TIMEOUT_MS): con estos datasets, un plan que tarda más es
+una regresión y corta el script con error en vez de colgarlo.
+
+Uso:
+    python benchmarks/presupuesto_consultas.py
+    python benchmarks/presupuesto_consultas.py --rutas alertas con_stats
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Agregar el directorio raíz al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Un solo proceso: la escucha de invalidaciones entre workers no hace falta
+os.environ.setdefault("INVALIDACION_CACHE", "0")
+# Las consultas por request se leen del header X-Query-Count
+os.environ["INSTRUMENTACION"] = "1"
+os.environ.setdefault("DB_STATEMENT_TIMEOUT_MS", "10000")
+
+from bench_endpoints import provisionar
+from cliente_asgi import ClienteASGI
+from src.infrastructure.cache.repositorios_cacheados import limpiar_caches
+from src.infrastructure.database.generador_datos import ParametrosDataset
+
+
+# Los dos extremos: si el conteo depende del dataset, difieren
+TAMANOS: Dict[str, ParametrosDataset] = {
+    "1 curso": ParametrosDataset(cohortes=1, alumnos=30, cursos=1),
+    "50 cursos": ParametrosDataset(cohortes=2, alumnos=1500, cursos=50),
+}
+
+# nombre -> (ruta, máximo de sentencias). {curso_id}, {alumno_id}, {clase_id}
+# y {tp_id} se completan con IDs del dataset cargado. Cada get_db_connection()
+# verifica la conexión con un SELECT 1 y las rutas con ETag consultan las
+# versiones: con-stats son 4 = 2 de base + 1 del ETag + 1 del endpoint.
+PRESUPUESTOS: Dict[str, Tuple[str, int]] = {
+    "alertas": ("/api/alertas/", 6),
+    "con_stats": ("/api/cursos/con-stats", 4),
+    "cursos": ("/api/cursos/", 3),
+    "alumnos": ("/api/alumnos/?limite=50", 5),
+    "alumnos_busqueda": ("/api/alumnos/?buscar=Pérez", 5),
+    "tps": ("/api/tps/", 4),
+    "tps_por_curso": ("/api/tps/curso/{curso_id}", 3),
+    "clases_por_curso": ("/api/clases/curso/{curso_id}", 3),
+    "clases_recientes": ("/api/clases/recientes?limite=10", 2),
+    "inscripciones_por_curso": ("/api/inscripciones/curso/{curso_id}", 3),
+    "inscripciones_por_alumno": ("/api/inscripciones/alumno/{alumno_id}", 3),
+    "asistencias_por_clase": ("/api/asistencias/clase/{clase_id}", 3),
+    "participaciones_por_clase": ("/api/participaciones/clase/{clase_id}", 3),
+    "entregas_por_tp": ("/api/entregas/tp/{tp_id}", 2),
+}
+
+
+async def obtener_ids(cliente: ClienteASGI) -> Dict[str, Any]:
+    """Un curso con alumnos, clases y TPs, y uno de sus alumnos"""
+    for curso in (await cliente.request("GET", "/api/cursos/")).json()["cursos"]:
+        inscriptos = (await cliente.request("GET", f"/api/inscripciones/curso/{curso['id']}")).json()
+        clases = (await cliente.request("GET", f"/api/clases/curso/{curso['id']}")).json()
+        tps = (await cliente.request("GET", f"/api/tps/curso/{curso['id']}")).json()
+        if inscriptos and clases and tps:
+            return {
+                "curso_id": curso["id"],
+                "alumno_id": inscriptos[0]["alumno_id"],
+                "clase_id": clases[0]["id"],
+                "tp_id": tps[0]["id"],
+            }
+    raise RuntimeError("No hay cursos con alumnos, clases y TPs")
+
+
+async def contar_consultas(cliente: ClienteASGI, ruta: str) -> int:
+    """Sentencias que ejecuta la ruta con las cachés vacías"""
+    limpiar_caches()
+    respuesta = await cliente.request("GET", ruta)
+    if respuesta.status >= 400:
+        raise RuntimeError(f"{ruta} respondió {respuesta.status}: {respuesta.body[:300]!r}")
+    return int(respuesta.headers["x-query-count"])
+
+
+async def ejecutar(nombres: List[str]) -> Dict[str, Dict[str, int]]:
+    """nombre de ruta -> {tamaño: consultas}"""
+    from src.presentation.api.main import app
+
+    cliente = ClienteASGI(app)
+    conteos: Dict[str, Dict[str, int]] = {nombre: {} for nombre in nombres}
+    for tamano, parametros in TAMANOS.items():
+        print(f"🧪 Cargando dataset de {tamano}...")
+        await provisionar(cliente, parametros)
+        ids = await obtener_ids(cliente)
+        for nombre in nombres:
+            ruta, _ = PRESUPUESTOS[nombre]
+            conteos[nombre][tamano] = await contar_consultas(cliente, ruta.format(**ids))
+    return conteos
+
+
+def verificar(conteos: Dict[str, Dict[str, int]]) -> List[str]:
+    """Rutas que exceden su presupuesto o cuyo conteo crece con el dataset"""
+    fallas = []
+    for nombre, por_tamano in conteos.items():
+        ruta, maximo = PRESUPUESTOS[nombre]
+        peor = max(por_tamano.values())
+        if peor > maximo:
+            fallas.append(f"{ruta}: {peor} consultas (máximo {maximo})")
+        elif len(set(por_tamano.values())) > 1:
+            fallas.append(f"{ruta}: el conteo depende del dataset {por_tamano}")
+    return fallas
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Verifica el máximo de consultas SQL por ruta")
+    parser.add_argument("--rutas", nargs="*", choices=sorted(PRESUPUESTOS), help="Verificar solo estas rutas")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🔢 Presupuesto de consultas por ruta")
+    print("=" * 70)
+
+    conteos = asyncio.run(ejecutar(args.rutas or list(PRESUPUESTOS)))
+
+    print(f"\n{'Ruta':28} " + " ".join(f"{t:>10}" for t in TAMANOS) + f" {'máximo':>8}")
+    for nombre, por_tamano in conteos.items():
+        print(f"{nombre:28} " + " ".join(f"{por_tamano[t]:>10}" for t in TAMANOS)
+              + f" {PRESUPUESTOS[nombre][1]:>8}")
+
+    fallas = verificar(conteos)
+    if fallas:
+        print("\n❌ Rutas fuera de presupuesto:")
+        for falla in fallas:
+            print(f"   - {falla}")
+        sys.exit(1)
+    print("\n✅ Todas las rutas dentro del presupuesto")
+
+
+if __name__ == "__main__":
+    main()
@@ -349,26 +349,15 @@ async function cargarUltimasClases() {
     container.innerHTML = '<p class="loading">Cargando últimas clases...</p>';
 
     try {
-        // Obtener clases de todos los cursos
-        const cursos = state.clases || [];
+        // Una sola request: el servidor ordena y limita las clases de todos los cursos
         let todasLasClases = [];
-
-        // Crear mapa de cursos para obtener nombres
-        const cursosMap = {};
-        cursos.forEach(c => cursosMap[c.id] = c);
-
-        // Obtener clases de cada curso
-        for (const curso of cursos) {
-            const response = await fetch(`${API_URL}/clases/curso/${curso.id}`);
-            if (response.ok) {
-                const clases = await response.json();
-                // Agregar info del curso a cada clase
-                clases.forEach(clase => {
-                    clase.cursoNombre = curso.nombre_materia || curso.materia;
-                    clase.cursoAnio = curso.anio;
-                });
-                todasLasClases = todasLasClases.concat(clases);
-            }
+        const response = await fetch(`${API_URL}/clases/recientes?limite=10`);
+        if (response.ok) {
+            todasLasClases = await response.json();
+            todasLasClases.forEach(clase => {
+                clase.cursoNombre = clase.curso_nombre;
+                clase.cursoAnio = clase.curso_anio;
+            });
         }
 
         if (todasLasClases.length === 0) {
@@ -381,9 +370,8 @@ async function cargarUltimasClases() {
             return;
         }
 
-        // Ordenar por fecha descendente y tomar las últimas 10
-        todasLasClases.sort((a, b) => new Date(b.fecha) - new Date(a.fecha));
-        const ultimasClases = todasLasClases.slice(0, 10);
+        // Ya vienen ordenadas por fecha descendente y limitadas a 10
+        const ultimasClases = todasLasClases;
 
         container.innerHTML = ultimasClases.map(clase => {
             const fecha = new Date(clase.fecha).toLocaleDateString('es-AR', {
@@ -0,0 +1,90 @@
+"""
+Script para Generar un Dataset Sintético
+Sistema de Seguimiento de Alumnos
+
+Carga cohortes, alumnos, cursos, clases, TPs y su historial (asistencias,
+participaciones, entregas) con una semilla fija, para pruebas de capacidad.
+
+Uso:
+    # PostgreSQL (usa DATABASE_URL / POSTGRES_URL)
+    python scripts/generar_datos.py --alumnos 3200 --cursos 4 --cohortes 2
+
+    # SQLite (crea el schema si el archivo es nuevo)
+    python scripts/generar_datos.py --sqlite datos.db --alumnos 3200
+
+Con esos parámetros se generan ~100.000 registros de asistencia.
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.database.generador_datos import ParametrosDataset, generar_dataset
+
+
+def parsear_argumentos() -> argparse.Namespace:
+    defecto = ParametrosDataset()
+    parser = argparse.ArgumentParser(description="Genera un dataset sintético reproducible")
+    parser.add_argument("--cohortes", type=int, default=defecto.cohortes)
+    parser.add_argument("--alumnos", type=int, default=defecto.alumnos)
+    parser.add_argument("--cursos", type=int, default=defecto.cursos)
+    parser.add_argument("--clases-por-curso", type=int, default=defecto.clases_por_curso)
+    parser.add_argument("--tps-por-curso", type=int, default=defecto.tps_por_curso)
+    parser.add_argument("--anio-inicial", type=int, default=defecto.anio_inicial)
+    parser.add_argument("--semilla", type=int, default=defecto.semilla)
+    parser.add_argument("--tasa-participacion", type=float, default=defecto.tasa_participacion)
+    parser.add_argument("--sqlite", metavar="RUTA", help="Cargar en un archivo SQLite en vez de PostgreSQL")
+    return parser.parse_args()
+
+
+def abrir_conexion(args: argparse.Namespace):
+    if not args.sqlite:
+        from src.infrastructure.database.connection import crear_conexion
+        return crear_conexion()
+
+    conexion = sqlite3.connect(args.sqlite)
+    conexion.execute("PRAGMA foreign_keys = ON")
+    schema = project_root / "src" / "infrastructure" / "database" / "schema.sql"
+    conexion.executescript(schema.read_text(encoding="utf-8"))
+    return conexion
+
+
+def main():
+    """Función principal"""
+    args = parsear_argumentos()
+    parametros = ParametrosDataset(
+        cohortes=args.cohortes,
+        alumnos=args.alumnos,
+        cursos=args.cursos,
+        clases_por_curso=args.clases_por_curso,
+        tps_por_curso=args.tps_por_curso,
+        anio_inicial=args.anio_inicial,
+        semilla=args.semilla,
+        tasa_participacion=args.tasa_participacion,
+    )
+
+    print("=" * 70)
+    print("🧪 Generando dataset sintético")
+    print("=" * 70)
+
+    conexion = abrir_conexion(args)
+    try:
+        resultado = generar_dataset(conexion, parametros)
+    except Exception as e:
+        print(f"\n❌ Error al generar datos: {e}")
+        sys.exit(1)
+    finally:
+        conexion.close()
+
+    for tabla, cantidad in resultado.items():
+        print(f"   {tabla:20} {cantidad}")
+    print("\n✅ Dataset cargado")
+
+
+if __name__ == "__main__":
+    main()
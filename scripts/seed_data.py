@@ -13,7 +13,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.infrastructure.database.connection import get_db_connection
-from src.infrastructure.repositories.sqlite.alumno_repository_sqlite import AlumnoRepositorySQLite
+from src.infrastructure.repositories.backends import crear_repositorio
 from src.application.services.alumno_service import AlumnoService
 
 
@@ -22,7 +22,7 @@ def cargar_alumnos_ejemplo():
     print("\n📝 Cargando alumnos de ejemplo...")
     
     conexion = get_db_connection()
-    alumno_repo = AlumnoRepositorySQLite(conexion)
+    alumno_repo = crear_repositorio("alumno", conexion)
     alumno_service = AlumnoService(alumno_repo)
     
     alumnos_ejemplo = [
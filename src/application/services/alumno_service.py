@@ -10,7 +10,10 @@ Decisión de diseño: Capa de Servicios
 - Implementan los casos de uso definidos en la documentación
 """
 
-from typing import List, Optional
+import csv
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 from src.domain.entities.alumno import Alumno
 from src.infrastructure.repositories.base.alumno_repository_base import AlumnoRepositoryBase
 from src.domain.exceptions.domain_exceptions import (
@@ -20,6 +23,50 @@ from src.domain.exceptions.domain_exceptions import (
 )
 
 
+# Políticas ante un DNI que ya existe en la BD durante una importación
+POLITICAS_CONFLICTO = ("omitir", "actualizar", "error")
+
+_COLUMNAS_IMPORTACION = ("nombre", "apellido", "dni", "email", "cohorte")
+
+
+def _compilar_validador(encabezado: Sequence[str]) -> Callable[[Sequence[str]], Alumno]:
+    """
+    Arma, a partir del encabezado del CSV, la función que convierte una fila en Alumno.
+    
+    Decisión de diseño: Validador compilado una vez por archivo
+    - La posición de cada columna se resuelve una sola vez (itemgetter), no
+      por fila ni con DictReader (que arma un dict por fila)
+    - Las reglas de dominio siguen en la entidad (__post_init__); aquí solo
+      se agregan los límites de largo del schema de la API
+    
+    Raises:
+        ValueError: Si faltan columnas obligatorias
+    """
+    posiciones = {nombre.strip().lower(): i for i, nombre in enumerate(encabezado)}
+    faltantes = [c for c in _COLUMNAS_IMPORTACION if c not in posiciones]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el CSV: {', '.join(faltantes)}")
+    
+    extraer = itemgetter(*(posiciones[c] for c in _COLUMNAS_IMPORTACION))
+    ancho = max(posiciones[c] for c in _COLUMNAS_IMPORTACION) + 1
+    
+    def validar(fila: Sequence[str]) -> Alumno:
+        if len(fila) < ancho:
+            raise ValueError(f"La fila tiene {len(fila)} columnas, se esperaban al menos {ancho}")
+        nombre, apellido, dni, email, cohorte = (v.strip() for v in extraer(fila))
+        if len(nombre) > 100 or len(apellido) > 100:
+            raise ValueError("Nombre y apellido admiten hasta 100 caracteres")
+        if not 7 <= len(dni) <= 20:
+            raise ValueError("El DNI debe tener entre 7 y 20 caracteres")
+        try:
+            cohorte = int(cohorte)
+        except ValueError:
+            raise ValueError(f"Cohorte inválida: {cohorte!r}")
+        return Alumno(nombre=nombre, apellido=apellido, dni=dni, email=email, cohorte=cohorte)
+    
+    return validar
+
+
 class AlumnoService:
     """
     Servicio de Aplicación para gestión de Alumnos.
@@ -243,3 +290,98 @@ class AlumnoService:
             return len(self.alumno_repo.obtener_por_cohorte(cohorte))
         else:
             return self.alumno_repo.contar_total()
+    
+    def importar_csv(
+        self,
+        lineas: Iterable[str],
+        politica: str = "omitir",
+        tamano_lote: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Importa alumnos desde un CSV (encabezado + una fila por alumno).
+        
+        Decisión de diseño: Lectura en streaming y lotes
+        - Las filas se leen de a una y se insertan de a tamano_lote con
+          AlumnoRepository.crear_lote (un INSERT multi-fila y un commit por
+          lote), en vez de obtener_por_dni + INSERT + commit por alumno
+        - En memoria queda solo el lote actual y el conjunto de DNIs vistos
+        - Las filas inválidas no frenan la importación: se informan en
+          'errores' con su número de fila (la 1 es el encabezado)
+        - Un lote ya confirmado no se revierte si uno posterior falla
+        
+        Args:
+            lineas: Líneas de texto del CSV (ej: el archivo abierto en modo texto)
+            politica: Qué hacer con un DNI que ya existe en la BD:
+                'omitir' (se cuenta en omitidos), 'actualizar' (se sobrescriben
+                nombre, apellido, email y cohorte) o 'error' (se informa como error)
+            tamano_lote: Alumnos por INSERT
+        
+        Returns:
+            Dict: filas, creados, actualizados, omitidos y errores
+                ([{fila, dni, error}])
+        
+        Raises:
+            ValueError: Si el archivo está vacío, faltan columnas o la política no existe
+        """
+        if politica not in POLITICAS_CONFLICTO:
+            raise ValueError(f"Política inválida: {politica}. Opciones: {', '.join(POLITICAS_CONFLICTO)}")
+        
+        lineas = iter(lineas)
+        primera = next(lineas, None)
+        if primera is None or not primera.strip():
+            raise ValueError("El archivo CSV está vacío")
+        # Las planillas en español suelen exportarse con ';'
+        delimitador = ";" if primera.count(";") > primera.count(",") else ","
+        lector = csv.reader(chain([primera], lineas), delimiter=delimitador)
+        validar = _compilar_validador(next(lector))
+        
+        resultado = {"filas": 0, "creados": 0, "actualizados": 0, "omitidos": 0, "errores": []}
+        errores = resultado["errores"]
+        vistos: Dict[str, int] = {}
+        lote: List[Alumno] = []
+        filas_lote: Dict[str, int] = {}
+        
+        def confirmar_lote() -> None:
+            creados, actualizados = self.alumno_repo.crear_lote(lote, politica == "actualizar")
+            resultado["creados"] += len(creados)
+            resultado["actualizados"] += len(actualizados)
+            escritos = {a.dni for a in creados} | {a.dni for a in actualizados}
+            for alumno in lote:
+                if alumno.dni in escritos:
+                    continue
+                if politica == "error":
+                    errores.append({
+                        "fila": filas_lote[alumno.dni],
+                        "dni": alumno.dni,
+                        "error": f"Ya existe un alumno con DNI {alumno.dni}"
+                    })
+                else:
+                    resultado["omitidos"] += 1
+            lote.clear()
+            filas_lote.clear()
+        
+        for numero, fila in enumerate(lector, start=2):
+            if not any(campo.strip() for campo in fila):
+                continue
+            resultado["filas"] += 1
+            try:
+                alumno = validar(fila)
+            except ValueError as e:
+                errores.append({"fila": numero, "dni": None, "error": str(e)})
+                continue
+            if alumno.dni in vistos:
+                errores.append({
+                    "fila": numero,
+                    "dni": alumno.dni,
+                    "error": f"DNI repetido en el archivo (fila {vistos[alumno.dni]})"
+                })
+                continue
+            vistos[alumno.dni] = numero
+            filas_lote[alumno.dni] = numero
+            lote.append(alumno)
+            if len(lote) >= tamano_lote:
+                confirmar_lote()
+        
+        if lote:
+            confirmar_lote()
+        return resultado
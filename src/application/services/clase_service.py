@@ -53,6 +53,10 @@ class ClaseService:
             raise CursoNoEncontradoException(f"Curso {curso_id} no encontrado")
         return self.clase_repo.obtener_por_curso(curso_id)
     
+    def listar_clases_recientes(self, limite: int = 10, docente: Optional[str] = None) -> List[dict]:
+        """Clases más recientes de todos los cursos, con conteos de asistencia"""
+        return self.clase_repo.obtener_recientes(limite, docente)
+    
     def actualizar_clase(
         self,
         clase_id: int,
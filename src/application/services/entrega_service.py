@@ -3,9 +3,9 @@ Servicio de Aplicación: EntregaTPService
 Sistema de Seguimiento de Alumnos
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from datetime import date
-from src.domain.entities.entrega_tp import EntregaTP
+from src.domain.entities.entrega_tp import EntregaTP, ESTADOS_ENTREGA
 from src.infrastructure.repositories.base.entrega_tp_repository_base import EntregaTPRepositoryBase
 from src.infrastructure.repositories.base.tp_repository_base import TrabajoPracticoRepositoryBase
 from src.infrastructure.repositories.base.inscripcion_repository_base import InscripcionRepositoryBase
@@ -74,6 +74,69 @@ class EntregaTPService:
         
         return self.entrega_repo.crear_o_actualizar(entrega)
     
+    def registrar_entregas_masivo(self, tp_id: int, items: Iterable[dict]) -> List[EntregaTP]:
+        """
+        Registra (o corrige) las entregas de muchos alumnos para un TP.
+        
+        Decisión de diseño: Validar todo antes de escribir
+        - El TP se lee una vez y su fecha límite se usa para todas las filas
+        - La inscripción se valida como conjunto (filtrar_inscriptos): una
+          consulta o el índice en memoria, no una por alumno
+        - Si algo no valida no se escribe nada; si valida, un solo upsert
+        
+        Args:
+            tp_id: ID del trabajo práctico
+            items: dicts con alumno_id, estado, nota, fecha_entrega_real, observaciones
+        
+        Returns:
+            List[EntregaTP]: Las entregas guardadas
+        
+        Raises:
+            TrabajoPracticoNoEncontradoException: Si el TP no existe
+            AlumnoNoInscriptoException: Si algún alumno no está inscripto en el curso
+            ValueError: Alumnos repetidos, estado o nota inválidos
+        """
+        items = list(items)
+        tp = self.tp_repo.obtener_por_id(tp_id)
+        if not tp:
+            raise TrabajoPracticoNoEncontradoException(f"TP {tp_id} no encontrado")
+        
+        alumno_ids = [item['alumno_id'] for item in items]
+        if len(set(alumno_ids)) != len(alumno_ids):
+            raise ValueError("Hay alumnos repetidos en la lista de entregas")
+        
+        no_inscriptos = set(alumno_ids) - self.inscripcion_repo.filtrar_inscriptos(tp.curso_id, alumno_ids)
+        if no_inscriptos:
+            raise AlumnoNoInscriptoException(
+                f"Alumnos no inscriptos en el curso de este TP: {sorted(no_inscriptos)}"
+            )
+        
+        hoy = date.today()
+        entregas = []
+        for item in items:
+            estado = item.get('estado') or 'entregado'
+            if estado not in ESTADOS_ENTREGA:
+                raise ValueError(f"Estado inválido para alumno {item['alumno_id']}: {estado}")
+            
+            # Mismo criterio que crear_o_actualizar: el estado define si hubo entrega
+            entregado = estado in ('entregado', 'tarde')
+            fecha_real = item.get('fecha_entrega_real') or (hoy if entregado else None)
+            # Mismo cálculo que el trigger fn_calcular_entrega_tardia, contra la única fecha del TP
+            es_tardia = bool(fecha_real and tp.fecha_entrega and fecha_real > tp.fecha_entrega)
+            
+            entregas.append(EntregaTP(
+                trabajo_practico_id=tp_id,
+                alumno_id=item['alumno_id'],
+                fecha_entrega_real=fecha_real,
+                entregado=entregado,
+                es_tardia=es_tardia,
+                estado=estado,
+                nota=item.get('nota'),
+                observaciones=item.get('observaciones')
+            ))
+        
+        return self.entrega_repo.crear_o_actualizar_lote(entregas)
+    
     def obtener_entrega(self, id: int) -> EntregaTP:
         entrega = self.entrega_repo.obtener_por_id(id)
         if not entrega:
@@ -3,7 +3,7 @@ Servicio de Aplicación: InscripcionService
 Sistema de Seguimiento de Alumnos
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 from src.domain.entities.inscripcion import Inscripcion
 from src.infrastructure.repositories.base.inscripcion_repository_base import InscripcionRepositoryBase
 from src.infrastructure.repositories.base.alumno_repository_base import AlumnoRepositoryBase
@@ -43,6 +43,56 @@ class InscripcionService:
         inscripcion = Inscripcion(alumno_id=alumno_id, curso_id=curso_id)
         return self.inscripcion_repo.crear(inscripcion)
     
+    def matricular_masivo(
+        self,
+        pares: Optional[Iterable[Tuple[int, int]]] = None,
+        cohorte: Optional[int] = None,
+        curso_ids: Optional[Iterable[int]] = None
+    ) -> Dict[str, int]:
+        """
+        Inscribe muchos alumnos con una sola sentencia INSERT ... SELECT.
+        
+        Recibe pares (alumno_id, curso_id) explícitos, o una cohorte y los
+        cursos en los que inscribir a todos sus alumnos. Las inscripciones
+        que ya existen se cuentan pero no son error.
+        
+        Decisión de diseño: Todo o nada en la validación
+        - Si falta algún alumno o curso no se inscribe a nadie (404), igual
+          que las cargas masivas de entregas y participaciones
+        - Alumnos y cursos se validan con obtener_por_ids: una consulta por
+          tabla, no una por par
+        
+        Returns:
+            Dict[str, int]: solicitadas, creadas y existentes
+        """
+        if pares is not None:
+            pares = list(dict.fromkeys((int(a), int(c)) for a, c in pares))
+            self._validar_existencia(
+                {alumno_id for alumno_id, _ in pares},
+                {curso_id for _, curso_id in pares}
+            )
+            solicitadas, creadas = self.inscripcion_repo.inscribir_pares(pares)
+        else:
+            curso_ids = list(dict.fromkeys(curso_ids or ()))
+            self._validar_existencia(set(), set(curso_ids))
+            solicitadas, creadas = self.inscripcion_repo.inscribir_cohorte(cohorte, curso_ids)
+        
+        return {
+            "solicitadas": solicitadas,
+            "creadas": len(creadas),
+            "existentes": solicitadas - len(creadas),
+        }
+    
+    def _validar_existencia(self, alumno_ids: set, curso_ids: set) -> None:
+        if alumno_ids:
+            faltantes = alumno_ids - set(self.alumno_repo.obtener_por_ids(alumno_ids))
+            if faltantes:
+                raise AlumnoNoEncontradoException(f"No existen alumnos con ID {sorted(faltantes)}")
+        if curso_ids:
+            faltantes = curso_ids - set(self.curso_repo.obtener_por_ids(curso_ids))
+            if faltantes:
+                raise CursoNoEncontradoException(f"No existen cursos con ID {sorted(faltantes)}")
+    
     def obtener_inscripcion(self, id: int) -> Inscripcion:
         inscripcion = self.inscripcion_repo.obtener_por_id(id)
         if not inscripcion:
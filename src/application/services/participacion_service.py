@@ -3,7 +3,7 @@ Servicio de Aplicación: ParticipacionService
 Sistema de Seguimiento de Alumnos
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from src.domain.entities.registro_participacion import RegistroParticipacion
 from src.domain.value_objects.enums import NivelParticipacion
 from src.infrastructure.repositories.base.participacion_repository_base import RegistroParticipacionRepositoryBase
@@ -48,6 +48,53 @@ class ParticipacionService:
         )
         return self.participacion_repo.crear(registro)
     
+    def registrar_participaciones_masivo(
+        self,
+        clase_id: int,
+        items: Iterable[dict],
+        reemplazar: bool = False
+    ) -> Tuple[List[RegistroParticipacion], int]:
+        """
+        Registra la participación de muchos alumnos en una clase.
+        
+        Decisión de diseño: Validar todo y escribir una vez
+        - La clase se lee una vez y la inscripción se valida como conjunto
+          (una consulta o el índice en memoria)
+        - Todo o nada: si un alumno no está inscripto no se escribe ninguno
+        - reemplazar=True borra lo ya cargado para la clase en la misma
+          transacción (corregir la carga de fin de clase sin duplicar)
+        
+        Args:
+            clase_id: ID de la clase
+            items: dicts con alumno_id, nivel, comentario
+            reemplazar: Reemplazar los registros existentes de la clase
+        
+        Returns:
+            Tuple[List[RegistroParticipacion], int]: (registros creados, cantidad reemplazada)
+        """
+        items = list(items)
+        clase = self.clase_repo.obtener_por_id(clase_id)
+        if not clase:
+            raise ClaseNoEncontradaException(f"Clase {clase_id} no encontrada")
+        
+        alumno_ids = {item['alumno_id'] for item in items}
+        no_inscriptos = alumno_ids - self.inscripcion_repo.filtrar_inscriptos(clase.curso_id, alumno_ids)
+        if no_inscriptos:
+            raise AlumnoNoInscriptoException(
+                f"Alumnos no inscriptos en el curso de esta clase: {sorted(no_inscriptos)}"
+            )
+        
+        registros = [
+            RegistroParticipacion(
+                alumno_id=item['alumno_id'],
+                clase_id=clase_id,
+                nivel=NivelParticipacion(item['nivel']),
+                comentario=item.get('comentario')
+            )
+            for item in items
+        ]
+        return self.participacion_repo.crear_lote(clase_id, registros, reemplazar)
+    
     def listar_participaciones_clase(self, clase_id: int) -> List[RegistroParticipacion]:
         if not self.clase_repo.obtener_por_id(clase_id):
             raise ClaseNoEncontradaException(f"Clase {clase_id} no encontrada")
@@ -7,6 +7,7 @@ Decisión de diseño: Uso de dataclass
 - Inmutable por defecto si usamos frozen=True (no lo usamos para permitir updates)
 - Type hints nativos
 - Método __eq__ automático basado en atributos
+- slots=True: sin __dict__ por instancia, menos memoria al listar muchos alumnos
 """
 
 from dataclasses import dataclass, field
@@ -15,7 +16,13 @@ from typing import Optional
 import re
 
 
-@dataclass
+# Decisión de diseño: Compilar el patrón una sola vez
+# - validar_email se ejecuta en cada creación/actualización de alumno
+# - Evita recompilar (o buscar en la caché de re) el patrón en cada llamada
+_PATRON_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@dataclass(slots=True)
 class Alumno:
     """
     Entidad de Dominio: Alumno
@@ -95,8 +102,7 @@ class Alumno:
         Returns:
             bool: True si el email es válido, False en caso contrario
         """
-        patron = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(patron, self.email) is not None
+        return _PATRON_EMAIL.match(self.email) is not None
     
     def nombre_completo(self) -> str:
         """
@@ -153,6 +159,28 @@ class Alumno:
             fecha_creacion=datetime.fromisoformat(data['fecha_creacion']) if data.get('fecha_creacion') else None
         )
     
+    @classmethod
+    def from_row(cls, row) -> 'Alumno':
+        """
+        Crea una instancia desde una fila de BD SIN volver a validar.
+        
+        Decisión de diseño: Camino rápido de hidratación
+        - Los datos persistidos ya se validaron al crearse y la BD los
+          restringe con CHECK/UNIQUE, revalidarlos por fila es costo puro
+        - No ejecuta __post_init__ (ni la regex de email)
+        - Solo debe usarse con filas leídas de la BD, nunca con input de usuario
+        
+        Args:
+            row: Secuencia (id, nombre, apellido, dni, email, cohorte, fecha_creacion)
+        
+        Returns:
+            Alumno: Nueva instancia de Alumno
+        """
+        alumno = object.__new__(cls)
+        (alumno.id, alumno.nombre, alumno.apellido, alumno.dni,
+         alumno.email, alumno.cohorte, alumno.fecha_creacion) = row
+        return alumno
+    
     def __str__(self) -> str:
         """Representación en string del alumno"""
         return f"Alumno({self.nombre_completo()}, DNI: {self.dni}, Cohorte: {self.cohorte})"
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Clase:
     """
     Entidad de Dominio: Clase
@@ -50,3 +50,15 @@ class Clase:
             tema=data.get('tema'),
             fecha_creacion=datetime.fromisoformat(data['fecha_creacion']) if data.get('fecha_creacion') else None
         )
+
+    @classmethod
+    def from_row(cls, row) -> 'Clase':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        Args:
+            row: Secuencia (id, curso_id, fecha, numero_clase, tema, fecha_creacion)
+        """
+        clase = object.__new__(cls)
+        clase.id, clase.curso_id, clase.fecha, clase.numero_clase, clase.tema, clase.fecha_creacion = row
+        return clase
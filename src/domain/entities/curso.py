@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Curso:
     """
     Entidad de Dominio: Curso
@@ -95,5 +95,18 @@ class Curso:
             fecha_creacion=datetime.fromisoformat(data['fecha_creacion']) if data.get('fecha_creacion') else None
         )
     
+    @classmethod
+    def from_row(cls, row) -> 'Curso':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        Args:
+            row: Secuencia (id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion)
+        """
+        curso = object.__new__(cls)
+        (curso.id, curso.nombre_materia, curso.anio, curso.cuatrimestre,
+         curso.docente_responsable, curso.fecha_creacion) = row
+        return curso
+    
     def __str__(self) -> str:
         return f"Curso({self.nombre_completo()}, Docente: {self.docente_responsable})"
@@ -7,7 +7,10 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 
-@dataclass
+# Estados válidos de una entrega (mismo CHECK que la tabla entrega_tp)
+ESTADOS_ENTREGA = ('pendiente', 'entregado', 'tarde', 'no_entregado')
+
+@dataclass(slots=True)
 class EntregaTP:
     """
     Entidad de Dominio: EntregaTP
@@ -34,9 +37,8 @@ class EntregaTP:
             self.fecha_entrega_real = date.fromisoformat(self.fecha_entrega_real)
         
         # Validar estado
-        estados_validos = ['pendiente', 'entregado', 'tarde', 'no_entregado']
-        if self.estado not in estados_validos:
-            raise ValueError(f"Estado inválido. Debe ser uno de: {estados_validos}")
+        if self.estado not in ESTADOS_ENTREGA:
+            raise ValueError(f"Estado inválido. Debe ser uno de: {list(ESTADOS_ENTREGA)}")
         
         # Validar nota si existe
         if self.nota is not None and (self.nota < 1 or self.nota > 10):
@@ -71,3 +73,20 @@ class EntregaTP:
             fecha_registro=datetime.fromisoformat(data['fecha_registro']) if data.get('fecha_registro') else None
         )
 
+    @classmethod
+    def from_row(cls, row) -> 'EntregaTP':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        Args:
+            row: Secuencia (id, trabajo_practico_id, alumno_id, fecha_entrega_real,
+                 entregado, es_tardia, estado, nota, observaciones, fecha_registro)
+        """
+        entrega = object.__new__(cls)
+        (entrega.id, entrega.trabajo_practico_id, entrega.alumno_id, entrega.fecha_entrega_real,
+         entregado, es_tardia, estado, nota, entrega.observaciones, entrega.fecha_registro) = row
+        entrega.entregado = bool(entregado)
+        entrega.es_tardia = bool(es_tardia)
+        entrega.estado = estado or 'pendiente'
+        entrega.nota = float(nota) if nota is not None else None
+        return entrega
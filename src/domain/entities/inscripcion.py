@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Inscripcion:
     """
     Entidad de Dominio: Inscripcion
@@ -40,3 +40,15 @@ class Inscripcion:
             curso_id=data['curso_id'],
             fecha_inscripcion=datetime.fromisoformat(data['fecha_inscripcion']) if data.get('fecha_inscripcion') else None
         )
+
+    @classmethod
+    def from_row(cls, row) -> 'Inscripcion':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        Args:
+            row: Secuencia (id, alumno_id, curso_id, fecha_inscripcion)
+        """
+        inscripcion = object.__new__(cls)
+        inscripcion.id, inscripcion.alumno_id, inscripcion.curso_id, inscripcion.fecha_inscripcion = row
+        return inscripcion
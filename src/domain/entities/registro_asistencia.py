@@ -9,7 +9,7 @@ from typing import Optional
 from src.domain.value_objects.enums import EstadoAsistencia
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistroAsistencia:
     """
     Entidad de Dominio: RegistroAsistencia
@@ -46,7 +46,7 @@ class RegistroAsistencia:
             # Si recibimos un string, intentamos convertirlo
             if isinstance(self.estado, str):
                 try:
-                    self.estado = EstadoAsistencia(self.estado)
+                    self.estado = EstadoAsistencia.desde_valor(self.estado)
                 except ValueError:
                     raise ValueError(
                         f"Estado inválido: {self.estado}. "
@@ -100,5 +100,21 @@ class RegistroAsistencia:
             fecha_registro=datetime.fromisoformat(data['fecha_registro']) if data.get('fecha_registro') else None
         )
     
+    @classmethod
+    def from_row(cls, row) -> 'RegistroAsistencia':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        La BD ya garantiza el estado con un CHECK, solo se convierte
+        el string al enum mediante el lookup cacheado.
+        
+        Args:
+            row: Secuencia (id, alumno_id, clase_id, estado, fecha_registro)
+        """
+        registro = object.__new__(cls)
+        registro.id, registro.alumno_id, registro.clase_id, estado, registro.fecha_registro = row
+        registro.estado = EstadoAsistencia.desde_valor(estado)
+        return registro
+    
     def __str__(self) -> str:
         return f"RegistroAsistencia(Alumno {self.alumno_id}, Clase {self.clase_id}, Estado: {self.estado.value})"
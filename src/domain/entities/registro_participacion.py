@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 from src.domain.value_objects.enums import NivelParticipacion
 
-@dataclass
+@dataclass(slots=True)
 class RegistroParticipacion:
     """
     Entidad de Dominio: RegistroParticipacion
@@ -29,7 +29,7 @@ class RegistroParticipacion:
         
         if not isinstance(self.nivel, NivelParticipacion):
              if isinstance(self.nivel, str):
-                 self.nivel = NivelParticipacion(self.nivel)
+                 self.nivel = NivelParticipacion.desde_valor(self.nivel)
              else:
                  raise ValueError("Nivel de participación inválido")
 
@@ -53,3 +53,16 @@ class RegistroParticipacion:
             comentario=data.get('comentario'),
             fecha_registro=datetime.fromisoformat(data['fecha_registro']) if data.get('fecha_registro') else None
         )
+
+    @classmethod
+    def from_row(cls, row) -> 'RegistroParticipacion':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        Args:
+            row: Secuencia (id, alumno_id, clase_id, nivel, comentario, fecha_registro)
+        """
+        registro = object.__new__(cls)
+        registro.id, registro.alumno_id, registro.clase_id, nivel, registro.comentario, registro.fecha_registro = row
+        registro.nivel = NivelParticipacion.desde_valor(nivel)
+        return registro
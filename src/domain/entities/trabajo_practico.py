@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class TrabajoPractico:
     """
     Entidad de Dominio: TrabajoPractico
@@ -49,3 +49,15 @@ class TrabajoPractico:
             fecha_entrega=date.fromisoformat(data['fecha_entrega']) if isinstance(data['fecha_entrega'], str) else data['fecha_entrega'],
             fecha_creacion=datetime.fromisoformat(data['fecha_creacion']) if data.get('fecha_creacion') else None
         )
+
+    @classmethod
+    def from_row(cls, row) -> 'TrabajoPractico':
+        """
+        Crea una instancia desde una fila de BD sin revalidar.
+        
+        Args:
+            row: Secuencia (id, curso_id, titulo, descripcion, fecha_entrega, fecha_creacion)
+        """
+        tp = object.__new__(cls)
+        tp.id, tp.curso_id, tp.titulo, tp.descripcion, tp.fecha_entrega, tp.fecha_creacion = row
+        return tp
@@ -33,6 +33,20 @@ class EstadoAsistencia(str, Enum):
     def valores_validos(cls) -> list[str]:
         """Retorna lista de valores válidos como strings"""
         return [estado.value for estado in cls]
+    
+    @classmethod
+    def desde_valor(cls, valor: str) -> 'EstadoAsistencia':
+        """
+        Obtiene el miembro a partir de su valor con un lookup cacheado.
+        
+        Decisión de diseño: Diccionario precalculado
+        - EstadoAsistencia(valor) pasa por EnumMeta.__call__ en cada llamada
+        - Al hidratar miles de filas conviene un acceso directo a dict
+        """
+        try:
+            return _ESTADOS_ASISTENCIA[valor]
+        except KeyError:
+            raise ValueError(f"{valor!r} no es un EstadoAsistencia válido") from None
 
 
 class NivelParticipacion(str, Enum):
@@ -58,6 +72,14 @@ class NivelParticipacion(str, Enum):
         """Retorna lista de valores válidos como strings"""
         return [nivel.value for nivel in cls]
     
+    @classmethod
+    def desde_valor(cls, valor: str) -> 'NivelParticipacion':
+        """Obtiene el miembro a partir de su valor (lookup cacheado)"""
+        try:
+            return _NIVELES_PARTICIPACION[valor]
+        except KeyError:
+            raise ValueError(f"{valor!r} no es un NivelParticipacion válido") from None
+    
     def valor_numerico(self) -> int:
         """
         Convierte el nivel a un valor numérico para cálculos.
@@ -116,6 +138,14 @@ class NivelRiesgo(str, Enum):
         """Retorna lista de valores válidos como strings"""
         return [nivel.value for nivel in cls]
     
+    @classmethod
+    def desde_valor(cls, valor: str) -> 'NivelRiesgo':
+        """Obtiene el miembro a partir de su valor (lookup cacheado)"""
+        try:
+            return _NIVELES_RIESGO[valor]
+        except KeyError:
+            raise ValueError(f"{valor!r} no es un NivelRiesgo válido") from None
+    
     def prioridad(self) -> int:
         """
         Retorna un valor numérico de prioridad para ordenamiento.
@@ -139,3 +169,12 @@ class NivelRiesgo(str, Enum):
             NivelRiesgo.ALTO: "#F44336"    # Rojo
         }
         return mapping[self]
+
+
+# ============================================================================
+# Lookups cacheados valor -> miembro (usados por desde_valor)
+# ============================================================================
+
+_ESTADOS_ASISTENCIA = {estado.value: estado for estado in EstadoAsistencia}
+_NIVELES_PARTICIPACION = {nivel.value: nivel for nivel in NivelParticipacion}
+_NIVELES_RIESGO = {nivel.value: nivel for nivel in NivelRiesgo}
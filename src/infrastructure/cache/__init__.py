@@ -0,0 +1 @@
+# cache package
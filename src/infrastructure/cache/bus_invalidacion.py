@@ -0,0 +1,223 @@
+"""
+Bus de Invalidación de Caches (LISTEN/NOTIFY)
+Sistema de Seguimiento de Alumnos
+
+Con varios workers de uvicorn (o varias instancias) cada proceso tiene sus
+propios caches en memoria: una escritura en un worker deja datos viejos en
+los demás. Los triggers fn_notificar_invalidacion publican en el canal
+invalidacion_cache qué fila cambió, y un thread por proceso escucha ese
+canal y descarta las entradas afectadas.
+
+Decisión de diseño: Triggers en la BD, no NOTIFY desde los repositorios
+- Cubre TODAS las escrituras: API, seed, scripts, SQL directo, borrados
+  en cascada
+- NOTIFY se entrega recién en el COMMIT: una transacción revertida no
+  invalida nada, y los otros workers no releen antes de que el dato exista
+- No hace falta un servidor de cache aparte: alcanza con el Postgres que
+  ya se usa
+
+Decisión de diseño: Polling corto en vez de esperar el socket
+- pg8000 solo procesa notificaciones mientras lee una respuesta: el thread
+  ejecuta SELECT 1 cada INVALIDACION_INTERVALO_SEGUNDOS en una conexión
+  propia (en autocommit, no toca la conexión compartida de los requests)
+- Si la conexión se cae, o se acumulan más eventos de los que se pueden
+  guardar, se vacían todos los caches: se pudieron perder eventos
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from src.infrastructure.cache.repositorios_cacheados import (
+    CACHE_CLASES,
+    CACHE_CURSOS,
+    CACHE_TPS,
+    INDICE_INSCRIPCIONES,
+    limpiar_caches,
+)
+
+
+CANAL = "invalidacion_cache"
+
+_INTERVALO_SEGUNDOS = float(os.environ.get("INVALIDACION_INTERVALO_SEGUNDOS", "0.5"))
+_MAX_EVENTOS_PENDIENTES = 10000
+
+Manejador = Callable[[dict], None]
+
+# tabla -> funciones que reciben el evento {"tabla": ..., <claves>}
+_MANEJADORES: Dict[str, List[Manejador]] = {}
+
+
+def registrar_manejador(tabla: str, manejador: Manejador) -> None:
+    """
+    Registra una función a ejecutar cuando cambia una fila de la tabla.
+
+    El evento trae solo las columnas clave del trigger; si no trae ninguna
+    (TRUNCATE), el manejador debe descartar todo lo de esa tabla.
+    """
+    _MANEJADORES.setdefault(tabla, []).append(manejador)
+
+
+def aplicar_evento(payload: str) -> None:
+    """Decodifica un payload de NOTIFY y ejecuta los manejadores de su tabla"""
+    try:
+        evento = json.loads(payload)
+        tabla = evento["tabla"]
+    except (ValueError, KeyError, TypeError):
+        print(f"⚠️ Evento de invalidación inválido: {payload!r}")
+        return
+
+    for manejador in _MANEJADORES.get(tabla, ()):
+        manejador(evento)
+
+
+def _por_id(cache) -> Manejador:
+    def manejador(evento: dict) -> None:
+        if evento.get("id") is None:
+            cache.limpiar()
+        else:
+            cache.invalidar(evento["id"])
+    return manejador
+
+
+def _invalidar_inscripciones_curso(evento: dict) -> None:
+    if evento.get("curso_id") is None:
+        INDICE_INSCRIPCIONES.limpiar()
+    else:
+        INDICE_INSCRIPCIONES.invalidar(evento["curso_id"])
+
+
+def _invalidar_curso(evento: dict) -> None:
+    # Si se borró el curso, también se borraron sus inscripciones
+    _invalidar_inscripciones_curso({"curso_id": evento.get("id")})
+
+
+def _quitar_alumno(evento: dict) -> None:
+    if evento.get("id") is not None:
+        INDICE_INSCRIPCIONES.quitar_alumno(evento["id"])
+
+
+registrar_manejador("curso", _por_id(CACHE_CURSOS))
+registrar_manejador("curso", _invalidar_curso)
+registrar_manejador("clase", _por_id(CACHE_CLASES))
+registrar_manejador("trabajo_practico", _por_id(CACHE_TPS))
+registrar_manejador("inscripcion", _invalidar_inscripciones_curso)
+registrar_manejador("alumno", _quitar_alumno)
+# registro_asistencia y entrega_tp no publican eventos: quien agregue un
+# cache de esas tablas necesita su trigger (ver schema_postgres.sql) y su manejador
+
+
+class EscuchaInvalidaciones:
+    """
+    Thread que escucha el canal de invalidación y aplica los eventos.
+
+    Args:
+        crear_conexion: Función que abre una conexión nueva a PostgreSQL
+        intervalo_segundos: Cada cuánto se consultan eventos pendientes
+    """
+
+    def __init__(self, crear_conexion: Callable, intervalo_segundos: float = _INTERVALO_SEGUNDOS):
+        self.crear_conexion = crear_conexion
+        self.intervalo_segundos = intervalo_segundos
+        self._detener = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.conectado = False
+        self.eventos = 0
+        self.reconexiones = 0
+        self.desbordes = 0
+
+    def iniciar(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._detener.clear()
+        self._thread = threading.Thread(target=self._ejecutar, name="escucha-invalidaciones", daemon=True)
+        self._thread.start()
+
+    def detener(self, timeout: float = 2.0) -> None:
+        self._detener.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _ejecutar(self) -> None:
+        espera = 1.0
+        primera = True
+        while not self._detener.is_set():
+            conexion = None
+            try:
+                conexion = self.crear_conexion()
+                conexion.autocommit = True
+                # El deque por defecto de pg8000 guarda solo 100 eventos
+                conexion.notifications = deque(maxlen=_MAX_EVENTOS_PENDIENTES)
+                cursor = conexion.cursor()
+                cursor.execute(f"LISTEN {CANAL}")
+                if not primera:
+                    # Mientras estuvo desconectado se pudieron perder eventos
+                    self.reconexiones += 1
+                    limpiar_caches()
+                primera = False
+                self.conectado = True
+                espera = 1.0
+
+                while not self._detener.is_set():
+                    cursor.execute("SELECT 1")
+                    self._procesar(conexion.notifications)
+                    self._detener.wait(self.intervalo_segundos)
+            except Exception as e:
+                print(f"⚠️ Escucha de invalidaciones desconectada: {e}")
+            finally:
+                self.conectado = False
+                if conexion is not None:
+                    try:
+                        conexion.close()
+                    except Exception:
+                        pass
+            self._detener.wait(espera)
+            espera = min(espera * 2, 30.0)
+
+    def _procesar(self, pendientes: deque) -> None:
+        if len(pendientes) == pendientes.maxlen:
+            # Se descartaron eventos viejos: no se sabe qué se perdió
+            self.desbordes += 1
+            pendientes.clear()
+            limpiar_caches()
+            return
+        while pendientes:
+            _, canal, payload = pendientes.popleft()
+            if canal == CANAL:
+                self.eventos += 1
+                aplicar_evento(payload)
+
+    def estadisticas(self) -> Dict[str, object]:
+        return {
+            "activo": self._thread is not None and self._thread.is_alive(),
+            "conectado": self.conectado,
+            "eventos": self.eventos,
+            "reconexiones": self.reconexiones,
+            "desbordes": self.desbordes,
+            "intervalo_segundos": self.intervalo_segundos,
+        }
+
+
+_escucha: Optional[EscuchaInvalidaciones] = None
+
+
+def iniciar_escucha() -> EscuchaInvalidaciones:
+    """Inicia (una vez por proceso) el thread de escucha"""
+    global _escucha
+    if _escucha is None:
+        from src.infrastructure.database.connection import crear_conexion
+        _escucha = EscuchaInvalidaciones(crear_conexion)
+    _escucha.iniciar()
+    return _escucha
+
+
+def detener_escucha() -> None:
+    if _escucha is not None:
+        _escucha.detener()
+
+
+def estadisticas_escucha() -> Optional[Dict[str, object]]:
+    """Estado del thread de escucha (None si no se inició en este proceso)"""
+    return _escucha.estadisticas() if _escucha is not None else None
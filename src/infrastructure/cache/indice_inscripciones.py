@@ -0,0 +1,163 @@
+"""
+Índice de Inscripciones en Memoria
+Sistema de Seguimiento de Alumnos
+
+Conjunto de alumno_ids inscriptos por curso, para responder "¿el alumno X
+está inscripto en el curso Y?" sin ir a la BD. Esa validación se hace en
+cada registro de asistencia, participación y entrega.
+
+Decisión de diseño: frozenset por curso, carga perezosa
+- Un curso se carga completo con UNA consulta la primera vez que se lo
+  consulta (SELECT alumno_id ... WHERE curso_id = ?)
+- frozenset: pertenencia O(1) y validación de un listado entero con una
+  intersección de conjuntos, sin ordenar ni buscar
+- Inmutable: las altas/bajas reemplazan el conjunto bajo el lock, los
+  lectores nunca ven uno a medio modificar
+- Contador de escrituras: si hubo un alta/baja mientras se cargaba desde
+  la BD, la carga no se guarda (podría haber leído el estado anterior). Las
+  inscripciones cambian poco, así que descartar de más es barato
+- Acotado en cursos (LRU) y con TTL, igual que CacheLRUTTL, para tolerar
+  escrituras que no pasan por la API (scripts, SQL directo)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Tuple
+
+
+class IndiceInscripciones:
+    """
+    Índice curso_id -> alumno_ids inscriptos.
+
+    Args:
+        nombre: Identificador para estadísticas
+        max_cursos: Cantidad máxima de cursos cargados (se descarta el menos usado)
+        ttl_segundos: Vida máxima de un curso cargado
+    """
+
+    def __init__(self, nombre: str, max_cursos: int = 1024, ttl_segundos: float = 300.0):
+        self.nombre = nombre
+        self.max_cursos = max_cursos
+        self.ttl_segundos = ttl_segundos
+        self._cursos: "OrderedDict[int, Tuple[float, FrozenSet[int]]]" = OrderedDict()
+        self._escrituras = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.cargas = 0
+        self.expiradas = 0
+        self.desalojadas = 0
+        self.invalidaciones = 0
+
+    def _vigente(self, curso_id: int):
+        """Conjunto cargado del curso o None (llamar con el lock tomado)"""
+        entrada = self._cursos.get(curso_id)
+        if entrada is None:
+            return None
+        vence, alumnos = entrada
+        if vence < time.monotonic():
+            del self._cursos[curso_id]
+            self.expiradas += 1
+            return None
+        self._cursos.move_to_end(curso_id)
+        return alumnos
+
+    def _guardar(self, curso_id: int, alumnos: FrozenSet[int]) -> None:
+        """Guarda el conjunto de un curso (llamar con el lock tomado)"""
+        self._cursos[curso_id] = (time.monotonic() + self.ttl_segundos, alumnos)
+        self._cursos.move_to_end(curso_id)
+        while len(self._cursos) > self.max_cursos:
+            self._cursos.popitem(last=False)
+            self.desalojadas += 1
+
+    def alumnos_de(
+        self,
+        curso_id: int,
+        cargar: Callable[[int], Iterable[int]],
+        guardar: bool = True
+    ) -> FrozenSet[int]:
+        """
+        Devuelve los alumno_ids inscriptos en un curso, cargándolos si hace falta.
+
+        Args:
+            curso_id: ID del curso
+            cargar: Función curso_id -> alumno_ids (una consulta a la BD)
+            guardar: False para no guardar lo cargado (ej: dentro de una transacción)
+
+        Returns:
+            FrozenSet[int]: alumno_ids inscriptos
+        """
+        with self._lock:
+            alumnos = self._vigente(curso_id)
+            if alumnos is not None:
+                self.hits += 1
+                return alumnos
+            self.misses += 1
+            escrituras = self._escrituras
+
+        # La consulta se hace fuera del lock: no bloquear a los otros cursos
+        alumnos = frozenset(cargar(curso_id))
+
+        with self._lock:
+            self.cargas += 1
+            if guardar and self._escrituras == escrituras:
+                self._guardar(curso_id, alumnos)
+        return alumnos
+
+    def agregar(self, curso_id: int, alumno_id: int) -> None:
+        """Registra una inscripción confirmada (si el curso no está cargado, no hace nada)"""
+        with self._lock:
+            self._escrituras += 1
+            alumnos = self._vigente(curso_id)
+            if alumnos is not None:
+                self._guardar(curso_id, alumnos | {alumno_id})
+
+    def quitar(self, curso_id: int, alumno_id: int) -> None:
+        """Registra una baja confirmada"""
+        with self._lock:
+            self._escrituras += 1
+            alumnos = self._vigente(curso_id)
+            if alumnos is not None:
+                self._guardar(curso_id, alumnos - {alumno_id})
+
+    def quitar_alumno(self, alumno_id: int) -> None:
+        """Quita a un alumno de todos los cursos cargados (ej: alumno eliminado)"""
+        with self._lock:
+            self._escrituras += 1
+            for curso_id, (vence, alumnos) in list(self._cursos.items()):
+                if alumno_id in alumnos:
+                    self._cursos[curso_id] = (vence, alumnos - {alumno_id})
+
+    def invalidar(self, curso_id: int) -> None:
+        """Descarta un curso: la próxima consulta lo relee de la BD"""
+        with self._lock:
+            self._escrituras += 1
+            if self._cursos.pop(curso_id, None) is not None:
+                self.invalidaciones += 1
+
+    def limpiar(self) -> None:
+        """Descarta todos los cursos (las estadísticas se conservan)"""
+        with self._lock:
+            self.invalidaciones += len(self._cursos)
+            self._escrituras += 1
+            self._cursos.clear()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """Estadísticas de uso del índice"""
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                "entradas": len(self._cursos),
+                "inscripciones": sum(len(alumnos) for _, alumnos in self._cursos.values()),
+                "max_entradas": self.max_cursos,
+                "ttl_segundos": self.ttl_segundos,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / consultas, 4) if consultas else 0.0,
+                "cargas": self.cargas,
+                "expiradas": self.expiradas,
+                "desalojadas": self.desalojadas,
+                "invalidaciones": self.invalidaciones,
+            }
+
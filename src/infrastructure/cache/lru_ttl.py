@@ -0,0 +1,118 @@
+"""
+Cache LRU con TTL
+Sistema de Seguimiento de Alumnos
+
+Cache en memoria del proceso, acotado en cantidad de entradas (LRU) y en
+antigüedad (TTL), con estadísticas de aciertos.
+
+Decisión de diseño: OrderedDict + lock en vez de functools.lru_cache
+- lru_cache no tiene TTL ni permite invalidar una sola clave
+- move_to_end/popitem(last=False) dan LRU en O(1)
+- El lock hace seguro el uso desde el threadpool de FastAPI
+- Contador de invalidaciones (generación): quien lee de la BD sin el lock
+  descarta su resultado si hubo una invalidación mientras tanto
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class CacheLRUTTL:
+    """
+    Cache LRU con expiración por TTL.
+    
+    Args:
+        nombre: Identificador para estadísticas
+        max_entradas: Cantidad máxima de entradas (se descarta la menos usada)
+        ttl_segundos: Vida máxima de una entrada
+    """
+    
+    def __init__(self, nombre: str, max_entradas: int = 1024, ttl_segundos: float = 300.0):
+        self.nombre = nombre
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self._datos: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._escrituras = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expiradas = 0
+        self.desalojadas = 0
+        self.invalidaciones = 0
+    
+    def obtener(self, clave: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca una clave.
+        
+        Returns:
+            Tuple[bool, Any]: (encontrado, valor)
+        """
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                self.misses += 1
+                return False, None
+            
+            vence, valor = entrada
+            if vence < time.monotonic():
+                del self._datos[clave]
+                self.expiradas += 1
+                self.misses += 1
+                return False, None
+            
+            self._datos.move_to_end(clave)
+            self.hits += 1
+            return True, valor
+    
+    def generacion(self) -> int:
+        """Cantidad de invalidaciones hasta ahora (tomarla antes de leer de la BD)"""
+        with self._lock:
+            return self._escrituras
+    
+    def guardar(self, clave: Hashable, valor: Any, generacion: Optional[int] = None) -> None:
+        """
+        Guarda (o reemplaza) una entrada, desalojando la menos usada si hace falta.
+        
+        Con generacion (ver generacion()), no guarda nada si hubo una
+        invalidación desde entonces: el valor leído puede ser el viejo.
+        """
+        with self._lock:
+            if generacion is not None and generacion != self._escrituras:
+                return
+            self._datos[clave] = (time.monotonic() + self.ttl_segundos, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+                self.desalojadas += 1
+    
+    def invalidar(self, clave: Hashable) -> None:
+        """Elimina una entrada (si existe)"""
+        with self._lock:
+            self._escrituras += 1
+            if self._datos.pop(clave, None) is not None:
+                self.invalidaciones += 1
+    
+    def limpiar(self) -> None:
+        """Elimina todas las entradas (las estadísticas se conservan)"""
+        with self._lock:
+            self.invalidaciones += len(self._datos)
+            self._escrituras += 1
+            self._datos.clear()
+    
+    def estadisticas(self) -> Dict[str, Any]:
+        """Estadísticas de uso del cache"""
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                "entradas": len(self._datos),
+                "max_entradas": self.max_entradas,
+                "ttl_segundos": self.ttl_segundos,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / consultas, 4) if consultas else 0.0,
+                "expiradas": self.expiradas,
+                "desalojadas": self.desalojadas,
+                "invalidaciones": self.invalidaciones,
+            }
@@ -0,0 +1,158 @@
+"""
+Mapa de Identidad por Request y Cargador por Lotes
+Sistema de Seguimiento de Alumnos
+
+Dentro de una misma request las mismas filas se piden varias veces: el
+servicio valida que exista la clase y después la vuelve a leer, un batch
+repite el mismo curso en cada sub-request, una carga masiva busca la
+misma clase para cada alumno. El mapa de identidad guarda lo ya leído
+durante la request, y el cargador junta los IDs pendientes en una sola
+consulta WHERE id = ANY(...).
+
+Decisión de diseño: ContextVar en vez de pasar el mapa por parámetro
+- Los servicios y repositorios no cambian de firma: el mapa se abre en un
+  middleware y los repositorios lo encuentran con mapa_actual()
+- FastAPI copia el contexto a los threads del threadpool: los endpoints
+  sync ven el mismo mapa que abrió el middleware
+- Sin request (scripts, tests) no hay mapa y todo va directo a la BD
+- Vive lo que dura la request: no hay TTL ni datos de otras requests. Las
+  escrituras invalidan la entrada
+- Se entregan copias de lo guardado: los servicios modifican la entidad
+  antes de validar/actualizar y un fallo no debe ensuciar el mapa (en un
+  batch lo siguen usando las sub-requests siguientes)
+"""
+
+import copy
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+_mapa_request: ContextVar[Optional["MapaIdentidad"]] = ContextVar("mapa_identidad", default=None)
+
+
+class MapaIdentidad:
+    """Entidades leídas durante la request actual, por (tabla, id)"""
+
+    def __init__(self):
+        self._entidades: Dict[Tuple[str, Hashable], Any] = {}
+        self._pendientes: Dict[str, Set[Hashable]] = {}
+        # Los GET iniciales de un batch corren en paralelo y comparten el mapa
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.consultas = 0
+
+    def obtener(self, tabla: str, id: Hashable) -> Tuple[bool, Any]:
+        """
+        Returns:
+            Tuple[bool, Any]: (encontrado, entidad o None si se sabe que no existe)
+        """
+        with self._lock:
+            clave = (tabla, id)
+            if clave in self._entidades:
+                self.hits += 1
+                return True, self._entidades[clave]
+            return False, None
+
+    def guardar(self, tabla: str, id: Hashable, entidad: Any) -> None:
+        with self._lock:
+            self._entidades[(tabla, id)] = entidad
+
+    def invalidar(self, tabla: str, id: Hashable) -> None:
+        with self._lock:
+            self._entidades.pop((tabla, id), None)
+
+    def encolar(self, tabla: str, ids: Iterable[Hashable]) -> None:
+        """Anota IDs que se van a necesitar: se traen junto con la próxima carga"""
+        with self._lock:
+            pendientes = self._pendientes.setdefault(tabla, set())
+            pendientes.update(id for id in ids if (tabla, id) not in self._entidades)
+
+    def tomar_pendientes(self, tabla: str) -> Set[Hashable]:
+        with self._lock:
+            return self._pendientes.pop(tabla, set())
+
+
+def mapa_actual() -> Optional[MapaIdentidad]:
+    """Mapa de la request en curso (None fuera de una request)"""
+    return _mapa_request.get()
+
+
+@contextmanager
+def mapa_identidad() -> Iterator[MapaIdentidad]:
+    """Abre un mapa de identidad nuevo para el contexto actual"""
+    mapa = MapaIdentidad()
+    token = _mapa_request.set(mapa)
+    try:
+        yield mapa
+    finally:
+        _mapa_request.reset(token)
+
+
+class CargadorPorLotes:
+    """
+    Resuelve IDs de una tabla: primero el mapa de la request, y los que
+    faltan (más los encolados) con UNA llamada a cargar_muchos.
+
+    Args:
+        tabla: Nombre de la tabla (clave del mapa)
+        cargar_muchos: Función ids -> {id: entidad} (ej: repo.obtener_por_ids)
+    """
+
+    def __init__(self, tabla: str, cargar_muchos: Callable[[List[Hashable]], Dict[Hashable, Any]]):
+        self.tabla = tabla
+        self.cargar_muchos = cargar_muchos
+
+    def encolar(self, ids: Iterable[Hashable]) -> None:
+        """Anota IDs para traerlos en la próxima consulta (sin consultar ahora)"""
+        mapa = mapa_actual()
+        if mapa is not None:
+            mapa.encolar(self.tabla, ids)
+
+    def obtener(self, id: Hashable) -> Any:
+        """Una entidad por ID (o None si no existe)"""
+        return self.obtener_muchos((id,)).get(id)
+
+    def obtener_muchos(self, ids: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Varias entidades por ID.
+
+        Returns:
+            Dict: {id: entidad} solo con los que existen
+        """
+        ids = list(dict.fromkeys(ids))
+        mapa = mapa_actual()
+        if mapa is None:
+            return self.cargar_muchos(ids)
+
+        resultado: Dict[Hashable, Any] = {}
+        faltantes: List[Hashable] = []
+        for id in ids:
+            encontrado, entidad = mapa.obtener(self.tabla, id)
+            if not encontrado:
+                faltantes.append(id)
+            elif entidad is not None:
+                resultado[id] = copy.copy(entidad)
+
+        if faltantes:
+            pedidos = set(faltantes) | mapa.tomar_pendientes(self.tabla)
+            mapa.consultas += 1
+            cargados = self.cargar_muchos(list(pedidos))
+            for id in pedidos:
+                # También se anotan los que no existen: no se vuelven a consultar
+                mapa.guardar(self.tabla, id, cargados.get(id))
+            for id in faltantes:
+                if cargados.get(id) is not None:
+                    resultado[id] = copy.copy(cargados[id])
+        return resultado
+
+    def invalidar(self, id: Hashable) -> None:
+        mapa = mapa_actual()
+        if mapa is not None:
+            mapa.invalidar(self.tabla, id)
+
+    def guardar(self, id: Hashable, entidad: Any) -> None:
+        mapa = mapa_actual()
+        if mapa is not None:
+            mapa.guardar(self.tabla, id, entidad)
@@ -0,0 +1,393 @@
+"""
+Repositorios con Cache (Read-Through)
+Sistema de Seguimiento de Alumnos
+
+Envoltorios de CursoRepositoryBase, ClaseRepositoryBase y
+TrabajoPracticoRepositoryBase que cachean obtener_por_id, de
+InscripcionRepositoryBase que responde existe() con el índice de
+inscripciones en memoria, y de AlumnoRepositoryBase que evita releer
+alumnos dentro de una misma request.
+
+Decisión de diseño: Patrón Decorator sobre la interfaz base
+- Los servicios reciben un *RepositoryBase: no se enteran del cache
+- Sirve para cualquier implementación (Postgres, SQLite)
+- obtener_por_id es lo que se consulta en cada validación de escritura
+  (curso de una clase, clase de una asistencia, TP de una entrega) y esas
+  filas casi nunca cambian
+- actualizar/eliminar invalidan la entrada (write-through): el próximo
+  obtener_por_id relee de la BD. Una lectura que empezó antes de la
+  invalidación no guarda lo que trajo (generación del cache), y dentro de
+  transaccion() se invalida otra vez después del COMMIT
+- Se devuelven copias: los servicios modifican la entidad antes de
+  actualizar y un fallo no debe dejar el cache con datos sucios
+- Dentro de transaccion() no se guardan entradas: la transacción podría
+  revertirse y el cache quedaría con datos que nunca existieron
+- Delante del cache va el mapa de identidad de la request
+  (CargadorPorLotes): la misma fila se resuelve una vez por request y
+  obtener_por_ids trae todo lo que falta con una sola consulta
+"""
+
+import copy
+import os
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.domain.entities.alumno import Alumno
+from src.domain.entities.clase import Clase
+from src.domain.entities.curso import Curso
+from src.domain.entities.inscripcion import Inscripcion
+from src.domain.entities.trabajo_practico import TrabajoPractico
+from src.infrastructure.cache.indice_inscripciones import IndiceInscripciones
+from src.infrastructure.cache.lru_ttl import CacheLRUTTL
+from src.infrastructure.cache.mapa_identidad import CargadorPorLotes
+from src.infrastructure.database.connection import al_confirmar, en_transaccion
+from src.infrastructure.repositories.base.alumno_repository_base import AlumnoRepositoryBase
+from src.infrastructure.repositories.base.clase_repository_base import ClaseRepositoryBase
+from src.infrastructure.repositories.base.curso_repository_base import CursoRepositoryBase
+from src.infrastructure.repositories.base.inscripcion_repository_base import InscripcionRepositoryBase
+from src.infrastructure.repositories.base.tp_repository_base import TrabajoPracticoRepositoryBase
+
+
+_MAX_ENTRADAS = int(os.environ.get("CACHE_MAX_ENTRADAS", "1024"))
+_TTL_SEGUNDOS = float(os.environ.get("CACHE_TTL_SEGUNDOS", "300"))
+
+# Caches compartidos por todo el proceso (los repositorios se crean por request)
+CACHE_CURSOS = CacheLRUTTL("cursos", _MAX_ENTRADAS, _TTL_SEGUNDOS)
+CACHE_CLASES = CacheLRUTTL("clases", _MAX_ENTRADAS, _TTL_SEGUNDOS)
+CACHE_TPS = CacheLRUTTL("tps", _MAX_ENTRADAS, _TTL_SEGUNDOS)
+INDICE_INSCRIPCIONES = IndiceInscripciones("inscripciones", _MAX_ENTRADAS, _TTL_SEGUNDOS)
+
+CACHES: Dict[str, CacheLRUTTL] = {
+    cache.nombre: cache for cache in (CACHE_CURSOS, CACHE_CLASES, CACHE_TPS)
+}
+
+
+def estadisticas_caches() -> Dict[str, dict]:
+    """Estadísticas de todos los caches de entidades"""
+    estadisticas = {nombre: cache.estadisticas() for nombre, cache in CACHES.items()}
+    estadisticas[INDICE_INSCRIPCIONES.nombre] = INDICE_INSCRIPCIONES.estadisticas()
+    return estadisticas
+
+
+def limpiar_caches() -> None:
+    """Vacía todos los caches (ej: después de borrados masivos por SQL directo)"""
+    for cache in CACHES.values():
+        cache.limpiar()
+    INDICE_INSCRIPCIONES.limpiar()
+
+
+def _leer_muchos(cache: CacheLRUTTL, ids: List[int], cargar_muchos) -> Dict[int, object]:
+    """Read-through: busca cada ID en el cache y carga los que faltan con una consulta"""
+    encontrados = {}
+    faltantes = []
+    for id in ids:
+        encontrado, entidad = cache.obtener(id)
+        if encontrado:
+            encontrados[id] = entidad
+        else:
+            faltantes.append(id)
+    if faltantes:
+        # Antes de leer: si mientras tanto se invalida algo, lo leído puede ser viejo
+        generacion = cache.generacion()
+        # No se cachean ausencias: un ID inexistente puede crearse después
+        cargados = cargar_muchos(faltantes)
+        if not en_transaccion():
+            for id, entidad in cargados.items():
+                cache.guardar(id, entidad, generacion)
+        encontrados.update(cargados)
+    return {id: copy.copy(entidad) for id, entidad in encontrados.items()}
+
+
+def _cargador(tabla: str, cache: CacheLRUTTL, repo) -> CargadorPorLotes:
+    """Mapa de identidad de la request -> cache del proceso -> BD"""
+    return CargadorPorLotes(tabla, lambda ids: _leer_muchos(cache, ids, repo.obtener_por_ids))
+
+
+def _invalidar_escritura(cache: CacheLRUTTL, cargador: CargadorPorLotes, id: int, cascada=None) -> None:
+    """
+    Invalida después de escribir y, dentro de transaccion(), otra vez
+    después del COMMIT: hasta entonces la BD sigue mostrando la fila vieja
+    y un lector puede haberla vuelto a cachear.
+    """
+    def invalidar():
+        cache.invalidar(id)
+        if cascada is not None:
+            cascada()
+
+    invalidar()
+    cargador.invalidar(id)
+    if en_transaccion():
+        al_confirmar(invalidar)
+
+
+class CursoRepositoryCache(CursoRepositoryBase):
+    """CursoRepositoryBase con cache de obtener_por_id"""
+
+    def __init__(self, repo: CursoRepositoryBase, cache: CacheLRUTTL = CACHE_CURSOS):
+        self.repo = repo
+        self.cache = cache
+        self.cargador = _cargador("curso", cache, repo)
+
+    def crear(self, curso: Curso) -> Curso:
+        creado = self.repo.crear(curso)
+        self.cargador.invalidar(creado.id)
+        return creado
+
+    def obtener_por_id(self, id: int) -> Optional[Curso]:
+        return self.cargador.obtener(id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Curso]:
+        return self.cargador.obtener_muchos(ids)
+
+    def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Curso]:
+        return self.repo.obtener_todos(limite, offset)
+
+    def buscar_por_anio_y_cuatrimestre(self, anio: int, cuatrimestre: int) -> List[Curso]:
+        return self.repo.buscar_por_anio_y_cuatrimestre(anio, cuatrimestre)
+
+    def actualizar(self, curso: Curso) -> Curso:
+        try:
+            return self.repo.actualizar(curso)
+        finally:
+            _invalidar_escritura(self.cache, self.cargador, curso.id)
+
+    def eliminar(self, id: int) -> bool:
+        def cascada():
+            # Las clases, TPs e inscripciones del curso se borran en cascada en la BD
+            CACHE_CLASES.limpiar()
+            CACHE_TPS.limpiar()
+            INDICE_INSCRIPCIONES.invalidar(id)
+
+        try:
+            return self.repo.eliminar(id)
+        finally:
+            _invalidar_escritura(self.cache, self.cargador, id, cascada)
+
+
+class ClaseRepositoryCache(ClaseRepositoryBase):
+    """ClaseRepositoryBase con cache de obtener_por_id"""
+
+    def __init__(self, repo: ClaseRepositoryBase, cache: CacheLRUTTL = CACHE_CLASES):
+        self.repo = repo
+        self.cache = cache
+        self.cargador = _cargador("clase", cache, repo)
+
+    def crear(self, clase: Clase) -> Clase:
+        creado = self.repo.crear(clase)
+        self.cargador.invalidar(creado.id)
+        return creado
+
+    def obtener_por_id(self, id: int) -> Optional[Clase]:
+        return self.cargador.obtener(id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Clase]:
+        return self.cargador.obtener_muchos(ids)
+
+    def obtener_por_curso(self, curso_id: int) -> List[Clase]:
+        return self.repo.obtener_por_curso(curso_id)
+
+    def obtener_por_fecha(self, curso_id: int, fecha: date) -> Optional[Clase]:
+        return self.repo.obtener_por_fecha(curso_id, fecha)
+
+    def obtener_recientes(self, limite: int, docente: Optional[str] = None) -> List[dict]:
+        return self.repo.obtener_recientes(limite, docente)
+
+    def actualizar(self, clase: Clase) -> Clase:
+        try:
+            return self.repo.actualizar(clase)
+        finally:
+            _invalidar_escritura(self.cache, self.cargador, clase.id)
+
+    def eliminar(self, id: int) -> bool:
+        try:
+            return self.repo.eliminar(id)
+        finally:
+            _invalidar_escritura(self.cache, self.cargador, id)
+
+
+class TrabajoPracticoRepositoryCache(TrabajoPracticoRepositoryBase):
+    """TrabajoPracticoRepositoryBase con cache de obtener_por_id"""
+
+    def __init__(self, repo: TrabajoPracticoRepositoryBase, cache: CacheLRUTTL = CACHE_TPS):
+        self.repo = repo
+        self.cache = cache
+        self.cargador = _cargador("trabajo_practico", cache, repo)
+
+    def crear(self, tp: TrabajoPractico) -> TrabajoPractico:
+        creado = self.repo.crear(tp)
+        self.cargador.invalidar(creado.id)
+        return creado
+
+    def obtener_por_id(self, id: int) -> Optional[TrabajoPractico]:
+        return self.cargador.obtener(id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, TrabajoPractico]:
+        return self.cargador.obtener_muchos(ids)
+
+    def obtener_por_curso(self, curso_id: int) -> List[TrabajoPractico]:
+        return self.repo.obtener_por_curso(curso_id)
+
+    def obtener_todos(self) -> List[TrabajoPractico]:
+        return self.repo.obtener_todos()
+
+    def actualizar(self, tp: TrabajoPractico) -> TrabajoPractico:
+        try:
+            return self.repo.actualizar(tp)
+        finally:
+            _invalidar_escritura(self.cache, self.cargador, tp.id)
+
+    def eliminar(self, id: int) -> bool:
+        try:
+            return self.repo.eliminar(id)
+        finally:
+            _invalidar_escritura(self.cache, self.cargador, id)
+
+
+class InscripcionRepositoryIndexada(InscripcionRepositoryBase):
+    """
+    InscripcionRepositoryBase que responde existe() desde el índice en memoria.
+
+    - La primera consulta de un curso lo carga con obtener_alumno_ids_por_curso
+    - crear/eliminar actualizan el índice después de escribir en la BD
+    - Dentro de transaccion() el índice no se toca: se invalida el curso y se
+      consulta la BD, porque la transacción puede revertirse. Se invalida
+      otra vez después del COMMIT: hasta entonces un lector puede volver a
+      cargar la lista vieja
+    """
+
+    def __init__(self, repo: InscripcionRepositoryBase, indice: IndiceInscripciones = INDICE_INSCRIPCIONES):
+        self.repo = repo
+        self.indice = indice
+
+    def _invalidar_en_transaccion(self, curso_id: int) -> None:
+        self.indice.invalidar(curso_id)
+        al_confirmar(lambda: self.indice.invalidar(curso_id))
+
+    def _alumnos_de(self, curso_id: int):
+        return self.indice.alumnos_de(
+            curso_id,
+            self.repo.obtener_alumno_ids_por_curso,
+            guardar=not en_transaccion()
+        )
+
+    def crear(self, inscripcion: Inscripcion) -> Inscripcion:
+        if en_transaccion():
+            try:
+                return self.repo.crear(inscripcion)
+            finally:
+                self._invalidar_en_transaccion(inscripcion.curso_id)
+        creada = self.repo.crear(inscripcion)
+        self.indice.agregar(creada.curso_id, creada.alumno_id)
+        return creada
+
+    def obtener_por_id(self, id: int) -> Optional[Inscripcion]:
+        return self.repo.obtener_por_id(id)
+
+    def obtener_por_alumno(self, alumno_id: int) -> List[Inscripcion]:
+        return self.repo.obtener_por_alumno(alumno_id)
+
+    def obtener_por_curso(self, curso_id: int) -> List[Inscripcion]:
+        return self.repo.obtener_por_curso(curso_id)
+
+    def existe(self, alumno_id: int, curso_id: int) -> bool:
+        return alumno_id in self._alumnos_de(curso_id)
+
+    def obtener_alumno_ids_por_curso(self, curso_id: int) -> List[int]:
+        return list(self._alumnos_de(curso_id))
+
+    def filtrar_inscriptos(self, curso_id: int, alumno_ids: Iterable[int]) -> Set[int]:
+        return set(self._alumnos_de(curso_id).intersection(alumno_ids))
+
+    def inscribir_pares(self, pares: Iterable[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+        return self._inscribir_masivo(self.repo.inscribir_pares, pares)
+
+    def inscribir_cohorte(self, cohorte: int, curso_ids: Iterable[int]) -> Tuple[int, List[Tuple[int, int]]]:
+        return self._inscribir_masivo(lambda ids: self.repo.inscribir_cohorte(cohorte, ids), list(curso_ids))
+
+    def _inscribir_masivo(self, inscribir, argumento) -> Tuple[int, List[Tuple[int, int]]]:
+        candidatos, creados = inscribir(argumento)
+        if en_transaccion():
+            for curso_id in {curso_id for _, curso_id in creados}:
+                self._invalidar_en_transaccion(curso_id)
+        else:
+            for alumno_id, curso_id in creados:
+                self.indice.agregar(curso_id, alumno_id)
+        return candidatos, creados
+
+    def eliminar(self, id: int) -> bool:
+        # Se necesita el par (alumno, curso) para actualizar el índice
+        inscripcion = self.repo.obtener_por_id(id)
+        try:
+            return self.repo.eliminar(id)
+        finally:
+            if inscripcion is not None:
+                if en_transaccion():
+                    self._invalidar_en_transaccion(inscripcion.curso_id)
+                else:
+                    self.indice.quitar(inscripcion.curso_id, inscripcion.alumno_id)
+
+
+class AlumnoRepositoryCache(AlumnoRepositoryBase):
+    """
+    AlumnoRepositoryBase con mapa de identidad por request.
+
+    - Los alumnos no se cachean entre requests (son muchos y se editan más
+      que cursos o clases), solo se evita releerlos dentro de la misma request
+    - Al eliminar, quita al alumno del índice de inscripciones
+    """
+
+    def __init__(self, repo: AlumnoRepositoryBase, indice: IndiceInscripciones = INDICE_INSCRIPCIONES):
+        self.repo = repo
+        self.indice = indice
+        self.cargador = CargadorPorLotes("alumno", repo.obtener_por_ids)
+
+    def crear(self, alumno: Alumno) -> Alumno:
+        creado = self.repo.crear(alumno)
+        self.cargador.invalidar(creado.id)
+        return creado
+
+    def crear_lote(self, alumnos: List[Alumno], actualizar_existentes: bool = False) -> Tuple[List[Alumno], List[Alumno]]:
+        creados, actualizados = self.repo.crear_lote(alumnos, actualizar_existentes)
+        # Los creados pueden estar en el mapa como ausentes (igual que en crear)
+        for alumno in creados + actualizados:
+            self.cargador.invalidar(alumno.id)
+        return creados, actualizados
+
+    def obtener_por_id(self, id: int) -> Optional[Alumno]:
+        return self.cargador.obtener(id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Alumno]:
+        return self.cargador.obtener_muchos(ids)
+
+    def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
+        return self.repo.obtener_por_dni(dni)
+
+    def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Alumno]:
+        return self.repo.obtener_todos(limite, offset)
+
+    def buscar_por_nombre(self, nombre: str) -> List[Alumno]:
+        return self.repo.buscar_por_nombre(nombre)
+
+    def obtener_por_cohorte(self, cohorte: int) -> List[Alumno]:
+        return self.repo.obtener_por_cohorte(cohorte)
+
+    def actualizar(self, alumno: Alumno) -> Alumno:
+        try:
+            return self.repo.actualizar(alumno)
+        finally:
+            self.cargador.invalidar(alumno.id)
+
+    def eliminar(self, id: int) -> bool:
+        try:
+            return self.repo.eliminar(id)
+        finally:
+            self.cargador.invalidar(id)
+            # Las inscripciones del alumno se borran en cascada en la BD
+            if en_transaccion():
+                self.indice.limpiar()
+                al_confirmar(self.indice.limpiar)
+            else:
+                self.indice.quitar_alumno(id)
+
+    def contar_total(self) -> int:
+        return self.repo.contar_total()
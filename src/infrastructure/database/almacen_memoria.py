@@ -0,0 +1,461 @@
+"""
+Almacén en Memoria
+Sistema de Seguimiento de Alumnos
+
+Backend DB_BACKEND=memoria: las tablas son diccionarios id -> entidad en el
+proceso, con índices hash sobre las mismas claves que el schema SQL. Sirve
+para medir el costo de servicios y serialización sin la BD de por medio y
+para correr la API completa sin PostgreSQL.
+
+Decisión de diseño: Entidades como filas, siempre copiadas
+- Cada tabla guarda entidades de dominio; se copian al entrar y al salir,
+  así un servicio que modifica lo que leyó no cambia el almacén sin pasar
+  por actualizar() (igual que con una BD)
+- copy.copy no llama a __init__: no se revalida lo que ya se validó
+
+Decisión de diseño: Índices declarados en ESQUEMA
+- Únicos: dni, (alumno_id, curso_id), (curso_id, numero_clase),
+  (alumno_id, clase_id), (trabajo_practico_id, alumno_id). Un duplicado
+  lanza ViolacionUnicidad, como el IntegrityError de la BD
+- No únicos: las FKs por las que se busca (curso_id, clase_id, ...). Se
+  usan también para los borrados en cascada (ON DELETE CASCADE)
+- Un índice no único es {clave: {id: None}}; las búsquedas devuelven las
+  filas en orden de id (el orden físico de una tabla recién cargada)
+
+Decisión de diseño: Transacciones con log de deshacer, sin aislamiento
+- transaccion() recibe una TransaccionMemoria: cada escritura anota cómo
+  deshacerse y el ROLLBACK las deshace en orden inverso (también hasta un
+  SAVEPOINT)
+- No hay aislamiento: lo escrito dentro de una transacción es visible para
+  el resto antes del COMMIT. Alcanza para benchmarks y pruebas; no es un
+  reemplazo de la BD para requests concurrentes que se pisan
+- Los ids consumidos no se devuelven en el ROLLBACK (como las secuencias)
+"""
+
+import copy
+import threading
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# tabla -> índices únicos, índices no únicos y FKs (columna -> tabla referenciada)
+ESQUEMA: Dict[str, Dict[str, Any]] = {
+    "alumno": {
+        "unicos": {"dni": ("dni",)},
+        "indices": {"cohorte": ("cohorte",)},
+        "referencias": {},
+    },
+    "curso": {
+        "unicos": {},
+        "indices": {},
+        "referencias": {},
+    },
+    "inscripcion": {
+        "unicos": {"alumno_curso": ("alumno_id", "curso_id")},
+        "indices": {"alumno_id": ("alumno_id",), "curso_id": ("curso_id",)},
+        "referencias": {"alumno_id": "alumno", "curso_id": "curso"},
+    },
+    "clase": {
+        "unicos": {"curso_numero": ("curso_id", "numero_clase")},
+        "indices": {"curso_id": ("curso_id",)},
+        "referencias": {"curso_id": "curso"},
+    },
+    "registro_asistencia": {
+        "unicos": {"alumno_clase": ("alumno_id", "clase_id")},
+        "indices": {"clase_id": ("clase_id",), "alumno_id": ("alumno_id",)},
+        "referencias": {"alumno_id": "alumno", "clase_id": "clase"},
+    },
+    "registro_participacion": {
+        "unicos": {},
+        "indices": {"clase_id": ("clase_id",), "alumno_id": ("alumno_id",)},
+        "referencias": {"alumno_id": "alumno", "clase_id": "clase"},
+    },
+    "trabajo_practico": {
+        "unicos": {},
+        "indices": {"curso_id": ("curso_id",)},
+        "referencias": {"curso_id": "curso"},
+    },
+    "entrega_tp": {
+        "unicos": {"tp_alumno": ("trabajo_practico_id", "alumno_id")},
+        "indices": {"trabajo_practico_id": ("trabajo_practico_id",), "alumno_id": ("alumno_id",)},
+        "referencias": {"trabajo_practico_id": "trabajo_practico", "alumno_id": "alumno"},
+    },
+}
+
+
+class ViolacionUnicidad(Exception):
+    """Ya existe una fila con la misma clave en un índice único"""
+
+    def __init__(self, tabla: str, indice: str):
+        super().__init__(f"unique constraint {tabla}.{indice}")
+        self.tabla = tabla
+        self.indice = indice
+
+
+class ViolacionReferencia(Exception):
+    """La FK apunta a una fila que no existe"""
+
+    def __init__(self, tabla: str, columna: str, valor: Any):
+        super().__init__(f"foreign key {tabla}.{columna} = {valor!r} no existe")
+        self.tabla = tabla
+        self.columna = columna
+
+
+class _Tabla:
+    """Filas de una tabla con sus índices"""
+
+    def __init__(self, nombre: str, definicion: Dict[str, Any]):
+        self.nombre = nombre
+        self.filas: Dict[int, Any] = {}
+        self.ultimo_id = 0
+        self.version = 0
+        self.referencias: Dict[str, str] = definicion["referencias"]
+        self.claves_unicas: Dict[str, Callable] = {n: attrgetter(*c) for n, c in definicion["unicos"].items()}
+        self.claves: Dict[str, Callable] = {n: attrgetter(*c) for n, c in definicion["indices"].items()}
+        self.unicos: Dict[str, Dict[Any, int]] = {n: {} for n in self.claves_unicas}
+        self.indices: Dict[str, Dict[Any, Dict[int, None]]] = {n: {} for n in self.claves}
+
+    def verificar_unicos(self, entidad, excepto: Optional[int] = None):
+        for nombre, clave in self.claves_unicas.items():
+            existente = self.unicos[nombre].get(clave(entidad))
+            if existente is not None and existente != excepto:
+                raise ViolacionUnicidad(self.nombre, nombre)
+
+    def indexar(self, entidad):
+        for nombre, clave in self.claves_unicas.items():
+            self.unicos[nombre][clave(entidad)] = entidad.id
+        for nombre, clave in self.claves.items():
+            self.indices[nombre].setdefault(clave(entidad), {})[entidad.id] = None
+
+    def desindexar(self, entidad):
+        for nombre, clave in self.claves_unicas.items():
+            self.unicos[nombre].pop(clave(entidad), None)
+        for nombre, clave in self.claves.items():
+            ids = self.indices[nombre].get(clave(entidad))
+            if ids is not None:
+                ids.pop(entidad.id, None)
+                if not ids:
+                    del self.indices[nombre][clave(entidad)]
+
+    def poner(self, entidad):
+        """Guarda la fila (nueva o reemplazando la del mismo id) sin verificar"""
+        anterior = self.filas.get(entidad.id)
+        if anterior is not None:
+            self.desindexar(anterior)
+        self.filas[entidad.id] = entidad
+        self.indexar(entidad)
+
+    def quitar(self, id: int):
+        entidad = self.filas.pop(id, None)
+        if entidad is not None:
+            self.desindexar(entidad)
+        return entidad
+
+
+class AlmacenMemoria:
+    """
+    Tablas en memoria con índices hash.
+
+    Los repositorios de repositories/memoria lo reciben como "conexión".
+    Todas las operaciones toman el mismo RLock: son atómicas entre threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tablas: Dict[str, _Tabla] = {nombre: _Tabla(nombre, definicion) for nombre, definicion in ESQUEMA.items()}
+        # tabla referenciada -> [(tabla hija, índice de la FK)] para el CASCADE
+        self._hijas: Dict[str, List[Tuple[str, str]]] = {nombre: [] for nombre in ESQUEMA}
+        for nombre, definicion in ESQUEMA.items():
+            for columna, referida in definicion["referencias"].items():
+                self._hijas[referida].append((nombre, columna))
+
+    # ------------------------------------------------------------------
+    # Escrituras (deshacer: log de la transacción en curso, si hay)
+    # ------------------------------------------------------------------
+
+    def insertar(self, tabla: str, entidad, deshacer: Optional[list] = None):
+        """
+        Inserta una copia de la entidad con un id nuevo.
+
+        Returns:
+            La copia guardada (la entidad recibida no se modifica)
+
+        Raises:
+            ViolacionUnicidad, ViolacionReferencia
+        """
+        with self._lock:
+            t = self._tablas[tabla]
+            self._verificar_referencias(t, entidad)
+            t.verificar_unicos(entidad)
+            t.ultimo_id += 1
+            fila = copy.copy(entidad)
+            fila.id = t.ultimo_id
+            t.poner(fila)
+            t.version += 1
+            if deshacer is not None:
+                deshacer.append((tabla, fila.id, None))
+            return copy.copy(fila)
+
+    def reemplazar(self, tabla: str, entidad, deshacer: Optional[list] = None) -> bool:
+        """
+        Reemplaza la fila con el id de la entidad.
+
+        Returns:
+            False si no existe una fila con ese id
+        """
+        with self._lock:
+            t = self._tablas[tabla]
+            anterior = t.filas.get(entidad.id)
+            if anterior is None:
+                return False
+            self._verificar_referencias(t, entidad)
+            t.verificar_unicos(entidad, excepto=entidad.id)
+            t.poner(copy.copy(entidad))
+            t.version += 1
+            if deshacer is not None:
+                deshacer.append((tabla, entidad.id, anterior))
+            return True
+
+    def eliminar(self, tabla: str, id: int, deshacer: Optional[list] = None) -> bool:
+        """Borra la fila y, en cascada, las que la referencian"""
+        with self._lock:
+            if id not in self._tablas[tabla].filas:
+                return False
+            self._eliminar_en_cascada(tabla, id, deshacer)
+            return True
+
+    def eliminar_donde(self, tabla: str, indice: str, clave: Any, deshacer: Optional[list] = None) -> int:
+        """Borra las filas con esa clave en el índice; devuelve cuántas"""
+        with self._lock:
+            ids = list(self._ids(tabla, indice, clave))
+            for id in ids:
+                self._eliminar_en_cascada(tabla, id, deshacer)
+            return len(ids)
+
+    def _eliminar_en_cascada(self, tabla: str, id: int, deshacer: Optional[list]):
+        for hija, columna in self._hijas[tabla]:
+            for hija_id in list(self._tablas[hija].indices[columna].get(id, ())):
+                self._eliminar_en_cascada(hija, hija_id, deshacer)
+        t = self._tablas[tabla]
+        fila = t.quitar(id)
+        t.version += 1
+        if deshacer is not None:
+            deshacer.append((tabla, id, fila))
+
+    def _verificar_referencias(self, t: _Tabla, entidad):
+        for columna, referida in t.referencias.items():
+            valor = getattr(entidad, columna)
+            if valor not in self._tablas[referida].filas:
+                raise ViolacionReferencia(t.nombre, columna, valor)
+
+    def deshacer(self, registro: list, hasta: int = 0):
+        """Revierte las escrituras anotadas en el log desde la posición `hasta`"""
+        with self._lock:
+            while len(registro) > hasta:
+                tabla, id, anterior = registro.pop()
+                t = self._tablas[tabla]
+                if anterior is None:
+                    t.quitar(id)
+                else:
+                    t.poner(anterior)
+                t.version += 1
+
+    def vaciar(self, reiniciar_ids: bool = True):
+        """Borra todas las filas (TRUNCATE ... RESTART IDENTITY)"""
+        with self._lock:
+            for t in self._tablas.values():
+                t.filas.clear()
+                for indice in (*t.unicos.values(), *t.indices.values()):
+                    indice.clear()
+                if reiniciar_ids:
+                    t.ultimo_id = 0
+                t.version += 1
+
+    # ------------------------------------------------------------------
+    # Lecturas (devuelven copias)
+    # ------------------------------------------------------------------
+
+    def obtener(self, tabla: str, id: int):
+        with self._lock:
+            fila = self._tablas[tabla].filas.get(id)
+            return copy.copy(fila) if fila is not None else None
+
+    def obtener_varios(self, tabla: str, ids: Iterable[int]) -> Dict[int, Any]:
+        with self._lock:
+            filas = self._tablas[tabla].filas
+            return {id: copy.copy(filas[id]) for id in set(ids) if id in filas}
+
+    def obtener_unico(self, tabla: str, indice: str, clave: Any):
+        """Fila con esa clave en un índice único, o None"""
+        with self._lock:
+            t = self._tablas[tabla]
+            id = t.unicos[indice].get(clave)
+            return copy.copy(t.filas[id]) if id is not None else None
+
+    def buscar(self, tabla: str, indice: str, clave: Any) -> List[Any]:
+        """Filas con esa clave en un índice no único, en orden de id"""
+        with self._lock:
+            filas = self._tablas[tabla].filas
+            return [copy.copy(filas[id]) for id in self._ids(tabla, indice, clave)]
+
+    def todos(self, tabla: str, filtro: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        with self._lock:
+            filas = self._tablas[tabla].filas.values()
+            return [copy.copy(fila) for fila in filas if filtro is None or filtro(fila)]
+
+    def existe(self, tabla: str, id: int) -> bool:
+        return id in self._tablas[tabla].filas
+
+    def contar(self, tabla: str) -> int:
+        return len(self._tablas[tabla].filas)
+
+    def ids(self, tabla: str) -> List[int]:
+        """Todos los IDs de la tabla (sin copiar filas)"""
+        with self._lock:
+            return list(self._tablas[tabla].filas)
+
+    def ids_por(self, tabla: str, indice: str, clave: Any) -> List[int]:
+        """IDs con esa clave en un índice no único (sin copiar filas)"""
+        with self._lock:
+            return list(self._ids(tabla, indice, clave))
+
+    def _ids(self, tabla: str, indice: str, clave: Any) -> Iterable[int]:
+        ids = self._tablas[tabla].indices[indice].get(clave)
+        if ids is None:
+            return ()
+        # Ordenados por id: el índice de una fila reemplazada queda al final
+        return sorted(ids)
+
+    def versiones(self, tablas: Iterable[str]) -> Dict[str, int]:
+        """Contador de cambios por tabla (como tabla_version)"""
+        with self._lock:
+            return {tabla: self._tablas[tabla].version if tabla in self._tablas else 0 for tabla in tablas}
+
+    @contextmanager
+    def atomico(self):
+        """
+        Bloque de varias escrituras que se deshace entero si falla
+        (lo que en SQL es una sentencia multi-fila o un DELETE + INSERT).
+
+        Yields:
+            TransaccionMemoria: usarla para escribir dentro del bloque
+        """
+        with self._lock:
+            transaccion = TransaccionMemoria(self)
+            try:
+                yield transaccion
+            except BaseException:
+                transaccion.cierre.rollback()
+                raise
+
+    # ------------------------------------------------------------------
+    # Interfaz de conexión
+    # ------------------------------------------------------------------
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def abrir_transaccion(self) -> "TransaccionMemoria":
+        return TransaccionMemoria(self)
+
+
+class TransaccionMemoria:
+    """
+    Conexión de transaccion() con el backend en memoria.
+
+    Expone la misma API que AlmacenMemoria (las escrituras se anotan en el
+    log de deshacer) y la de ConexionTransaccional: commit() no hace nada,
+    rollback() vuelve al último SAVEPOINT o marca revertir_al_final.
+    """
+
+    def __init__(self, almacen: AlmacenMemoria):
+        self._almacen = almacen
+        self._deshacer: list = []
+        self._savepoints: List[Tuple[str, int]] = []
+        self.revertir_al_final = False
+        self.al_confirmar: list = []
+        self.cierre = _CierreTransaccion(self)
+
+    def insertar(self, tabla: str, entidad):
+        return self._almacen.insertar(tabla, entidad, self._deshacer)
+
+    def reemplazar(self, tabla: str, entidad) -> bool:
+        return self._almacen.reemplazar(tabla, entidad, self._deshacer)
+
+    def eliminar(self, tabla: str, id: int) -> bool:
+        return self._almacen.eliminar(tabla, id, self._deshacer)
+
+    def eliminar_donde(self, tabla: str, indice: str, clave: Any) -> int:
+        return self._almacen.eliminar_donde(tabla, indice, clave, self._deshacer)
+
+    def vaciar(self, reiniciar_ids: bool = True):
+        raise RuntimeError("vaciar() no se puede deshacer: llamarlo fuera de transaccion()")
+
+    def __getattr__(self, nombre):
+        # Lecturas: directo al almacén
+        return getattr(self._almacen, nombre)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        if self._savepoints:
+            self._almacen.deshacer(self._deshacer, self._savepoints[-1][1])
+        else:
+            self.revertir_al_final = True
+
+    def close(self):
+        pass
+
+    def crear_savepoint(self) -> str:
+        nombre = f"sp_{len(self._savepoints) + 1}"
+        self._savepoints.append((nombre, len(self._deshacer)))
+        return nombre
+
+    def liberar_savepoint(self, nombre: str):
+        self._savepoints = [sp for sp in self._savepoints if sp[0] != nombre]
+
+    def cerrar_savepoint(self, nombre: str) -> bool:
+        # Sin SQL no hay transacción abortada: siempre se conserva lo hecho
+        self.liberar_savepoint(nombre)
+        return True
+
+    @contextmanager
+    def atomico(self):
+        with self._almacen._lock:
+            inicio = len(self._deshacer)
+            try:
+                yield self
+            except BaseException:
+                self._almacen.deshacer(self._deshacer, inicio)
+                raise
+
+    @contextmanager
+    def punto_de_guardado(self):
+        nombre = self.crear_savepoint()
+        try:
+            yield
+        finally:
+            self.liberar_savepoint(nombre)
+
+
+class _CierreTransaccion:
+    """COMMIT / ROLLBACK final de una TransaccionMemoria (lo usa transaccion())"""
+
+    def __init__(self, transaccion: TransaccionMemoria):
+        self._transaccion = transaccion
+
+    def commit(self):
+        self._transaccion._deshacer.clear()
+
+    def rollback(self):
+        self._transaccion._almacen.deshacer(self._transaccion._deshacer)
+
+    def close(self):
+        pass
@@ -0,0 +1,475 @@
+"""
+Conexión a SQLite Afinada para un Solo Servidor
+Sistema de Seguimiento de Alumnos
+
+Backend de DB_BACKEND=sqlite: la base es un archivo local y cada consulta
+se resuelve sin viajes de red. Pensado para una instalación de un solo
+campus (un servidor, un proceso de uvicorn).
+
+Configuración por entorno:
+- SQLITE_PATH: archivo de la base (por defecto data/seguimiento.db)
+- SQLITE_MMAP_MB: megabytes del archivo mapeados en memoria (256)
+- SQLITE_ESPERA_ESCRITURA: segundos máximos esperando el turno de escritura (30)
+
+Decisión de diseño: WAL, synchronous=NORMAL y mmap
+- En modo WAL los lectores no bloquean al escritor ni el escritor a los
+  lectores: cada lectura ve la última transacción confirmada
+- Con WAL, synchronous=NORMAL no hace fsync en cada COMMIT (solo en los
+  checkpoints): un corte de luz puede perder las últimas transacciones
+  pero nunca corrompe la base
+- mmap: las lecturas toman las páginas de la page cache del sistema
+  operativo sin copiarlas al cache de SQLite
+
+Decisión de diseño: Una conexión de lectura por thread y una cola de escritura
+- SQLite admite un solo escritor a la vez. Con varias conexiones
+  escribiendo, las que no consiguen el lock reintentan sin orden hasta el
+  busy_timeout y fallan con "database is locked"
+- Acá hay UNA conexión de escritura y las transacciones esperan su turno en
+  una cola FIFO: la primera sentencia de escritura toma el turno (BEGIN
+  IMMEDIATE) y commit()/rollback() lo liberan. Si esa sentencia falla, la
+  transacción se revierte y el turno se libera (como en PostgreSQL, una
+  transacción con error no sigue)
+- Las lecturas fuera de una transacción van por la conexión del thread
+  (query_only): nunca esperan a un escritor
+- Dentro de una transacción, las lecturas van por la conexión de escritura:
+  ven lo que la propia transacción escribió
+- El dueño del turno se guarda en una ContextVar: dos requests async en el
+  mismo thread no se confunden
+
+Decisión de diseño: Traducir el SQL escrito para PostgreSQL
+- Las consultas crudas (alertas, con-stats, versiones, administración)
+  usan %s y = ANY(%s): el cursor las traduce a ? y a
+  IN (SELECT value FROM json_each(?)), con la lista como JSON
+- Los repositorios SQLite escriben ? directamente y no pagan la traducción
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+RUTA_SQLITE = os.environ.get("SQLITE_PATH", os.path.join("data", "seguimiento.db"))
+_MMAP_BYTES = int(os.environ.get("SQLITE_MMAP_MB", "256")) * 1024 * 1024
+_ESPERA_ESCRITURA = float(os.environ.get("SQLITE_ESPERA_ESCRITURA", "30"))
+
+_SCHEMA = Path(__file__).parent / "schema.sql"
+
+# Fechas como texto ISO 8601 (lo que leen los repositorios con fromisoformat).
+# Registrarlos evita los adaptadores por defecto, deprecados en Python 3.12
+sqlite3.register_adapter(date, lambda valor: valor.isoformat())
+sqlite3.register_adapter(datetime, lambda valor: valor.isoformat(" "))
+sqlite3.register_adapter(Decimal, float)
+
+_LECTURA = re.compile(r"^\s*(SELECT|EXPLAIN|VALUES|PRAGMA)\b", re.IGNORECASE)
+_CTE = re.compile(r"^\s*WITH\b", re.IGNORECASE)
+_ESCRITURA = re.compile(r"\b(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+_LITERAL_TEXTO = re.compile(r"'(?:[^']|'')*'")
+_MARCADOR = re.compile(r"=\s*ANY\s*\(\s*%s\s*\)|%s|%%", re.IGNORECASE)
+
+# Turno de escritura del contexto actual (ver ConexionSQLite)
+_turno_escritura: ContextVar = ContextVar("turno_escritura_sqlite", default=None)
+
+
+def es_lectura(sql: str) -> bool:
+    """True si la sentencia no modifica datos"""
+    if _LECTURA.match(sql):
+        return True
+    return bool(_CTE.match(sql)) and not _ESCRITURA.search(sql)
+
+
+@lru_cache(maxsize=512)
+def _traducir_sql(sql: str) -> Tuple[str, Tuple[int, ...]]:
+    """
+    SQL con marcadores de PostgreSQL -> SQL de SQLite.
+
+    Returns:
+        Tuple: (sql traducido, posiciones de los parámetros que son listas)
+    """
+    listas = []
+    indice = 0
+
+    def reemplazar(marcador):
+        nonlocal indice
+        texto = marcador.group()
+        if texto == "%%":
+            return "%"
+        if texto != "%s":
+            listas.append(indice)
+            indice += 1
+            return "IN (SELECT value FROM json_each(?))"
+        indice += 1
+        return "?"
+
+    partes = []
+    posicion = 0
+    # Los literales de texto ('%' en un LIKE) no se tocan
+    for literal in _LITERAL_TEXTO.finditer(sql):
+        partes.append(_MARCADOR.sub(reemplazar, sql[posicion:literal.start()]))
+        partes.append(literal.group())
+        posicion = literal.end()
+    partes.append(_MARCADOR.sub(reemplazar, sql[posicion:]))
+    return "".join(partes), tuple(listas)
+
+
+def traducir(sql: str, parametros: Any) -> Tuple[str, Any]:
+    """Traduce la sentencia y convierte a JSON los parámetros de = ANY(%s)"""
+    if "%" not in sql:
+        return sql, parametros
+    sql, listas = _traducir_sql(sql)
+    if listas:
+        parametros = list(parametros)
+        for posicion in listas:
+            parametros[posicion] = json.dumps(list(parametros[posicion]))
+    return sql, parametros
+
+
+def abrir_sqlite(ruta: Optional[str] = None, solo_lectura: bool = False, autocommit: bool = True) -> sqlite3.Connection:
+    """
+    Abre una conexión con los PRAGMAs de este backend.
+
+    Args:
+        ruta: Archivo de la base (por defecto SQLITE_PATH)
+        solo_lectura: Rechazar escrituras (PRAGMA query_only)
+        autocommit: Sin BEGIN implícito (las transacciones se abren a mano).
+            Con False se comporta como pg8000: las escrituras abren una
+            transacción que cierra commit()
+    """
+    ruta = ruta or RUTA_SQLITE
+    if ruta != ":memory:":
+        Path(ruta).parent.mkdir(parents=True, exist_ok=True)
+    conexion = sqlite3.connect(
+        ruta,
+        timeout=_ESPERA_ESCRITURA,
+        check_same_thread=False,
+        isolation_level=None if autocommit else "",
+    )
+    conexion.row_factory = sqlite3.Row
+    conexion.execute("PRAGMA journal_mode = WAL")
+    conexion.execute("PRAGMA synchronous = NORMAL")
+    conexion.execute(f"PRAGMA mmap_size = {_MMAP_BYTES}")
+    conexion.execute("PRAGMA foreign_keys = ON")
+    conexion.execute("PRAGMA temp_store = MEMORY")
+    if solo_lectura:
+        conexion.execute("PRAGMA query_only = ON")
+    return conexion
+
+
+class ColaEscritura:
+    """Turnos para la conexión de escritura, en orden de llegada"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._turnos: deque = deque()
+
+    def esperar_turno(self, timeout: float) -> threading.Event:
+        turno = threading.Event()
+        with self._lock:
+            self._turnos.append(turno)
+            if len(self._turnos) == 1:
+                turno.set()
+        if turno.wait(timeout):
+            return turno
+        with self._lock:
+            # Pudo llegar el turno entre el timeout y tomar el lock
+            if turno.is_set():
+                return turno
+            self._turnos.remove(turno)
+        raise sqlite3.OperationalError(f"database is locked: sin turno de escritura en {timeout} s")
+
+    def liberar(self, turno: threading.Event) -> None:
+        with self._lock:
+            if self._turnos and self._turnos[0] is turno:
+                self._turnos.popleft()
+                if self._turnos:
+                    self._turnos[0].set()
+
+
+
+class CursorSQLite:
+    """Cursor que elige la conexión por sentencia y traduce el SQL de PostgreSQL"""
+
+    def __init__(self, conexion: "ConexionSQLite"):
+        self._conexion = conexion
+        self._cursor: Optional[sqlite3.Cursor] = None
+
+    def execute(self, sql: str, parametros: Any = ()):
+        sql, parametros = traducir(sql, parametros)
+        self._preparar(sql)
+        try:
+            self._cursor.execute(sql, parametros)
+        except Exception:
+            self._conexion._fallo(self._cursor.connection)
+            raise
+        return self
+
+    def executemany(self, sql: str, filas):
+        sql, _ = traducir(sql, ())
+        self._preparar(sql)
+        try:
+            self._cursor.executemany(sql, filas)
+        except Exception:
+            self._conexion._fallo(self._cursor.connection)
+            raise
+        return self
+
+    def _preparar(self, sql: str) -> None:
+        if self._cursor is not None:
+            self._cursor.close()
+        self._cursor = self._conexion._conexion_para(sql).cursor()
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, cantidad: int = 1):
+        return self._cursor.fetchmany(cantidad)
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount if self._cursor is not None else -1
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid if self._cursor is not None else None
+
+    @property
+    def description(self):
+        return self._cursor.description if self._cursor is not None else None
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ConexionSQLite:
+    """
+    Conexión compartida del proceso: lecturas por thread, escrituras por turno.
+
+    Tiene la interfaz que usan los repositorios y el código de la API
+    (cursor, commit, rollback), igual que la conexión de pg8000.
+    """
+
+    def __init__(self, ruta: Optional[str] = None):
+        self.ruta = ruta or RUTA_SQLITE
+        self._local = threading.local()
+        self._cola = ColaEscritura()
+        self._escritura = abrir_sqlite(self.ruta)
+        self._turno: Optional[threading.Event] = None
+        self._ultimo_uso = 0.0
+        self._lock_recuperacion = threading.Lock()
+
+    def cursor(self) -> CursorSQLite:
+        return CursorSQLite(self)
+
+    def execute(self, sql: str, parametros: Any = ()) -> CursorSQLite:
+        return self.cursor().execute(sql, parametros)
+
+    def _lectura(self) -> sqlite3.Connection:
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            conexion = self._local.conexion = abrir_sqlite(self.ruta, solo_lectura=True)
+        return conexion
+
+    def _es_dueno(self) -> bool:
+        turno = _turno_escritura.get()
+        return turno is not None and turno is self._turno
+
+    def _conexion_para(self, sql: str) -> sqlite3.Connection:
+        if self._es_dueno():
+            self._ultimo_uso = time.monotonic()
+            return self._escritura
+        if es_lectura(sql):
+            return self._lectura()
+        self._tomar_turno()
+        return self._escritura
+
+    def _tomar_turno(self) -> None:
+        try:
+            turno = self._cola.esperar_turno(_ESPERA_ESCRITURA)
+        except sqlite3.OperationalError:
+            if not self._recuperar_turno_abandonado():
+                raise
+            turno = self._cola.esperar_turno(_ESPERA_ESCRITURA)
+        self._turno = turno
+        self._ultimo_uso = time.monotonic()
+        _turno_escritura.set(turno)
+        try:
+            self._escritura.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._soltar_turno()
+            raise
+
+    def _soltar_turno(self) -> None:
+        turno, self._turno = self._turno, None
+        _turno_escritura.set(None)
+        self._cola.liberar(turno)
+
+    def _recuperar_turno_abandonado(self) -> bool:
+        """
+        Revierte una escritura que nunca llegó a commit()/rollback() (el
+        código que la empezó terminó con un error no manejado): sin esto,
+        nadie más podría escribir hasta reiniciar el proceso.
+        """
+        with self._lock_recuperacion:
+            turno = self._turno
+            if turno is None or time.monotonic() - self._ultimo_uso < _ESPERA_ESCRITURA:
+                return False
+            print("⚠️ Escritura SQLite abandonada sin commit ni rollback: se revierte")
+            self._escritura.rollback()
+            self._turno = None
+            self._cola.liberar(turno)
+            return True
+
+    def _fallo(self, conexion: sqlite3.Connection) -> None:
+        if conexion is self._escritura and self._es_dueno():
+            self.rollback()
+
+    def commit(self) -> None:
+        if not self._es_dueno():
+            return
+        try:
+            self._escritura.commit()
+        finally:
+            self._soltar_turno()
+
+    def rollback(self) -> None:
+        if not self._es_dueno():
+            return
+        try:
+            self._escritura.rollback()
+        finally:
+            self._soltar_turno()
+
+    def abrir_transaccion(self) -> "TransaccionSQLite":
+        """Transacción explícita que retiene el turno hasta close() (ver connection.transaccion)"""
+        return TransaccionSQLite(self)
+
+    def close(self) -> None:
+        # Compartida por todo el proceso: no se cierra por request
+        pass
+
+
+class TransaccionSQLite:
+    """
+    Conexión de una transacción explícita: toma el turno de escritura al
+    abrirse y lo suelta en close(). Los errores NO revierten solos: eso lo
+    decide quien la usa (ConexionTransaccional vuelve a un SAVEPOINT).
+    """
+
+    def __init__(self, compartida: ConexionSQLite):
+        self._compartida = compartida
+        self._turno = compartida._cola.esperar_turno(_ESPERA_ESCRITURA)
+        self._conexion = compartida._escritura
+        try:
+            self._conexion.execute("BEGIN IMMEDIATE")
+        except Exception:
+            compartida._cola.liberar(self._turno)
+            raise
+
+    def cursor(self) -> "_CursorTransaccion":
+        return _CursorTransaccion(self._conexion.cursor())
+
+    def execute(self, sql: str, parametros: Any = ()):
+        return self.cursor().execute(sql, parametros)
+
+    def commit(self) -> None:
+        self._conexion.commit()
+
+    def rollback(self) -> None:
+        self._conexion.rollback()
+
+    def close(self) -> None:
+        if self._turno is not None:
+            if self._conexion.in_transaction:
+                self._conexion.rollback()
+            self._compartida._cola.liberar(self._turno)
+            self._turno = None
+
+
+class _CursorTransaccion:
+    """Cursor de TransaccionSQLite: solo traduce el SQL"""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, sql: str, parametros: Any = ()):
+        self._cursor.execute(*traducir(sql, parametros))
+        return self
+
+    def executemany(self, sql: str, filas):
+        self._cursor.executemany(traducir(sql, ())[0], filas)
+        return self
+
+    def __getattr__(self, nombre):
+        return getattr(self._cursor, nombre)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+        return False
+
+
+def inicializar_sqlite(ruta: Optional[str] = None) -> Dict[str, int]:
+    """
+    Crea el schema (schema.sql) y agrega las columnas que le falten a una
+    base creada con una versión anterior.
+    """
+    conexion = abrir_sqlite(ruta)
+    resultado = {"success": 0, "skipped": 0, "errors": 0}
+    try:
+        sentencia = ""
+        for linea in _SCHEMA.read_text(encoding="utf-8").splitlines(keepends=True):
+            if not sentencia and (not linea.strip() or linea.lstrip().startswith("--")):
+                continue
+            sentencia += linea
+            if not sqlite3.complete_statement(sentencia):
+                continue
+            try:
+                conexion.execute(sentencia)
+                resultado["success"] += 1
+            except sqlite3.Error as e:
+                resultado["errors"] += 1
+                print(f"⚠️ Error en statement: {e}")
+            sentencia = ""
+
+        # Columnas agregadas después de la primera versión del schema
+        columnas = {fila["name"] for fila in conexion.execute("PRAGMA table_info(entrega_tp)")}
+        for columna, definicion in (
+            ("estado", "TEXT NOT NULL DEFAULT 'pendiente'"),
+            ("nota", "REAL"),
+            ("observaciones", "TEXT"),
+        ):
+            if columna not in columnas:
+                conexion.execute(f"ALTER TABLE entrega_tp ADD COLUMN {columna} {definicion}")
+    finally:
+        conexion.close()
+
+    print(f"✅ Schema SQLite inicializado en {ruta or RUTA_SQLITE}: {resultado['success']} OK, {resultado['errors']} errores")
+    return resultado
@@ -0,0 +1,412 @@
+"""
+Generador de Datos Sintéticos
+Sistema de Seguimiento de Alumnos
+
+Genera datasets parametrizables (cohortes, alumnos, cursos, clases y TPs)
+para pruebas de capacidad, con distribuciones realistas de ausencias y
+notas. Lo usan scripts/generar_datos.py y POST /api/seed/sintetico.
+
+Decisión de diseño: Semilla fija y perfiles de alumno
+- Todo sale de un único random.Random(semilla) recorrido en orden fijo: la
+  misma semilla y los mismos parámetros generan exactamente los mismos datos,
+  en PostgreSQL o en SQLite
+- Cada alumno tiene un perfil (regular, en riesgo, abandono). Las ausencias
+  siguen una cadena de Markov: faltar aumenta la probabilidad de faltar a la
+  clase siguiente, así aparecen rachas como las que buscan las alertas
+- Los de perfil abandono dejan de asistir y de entregar a partir de una clase
+- Notas con distribución normal según el perfil, acotadas a 1..10
+
+Decisión de diseño: Carga en una sola transacción
+- Tablas padre (alumno, curso, clase, trabajo_practico) con INSERT multi-fila
+  ... RETURNING, para conocer los IDs generados por clave natural
+- Tablas grandes (asistencia, participación, entregas): COPY FROM STDIN en
+  PostgreSQL; INSERT multi-fila en SQLite
+- Un solo COMMIT al final: si algo falla no queda un dataset a medias
+- Después del COMMIT, ANALYZE de las tablas cargadas (en SQLite, ANALYZE y
+  PRAGMA optimize): sin estadísticas el planner estima tablas casi vacías
+  y las primeras consultas sobre el dataset nuevo eligen mal los planes
+- Los DNIs se derivan de la semilla: regenerar con la misma semilla sobre
+  los mismos datos falla por DNI duplicado (vaciar antes con /api/clear-all)
+"""
+
+import csv
+import io
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# (nombre, probabilidad de faltar, probabilidad de seguir faltando, prob. de entregar, nota media)
+_PERFILES = (
+    ("regular", 0.08, 0.30, 0.92, 7.5),
+    ("riesgo", 0.22, 0.60, 0.60, 5.5),
+    ("abandono", 0.15, 0.50, 0.70, 5.0),
+)
+_PESOS_PERFILES = (0.70, 0.20, 0.10)
+
+_NIVELES_PARTICIPACION = ("Ninguna", "Baja", "Media", "Alta")
+_PESOS_NIVELES = (0.10, 0.30, 0.40, 0.20)
+
+_NOMBRES = (
+    "Juan", "María", "Carlos", "Ana", "Pedro", "Laura", "Diego", "Lucía", "Martín", "Sofía",
+    "Javier", "Valentina", "Nicolás", "Camila", "Matías", "Julieta", "Tomás", "Florencia",
+)
+_APELLIDOS = (
+    "Pérez", "García", "López", "Martínez", "Rodríguez", "Fernández", "Sánchez", "Romero",
+    "Gómez", "Díaz", "Álvarez", "Torres", "Ruiz", "Ramírez", "Flores", "Acosta", "Benítez",
+)
+_MATERIAS = (
+    "Programación", "Base de Datos", "Matemática Discreta", "Redes", "Sistemas Operativos",
+    "Ingeniería de Software", "Estadística", "Arquitectura de Computadoras",
+)
+
+_TABLAS_CARGADAS = (
+    "alumno", "curso", "clase", "trabajo_practico", "inscripcion",
+    "registro_asistencia", "registro_participacion", "entrega_tp",
+)
+
+# Máximo de parámetros por sentencia (pg8000: 32767, SQLite >= 3.32: 32766)
+_MAX_PARAMETROS = 30000
+_FILAS_POR_CHUNK_COPY = 2000
+
+
+@dataclass
+class ParametrosDataset:
+    """Tamaño y forma del dataset a generar"""
+    cohortes: int = 2
+    alumnos: int = 200
+    cursos: int = 4
+    clases_por_curso: int = 16
+    tps_por_curso: int = 4
+    anio_inicial: int = 2023
+    semilla: int = 42
+    # Fracción de presentes con registro de participación en cada clase
+    tasa_participacion: float = 0.5
+
+    def validar(self) -> None:
+        if self.cohortes < 1 or self.alumnos < 0 or self.cursos < 0:
+            raise ValueError("cohortes debe ser >= 1; alumnos y cursos >= 0")
+        if self.clases_por_curso < 0 or self.tps_por_curso < 0:
+            raise ValueError("clases_por_curso y tps_por_curso deben ser >= 0")
+        if self.alumnos > 999999:
+            raise ValueError("Se admiten hasta 999999 alumnos por dataset")
+        if not 2000 <= self.anio_inicial <= 2100 - self.cohortes:
+            raise ValueError("anio_inicial fuera de rango")
+        if not 0.0 <= self.tasa_participacion <= 1.0:
+            raise ValueError("tasa_participacion debe estar entre 0 y 1")
+
+
+class GeneradorDatos:
+    """
+    Genera y carga un dataset sintético.
+
+    Args:
+        conexion: Conexión pg8000 o sqlite3 (el dialecto se detecta)
+        parametros: Tamaño del dataset
+    """
+
+    def __init__(self, conexion, parametros: ParametrosDataset):
+        parametros.validar()
+        self.conexion = conexion
+        self.p = parametros
+        self.rng = random.Random(parametros.semilla)
+        self.es_sqlite = isinstance(conexion, sqlite3.Connection)
+        self.marcador = "?" if self.es_sqlite else "%s"
+
+    # ------------------------------------------------------------------
+    # Carga
+    # ------------------------------------------------------------------
+
+    def cargar(self) -> Dict[str, Any]:
+        """
+        Genera el dataset y lo inserta en una transacción.
+
+        Returns:
+            Dict: filas insertadas por tabla y segundos totales
+        """
+        inicio = time.perf_counter()
+        resultado: Dict[str, Any] = {}
+        cursor = self.conexion.cursor()
+        try:
+            alumnos = self._insertar_alumnos(cursor)
+            cursos = self._insertar_cursos(cursor)
+            clases = self._insertar_clases(cursor, cursos)
+            tps = self._insertar_tps(cursor, cursos)
+            inscripciones = self._inscripciones(alumnos, cursos)
+            self._volcar(cursor, "inscripcion", ("alumno_id", "curso_id", "fecha_inscripcion"), inscripciones)
+
+            asistencias, participaciones, entregas = self._historial(alumnos, cursos, clases, tps)
+            self._volcar(cursor, "registro_asistencia", ("alumno_id", "clase_id", "estado"), asistencias)
+            self._volcar(
+                cursor, "registro_participacion", ("alumno_id", "clase_id", "nivel", "comentario"), participaciones
+            )
+            if self._tiene_columna(cursor, "entrega_tp", "estado"):
+                columnas = ("trabajo_practico_id", "alumno_id", "fecha_entrega_real", "entregado", "es_tardia",
+                            "estado", "nota")
+            else:
+                # Esquema sin la migración add_nota_to_entrega_tp
+                columnas = ("trabajo_practico_id", "alumno_id", "fecha_entrega_real", "entregado", "es_tardia")
+                entregas = [fila[:5] for fila in entregas]
+            self._volcar(cursor, "entrega_tp", columnas, entregas)
+
+            self.conexion.commit()
+        except Exception:
+            self.conexion.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        self.analizar()
+
+        resultado.update({
+            "alumnos": len(alumnos),
+            "cursos": len(cursos),
+            "clases": sum(len(c) for c in clases.values()),
+            "trabajos_practicos": sum(len(t) for t in tps.values()),
+            "inscripciones": len(inscripciones),
+            "asistencias": len(asistencias),
+            "participaciones": len(participaciones),
+            "entregas": len(entregas),
+            "semilla": self.p.semilla,
+            "segundos": round(time.perf_counter() - inicio, 3),
+        })
+        return resultado
+
+    def analizar(self) -> None:
+        """
+        Actualiza las estadísticas del planner de las tablas cargadas.
+
+        Los datos ya están confirmados: si falla (ej: usuario sin permisos)
+        solo se avisa.
+        """
+        cursor = self.conexion.cursor()
+        try:
+            if self.es_sqlite:
+                cursor.execute("ANALYZE")
+                cursor.execute("PRAGMA optimize")
+            else:
+                for tabla in _TABLAS_CARGADAS:
+                    cursor.execute(f"ANALYZE {tabla}")
+            self.conexion.commit()
+        except Exception as e:
+            self.conexion.rollback()
+            print(f"⚠️ No se pudo ejecutar ANALYZE después de la carga: {e}")
+        finally:
+            cursor.close()
+
+    def _insertar_alumnos(self, cursor) -> List[Tuple[int, int, str]]:
+        """Returns: [(id, cohorte, perfil)] en el orden generado"""
+        filas, perfiles = [], {}
+        ahora = datetime.now()
+        for i in range(self.p.alumnos):
+            nombre = self.rng.choice(_NOMBRES)
+            apellido = self.rng.choice(_APELLIDOS)
+            cohorte = self.p.anio_inicial + self.rng.randrange(self.p.cohortes)
+            perfil = self.rng.choices(_PERFILES, _PESOS_PERFILES)[0]
+            dni = f"9{self.p.semilla % 100:02d}{i:06d}"
+            email = f"{nombre}.{apellido}.{i}@sintetico.edu".lower()
+            filas.append((nombre, apellido, dni, email, cohorte, ahora))
+            perfiles[dni] = (cohorte, perfil)
+
+        ids = self._insertar_retornando(
+            cursor, "alumno", ("nombre", "apellido", "dni", "email", "cohorte", "fecha_creacion"), filas, "dni"
+        )
+        return [(ids[fila[2]], *perfiles[fila[2]]) for fila in filas]
+
+    def _insertar_cursos(self, cursor) -> List[Tuple[int, int, int]]:
+        """Returns: [(id, anio, cuatrimestre)]; el curso k es de la cohorte k % cohortes"""
+        filas = []
+        ahora = datetime.now()
+        for k in range(self.p.cursos):
+            anio = self.p.anio_inicial + k % self.p.cohortes
+            cuatrimestre = 1 + (k // self.p.cohortes) % 2
+            materia = f"{_MATERIAS[k % len(_MATERIAS)]} {k + 1:03d} (s{self.p.semilla})"
+            docente = f"Prof. {self.rng.choice(_APELLIDOS)}"
+            filas.append((materia, anio, cuatrimestre, docente, ahora))
+
+        ids = self._insertar_retornando(
+            cursor, "curso", ("nombre_materia", "anio", "cuatrimestre", "docente_responsable", "fecha_creacion"),
+            filas, "nombre_materia"
+        )
+        return [(ids[fila[0]], fila[1], fila[2]) for fila in filas]
+
+    def _inicio_cursada(self, anio: int, cuatrimestre: int) -> date:
+        return date(anio, 3, 10) if cuatrimestre == 1 else date(anio, 8, 11)
+
+    def _insertar_clases(self, cursor, cursos) -> Dict[int, List[Tuple[int, date]]]:
+        """Returns: {curso_id: [(clase_id, fecha)] por número de clase}"""
+        filas = []
+        for curso_id, anio, cuatrimestre in cursos:
+            inicio = self._inicio_cursada(anio, cuatrimestre)
+            for n in range(1, self.p.clases_por_curso + 1):
+                filas.append((curso_id, inicio + timedelta(weeks=n - 1), n, f"Clase {n}"))
+
+        ids = self._insertar_retornando(
+            cursor, "clase", ("curso_id", "fecha", "numero_clase", "tema"), filas, ("curso_id", "numero_clase")
+        )
+        clases: Dict[int, List[Tuple[int, date]]] = {curso_id: [] for curso_id, _, _ in cursos}
+        for curso_id, fecha, numero, _ in filas:
+            clases[curso_id].append((ids[(curso_id, numero)], fecha))
+        return clases
+
+    def _insertar_tps(self, cursor, cursos) -> Dict[int, List[Tuple[int, date]]]:
+        """Returns: {curso_id: [(tp_id, fecha_entrega)]}, repartidos a lo largo de la cursada"""
+        filas = []
+        semanas = max(self.p.clases_por_curso, 1)
+        ahora = datetime.now()
+        for curso_id, anio, cuatrimestre in cursos:
+            inicio = self._inicio_cursada(anio, cuatrimestre)
+            for t in range(1, self.p.tps_por_curso + 1):
+                vence = inicio + timedelta(weeks=semanas * t // (self.p.tps_por_curso + 1))
+                filas.append((curso_id, f"TP{t}", f"Trabajo práctico {t}", vence, ahora))
+
+        ids = self._insertar_retornando(
+            cursor, "trabajo_practico", ("curso_id", "titulo", "descripcion", "fecha_entrega", "fecha_creacion"),
+            filas, ("curso_id", "titulo")
+        )
+        tps: Dict[int, List[Tuple[int, date]]] = {curso_id: [] for curso_id, _, _ in cursos}
+        for curso_id, titulo, _, vence, _ in filas:
+            tps[curso_id].append((ids[(curso_id, titulo)], vence))
+        return tps
+
+    # ------------------------------------------------------------------
+    # Generación de las tablas grandes
+    # ------------------------------------------------------------------
+
+    def _inscripciones(self, alumnos, cursos) -> List[tuple]:
+        """Cada alumno cursa todas las materias del año de su cohorte"""
+        cursos_por_anio: Dict[int, List[Tuple[int, date]]] = {}
+        for curso_id, anio, cuatrimestre in cursos:
+            cursos_por_anio.setdefault(anio, []).append((curso_id, self._inicio_cursada(anio, cuatrimestre)))
+        return [
+            (alumno_id, curso_id, inicio - timedelta(days=7))
+            for alumno_id, cohorte, _ in alumnos
+            for curso_id, inicio in cursos_por_anio.get(cohorte, ())
+        ]
+
+    def _historial(self, alumnos, cursos, clases, tps) -> Tuple[List[tuple], List[tuple], List[tuple]]:
+        """Asistencias, participaciones y entregas de cada alumno en cada curso que cursa"""
+        rng = self.rng
+        asistencias, participaciones, entregas = [], [], []
+        cursos_por_anio: Dict[int, List[int]] = {}
+        for curso_id, anio, _ in cursos:
+            cursos_por_anio.setdefault(anio, []).append(curso_id)
+
+        for alumno_id, cohorte, (perfil, p_falta, p_racha, p_entrega, nota_media) in alumnos:
+            for curso_id in cursos_por_anio.get(cohorte, ()):
+                clases_curso = clases[curso_id]
+                abandona = (
+                    int(len(clases_curso) * rng.uniform(0.3, 0.7))
+                    if perfil == "abandono" else len(clases_curso)
+                )
+                fecha_abandono = clases_curso[abandona][1] if abandona < len(clases_curso) else None
+
+                falto = False
+                for n, (clase_id, _) in enumerate(clases_curso):
+                    if n >= abandona:
+                        falta = True
+                    else:
+                        falta = rng.random() < (p_racha if falto else p_falta)
+                    falto = falta
+                    if falta:
+                        estado = "Justificada" if rng.random() < 0.15 and n < abandona else "Ausente"
+                    else:
+                        estado = "Tardanza" if rng.random() < 0.08 else "Presente"
+                        if rng.random() < self.p.tasa_participacion:
+                            nivel = rng.choices(_NIVELES_PARTICIPACION, _PESOS_NIVELES)[0]
+                            participaciones.append((alumno_id, clase_id, nivel, None))
+                    asistencias.append((alumno_id, clase_id, estado))
+
+                for tp_id, vence in tps[curso_id]:
+                    abandonado = fecha_abandono is not None and vence >= fecha_abandono
+                    if abandonado or rng.random() >= p_entrega:
+                        entregas.append((tp_id, alumno_id, None, False, False, "no_entregado", None))
+                        continue
+                    tarde = rng.random() < 0.15
+                    entregada = vence + timedelta(days=rng.randint(1, 7)) if tarde else vence - timedelta(days=rng.randint(0, 5))
+                    nota = round(min(10.0, max(1.0, rng.gauss(nota_media, 1.5))), 1)
+                    entregas.append((tp_id, alumno_id, entregada, True, tarde, "tarde" if tarde else "entregado", nota))
+
+        return asistencias, participaciones, entregas
+
+    # ------------------------------------------------------------------
+    # SQL
+    # ------------------------------------------------------------------
+
+    def _tamano_lote(self, columnas: int) -> int:
+        return max(1, min(1000, _MAX_PARAMETROS // columnas))
+
+    def _insertar_retornando(self, cursor, tabla: str, columnas: Sequence[str], filas: List[tuple], clave) -> Dict:
+        """
+        INSERT multi-fila ... RETURNING id, <clave>.
+
+        Returns:
+            Dict: clave natural -> id (el orden de RETURNING no está garantizado)
+        """
+        claves = (clave,) if isinstance(clave, str) else tuple(clave)
+        ids: Dict = {}
+        fila_sql = f"({', '.join([self.marcador] * len(columnas))})"
+        tamano = self._tamano_lote(len(columnas))
+        for inicio in range(0, len(filas), tamano):
+            lote = filas[inicio:inicio + tamano]
+            cursor.execute(
+                f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES {', '.join([fila_sql] * len(lote))} "
+                f"RETURNING id, {', '.join(claves)}",
+                [valor for fila in lote for valor in fila]
+            )
+            for row in cursor.fetchall():
+                row = tuple(row)
+                ids[row[1] if len(claves) == 1 else row[1:]] = row[0]
+        return ids
+
+    def _volcar(self, cursor, tabla: str, columnas: Sequence[str], filas: List[tuple]) -> None:
+        """Inserta filas sin necesitar sus IDs: COPY en PostgreSQL, INSERT multi-fila en SQLite"""
+        if not filas:
+            return
+        if not self.es_sqlite:
+            cursor.execute(
+                f"COPY {tabla} ({', '.join(columnas)}) FROM STDIN WITH (FORMAT csv)",
+                stream=_chunks_csv(filas)
+            )
+            return
+        fila_sql = f"({', '.join(['?'] * len(columnas))})"
+        tamano = self._tamano_lote(len(columnas))
+        for inicio in range(0, len(filas), tamano):
+            lote = filas[inicio:inicio + tamano]
+            cursor.execute(
+                f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES {', '.join([fila_sql] * len(lote))}",
+                [valor for fila in lote for valor in fila]
+            )
+
+    def _tiene_columna(self, cursor, tabla: str, columna: str) -> bool:
+        if self.es_sqlite:
+            cursor.execute(f"PRAGMA table_info({tabla})")
+            return any(row[1] == columna for row in cursor.fetchall())
+        cursor.execute(
+            "SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
+            (tabla, columna)
+        )
+        return cursor.fetchone() is not None
+
+
+def _chunks_csv(filas: List[tuple]) -> Iterator[str]:
+    """
+    Filas en formato CSV de COPY, de a _FILAS_POR_CHUNK_COPY por mensaje.
+
+    pg8000 manda un mensaje CopyData por elemento: agrupar evita un
+    mensaje (y un flush del socket) por fila. None se escribe como campo
+    vacío sin comillas, que COPY csv interpreta como NULL.
+    """
+    for inicio in range(0, len(filas), _FILAS_POR_CHUNK_COPY):
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer, lineterminator="\n")
+        escritor.writerows(filas[inicio:inicio + _FILAS_POR_CHUNK_COPY])
+        yield buffer.getvalue()
+
+
+def generar_dataset(conexion, parametros: Optional[ParametrosDataset] = None) -> Dict[str, Any]:
+    """Genera y carga un dataset sintético (ver GeneradorDatos)"""
+    return GeneradorDatos(conexion, parametros or ParametrosDataset()).cargar()
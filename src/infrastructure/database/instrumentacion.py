@@ -0,0 +1,169 @@
+"""
+Instrumentación de Consultas SQL por Request
+Sistema de Seguimiento de Alumnos
+
+Cuenta y cronometra cada execute() de las conexiones de la app y lo
+acumula en las métricas de la request en curso: cantidad de sentencias,
+tiempo total en la BD, la sentencia más lenta y el tiempo de
+serialización de la respuesta. El middleware de instrumentación abre las
+métricas y las publica como headers Server-Timing / X-Query-Count.
+
+Decisión de diseño: Envolver el cursor, no los repositorios
+- Los repositorios, los routers con SQL directo (alertas, con-stats) y los
+  middlewares piden cursores a la misma conexión: envolviendo cursor() se
+  cuentan todos sin tocar ninguno
+- ContextVar, igual que el mapa de identidad: el threadpool de FastAPI
+  hereda las métricas de la request que lo invocó. Sin request (scripts,
+  thread de invalidaciones) no hay métricas y el envoltorio solo delega
+- Costo por sentencia: dos perf_counter() y un lock; nada si no hay request
+  (tampoco se registran consultas lentas fuera de una request)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from src.infrastructure.monitoreo.consultas_lentas import CONSULTAS_LENTAS
+
+
+_metricas_request: ContextVar[Optional["MetricasRequest"]] = ContextVar("metricas_request", default=None)
+
+
+class MetricasRequest:
+    """Métricas de base de datos y serialización de una request"""
+
+    def __init__(self):
+        # Las sub-requests de /api/batch registran en paralelo desde varios threads
+        self._lock = threading.Lock()
+        self.consultas = 0
+        self.segundos_bd = 0.0
+        self.segundos_mas_lenta = 0.0
+        self.sql_mas_lenta: Optional[str] = None
+        self.segundos_serializacion = 0.0
+        # "MÉTODO /path" de la request (para el registro de consultas lentas)
+        self.ruta: Optional[str] = None
+
+    def registrar_consulta(self, sql: str, segundos: float) -> None:
+        with self._lock:
+            self.consultas += 1
+            self.segundos_bd += segundos
+            if segundos > self.segundos_mas_lenta:
+                self.segundos_mas_lenta = segundos
+                self.sql_mas_lenta = sql
+
+    def registrar_serializacion(self, segundos: float) -> None:
+        with self._lock:
+            self.segundos_serializacion += segundos
+
+
+def metricas_actuales() -> Optional[MetricasRequest]:
+    """Métricas de la request en curso (None fuera de una request)"""
+    return _metricas_request.get()
+
+
+@contextmanager
+def medir_request() -> Iterator[MetricasRequest]:
+    """Abre métricas nuevas para el contexto actual"""
+    metricas = MetricasRequest()
+    token = _metricas_request.set(metricas)
+    try:
+        yield metricas
+    finally:
+        _metricas_request.reset(token)
+
+
+class CursorInstrumentado:
+    """
+    Cursor que registra cada execute() en las métricas de la request.
+
+    Las sentencias que superan el umbral de consultas lentas se registran
+    además en monitoreo/consultas_lentas.py (con el plan, si se muestrean).
+    """
+
+    def __init__(self, cursor, conexion=None):
+        self._cursor = cursor
+        # Conexión cruda: el EXPLAIN de una consulta lenta corre en otro cursor
+        self._conexion = conexion
+
+    def _medir(self, metodo, sql, *args, explicable: bool = False, **kwargs):
+        metricas = _metricas_request.get()
+        if metricas is None:
+            return metodo(sql, *args, **kwargs)
+        inicio = time.perf_counter()
+        try:
+            resultado = metodo(sql, *args, **kwargs)
+        except BaseException:
+            metricas.registrar_consulta(sql, time.perf_counter() - inicio)
+            raise
+        segundos = time.perf_counter() - inicio
+        metricas.registrar_consulta(sql, segundos)
+        if segundos >= CONSULTAS_LENTAS.umbral_segundos:
+            # COPY (stream=...) y executemany se registran sin plan
+            conexion = self._conexion if explicable and not kwargs else None
+            CONSULTAS_LENTAS.registrar(conexion, sql, args[0] if args else None, segundos, metricas.ruta)
+        return resultado
+
+    def execute(self, sql, *args, **kwargs):
+        return self._medir(self._cursor.execute, sql, *args, explicable=True, **kwargs)
+
+    def executemany(self, sql, *args, **kwargs):
+        return self._medir(self._cursor.executemany, sql, *args, **kwargs)
+
+    def __getattr__(self, nombre):
+        return getattr(self._cursor, nombre)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+        return False
+
+
+class ConexionInstrumentada:
+    """Conexión cuyos cursores registran las consultas (el resto se delega)"""
+
+    def __init__(self, conexion):
+        self._conexion = conexion
+
+    def cursor(self):
+        return CursorInstrumentado(self._conexion.cursor(), self._conexion)
+
+    def __getattr__(self, nombre):
+        return getattr(self._conexion, nombre)
+
+
+class PresupuestoConsultasExcedido(AssertionError):
+    """Un bloque ejecutó más sentencias SQL que las permitidas"""
+
+    def __init__(self, descripcion: str, maximo: int, metricas: MetricasRequest):
+        self.maximo = maximo
+        self.consultas = metricas.consultas
+        super().__init__(
+            f"{descripcion}: {metricas.consultas} consultas (máximo {maximo}). "
+            f"Más lenta: {' '.join((metricas.sql_mas_lenta or '').split())[:200]}"
+        )
+
+
+@contextmanager
+def limite_consultas(maximo: int, descripcion: str = "bloque") -> Iterator[MetricasRequest]:
+    """
+    Falla si el bloque ejecuta más de 'maximo' sentencias SQL.
+
+    Para código que corre sin middleware (servicios, repositorios, scripts).
+    Las rutas HTTP se controlan con el header X-Query-Count
+    (ver benchmarks/presupuesto_consultas.py).
+
+    Uso:
+        with limite_consultas(3, "alertas"):
+            obtener_alertas()
+    """
+    with medir_request() as metricas:
+        yield metricas
+    if metricas.consultas > maximo:
+        raise PresupuestoConsultasExcedido(descripcion, maximo, metricas)
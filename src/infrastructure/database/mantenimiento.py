@@ -0,0 +1,456 @@
+"""
+Mantenimiento de Datos
+Sistema de Seguimiento de Alumnos
+
+Operaciones de administración sobre conjuntos de filas: vaciar la base,
+borrar los datos de prueba y purgar (todo, una cohorte o un año) por lotes
+en segundo plano.
+
+Decisión de diseño: Una sentencia por tabla, no una por entidad
+- Vaciar es un solo TRUNCATE ... RESTART IDENTITY CASCADE en una
+  transacción: no recorre filas, no deja tablas infladas de filas muertas
+  y, si falla, no queda la base a medio borrar
+- Los datos de prueba se borran con DELETE ... WHERE id = ANY(%s): la
+  cantidad de sentencias no depende de cuántos alumnos o cursos haya
+- SQLite no tiene TRUNCATE: se borra tabla por tabla en una transacción y
+  se reinician los AUTOINCREMENT en sqlite_sequence
+- Después de vaciar, ANALYZE: sin él el planner sigue con las estadísticas
+  de las tablas llenas (SQLite) o sin ninguna (PostgreSQL, TRUNCATE las
+  descarta) hasta que actúe el autovacuum
+
+Decisión de diseño: Purgas por lotes en un thread
+- TRUNCATE toma un lock exclusivo de las tablas y un DELETE de miles de
+  filas retiene sus locks hasta el COMMIT. Una purga borra de a
+  tamano_lote filas, con un COMMIT por lote: las requests que escriben
+  esperan a lo sumo un lote
+- Una sola conexión para toda la purga (conteos y lotes): abrir una por
+  lote costaría más que el DELETE
+- Los caches se vacían una vez, al terminar (o al fallar): mientras tanto
+  pueden servir filas ya borradas, como cualquier lectura anterior al
+  COMMIT de un borrado
+- Se borra primero en las tablas hijas: así la cascada de borrar un curso
+  o un alumno no arrastra miles de filas en un solo lote
+- Los IDs a purgar se resuelven al empezar (cursos del año, sus clases y
+  TPs, alumnos de la cohorte): lo que se cree después no se toca
+- Corre en un thread del proceso (una purga a la vez): el endpoint
+  responde enseguida y el progreso se consulta con GET /api/purgas/{id}
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.infrastructure.database.connection import crear_conexion, get_db_connection, transaccion
+from src.infrastructure.repositories.backends import backend_activo
+
+
+# Tablas de datos en orden de borrado (hijas primero)
+TABLAS_DATOS = (
+    "entrega_tp",
+    "registro_participacion",
+    "registro_asistencia",
+    "inscripcion",
+    "trabajo_practico",
+    "clase",
+    "alumno",
+    "curso",
+)
+
+# Datos que carga POST /api/seed
+DNIS_PRUEBA = ("12345678", "23456789", "34567890", "45678901", "56789012", "67890123", "78901234", "89012345")
+CURSOS_PRUEBA = ("Programación I", "Matemática Discreta", "Base de Datos", "Programación II")
+
+ALCANCES_PURGA = ("todo", "cohorte", "anio")
+
+_MAX_PURGAS_GUARDADAS = 20
+
+
+def _limpiar_caches() -> None:
+    from src.infrastructure.cache.repositorios_cacheados import limpiar_caches
+    limpiar_caches()
+
+
+# ============================================================================
+# Vaciar y datos de prueba
+# ============================================================================
+
+def vaciar_todo() -> Dict[str, Any]:
+    """
+    Borra todas las filas de todas las tablas de datos y reinicia los IDs.
+
+    Returns:
+        Dict: {"filas": {tabla: filas borradas}, "conteo": "exacto" | "estimado"}.
+        Con PostgreSQL el conteo es la estimación de pg_class (contar
+        exacto recorrería las tablas que TRUNCATE evita recorrer)
+    """
+    backend = backend_activo()
+    if backend == "memoria":
+        almacen = get_db_connection()
+        filas = {tabla: almacen.contar(tabla) for tabla in TABLAS_DATOS}
+        almacen.vaciar(reiniciar_ids=True)
+        _limpiar_caches()
+        return {"filas": filas, "conteo": "exacto"}
+
+    with transaccion() as conexion:
+        cursor = conexion.cursor()
+        try:
+            if backend == "sqlite":
+                filas = {}
+                for tabla in TABLAS_DATOS:
+                    cursor.execute(f"DELETE FROM {tabla}")
+                    filas[tabla] = cursor.rowcount
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = ANY(%s)", (list(TABLAS_DATOS),))
+                cursor.execute("ANALYZE")
+                conteo = "exacto"
+            else:
+                cursor.execute(
+                    "SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class "
+                    "WHERE relkind = 'r' AND relname = ANY(%s)",
+                    (list(TABLAS_DATOS),)
+                )
+                estimadas = dict(cursor.fetchall())
+                filas = {tabla: estimadas.get(tabla, 0) for tabla in TABLAS_DATOS}
+                cursor.execute(f"TRUNCATE {', '.join(TABLAS_DATOS)} RESTART IDENTITY CASCADE")
+                # En la misma transacción: las estadísticas se confirman junto con el vaciado
+                cursor.execute(f"ANALYZE {', '.join(TABLAS_DATOS)}")
+                conteo = "estimado"
+        finally:
+            cursor.close()
+
+    _limpiar_caches()
+    return {"filas": filas, "conteo": conteo}
+
+
+def borrar_datos_prueba() -> Dict[str, int]:
+    """
+    Borra los alumnos (por DNI) y cursos (por nombre) de POST /api/seed,
+    con todo lo que dependa de ellos, en una transacción.
+
+    Returns:
+        Dict[str, int]: {"alumnos": borrados, "cursos": borrados}
+    """
+    if backend_activo() == "memoria":
+        almacen = get_db_connection()
+        nombres = set(CURSOS_PRUEBA)
+        with almacen.atomico() as conexion:
+            alumno_ids = [a.id for a in (conexion.obtener_unico("alumno", "dni", dni) for dni in DNIS_PRUEBA) if a]
+            curso_ids = [c.id for c in conexion.todos("curso", lambda c: c.nombre_materia in nombres)]
+            # El almacén borra en cascada, como las FKs
+            for alumno_id in alumno_ids:
+                conexion.eliminar("alumno", alumno_id)
+            for curso_id in curso_ids:
+                conexion.eliminar("curso", curso_id)
+        _limpiar_caches()
+        return {"alumnos": len(alumno_ids), "cursos": len(curso_ids)}
+
+    with transaccion() as conexion:
+        cursor = conexion.cursor()
+        try:
+            cursor.execute("SELECT id FROM alumno WHERE dni = ANY(%s)", (list(DNIS_PRUEBA),))
+            alumno_ids = [fila[0] for fila in cursor.fetchall()]
+            cursor.execute("SELECT id FROM curso WHERE nombre_materia = ANY(%s)", (list(CURSOS_PRUEBA),))
+            curso_ids = [fila[0] for fila in cursor.fetchall()]
+
+            # Explícito y no solo por cascada: bases viejas sin ON DELETE CASCADE
+            if alumno_ids:
+                for tabla in ("registro_asistencia", "registro_participacion", "entrega_tp", "inscripcion"):
+                    cursor.execute(f"DELETE FROM {tabla} WHERE alumno_id = ANY(%s)", (alumno_ids,))
+                cursor.execute("DELETE FROM alumno WHERE id = ANY(%s)", (alumno_ids,))
+            if curso_ids:
+                for tabla in ("trabajo_practico", "clase", "inscripcion"):
+                    cursor.execute(f"DELETE FROM {tabla} WHERE curso_id = ANY(%s)", (curso_ids,))
+                cursor.execute("DELETE FROM curso WHERE id = ANY(%s)", (curso_ids,))
+        finally:
+            cursor.close()
+
+    _limpiar_caches()
+    return {"alumnos": len(alumno_ids), "cursos": len(curso_ids)}
+
+
+# ============================================================================
+# Purgas por lotes
+# ============================================================================
+
+class PurgaEnCursoError(Exception):
+    """Ya hay una purga corriendo en este proceso"""
+
+    def __init__(self, purga: "Purga"):
+        super().__init__(f"Ya hay una purga en curso: {purga.id}")
+        self.purga = purga
+
+
+class Purga:
+    """Estado y progreso de una purga (se actualiza desde su thread)"""
+
+    def __init__(self, alcance: str, valor: Optional[int], tamano_lote: int):
+        self.id = uuid.uuid4().hex[:12]
+        self.alcance = alcance
+        self.valor = valor
+        self.tamano_lote = tamano_lote
+        self.estado = "pendiente"  # pendiente, en_curso, completada, error
+        self.total: Dict[str, int] = {}
+        self.borradas: Dict[str, int] = {}
+        self.lotes = 0
+        self.tabla_actual: Optional[str] = None
+        self.error: Optional[str] = None
+        self.creada = datetime.now()
+        self._inicio: Optional[float] = None
+        self._fin: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def progreso(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self.total.values())
+            borradas = sum(self.borradas.values())
+            if self._inicio is None:
+                segundos = 0.0
+            else:
+                segundos = (self._fin or time.perf_counter()) - self._inicio
+            return {
+                "id": self.id,
+                "alcance": self.alcance,
+                "valor": self.valor,
+                "tamano_lote": self.tamano_lote,
+                "estado": self.estado,
+                "porcentaje": round(100 * borradas / total, 1) if total else (100.0 if self.estado == "completada" else 0.0),
+                "filas_borradas": borradas,
+                "filas_total": total,
+                "tablas": {
+                    tabla: {"borradas": self.borradas.get(tabla, 0), "total": cantidad}
+                    for tabla, cantidad in self.total.items()
+                },
+                "tabla_actual": self.tabla_actual,
+                "lotes": self.lotes,
+                "segundos": round(segundos, 2),
+                "creada": self.creada.isoformat(timespec="seconds"),
+                "error": self.error,
+            }
+
+
+# Plan de cada alcance: (tabla, columna, conjunto de IDs) en orden de borrado.
+# columna None = todas las filas de la tabla
+_PLANES: Dict[str, List[Tuple[str, Optional[str], Optional[str]]]] = {
+    "todo": [(tabla, None, None) for tabla in TABLAS_DATOS],
+    "cohorte": [
+        ("registro_asistencia", "alumno_id", "alumnos"),
+        ("registro_participacion", "alumno_id", "alumnos"),
+        ("entrega_tp", "alumno_id", "alumnos"),
+        ("inscripcion", "alumno_id", "alumnos"),
+        ("alumno", "id", "alumnos"),
+    ],
+    "anio": [
+        ("registro_asistencia", "clase_id", "clases"),
+        ("registro_participacion", "clase_id", "clases"),
+        ("entrega_tp", "trabajo_practico_id", "tps"),
+        ("inscripcion", "curso_id", "cursos"),
+        ("clase", "id", "clases"),
+        ("trabajo_practico", "id", "tps"),
+        ("curso", "id", "cursos"),
+    ],
+}
+
+
+def _abrir_conexion():
+    """
+    Conexión de toda la purga. En PostgreSQL, una propia: la compartida del
+    thread hace rollback() cada vez que se pide. En SQLite, la del thread
+    (cada commit() libera el turno de escritura); en memoria, el almacén.
+    """
+    if backend_activo() == "postgres":
+        return crear_conexion()
+    return get_db_connection()
+
+
+def _resolver_ids(conexion, alcance: str, valor: Optional[int]) -> Dict[str, List[int]]:
+    """IDs raíz de la purga, tomados una vez al empezar"""
+    if alcance == "todo":
+        return {}
+    if backend_activo() == "memoria":
+        almacen = conexion
+        if alcance == "cohorte":
+            return {"alumnos": almacen.ids_por("alumno", "cohorte", valor)}
+        cursos = [c.id for c in almacen.todos("curso", lambda c: c.anio == valor)]
+        return {
+            "cursos": cursos,
+            "clases": [id for curso_id in cursos for id in almacen.ids_por("clase", "curso_id", curso_id)],
+            "tps": [id for curso_id in cursos for id in almacen.ids_por("trabajo_practico", "curso_id", curso_id)],
+        }
+
+    cursor = conexion.cursor()
+    try:
+        if alcance == "cohorte":
+            cursor.execute("SELECT id FROM alumno WHERE cohorte = %s", (valor,))
+            return {"alumnos": [fila[0] for fila in cursor.fetchall()]}
+        cursor.execute("SELECT id FROM curso WHERE anio = %s", (valor,))
+        cursos = [fila[0] for fila in cursor.fetchall()]
+        ids = {"cursos": cursos, "clases": [], "tps": []}
+        if cursos:
+            cursor.execute("SELECT id FROM clase WHERE curso_id = ANY(%s)", (cursos,))
+            ids["clases"] = [fila[0] for fila in cursor.fetchall()]
+            cursor.execute("SELECT id FROM trabajo_practico WHERE curso_id = ANY(%s)", (cursos,))
+            ids["tps"] = [fila[0] for fila in cursor.fetchall()]
+        return ids
+    finally:
+        cursor.close()
+        # No dejar una transacción abierta con snapshot viejo durante la purga
+        conexion.commit()
+
+
+def _ids_memoria(almacen, tabla: str, columna: Optional[str], ids: Optional[List[int]]) -> Iterator[int]:
+    """IDs de las filas alcanzadas, por los índices del almacén (sin copiar filas)"""
+    if columna is None:
+        return iter(almacen.ids(tabla))
+    if columna == "id":
+        return (id for id in ids if almacen.existe(tabla, id))
+    return (id for clave in ids for id in almacen.ids_por(tabla, columna, clave))
+
+
+def _contar(conexion, tabla: str, columna: Optional[str], ids: Optional[List[int]]) -> int:
+    if backend_activo() == "memoria":
+        return sum(1 for _ in _ids_memoria(conexion, tabla, columna, ids))
+
+    cursor = conexion.cursor()
+    try:
+        if columna is None:
+            cursor.execute(f"SELECT COUNT(*) FROM {tabla}")
+        else:
+            cursor.execute(f"SELECT COUNT(*) FROM {tabla} WHERE {columna} = ANY(%s)", (ids,))
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+        conexion.commit()
+
+
+def _borrar_lote(conexion, tabla: str, columna: Optional[str], ids: Optional[List[int]], tamano_lote: int) -> int:
+    """Borra hasta tamano_lote filas y confirma; devuelve cuántas"""
+    if backend_activo() == "memoria":
+        with conexion.atomico() as escritura:
+            lote = list(islice(_ids_memoria(conexion, tabla, columna, ids), tamano_lote))
+            for id in lote:
+                escritura.eliminar(tabla, id)
+        return len(lote)
+
+    cursor = conexion.cursor()
+    try:
+        if columna is None:
+            cursor.execute(
+                f"DELETE FROM {tabla} WHERE id IN (SELECT id FROM {tabla} LIMIT %s)",
+                (tamano_lote,)
+            )
+        else:
+            cursor.execute(
+                f"DELETE FROM {tabla} WHERE id IN "
+                f"(SELECT id FROM {tabla} WHERE {columna} = ANY(%s) LIMIT %s)",
+                (ids, tamano_lote)
+            )
+        borradas = cursor.rowcount
+        conexion.commit()
+        return borradas
+    except Exception:
+        conexion.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _ejecutar_purga(purga: Purga) -> None:
+    with purga._lock:
+        purga.estado = "en_curso"
+        purga._inicio = time.perf_counter()
+    conexion = None
+    try:
+        conexion = _abrir_conexion()
+        conjuntos = _resolver_ids(conexion, purga.alcance, purga.valor)
+        plan = [
+            (tabla, columna, conjuntos.get(conjunto) if conjunto else None)
+            for tabla, columna, conjunto in _PLANES[purga.alcance]
+        ]
+        for tabla, columna, ids in plan:
+            total = 0 if columna is not None and not ids else _contar(conexion, tabla, columna, ids)
+            with purga._lock:
+                purga.total[tabla] = total
+                purga.borradas[tabla] = 0
+
+        for tabla, columna, ids in plan:
+            if columna is not None and not ids:
+                continue
+            with purga._lock:
+                purga.tabla_actual = tabla
+            while True:
+                borradas = _borrar_lote(conexion, tabla, columna, ids, purga.tamano_lote)
+                with purga._lock:
+                    purga.borradas[tabla] += borradas
+                    # Pudieron crearse filas después del conteo inicial
+                    purga.total[tabla] = max(purga.total[tabla], purga.borradas[tabla])
+                    purga.lotes += 1
+                if borradas < purga.tamano_lote:
+                    break
+
+        with purga._lock:
+            purga.estado = "completada"
+            purga.tabla_actual = None
+        print(f"🧹 Purga {purga.id} ({purga.alcance}) completada: {sum(purga.borradas.values())} filas")
+    except Exception as e:
+        with purga._lock:
+            purga.estado = "error"
+            purga.error = str(e)
+        print(f"❌ Purga {purga.id} falló: {e}")
+    finally:
+        if conexion is not None:
+            conexion.close()
+        with purga._lock:
+            purga._fin = time.perf_counter()
+        _limpiar_caches()
+
+
+class PurgasEnSegundoPlano:
+    """Registro de purgas del proceso; corre una a la vez, cada una en su thread"""
+
+    def __init__(self, maximo_guardadas: int = _MAX_PURGAS_GUARDADAS):
+        self.maximo_guardadas = maximo_guardadas
+        self._purgas: "OrderedDict[str, Purga]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def iniciar(self, alcance: str, valor: Optional[int] = None, tamano_lote: int = 1000) -> Purga:
+        """
+        Lanza una purga en un thread y la devuelve sin esperarla.
+
+        Raises:
+            ValueError: Alcance desconocido, o cohorte/anio sin valor
+            PurgaEnCursoError: Ya hay otra purga corriendo
+        """
+        if alcance not in ALCANCES_PURGA:
+            raise ValueError(f"Alcance desconocido: {alcance!r} (opciones: {', '.join(ALCANCES_PURGA)})")
+        if alcance != "todo" and valor is None:
+            raise ValueError(f"La purga por {alcance} necesita un valor")
+        if tamano_lote < 1:
+            raise ValueError("tamano_lote debe ser positivo")
+
+        with self._lock:
+            for existente in self._purgas.values():
+                if existente.estado in ("pendiente", "en_curso"):
+                    raise PurgaEnCursoError(existente)
+            purga = Purga(alcance, valor if alcance != "todo" else None, tamano_lote)
+            self._purgas[purga.id] = purga
+            while len(self._purgas) > self.maximo_guardadas:
+                self._purgas.popitem(last=False)
+
+        threading.Thread(target=_ejecutar_purga, args=(purga,), name=f"purga-{purga.id}", daemon=True).start()
+        return purga
+
+    def obtener(self, purga_id: str) -> Optional[Purga]:
+        with self._lock:
+            return self._purgas.get(purga_id)
+
+    def listar(self) -> List[Dict[str, Any]]:
+        """Progreso de las purgas guardadas, la más reciente primero"""
+        with self._lock:
+            purgas = list(self._purgas.values())
+        return [purga.progreso() for purga in reversed(purgas)]
+
+
+PURGAS = PurgasEnSegundoPlano()
@@ -103,6 +103,10 @@ CREATE TABLE IF NOT EXISTS clase (
 -- Índices para clase
 CREATE INDEX IF NOT EXISTS idx_clase_curso ON clase(curso_id);
 CREATE INDEX IF NOT EXISTS idx_clase_fecha ON clase(fecha);
+-- Feed de clases recientes (ORDER BY fecha DESC, id DESC LIMIT n)
+CREATE INDEX IF NOT EXISTS idx_clase_fecha_id_desc ON clase(fecha DESC, id DESC);
+-- Clases de un curso en orden cronológico
+CREATE INDEX IF NOT EXISTS idx_clase_curso_fecha ON clase(curso_id, fecha);
 
 -- ============================================================================
 -- TABLA: registro_asistencia
@@ -190,6 +194,9 @@ CREATE TABLE IF NOT EXISTS entrega_tp (
     fecha_entrega_real DATE,
     entregado BOOLEAN NOT NULL DEFAULT FALSE,
     es_tardia BOOLEAN NOT NULL DEFAULT FALSE,
+    estado TEXT NOT NULL DEFAULT 'pendiente',  -- pendiente, entregado, tarde, no_entregado
+    nota REAL,                                 -- Nota del TP (1-10)
+    observaciones TEXT,                        -- Comentarios del docente
     fecha_registro TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     -- Foreign Keys
@@ -197,9 +204,16 @@ CREATE TABLE IF NOT EXISTS entrega_tp (
     FOREIGN KEY (alumno_id) REFERENCES alumno(id) ON DELETE CASCADE,
     
     -- Constraint: Solo una entrega por alumno por TP
-    UNIQUE(trabajo_practico_id, alumno_id)
+    UNIQUE(trabajo_practico_id, alumno_id),
+    CHECK (estado IN ('pendiente', 'entregado', 'tarde', 'no_entregado')),
+    CHECK (nota IS NULL OR (nota >= 1 AND nota <= 10))
 );
 
+-- Bases creadas antes de estado/nota/observaciones (ver migrations/add_nota_to_entrega_tp.sql)
+ALTER TABLE entrega_tp ADD COLUMN IF NOT EXISTS estado TEXT NOT NULL DEFAULT 'pendiente';
+ALTER TABLE entrega_tp ADD COLUMN IF NOT EXISTS nota REAL;
+ALTER TABLE entrega_tp ADD COLUMN IF NOT EXISTS observaciones TEXT;
+
 -- Índices para entrega_tp
 CREATE INDEX IF NOT EXISTS idx_entrega_tp ON entrega_tp(trabajo_practico_id);
 CREATE INDEX IF NOT EXISTS idx_entrega_alumno ON entrega_tp(alumno_id);
@@ -304,4 +318,328 @@ CREATE TRIGGER trg_calcular_entrega_tardia
 BEFORE INSERT ON entrega_tp
 FOR EACH ROW
 EXECUTE FUNCTION fn_calcular_entrega_tardia();
+
+-- ============================================================================
+-- TABLA: tabla_version
+-- Descripción: Contador de cambios por tabla (para ETags HTTP baratos)
+-- Cada transacción que modifica una tabla incrementa su versión UNA vez,
+-- en el COMMIT:
+-- - Un trigger por sentencia anota la tabla en una variable local de la
+--   transacción (seguimiento.versiones_pendientes): no toma ningún lock
+-- - Un constraint trigger diferido (corre en el COMMIT) incrementa todas
+--   las anotadas, en orden alfabético: la fila de tabla_version queda
+--   bloqueada solo durante el COMMIT y, con un orden fijo, dos
+--   transacciones que tocan las mismas tablas no se bloquean en ciclo
+-- - Una sentencia que no cambió filas no dispara el diferido: si es la
+--   única de la transacción, no hay nada que incrementar
+-- - TRUNCATE incrementa en el momento (ya bloquea la tabla entera)
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS tabla_version (
+    tabla TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+-- Función: Incrementar versión de la tabla modificada (TRUNCATE)
+CREATE OR REPLACE FUNCTION fn_incrementar_version_tabla()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES (TG_TABLE_NAME, 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = tabla_version.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Función: Anotar la tabla modificada (por sentencia, sin locks)
+CREATE OR REPLACE FUNCTION fn_anotar_version_pendiente()
+RETURNS TRIGGER AS $$
+DECLARE
+    pendientes TEXT := COALESCE(current_setting('seguimiento.versiones_pendientes', true), '');
+BEGIN
+    IF NOT TG_TABLE_NAME = ANY(string_to_array(pendientes, ',')) THEN
+        PERFORM set_config(
+            'seguimiento.versiones_pendientes',
+            concat_ws(',', NULLIF(pendientes, ''), TG_TABLE_NAME),
+            true
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Función: Incrementar las versiones anotadas (diferida, en el COMMIT)
+-- La primera fila que dispara la incrementa todas; las demás no hacen nada
+CREATE OR REPLACE FUNCTION fn_incrementar_versiones_pendientes()
+RETURNS TRIGGER AS $$
+DECLARE
+    pendientes TEXT := COALESCE(current_setting('seguimiento.versiones_pendientes', true), '');
+BEGIN
+    IF pendientes <> '' THEN
+        PERFORM set_config('seguimiento.versiones_pendientes', '', true);
+        INSERT INTO tabla_version (tabla, version)
+        SELECT tabla, 1 FROM unnest(string_to_array(pendientes, ',')) AS tabla ORDER BY tabla
+        ON CONFLICT (tabla) DO UPDATE SET version = tabla_version.version + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_version_alumno ON alumno;
+CREATE TRIGGER trg_version_alumno
+AFTER INSERT OR UPDATE OR DELETE ON alumno
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_alumno ON alumno;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_alumno
+AFTER INSERT OR UPDATE OR DELETE ON alumno
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_alumno ON alumno;
+CREATE TRIGGER trg_version_truncate_alumno
+AFTER TRUNCATE ON alumno
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_curso ON curso;
+CREATE TRIGGER trg_version_curso
+AFTER INSERT OR UPDATE OR DELETE ON curso
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_curso ON curso;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_curso
+AFTER INSERT OR UPDATE OR DELETE ON curso
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_curso ON curso;
+CREATE TRIGGER trg_version_truncate_curso
+AFTER TRUNCATE ON curso
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_inscripcion ON inscripcion;
+CREATE TRIGGER trg_version_inscripcion
+AFTER INSERT OR UPDATE OR DELETE ON inscripcion
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_inscripcion ON inscripcion;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_inscripcion
+AFTER INSERT OR UPDATE OR DELETE ON inscripcion
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_inscripcion ON inscripcion;
+CREATE TRIGGER trg_version_truncate_inscripcion
+AFTER TRUNCATE ON inscripcion
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_clase ON clase;
+CREATE TRIGGER trg_version_clase
+AFTER INSERT OR UPDATE OR DELETE ON clase
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_clase ON clase;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_clase
+AFTER INSERT OR UPDATE OR DELETE ON clase
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_clase ON clase;
+CREATE TRIGGER trg_version_truncate_clase
+AFTER TRUNCATE ON clase
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_registro_asistencia ON registro_asistencia;
+CREATE TRIGGER trg_version_registro_asistencia
+AFTER INSERT OR UPDATE OR DELETE ON registro_asistencia
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_registro_asistencia ON registro_asistencia;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_registro_asistencia
+AFTER INSERT OR UPDATE OR DELETE ON registro_asistencia
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_registro_asistencia ON registro_asistencia;
+CREATE TRIGGER trg_version_truncate_registro_asistencia
+AFTER TRUNCATE ON registro_asistencia
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_registro_participacion ON registro_participacion;
+CREATE TRIGGER trg_version_registro_participacion
+AFTER INSERT OR UPDATE OR DELETE ON registro_participacion
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_registro_participacion ON registro_participacion;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_registro_participacion
+AFTER INSERT OR UPDATE OR DELETE ON registro_participacion
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_registro_participacion ON registro_participacion;
+CREATE TRIGGER trg_version_truncate_registro_participacion
+AFTER TRUNCATE ON registro_participacion
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_trabajo_practico ON trabajo_practico;
+CREATE TRIGGER trg_version_trabajo_practico
+AFTER INSERT OR UPDATE OR DELETE ON trabajo_practico
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_trabajo_practico ON trabajo_practico;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_trabajo_practico
+AFTER INSERT OR UPDATE OR DELETE ON trabajo_practico
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_trabajo_practico ON trabajo_practico;
+CREATE TRIGGER trg_version_truncate_trabajo_practico
+AFTER TRUNCATE ON trabajo_practico
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+DROP TRIGGER IF EXISTS trg_version_entrega_tp ON entrega_tp;
+CREATE TRIGGER trg_version_entrega_tp
+AFTER INSERT OR UPDATE OR DELETE ON entrega_tp
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_anotar_version_pendiente();
+
+DROP TRIGGER IF EXISTS trg_version_diferida_entrega_tp ON entrega_tp;
+CREATE CONSTRAINT TRIGGER trg_version_diferida_entrega_tp
+AFTER INSERT OR UPDATE OR DELETE ON entrega_tp
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fn_incrementar_versiones_pendientes();
+
+DROP TRIGGER IF EXISTS trg_version_truncate_entrega_tp ON entrega_tp;
+CREATE TRIGGER trg_version_truncate_entrega_tp
+AFTER TRUNCATE ON entrega_tp
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_incrementar_version_tabla();
+
+-- ============================================================================
+-- INVALIDACIÓN DE CACHES: NOTIFY invalidacion_cache
+-- Descripción: Cada proceso de la API cachea cursos, clases, TPs y el
+-- índice de inscripciones en memoria. Estos triggers publican qué fila
+-- cambió para que TODOS los workers descarten su copia (LISTEN en
+-- src/infrastructure/cache/bus_invalidacion.py)
+-- Payload JSON: {"tabla": ..., <columnas clave pasadas como argumentos>}
+-- NOTIFY se entrega al hacer COMMIT y descarta payloads repetidos dentro
+-- de la misma transacción (ej: 500 inscripciones a un curso = 1 evento)
+-- TRUNCATE publica solo {"tabla": ...}: se descarta todo lo de esa tabla
+-- ============================================================================
+CREATE OR REPLACE FUNCTION fn_notificar_invalidacion()
+RETURNS TRIGGER AS $$
+DECLARE
+    filas JSONB[];
+    fila JSONB;
+    columna TEXT;
+    payload JSONB;
+BEGIN
+    IF TG_LEVEL = 'STATEMENT' THEN
+        PERFORM pg_notify('invalidacion_cache', jsonb_build_object('tabla', TG_TABLE_NAME)::text);
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        filas := ARRAY[to_jsonb(NEW)];
+    ELSIF TG_OP = 'DELETE' THEN
+        filas := ARRAY[to_jsonb(OLD)];
+    ELSE
+        filas := ARRAY[to_jsonb(OLD), to_jsonb(NEW)];
+    END IF;
+
+    FOREACH fila IN ARRAY filas LOOP
+        payload := jsonb_build_object('tabla', TG_TABLE_NAME);
+        FOREACH columna IN ARRAY TG_ARGV LOOP
+            payload := payload || jsonb_build_object(columna, fila -> columna);
+        END LOOP;
+        PERFORM pg_notify('invalidacion_cache', payload::text);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- curso / clase / trabajo_practico: caches por ID (no se cachean ausencias,
+-- así que un INSERT no invalida nada)
+DROP TRIGGER IF EXISTS trg_notificar_curso ON curso;
+CREATE TRIGGER trg_notificar_curso
+AFTER UPDATE OR DELETE ON curso
+FOR EACH ROW
+EXECUTE FUNCTION fn_notificar_invalidacion('id');
+
+DROP TRIGGER IF EXISTS trg_notificar_clase ON clase;
+CREATE TRIGGER trg_notificar_clase
+AFTER UPDATE OR DELETE ON clase
+FOR EACH ROW
+EXECUTE FUNCTION fn_notificar_invalidacion('id');
+
+DROP TRIGGER IF EXISTS trg_notificar_trabajo_practico ON trabajo_practico;
+CREATE TRIGGER trg_notificar_trabajo_practico
+AFTER UPDATE OR DELETE ON trabajo_practico
+FOR EACH ROW
+EXECUTE FUNCTION fn_notificar_invalidacion('id');
+
+-- inscripcion: índice de inscriptos por curso. Solo curso_id (lo único que
+-- lee el manejador): una inscripción masiva de un curso es un solo evento
+DROP TRIGGER IF EXISTS trg_notificar_inscripcion ON inscripcion;
+CREATE TRIGGER trg_notificar_inscripcion
+AFTER INSERT OR UPDATE OR DELETE ON inscripcion
+FOR EACH ROW
+EXECUTE FUNCTION fn_notificar_invalidacion('curso_id');
+
+-- alumno: al borrarlo se borran en cascada sus inscripciones
+DROP TRIGGER IF EXISTS trg_notificar_alumno ON alumno;
+CREATE TRIGGER trg_notificar_alumno
+AFTER DELETE ON alumno
+FOR EACH ROW
+EXECUTE FUNCTION fn_notificar_invalidacion('id');
+
+-- registro_asistencia / entrega_tp: no hay caches de esas tablas, así que
+-- no publican nada (un trigger por fila en las tablas más escritas sería
+-- costo puro). Los DROP quitan los triggers de bases creadas antes
+DROP TRIGGER IF EXISTS trg_notificar_registro_asistencia ON registro_asistencia;
+DROP TRIGGER IF EXISTS trg_notificar_entrega_tp ON entrega_tp;
+
+DROP TRIGGER IF EXISTS trg_notificar_truncate_curso ON curso;
+CREATE TRIGGER trg_notificar_truncate_curso
+AFTER TRUNCATE ON curso
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_notificar_invalidacion();
+
+DROP TRIGGER IF EXISTS trg_notificar_truncate_clase ON clase;
+CREATE TRIGGER trg_notificar_truncate_clase
+AFTER TRUNCATE ON clase
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_notificar_invalidacion();
+
+DROP TRIGGER IF EXISTS trg_notificar_truncate_trabajo_practico ON trabajo_practico;
+CREATE TRIGGER trg_notificar_truncate_trabajo_practico
+AFTER TRUNCATE ON trabajo_practico
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_notificar_invalidacion();
+
+DROP TRIGGER IF EXISTS trg_notificar_truncate_inscripcion ON inscripcion;
+CREATE TRIGGER trg_notificar_truncate_inscripcion
+AFTER TRUNCATE ON inscripcion
+FOR EACH STATEMENT
+EXECUTE FUNCTION fn_notificar_invalidacion();
 """
@@ -98,6 +98,8 @@ CREATE TABLE IF NOT EXISTS clase (
 -- Índices para clase
 CREATE INDEX IF NOT EXISTS idx_clase_curso ON clase(curso_id);
 CREATE INDEX IF NOT EXISTS idx_clase_fecha ON clase(fecha);
+CREATE INDEX IF NOT EXISTS idx_clase_fecha_id_desc ON clase(fecha DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_clase_curso_fecha ON clase(curso_id, fecha);
 
 -- ============================================================================
 -- TABLA: registro_asistencia
@@ -185,6 +187,9 @@ CREATE TABLE IF NOT EXISTS entrega_tp (
     fecha_entrega_real DATE,
     entregado BOOLEAN NOT NULL DEFAULT 0,
     es_tardia BOOLEAN NOT NULL DEFAULT 0,
+    estado TEXT NOT NULL DEFAULT 'pendiente',
+    nota REAL,
+    observaciones TEXT,
     fecha_registro TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     -- Foreign Keys
@@ -344,6 +349,185 @@ BEGIN
     WHERE id = NEW.id;
 END;
 
+-- ============================================================================
+-- TABLA: tabla_version
+-- Descripción: Contador de cambios por tabla (para ETags HTTP baratos)
+-- SQLite no tiene triggers por sentencia: se incrementa una vez por fila
+-- modificada, que alcanza igual para saber si la tabla cambió
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS tabla_version (
+    tabla TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_version_alumno_insert
+AFTER INSERT ON alumno
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('alumno', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_alumno_update
+AFTER UPDATE ON alumno
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('alumno', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_alumno_delete
+AFTER DELETE ON alumno
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('alumno', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_curso_insert
+AFTER INSERT ON curso
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('curso', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_curso_update
+AFTER UPDATE ON curso
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('curso', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_curso_delete
+AFTER DELETE ON curso
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('curso', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_inscripcion_insert
+AFTER INSERT ON inscripcion
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('inscripcion', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_inscripcion_update
+AFTER UPDATE ON inscripcion
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('inscripcion', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_inscripcion_delete
+AFTER DELETE ON inscripcion
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('inscripcion', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_clase_insert
+AFTER INSERT ON clase
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('clase', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_clase_update
+AFTER UPDATE ON clase
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('clase', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_clase_delete
+AFTER DELETE ON clase
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('clase', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_registro_asistencia_insert
+AFTER INSERT ON registro_asistencia
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('registro_asistencia', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_registro_asistencia_update
+AFTER UPDATE ON registro_asistencia
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('registro_asistencia', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_registro_asistencia_delete
+AFTER DELETE ON registro_asistencia
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('registro_asistencia', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_registro_participacion_insert
+AFTER INSERT ON registro_participacion
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('registro_participacion', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_registro_participacion_update
+AFTER UPDATE ON registro_participacion
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('registro_participacion', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_registro_participacion_delete
+AFTER DELETE ON registro_participacion
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('registro_participacion', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_trabajo_practico_insert
+AFTER INSERT ON trabajo_practico
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('trabajo_practico', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_trabajo_practico_update
+AFTER UPDATE ON trabajo_practico
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('trabajo_practico', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_trabajo_practico_delete
+AFTER DELETE ON trabajo_practico
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('trabajo_practico', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_entrega_tp_insert
+AFTER INSERT ON entrega_tp
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('entrega_tp', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_entrega_tp_update
+AFTER UPDATE ON entrega_tp
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('entrega_tp', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_version_entrega_tp_delete
+AFTER DELETE ON entrega_tp
+BEGIN
+    INSERT INTO tabla_version (tabla, version) VALUES ('entrega_tp', 1)
+    ON CONFLICT (tabla) DO UPDATE SET version = version + 1;
+END;
+
 -- ============================================================================
 -- DATOS DE EJEMPLO (Comentados - descomentar para testing)
 -- ============================================================================
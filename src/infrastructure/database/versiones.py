@@ -0,0 +1,56 @@
+"""
+Versiones de Tablas
+Sistema de Seguimiento de Alumnos
+
+Lee los contadores de cambios de la tabla tabla_version (mantenida por
+triggers que la incrementan una vez por transacción, en el COMMIT, ver
+postgres_schema.py).
+
+Decisión de diseño: Versión por tabla en la propia BD
+- Sobrevive a múltiples instancias serverless (no depende de memoria local)
+- Leerla es un SELECT sobre una tabla de 8 filas con PK: mucho más barato
+  que recalcular un listado o el dashboard
+- Las escrituras que hacen rollback no incrementan la versión
+- Con DB_BACKEND=memoria los contadores los lleva el almacén (ahí un
+  ROLLBACK también incrementa: invalida de más, nunca de menos)
+"""
+
+from typing import Dict, Iterable
+
+from src.infrastructure.database.connection import get_db_connection
+from src.infrastructure.repositories.backends import backend_activo
+
+
+def obtener_versiones(tablas: Iterable[str]) -> Dict[str, int]:
+    """
+    Obtiene la versión actual de cada tabla pedida.
+
+    Las tablas que todavía no registraron cambios tienen versión 0.
+
+    Args:
+        tablas: Nombres de tablas
+
+    Returns:
+        Dict[str, int]: {tabla: version}
+    """
+    tablas = list(tablas)
+    if backend_activo() == "memoria":
+        # El almacén lleva sus propios contadores
+        return get_db_connection().versiones(tablas)
+
+    versiones = {tabla: 0 for tabla in tablas}
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT tabla, version FROM tabla_version WHERE tabla = ANY(%s)",
+            (tablas,)
+        )
+        for tabla, version in cursor.fetchall():
+            versiones[tabla] = version
+        conn.commit()
+    finally:
+        cursor.close()
+
+    return versiones
@@ -0,0 +1 @@
+# monitoreo package
@@ -0,0 +1,219 @@
+"""
+Registro de Consultas Lentas con Captura de Planes
+Sistema de Seguimiento de Alumnos
+
+Cuando una sentencia tarda más que el umbral, el cursor instrumentado (ver
+database/instrumentacion.py) la registra aquí. Se loguea una línea JSON con
+el SQL y los parámetros redactados, y la entrada se guarda en un buffer
+circular que se consulta en GET /api/consultas-lentas. Para una fracción
+de ellas (muestreo) se captura además el plan de ejecución.
+
+Configuración por entorno:
+- CONSULTA_LENTA_MS: umbral en milisegundos (por defecto 200)
+- CONSULTA_LENTA_MUESTREO: fracción de consultas lentas con EXPLAIN (0.1)
+- CONSULTA_LENTA_MAX: entradas del buffer circular (100)
+
+Decisión de diseño: Redactar antes de guardar
+- Los parámetros pueden ser DNIs, emails o nombres: del valor se guarda
+  solo el tipo (y el largo de textos y listas), nunca el contenido
+- Los literales de texto escritos en el SQL se reemplazan por '?'
+- El SQL redactado y los tipos alcanzan para reproducir el plan con datos
+  de prueba
+
+Decisión de diseño: EXPLAIN ANALYZE solo para lecturas
+- ANALYZE vuelve a ejecutar la sentencia: en un INSERT/UPDATE/DELETE la
+  aplicaría dos veces. Para escrituras se captura el plan estimado (EXPLAIN
+  sin ANALYZE)
+- Corre en la misma conexión (ve lo mismo que la sentencia original, con
+  los mismos parámetros) dentro de un SAVEPOINT: si el EXPLAIN falla no
+  aborta la transacción de la request
+- Re-ejecutar una consulta lenta duplica su costo: por eso el muestreo, y
+  cada sentencia distinta se explica como mucho una vez por minuto
+- En SQLite se usa EXPLAIN QUERY PLAN (no tiene ANALYZE ni BUFFERS)
+"""
+
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.database.conexion_sqlite import ConexionSQLite, TransaccionSQLite
+
+_LITERAL_TEXTO = re.compile(r"'(?:[^']|'')*'")
+_ESCRITURA = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE|TRUNCATE)\b", re.IGNORECASE)
+_EXPLICABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+# Segundos mínimos entre dos EXPLAIN de la misma sentencia
+_ESPERA_ENTRE_PLANES = 60.0
+
+
+def redactar_sql(sql: str) -> str:
+    """SQL en una línea, sin literales de texto"""
+    return " ".join(_LITERAL_TEXTO.sub("'?'", sql).split())
+
+
+def redactar_parametro(valor: Any) -> Any:
+    """Tipo del parámetro, sin su contenido"""
+    if valor is None:
+        return None
+    if isinstance(valor, bool):
+        return "<bool>"
+    if isinstance(valor, (int, float, Decimal)):
+        return f"<{type(valor).__name__}>"
+    if isinstance(valor, (str, bytes)):
+        return f"<{type(valor).__name__}:{len(valor)}>"
+    if isinstance(valor, (list, tuple, set)):
+        return f"<list:{len(valor)}>"
+    return f"<{type(valor).__name__}>"
+
+
+def redactar_parametros(parametros: Any) -> Any:
+    if parametros is None:
+        return None
+    if isinstance(parametros, dict):
+        return {clave: redactar_parametro(valor) for clave, valor in parametros.items()}
+    if isinstance(parametros, (list, tuple)):
+        return [redactar_parametro(valor) for valor in parametros]
+    return redactar_parametro(parametros)
+
+
+class RegistroConsultasLentas:
+    """
+    Buffer circular de consultas lentas.
+
+    Args:
+        umbral_ms: Duración a partir de la cual una sentencia es lenta
+        muestreo: Fracción de consultas lentas a las que se les captura el plan
+        capacidad: Entradas que se conservan (las más viejas se descartan)
+        log: Escribir una línea JSON por consulta lenta
+    """
+
+    def __init__(self, umbral_ms: float = 200.0, muestreo: float = 0.1, capacidad: int = 100, log: bool = True):
+        self.umbral_segundos = umbral_ms / 1000
+        self.muestreo = muestreo
+        self.log = log
+        self._entradas: deque = deque(maxlen=capacidad)
+        self._ultimo_plan: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._azar = random.Random()
+        self.registradas = 0
+        self.planes = 0
+
+    def registrar(self, conexion, sql: str, parametros: Any, segundos: float, ruta: Optional[str] = None) -> None:
+        """
+        Registra una sentencia lenta.
+
+        Args:
+            conexion: Conexión cruda donde corrió (None: no capturar plan)
+            parametros: Parámetros tal como se pasaron a execute()
+        """
+        sql_redactado = redactar_sql(sql)
+        entrada = {
+            "fecha": datetime.now().isoformat(timespec="milliseconds"),
+            "ms": round(segundos * 1000, 1),
+            "sql": sql_redactado[:2000],
+            "parametros": redactar_parametros(parametros),
+            "ruta": ruta,
+            "plan": None,
+            "plan_tipo": None,
+        }
+
+        if conexion is not None and self._corresponde_plan(sql_redactado):
+            entrada["plan_tipo"], entrada["plan"] = capturar_plan(conexion, sql, parametros)
+
+        with self._lock:
+            self._entradas.append(entrada)
+            self.registradas += 1
+            if entrada["plan"] is not None:
+                self.planes += 1
+
+        if self.log:
+            print(json.dumps({"evento": "consulta_lenta", **entrada, "plan": None}, ensure_ascii=False), flush=True)
+
+    def _corresponde_plan(self, sql_redactado: str) -> bool:
+        if not _EXPLICABLE.match(sql_redactado) or self._azar.random() >= self.muestreo:
+            return False
+        ahora = time.monotonic()
+        with self._lock:
+            if ahora - self._ultimo_plan.get(sql_redactado, float("-inf")) < _ESPERA_ENTRE_PLANES:
+                return False
+            if len(self._ultimo_plan) > 1000:
+                self._ultimo_plan.clear()
+            self._ultimo_plan[sql_redactado] = ahora
+        return True
+
+    def entradas(self) -> List[Dict[str, Any]]:
+        """Consultas registradas, la más reciente primero"""
+        with self._lock:
+            return list(reversed(self._entradas))
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+            self._ultimo_plan.clear()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        return {
+            "umbral_ms": round(self.umbral_segundos * 1000, 1),
+            "muestreo": self.muestreo,
+            "capacidad": self._entradas.maxlen,
+            "registradas": self.registradas,
+            "planes": self.planes,
+        }
+
+
+def capturar_plan(conexion, sql: str, parametros: Any):
+    """
+    Plan de ejecución de la sentencia en la misma conexión.
+
+    Returns:
+        Tuple[str, Optional[str]]: (tipo de plan, texto del plan o None si falló)
+    """
+    argumentos = () if parametros is None else (parametros,)
+
+    if isinstance(conexion, (sqlite3.Connection, ConexionSQLite, TransaccionSQLite)):
+        try:
+            filas = conexion.execute("EXPLAIN QUERY PLAN " + sql, *argumentos).fetchall()
+            return "EXPLAIN QUERY PLAN", "\n".join(str(fila[-1]) for fila in filas)
+        except Exception as e:
+            print(f"⚠️ No se pudo capturar el plan: {e}")
+            return "EXPLAIN QUERY PLAN", None
+
+    if _ESCRITURA.search(sql):
+        tipo, opciones = "EXPLAIN", "(FORMAT TEXT)"
+    else:
+        tipo, opciones = "EXPLAIN ANALYZE", "(ANALYZE, BUFFERS, FORMAT TEXT)"
+
+    cursor = conexion.cursor()
+    try:
+        cursor.execute("SAVEPOINT plan_consulta_lenta")
+        try:
+            cursor.execute(f"EXPLAIN {opciones} {sql}", *argumentos)
+            plan = "\n".join(fila[0] for fila in cursor.fetchall())
+            cursor.execute("RELEASE SAVEPOINT plan_consulta_lenta")
+            return tipo, plan
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT plan_consulta_lenta")
+            cursor.execute("RELEASE SAVEPOINT plan_consulta_lenta")
+            print(f"⚠️ No se pudo capturar el plan: {e}")
+            return tipo, None
+    except Exception as e:
+        # Sin transacción abierta (autocommit) no hay SAVEPOINT
+        print(f"⚠️ No se pudo capturar el plan: {e}")
+        return tipo, None
+    finally:
+        cursor.close()
+
+
+CONSULTAS_LENTAS = RegistroConsultasLentas(
+    umbral_ms=float(os.environ.get("CONSULTA_LENTA_MS", "200")),
+    muestreo=float(os.environ.get("CONSULTA_LENTA_MUESTREO", "0.1")),
+    capacidad=int(os.environ.get("CONSULTA_LENTA_MAX", "100")),
+)
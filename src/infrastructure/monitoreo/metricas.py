@@ -0,0 +1,231 @@
+"""
+Métricas del Proceso en Formato Prometheus
+Sistema de Seguimiento de Alumnos
+
+Contadores, gauges e histogramas que se exponen en GET /api/metrics con el
+formato de texto de Prometheus (version 0.0.4), para seguir SLOs de
+latencia y la capacidad bajo carga.
+
+Decisión de diseño: Un fragmento de contadores por thread
+- Cada thread (el event loop, los del threadpool de FastAPI) suma en sus
+  propios diccionarios: registrar una métrica no toma ningún lock
+- La exposición suma los fragmentos de todos los threads; copiar un dict
+  es atómico bajo el GIL, así que leer mientras otro thread escribe es seguro
+- Solo la primera métrica de cada thread toma un lock, para dar de alta su
+  fragmento
+- Los gauges que se incrementan y decrementan (requests en curso) también
+  se fragmentan: la suma de los fragmentos es el valor actual
+
+Decisión de diseño: Colectores para lo que ya se cuenta en otro lado
+- Los caches y la escucha de invalidaciones ya llevan sus estadísticas:
+  un colector las lee al exponer, sin duplicar contadores en el camino
+  caliente
+- Las métricas son por proceso: con varios workers, Prometheus scrapea
+  cada uno (o se suman con la etiqueta de instancia)
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latencias en segundos: de 5 ms (un GET cacheado) a 10 s
+BUCKETS_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Etiquetas = Tuple[Tuple[str, str], ...]
+Muestra = Tuple[str, Etiquetas, float]
+
+
+class _Fragmento:
+    """Métricas registradas por un thread"""
+
+    __slots__ = ("valores", "histogramas")
+
+    def __init__(self):
+        # (nombre, etiquetas) -> valor
+        self.valores: Dict[Tuple[str, Etiquetas], float] = {}
+        # (nombre, etiquetas) -> [cuenta por bucket..., cuenta +Inf, suma]
+        self.histogramas: Dict[Tuple[str, Etiquetas], List[float]] = {}
+
+
+class RegistroMetricas:
+    """
+    Registro de métricas de un proceso.
+
+    Las métricas se declaran una vez con describir() y se registran con
+    incrementar() (contadores y gauges) u observar() (histogramas). Las
+    etiquetas son tuplas de pares (clave, valor) en orden fijo.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._fragmentos: List[_Fragmento] = []
+        self._lock_alta = threading.Lock()
+        # nombre -> (tipo, ayuda, buckets)
+        self._descripciones: Dict[str, Tuple[str, str, Optional[Tuple[float, ...]]]] = {}
+        self._colectores: List[Callable[[], Iterable[Muestra]]] = []
+
+    def describir(self, nombre: str, tipo: str, ayuda: str, buckets: Tuple[float, ...] = BUCKETS_SEGUNDOS) -> None:
+        """Declara una métrica (tipo: counter, gauge o histogram)"""
+        self._descripciones[nombre] = (tipo, ayuda, buckets if tipo == "histogram" else None)
+
+    def registrar_colector(self, colector: Callable[[], Iterable[Muestra]]) -> None:
+        """Función que devuelve muestras (nombre, etiquetas, valor) al exponer"""
+        self._colectores.append(colector)
+
+    def _fragmento(self) -> _Fragmento:
+        try:
+            return self._local.fragmento
+        except AttributeError:
+            fragmento = _Fragmento()
+            with self._lock_alta:
+                self._fragmentos.append(fragmento)
+            self._local.fragmento = fragmento
+            return fragmento
+
+    def incrementar(self, nombre: str, etiquetas: Etiquetas = (), valor: float = 1.0) -> None:
+        """Suma 'valor' (negativo para bajar un gauge)"""
+        valores = self._fragmento().valores
+        clave = (nombre, etiquetas)
+        valores[clave] = valores.get(clave, 0.0) + valor
+
+    def observar(self, nombre: str, valor: float, etiquetas: Etiquetas = ()) -> None:
+        """Registra una observación en un histograma"""
+        histogramas = self._fragmento().histogramas
+        clave = (nombre, etiquetas)
+        buckets = self._descripciones[nombre][2]
+        datos = histogramas.get(clave)
+        if datos is None:
+            datos = histogramas[clave] = [0.0] * (len(buckets) + 2)
+        datos[bisect_left(buckets, valor)] += 1
+        datos[-1] += valor
+
+    def _sumar_fragmentos(self):
+        with self._lock_alta:
+            fragmentos = list(self._fragmentos)
+        valores: Dict[Tuple[str, Etiquetas], float] = {}
+        histogramas: Dict[Tuple[str, Etiquetas], List[float]] = {}
+        for fragmento in fragmentos:
+            for clave, valor in dict(fragmento.valores).items():
+                valores[clave] = valores.get(clave, 0.0) + valor
+            for clave, datos in dict(fragmento.histogramas).items():
+                datos = list(datos)
+                acumulado = histogramas.get(clave)
+                if acumulado is None:
+                    histogramas[clave] = datos
+                else:
+                    for i, cuenta in enumerate(datos):
+                        acumulado[i] += cuenta
+        return valores, histogramas
+
+    def exponer(self) -> str:
+        """Todas las métricas en formato de texto de Prometheus"""
+        valores, histogramas = self._sumar_fragmentos()
+        for colector in self._colectores:
+            try:
+                for nombre, etiquetas, valor in colector():
+                    valores[(nombre, etiquetas)] = valor
+            except Exception as e:
+                print(f"⚠️ Error en colector de métricas: {e}")
+
+        por_nombre: Dict[str, List[Tuple[Etiquetas, object]]] = {}
+        for (nombre, etiquetas), valor in list(valores.items()) + list(histogramas.items()):
+            por_nombre.setdefault(nombre, []).append((etiquetas, valor))
+
+        lineas = []
+        for nombre, (tipo, ayuda, buckets) in self._descripciones.items():
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} {tipo}")
+            for etiquetas, valor in sorted(por_nombre.get(nombre, []), key=lambda m: m[0]):
+                if tipo == "histogram":
+                    lineas.extend(_lineas_histograma(nombre, etiquetas, buckets, valor))
+                else:
+                    lineas.append(f"{nombre}{_formatear_etiquetas(etiquetas)} {_formatear_valor(valor)}")
+        return "\n".join(lineas) + "\n"
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _formatear_etiquetas(etiquetas: Etiquetas) -> str:
+    if not etiquetas:
+        return ""
+    return "{" + ",".join(f'{clave}="{_escapar(str(valor))}"' for clave, valor in etiquetas) + "}"
+
+
+def _formatear_valor(valor: float) -> str:
+    return str(int(valor)) if float(valor).is_integer() else repr(float(valor))
+
+
+def _lineas_histograma(nombre: str, etiquetas: Etiquetas, buckets: Tuple[float, ...], datos: List[float]) -> List[str]:
+    lineas = []
+    acumulado = 0.0
+    for limite, cuenta in zip(buckets + (float("inf"),), datos[:-1]):
+        acumulado += cuenta
+        le = "+Inf" if limite == float("inf") else repr(limite)
+        lineas.append(f"{nombre}_bucket{_formatear_etiquetas(etiquetas + (('le', le),))} {_formatear_valor(acumulado)}")
+    lineas.append(f"{nombre}_sum{_formatear_etiquetas(etiquetas)} {_formatear_valor(datos[-1])}")
+    lineas.append(f"{nombre}_count{_formatear_etiquetas(etiquetas)} {_formatear_valor(acumulado)}")
+    return lineas
+
+
+# ============================================================================
+# Registro del proceso y métricas de la app
+# ============================================================================
+
+METRICAS = RegistroMetricas()
+
+METRICAS.describir(
+    "http_request_duracion_segundos", "histogram",
+    "Latencia de las requests HTTP por ruta (plantilla), método y status",
+)
+METRICAS.describir("http_requests_en_curso", "gauge", "Requests HTTP en curso por método")
+METRICAS.describir("http_consultas_sql_total", "counter", "Sentencias SQL ejecutadas por ruta (plantilla)")
+METRICAS.describir(
+    "db_conexion_espera_segundos", "histogram",
+    "Espera para obtener una conexión: verificación de la compartida o apertura de una nueva",
+)
+METRICAS.describir("db_reconexiones_total", "counter", "Veces que get_db_connection() reabrió la conexión compartida")
+METRICAS.describir("db_consultas_lentas_total", "counter", "Sentencias que superaron CONSULTA_LENTA_MS")
+METRICAS.describir("cache_aciertos_total", "counter", "Aciertos de cada cache de entidades")
+METRICAS.describir("cache_fallos_total", "counter", "Fallos de cada cache de entidades")
+METRICAS.describir("cache_tasa_aciertos", "gauge", "Aciertos / consultas de cada cache de entidades")
+METRICAS.describir("cache_entradas", "gauge", "Entradas en cada cache de entidades")
+METRICAS.describir(
+    "invalidacion_reconexiones_total", "counter",
+    "Reconexiones del LISTEN de invalidaciones entre workers",
+)
+METRICAS.describir("invalidacion_conectada", "gauge", "1 si el LISTEN de invalidaciones está conectado")
+
+
+def _colectar_caches() -> Iterable[Muestra]:
+    from src.infrastructure.cache.repositorios_cacheados import estadisticas_caches
+
+    for nombre, estadisticas in estadisticas_caches().items():
+        etiquetas = (("cache", nombre),)
+        yield "cache_aciertos_total", etiquetas, estadisticas.get("hits", 0)
+        yield "cache_fallos_total", etiquetas, estadisticas.get("misses", 0)
+        yield "cache_tasa_aciertos", etiquetas, estadisticas.get("hit_rate", 0.0)
+        yield "cache_entradas", etiquetas, estadisticas.get("entradas", 0)
+
+
+def _colectar_invalidacion() -> Iterable[Muestra]:
+    from src.infrastructure.cache.bus_invalidacion import estadisticas_escucha
+
+    estadisticas = estadisticas_escucha()
+    if estadisticas is None:
+        # No se inició en este proceso (INVALIDACION_CACHE=0)
+        return
+    yield "invalidacion_reconexiones_total", (), estadisticas.get("reconexiones", 0)
+    yield "invalidacion_conectada", (), 1 if estadisticas.get("conectado") else 0
+
+
+def _colectar_consultas_lentas() -> Iterable[Muestra]:
+    from src.infrastructure.monitoreo.consultas_lentas import CONSULTAS_LENTAS
+
+    yield "db_consultas_lentas_total", (), CONSULTAS_LENTAS.registradas
+
+
+METRICAS.registrar_colector(_colectar_caches)
+METRICAS.registrar_colector(_colectar_consultas_lentas)
+METRICAS.registrar_colector(_colectar_invalidacion)
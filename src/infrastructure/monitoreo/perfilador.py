@@ -0,0 +1,135 @@
+"""
+Perfilador por Muestreo para Requests Individuales
+Sistema de Seguimiento de Alumnos
+
+Mientras dura una request perfilada, un thread toma cada ~1 ms la pila de
+los demás threads del proceso y cuenta cuántas veces aparece cada pila. El
+resultado se guarda en formato "folded" (una línea por pila: marcos
+separados por ';' y la cantidad de muestras), que leen directamente
+flamegraph.pl, speedscope e inferno.
+
+Decisión de diseño: Muestreo y no cProfile
+- Las rutas sync corren en el threadpool de FastAPI y cProfile solo ve el
+  thread que lo activó; sys._current_frames() ve todos
+- El costo lo paga el thread muestreador, no el código perfilado: los
+  tiempos relativos no se distorsionan como con un perfilador determinista
+- Se descartan las muestras de threads ociosos (esperando en una cola, un
+  lock o el selector del event loop)
+- Con otras requests en paralelo sus pilas también aparecen (van con el
+  nombre de su thread como primer marco); perfilar una a la vez lo acota
+
+Uso:
+    perfilador = PerfiladorMuestreo()
+    perfilador.iniciar()
+    ...
+    folded = perfilador.detener()
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Archivos donde un thread está esperando (sin trabajo que perfilar)
+_ARCHIVOS_OCIOSOS = ("threading.py", "queue.py", "selectors.py")
+
+# Tope por perfil: una request colgada no deja el muestreador corriendo
+_SEGUNDOS_MAXIMOS = 30.0
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _nombre_marco(codigo) -> str:
+    archivo = codigo.co_filename
+    if archivo.startswith(_RAIZ_PROYECTO):
+        archivo = os.path.relpath(archivo, _RAIZ_PROYECTO)
+    else:
+        archivo = os.path.basename(archivo)
+    # ';' separa marcos en el formato folded (la cuenta va después del último espacio)
+    return f"{codigo.co_qualname} ({archivo}:{codigo.co_firstlineno})".replace(";", ",")
+
+
+class PerfiladorMuestreo:
+    """
+    Muestrea las pilas de todos los threads (salvo el propio) hasta detener().
+
+    Args:
+        intervalo_segundos: Tiempo entre muestras
+    """
+
+    def __init__(self, intervalo_segundos: float = 0.001):
+        self.intervalo_segundos = intervalo_segundos
+        self.muestras = 0
+        self._pilas: Counter = Counter()
+        self._detener = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def iniciar(self) -> None:
+        self._thread = threading.Thread(target=self._muestrear, name="perfilador", daemon=True)
+        self._thread.start()
+
+    def detener(self) -> str:
+        """Detiene el muestreo y devuelve las pilas en formato folded"""
+        self._detener.set()
+        if self._thread is not None:
+            self._thread.join()
+        return "\n".join(
+            f"{';'.join(pila)} {cantidad}" for pila, cantidad in self._pilas.most_common()
+        ) + "\n"
+
+    def _muestrear(self) -> None:
+        propio = threading.get_ident()
+        fin = time.monotonic() + _SEGUNDOS_MAXIMOS
+        while not self._detener.wait(self.intervalo_segundos) and time.monotonic() < fin:
+            nombres = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, marco in sys._current_frames().items():
+                if ident == propio or marco.f_code.co_filename.endswith(_ARCHIVOS_OCIOSOS):
+                    continue
+                pila = []
+                while marco is not None:
+                    pila.append(_nombre_marco(marco.f_code))
+                    marco = marco.f_back
+                pila.append(nombres.get(ident, str(ident)).replace(";", ","))
+                self._pilas[tuple(reversed(pila))] += 1
+            self.muestras += 1
+
+
+class RegistroPerfiles:
+    """Últimos perfiles tomados, por ID"""
+
+    def __init__(self, capacidad: int = 20):
+        self._perfiles: deque = deque(maxlen=capacidad)
+        self._lock = threading.Lock()
+
+    def nuevo_id(self) -> str:
+        return uuid.uuid4().hex[:12]
+
+    def guardar(self, id: str, ruta: str, segundos: float, muestras: int, folded: str) -> None:
+        with self._lock:
+            self._perfiles.append({
+                "id": id,
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "ruta": ruta,
+                "ms": round(segundos * 1000, 1),
+                "muestras": muestras,
+                "folded": folded,
+            })
+
+    def obtener(self, id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return next((perfil for perfil in self._perfiles if perfil["id"] == id), None)
+
+    def resumen(self) -> List[Dict[str, Any]]:
+        """Perfiles guardados (sin las pilas), el más reciente primero"""
+        with self._lock:
+            return [
+                {clave: valor for clave, valor in perfil.items() if clave != "folded"}
+                for perfil in reversed(self._perfiles)
+            ]
+
+
+PERFILES = RegistroPerfiles()
@@ -0,0 +1,98 @@
+"""
+Registro de Backends de Persistencia
+Sistema de Seguimiento de Alumnos
+
+Elige la implementación de cada repositorio según la variable DB_BACKEND:
+- postgres (por defecto): pg8000 contra POSTGRES_URL / DATABASE_URL
+- sqlite: archivo local SQLITE_PATH (ver database/conexion_sqlite.py)
+- memoria: diccionarios en el proceso, sin persistencia (ver
+  database/almacen_memoria.py); para benchmarks y pruebas
+
+Decisión de diseño: Registro por nombre de entidad, con import diferido
+- Los routers piden "alumno", "clase", ... y no conocen la clase concreta:
+  cambiar de backend no toca routers ni servicios
+- Cada implementación se importa recién cuando se pide: con SQLite no se
+  importan pg8000 ni los repositorios de PostgreSQL
+- Los caches (repositorios_cacheados) envuelven el repositorio que
+  devuelva el registro, sea del backend que sea
+"""
+
+import importlib
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+BACKEND_POR_DEFECTO = "postgres"
+
+_POSTGRES = "src.infrastructure.repositories.postgres"
+_SQLITE = "src.infrastructure.repositories.sqlite"
+_MEMORIA = "src.infrastructure.repositories.memoria"
+
+# backend -> entidad -> "modulo.Clase"
+REPOSITORIOS: Dict[str, Dict[str, str]] = {
+    "postgres": {
+        "alumno": f"{_POSTGRES}.alumno_repository_postgres.AlumnoRepositoryPostgres",
+        "curso": f"{_POSTGRES}.curso_repository_postgres.CursoRepositoryPostgres",
+        "inscripcion": f"{_POSTGRES}.inscripcion_repository_postgres.InscripcionRepositoryPostgres",
+        "clase": f"{_POSTGRES}.clase_repository_postgres.ClaseRepositoryPostgres",
+        "asistencia": f"{_POSTGRES}.asistencia_repository_postgres.RegistroAsistenciaRepositoryPostgres",
+        "participacion": f"{_POSTGRES}.participacion_repository_postgres.RegistroParticipacionRepositoryPostgres",
+        "tp": f"{_POSTGRES}.tp_repository_postgres.TrabajoPracticoRepositoryPostgres",
+        "entrega": f"{_POSTGRES}.entrega_repository_postgres.EntregaTPRepositoryPostgres",
+        "export": f"{_POSTGRES}.export_repository_postgres.ExportRepositoryPostgres",
+    },
+    "sqlite": {
+        "alumno": f"{_SQLITE}.alumno_repository_sqlite.AlumnoRepositorySQLite",
+        "curso": f"{_SQLITE}.curso_repository_sqlite.CursoRepositorySQLite",
+        "inscripcion": f"{_SQLITE}.inscripcion_repository_sqlite.InscripcionRepositorySQLite",
+        "clase": f"{_SQLITE}.clase_repository_sqlite.ClaseRepositorySQLite",
+        "asistencia": f"{_SQLITE}.asistencia_repository_sqlite.RegistroAsistenciaRepositorySQLite",
+        "participacion": f"{_SQLITE}.participacion_repository_sqlite.RegistroParticipacionRepositorySQLite",
+        "tp": f"{_SQLITE}.tp_repository_sqlite.TrabajoPracticoRepositorySQLite",
+        "entrega": f"{_SQLITE}.entrega_tp_repository_sqlite.EntregaTPRepositorySQLite",
+        "export": f"{_SQLITE}.export_repository_sqlite.ExportRepositorySQLite",
+    },
+    "memoria": {
+        "alumno": f"{_MEMORIA}.alumno_repository_memoria.AlumnoRepositoryMemoria",
+        "curso": f"{_MEMORIA}.curso_repository_memoria.CursoRepositoryMemoria",
+        "inscripcion": f"{_MEMORIA}.inscripcion_repository_memoria.InscripcionRepositoryMemoria",
+        "clase": f"{_MEMORIA}.clase_repository_memoria.ClaseRepositoryMemoria",
+        "asistencia": f"{_MEMORIA}.asistencia_repository_memoria.RegistroAsistenciaRepositoryMemoria",
+        "participacion": f"{_MEMORIA}.participacion_repository_memoria.RegistroParticipacionRepositoryMemoria",
+        "tp": f"{_MEMORIA}.tp_repository_memoria.TrabajoPracticoRepositoryMemoria",
+        "entrega": f"{_MEMORIA}.entrega_tp_repository_memoria.EntregaTPRepositoryMemoria",
+        "export": f"{_MEMORIA}.export_repository_memoria.ExportRepositoryMemoria",
+    },
+}
+
+
+def backend_activo() -> str:
+    """Backend configurado en DB_BACKEND"""
+    backend = os.environ.get("DB_BACKEND", BACKEND_POR_DEFECTO).strip().lower()
+    if backend not in REPOSITORIOS:
+        raise ValueError(f"DB_BACKEND desconocido: {backend!r} (opciones: {', '.join(REPOSITORIOS)})")
+    return backend
+
+
+@lru_cache(maxsize=None)
+def clase_repositorio(entidad: str, backend: str) -> type:
+    """Clase que implementa el repositorio de la entidad en el backend"""
+    try:
+        ruta = REPOSITORIOS[backend][entidad]
+    except KeyError:
+        raise ValueError(f"No hay repositorio '{entidad}' para el backend '{backend}'")
+    modulo, nombre = ruta.rsplit(".", 1)
+    return getattr(importlib.import_module(modulo), nombre)
+
+
+def crear_repositorio(entidad: str, conexion: Any, backend: Optional[str] = None):
+    """
+    Instancia el repositorio de una entidad.
+
+    Args:
+        entidad: alumno, curso, inscripcion, clase, asistencia,
+            participacion, tp, entrega o export
+        conexion: Conexión del backend (ver get_db_connection)
+        backend: Por defecto, el de DB_BACKEND
+    """
+    return clase_repositorio(entidad, backend or backend_activo())(conexion)
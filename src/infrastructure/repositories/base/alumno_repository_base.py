@@ -16,7 +16,7 @@ Principio SOLID aplicado: Dependency Inversion
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from src.domain.entities.alumno import Alumno
 
 
@@ -50,6 +50,24 @@ class AlumnoRepositoryBase(ABC):
         """
         pass
     
+    @abstractmethod
+    def crear_lote(self, alumnos: List[Alumno], actualizar_existentes: bool = False) -> Tuple[List[Alumno], List[Alumno]]:
+        """
+        Inserta muchos alumnos en una sola sentencia (INSERT ... ON CONFLICT (dni)).
+        
+        Los DNIs del lote no deben repetirse entre sí.
+        
+        Args:
+            alumnos: Alumnos a insertar (sin ID)
+            actualizar_existentes: True para sobrescribir los datos de los DNIs
+                que ya existen, False para dejarlos como están
+        
+        Returns:
+            Tuple[List[Alumno], List[Alumno]]: (creados, actualizados). Los
+            DNIs existentes que no se actualizaron no aparecen en ninguna lista
+        """
+        pass
+    
     @abstractmethod
     def obtener_por_id(self, id: int) -> Optional[Alumno]:
         """
@@ -63,6 +81,19 @@ class AlumnoRepositoryBase(ABC):
         """
         pass
     
+    @abstractmethod
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Alumno]:
+        """
+        Obtiene varios alumnos por ID en una sola consulta.
+        
+        Args:
+            ids: IDs a buscar (se ignoran repetidos)
+        
+        Returns:
+            Dict[int, Alumno]: {id: entidad} solo con los que existen
+        """
+        pass
+    
     @abstractmethod
     def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
         """
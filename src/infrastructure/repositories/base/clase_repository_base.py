@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import date
 from src.domain.entities.clase import Clase
 
@@ -18,6 +18,10 @@ class ClaseRepositoryBase(ABC):
     def obtener_por_id(self, id: int) -> Optional[Clase]:
         pass
     
+    @abstractmethod
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Clase]:
+        pass
+    
     @abstractmethod
     def obtener_por_curso(self, curso_id: int) -> List[Clase]:
         pass
@@ -26,6 +30,18 @@ class ClaseRepositoryBase(ABC):
     def obtener_por_fecha(self, curso_id: int, fecha: date) -> Optional[Clase]:
         pass
     
+    @abstractmethod
+    def obtener_recientes(self, limite: int, docente: Optional[str] = None) -> List[dict]:
+        """
+        Clases más recientes de todos los cursos, en una sola consulta.
+        
+        Returns:
+            List[dict]: {"clase": Clase, "curso_nombre", "curso_anio",
+                         "total_registros", "presentes", "ausentes",
+                         "tardanzas", "justificadas"} ordenadas por fecha DESC
+        """
+        pass
+    
     @abstractmethod
     def actualizar(self, clase: Clase) -> Clase:
         pass
@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from src.domain.entities.curso import Curso
 
 
@@ -23,6 +23,11 @@ class CursoRepositoryBase(ABC):
         """Obtiene un curso por su ID."""
         pass
     
+    @abstractmethod
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Curso]:
+        """Obtiene varios cursos por ID en una sola consulta ({id: curso}, solo los que existen)."""
+        pass
+    
     @abstractmethod
     def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Curso]:
         """Obtiene todos los cursos del sistema."""
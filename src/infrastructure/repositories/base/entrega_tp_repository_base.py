@@ -14,6 +14,17 @@ class EntregaTPRepositoryBase(ABC):
         # UPSERT functionality might be useful here
         pass
     
+    @abstractmethod
+    def crear_o_actualizar_lote(self, entregas: List[EntregaTP]) -> List[EntregaTP]:
+        """
+        Upsert de muchas entregas en una sola sentencia.
+        
+        Las entregas son todas del mismo TP y llegan con entregado,
+        es_tardia y fecha_entrega_real ya calculados; no puede haber dos
+        del mismo alumno.
+        """
+        pass
+    
     @abstractmethod
     def obtener_por_id(self, id: int) -> Optional[EntregaTP]:
         pass
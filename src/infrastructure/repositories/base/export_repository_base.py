@@ -0,0 +1,43 @@
+"""
+Interfaz Base: ExportRepository
+Sistema de Seguimiento de Alumnos
+
+Lectura en streaming de los datos de un curso para exportarlos.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, Tuple
+
+# Tablas exportables -> columnas (en el orden en que se devuelven las filas)
+COLUMNAS_EXPORT: Dict[str, Tuple[str, ...]] = {
+    "asistencias": (
+        "id", "alumno_id", "dni", "apellido", "nombre",
+        "clase_id", "numero_clase", "fecha_clase", "estado", "fecha_registro",
+    ),
+    "participaciones": (
+        "id", "alumno_id", "dni", "apellido", "nombre",
+        "clase_id", "numero_clase", "fecha_clase", "nivel", "comentario", "fecha_registro",
+    ),
+    "entregas": (
+        "id", "alumno_id", "dni", "apellido", "nombre",
+        "trabajo_practico_id", "titulo", "fecha_limite", "fecha_entrega_real",
+        "entregado", "es_tardia", "estado", "nota", "observaciones", "fecha_registro",
+    ),
+}
+
+class ExportRepositoryBase(ABC):
+    
+    @abstractmethod
+    def iterar_filas(self, curso_id: int, tabla: str, tamano_lote: int = 1000) -> Iterator[Tuple]:
+        """
+        Itera las filas de una tabla del curso sin cargarlas todas en memoria.
+        
+        Args:
+            curso_id: ID del curso
+            tabla: Clave de COLUMNAS_EXPORT
+            tamano_lote: Filas traídas de la BD por viaje
+        
+        Yields:
+            Tuple: Fila en el orden de COLUMNAS_EXPORT[tabla]
+        """
+        pass
@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from src.domain.entities.inscripcion import Inscripcion
 
 class InscripcionRepositoryBase(ABC):
@@ -29,6 +29,38 @@ class InscripcionRepositoryBase(ABC):
     def existe(self, alumno_id: int, curso_id: int) -> bool:
         pass
     
+    @abstractmethod
+    def obtener_alumno_ids_por_curso(self, curso_id: int) -> List[int]:
+        """IDs de los alumnos inscriptos en un curso (una consulta, sin armar entidades)"""
+        pass
+    
+    @abstractmethod
+    def filtrar_inscriptos(self, curso_id: int, alumno_ids: Iterable[int]) -> Set[int]:
+        """Subconjunto de alumno_ids que están inscriptos en el curso (una consulta)"""
+        pass
+    
+    @abstractmethod
+    def inscribir_pares(self, pares: Iterable[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Inscribe muchos pares (alumno_id, curso_id) en una sola sentencia,
+        ignorando los que ya existen.
+        
+        Returns:
+            Tuple[int, List[Tuple[int, int]]]: (pares válidos, pares creados)
+        """
+        pass
+    
+    @abstractmethod
+    def inscribir_cohorte(self, cohorte: int, curso_ids: Iterable[int]) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Inscribe a todos los alumnos de una cohorte en los cursos indicados,
+        ignorando las inscripciones que ya existen.
+        
+        Returns:
+            Tuple[int, List[Tuple[int, int]]]: (pares alumno-curso candidatos, pares creados)
+        """
+        pass
+    
     @abstractmethod
     def eliminar(self, id: int) -> bool:
         pass
@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.domain.entities.registro_participacion import RegistroParticipacion
 
 class RegistroParticipacionRepositoryBase(ABC):
@@ -13,6 +13,26 @@ class RegistroParticipacionRepositoryBase(ABC):
     def crear(self, registro: RegistroParticipacion) -> RegistroParticipacion:
         pass
     
+    @abstractmethod
+    def crear_lote(
+        self,
+        clase_id: int,
+        registros: List[RegistroParticipacion],
+        reemplazar: bool = False
+    ) -> Tuple[List[RegistroParticipacion], int]:
+        """
+        Inserta muchos registros de una clase en una sola transacción.
+        
+        Args:
+            clase_id: Clase de todos los registros
+            registros: Registros a insertar (un INSERT multi-fila)
+            reemplazar: Si es True, antes borra los registros existentes de la clase
+        
+        Returns:
+            Tuple[List[RegistroParticipacion], int]: (registros creados, cantidad reemplazada)
+        """
+        pass
+    
     @abstractmethod
     def obtener_por_id(self, id: int) -> Optional[RegistroParticipacion]:
         pass
@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from src.domain.entities.trabajo_practico import TrabajoPractico
 
 class TrabajoPracticoRepositoryBase(ABC):
@@ -17,6 +17,10 @@ class TrabajoPracticoRepositoryBase(ABC):
     def obtener_por_id(self, id: int) -> Optional[TrabajoPractico]:
         pass
     
+    @abstractmethod
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, TrabajoPractico]:
+        pass
+    
     @abstractmethod
     def obtener_por_curso(self, curso_id: int) -> List[TrabajoPractico]:
         pass
@@ -0,0 +1 @@
+# memoria package
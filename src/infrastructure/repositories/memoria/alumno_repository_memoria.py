@@ -0,0 +1,113 @@
+"""
+Implementación en Memoria: AlumnoRepository
+Sistema de Seguimiento de Alumnos
+
+Mismo contrato que la versión PostgreSQL (orden, excepciones, carga
+masiva) sobre el AlmacenMemoria: el DNI se resuelve con su índice único.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+
+from src.infrastructure.repositories.base.alumno_repository_base import AlumnoRepositoryBase
+from src.infrastructure.database.almacen_memoria import ViolacionUnicidad
+from src.domain.entities.alumno import Alumno
+from src.domain.exceptions.domain_exceptions import (
+    DNIDuplicadoException,
+    AlumnoNoEncontradoException
+)
+
+TABLA = "alumno"
+
+
+def _orden(alumno: Alumno):
+    return (alumno.apellido, alumno.nombre, alumno.id)
+
+
+class AlumnoRepositoryMemoria(AlumnoRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, alumno: Alumno) -> Alumno:
+        nuevo = Alumno.from_row((None, alumno.nombre, alumno.apellido, alumno.dni,
+                                 alumno.email, alumno.cohorte, datetime.now()))
+        try:
+            guardado = self.conexion.insertar(TABLA, nuevo)
+        except ViolacionUnicidad:
+            raise DNIDuplicadoException(f"Ya existe un alumno con DNI {alumno.dni}")
+        alumno.id = guardado.id
+        alumno.fecha_creacion = guardado.fecha_creacion
+        return alumno
+
+    def crear_lote(self, alumnos: List[Alumno], actualizar_existentes: bool = False) -> Tuple[List[Alumno], List[Alumno]]:
+        if not alumnos:
+            return [], []
+        ahora = datetime.now()
+        creados, actualizados = [], []
+
+        with self.conexion.atomico() as conexion:
+            for alumno in alumnos:
+                existente = conexion.obtener_unico(TABLA, "dni", alumno.dni)
+                if existente is None:
+                    creados.append(conexion.insertar(TABLA, Alumno.from_row((
+                        None, alumno.nombre, alumno.apellido, alumno.dni, alumno.email, alumno.cohorte, ahora
+                    ))))
+                elif actualizar_existentes:
+                    existente.nombre = alumno.nombre
+                    existente.apellido = alumno.apellido
+                    existente.email = alumno.email
+                    existente.cohorte = alumno.cohorte
+                    conexion.reemplazar(TABLA, existente)
+                    actualizados.append(existente)
+        return creados, actualizados
+
+    def obtener_por_id(self, id: int) -> Optional[Alumno]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Alumno]:
+        return self.conexion.obtener_varios(TABLA, ids)
+
+    def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
+        return self.conexion.obtener_unico(TABLA, "dni", dni)
+
+    def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Alumno]:
+        alumnos = sorted(self.conexion.todos(TABLA), key=_orden)
+        if limite is not None:
+            return alumnos[offset:offset + limite]
+        return alumnos
+
+    def buscar_por_nombre(self, nombre: str) -> List[Alumno]:
+        # Como LOWER(...) LIKE LOWER('%texto%')
+        texto = nombre.lower()
+        return sorted(
+            self.conexion.todos(TABLA, lambda a: texto in a.nombre.lower() or texto in a.apellido.lower()),
+            key=_orden
+        )
+
+    def obtener_por_cohorte(self, cohorte: int) -> List[Alumno]:
+        return sorted(self.conexion.buscar(TABLA, "cohorte", cohorte), key=_orden)
+
+    def actualizar(self, alumno: Alumno) -> Alumno:
+        if alumno.id is None:
+            raise ValueError("El alumno debe tener un ID para actualizarlo")
+
+        existente = self.conexion.obtener(TABLA, alumno.id)
+        if existente is None:
+            raise AlumnoNoEncontradoException(f"No existe alumno con ID {alumno.id}")
+        existente.nombre = alumno.nombre
+        existente.apellido = alumno.apellido
+        existente.dni = alumno.dni
+        existente.email = alumno.email
+        existente.cohorte = alumno.cohorte
+        try:
+            self.conexion.reemplazar(TABLA, existente)
+        except ViolacionUnicidad:
+            raise DNIDuplicadoException(f"Ya existe otro alumno con DNI {alumno.dni}")
+        return alumno
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
+
+    def contar_total(self) -> int:
+        return self.conexion.contar(TABLA)
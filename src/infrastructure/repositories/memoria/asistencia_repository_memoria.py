@@ -0,0 +1,64 @@
+"""
+Implementación en Memoria: RegistroAsistenciaRepository
+Sistema de Seguimiento de Alumnos
+
+(alumno_id, clase_id) es un índice único, como el UNIQUE de la tabla.
+"""
+
+from typing import List, Optional
+from datetime import datetime
+
+from src.infrastructure.repositories.base.asistencia_repository_base import RegistroAsistenciaRepositoryBase
+from src.infrastructure.database.almacen_memoria import ViolacionUnicidad
+from src.domain.entities.registro_asistencia import RegistroAsistencia
+from src.domain.value_objects.enums import EstadoAsistencia
+from src.domain.exceptions.domain_exceptions import AsistenciaYaRegistradaException
+
+TABLA = "registro_asistencia"
+
+
+class RegistroAsistenciaRepositoryMemoria(RegistroAsistenciaRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, registro: RegistroAsistencia) -> RegistroAsistencia:
+        try:
+            guardado = self.conexion.insertar(TABLA, RegistroAsistencia.from_row((
+                None, registro.alumno_id, registro.clase_id, registro.estado.value, datetime.now()
+            )))
+        except ViolacionUnicidad:
+            raise AsistenciaYaRegistradaException(
+                f"Ya existe registro de asistencia para alumno {registro.alumno_id} en clase {registro.clase_id}"
+            )
+        registro.id = guardado.id
+        registro.fecha_registro = guardado.fecha_registro
+        return registro
+
+    def obtener_por_id(self, id: int) -> Optional[RegistroAsistencia]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_clase(self, clase_id: int) -> List[RegistroAsistencia]:
+        return self.conexion.buscar(TABLA, "clase_id", clase_id)
+
+    def obtener_por_alumno_y_curso(self, alumno_id: int, curso_id: int) -> List[RegistroAsistencia]:
+        # El JOIN con clase: las clases del curso, en orden de fecha
+        clases = {clase.id: clase for clase in self.conexion.buscar("clase", "curso_id", curso_id)}
+        registros = [r for r in self.conexion.buscar(TABLA, "alumno_id", alumno_id) if r.clase_id in clases]
+        return sorted(registros, key=lambda r: (clases[r.clase_id].fecha, r.id))
+
+    def existe(self, alumno_id: int, clase_id: int) -> bool:
+        return self.conexion.obtener_unico(TABLA, "alumno_clase", (alumno_id, clase_id)) is not None
+
+    def actualizar(self, registro: RegistroAsistencia) -> RegistroAsistencia:
+        if registro.id is None:
+            raise ValueError("ID requerido para actualizar")
+
+        existente = self.conexion.obtener(TABLA, registro.id)
+        if existente is not None:
+            existente.estado = EstadoAsistencia.desde_valor(registro.estado.value)
+            self.conexion.reemplazar(TABLA, existente)
+        return registro
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
@@ -0,0 +1,94 @@
+"""
+Implementación en Memoria: ClaseRepository
+Sistema de Seguimiento de Alumnos
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+from datetime import date, datetime
+
+from src.infrastructure.repositories.base.clase_repository_base import ClaseRepositoryBase
+from src.infrastructure.database.almacen_memoria import ViolacionUnicidad
+from src.domain.entities.clase import Clase
+from src.domain.exceptions.domain_exceptions import ClaseNoEncontradaException, BusinessRuleException
+
+TABLA = "clase"
+
+
+class ClaseRepositoryMemoria(ClaseRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, clase: Clase) -> Clase:
+        try:
+            guardada = self.conexion.insertar(TABLA, Clase.from_row((
+                None, clase.curso_id, clase.fecha, clase.numero_clase, clase.tema, datetime.now()
+            )))
+        except ViolacionUnicidad:
+            raise BusinessRuleException(f"Ya existe una clase con número {clase.numero_clase}")
+        clase.id = guardada.id
+        clase.fecha_creacion = guardada.fecha_creacion
+        return clase
+
+    def obtener_por_id(self, id: int) -> Optional[Clase]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Clase]:
+        return self.conexion.obtener_varios(TABLA, ids)
+
+    def obtener_por_curso(self, curso_id: int) -> List[Clase]:
+        return sorted(self.conexion.buscar(TABLA, "curso_id", curso_id), key=lambda c: c.numero_clase)
+
+    def obtener_por_fecha(self, curso_id: int, fecha: date) -> Optional[Clase]:
+        for clase in self.conexion.buscar(TABLA, "curso_id", curso_id):
+            if clase.fecha == fecha:
+                return clase
+        return None
+
+    def obtener_recientes(self, limite: int, docente: Optional[str] = None) -> List[dict]:
+        # Como en SQL: primero las `limite` clases más recientes, después las asistencias de esas
+        cursos = {curso.id: curso for curso in self.conexion.todos("curso")}
+        if docente:
+            texto = docente.lower()
+            cursos = {id: c for id, c in cursos.items() if texto in c.docente_responsable.lower()}
+        clases = sorted(
+            self.conexion.todos(TABLA, lambda c: c.curso_id in cursos),
+            key=lambda c: (c.fecha, c.id),
+            reverse=True
+        )[:limite]
+
+        recientes = []
+        for clase in clases:
+            estados = Counter(r.estado for r in self.conexion.buscar("registro_asistencia", "clase_id", clase.id))
+            curso = cursos[clase.curso_id]
+            recientes.append({
+                "clase": clase,
+                "curso_nombre": curso.nombre_materia,
+                "curso_anio": curso.anio,
+                "total_registros": sum(estados.values()),
+                "presentes": estados["Presente"],
+                "ausentes": estados["Ausente"],
+                "tardanzas": estados["Tardanza"],
+                "justificadas": estados["Justificada"],
+            })
+        return recientes
+
+    def actualizar(self, clase: Clase) -> Clase:
+        if clase.id is None:
+            raise ValueError("La clase debe tener un ID")
+
+        existente = self.conexion.obtener(TABLA, clase.id)
+        if existente is None:
+            raise ClaseNoEncontradaException(f"No existe clase con ID {clase.id}")
+        existente.fecha = clase.fecha
+        existente.numero_clase = clase.numero_clase
+        existente.tema = clase.tema
+        try:
+            self.conexion.reemplazar(TABLA, existente)
+        except ViolacionUnicidad:
+            raise BusinessRuleException(f"Ya existe una clase con número {clase.numero_clase}")
+        return clase
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
@@ -0,0 +1,63 @@
+"""
+Implementación en Memoria: CursoRepository
+Sistema de Seguimiento de Alumnos
+"""
+
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+
+from src.infrastructure.repositories.base.curso_repository_base import CursoRepositoryBase
+from src.domain.entities.curso import Curso
+from src.domain.exceptions.domain_exceptions import CursoNoEncontradoException
+
+TABLA = "curso"
+
+
+class CursoRepositoryMemoria(CursoRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, curso: Curso) -> Curso:
+        guardado = self.conexion.insertar(TABLA, Curso.from_row((
+            None, curso.nombre_materia, curso.anio, curso.cuatrimestre, curso.docente_responsable, datetime.now()
+        )))
+        curso.id = guardado.id
+        curso.fecha_creacion = guardado.fecha_creacion
+        return curso
+
+    def obtener_por_id(self, id: int) -> Optional[Curso]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Curso]:
+        return self.conexion.obtener_varios(TABLA, ids)
+
+    def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Curso]:
+        # ORDER BY anio DESC, cuatrimestre DESC, nombre_materia
+        cursos = sorted(self.conexion.todos(TABLA), key=lambda c: (-c.anio, -c.cuatrimestre, c.nombre_materia, c.id))
+        if limite is not None:
+            return cursos[offset:offset + limite]
+        return cursos
+
+    def buscar_por_anio_y_cuatrimestre(self, anio: int, cuatrimestre: int) -> List[Curso]:
+        return sorted(
+            self.conexion.todos(TABLA, lambda c: c.anio == anio and c.cuatrimestre == cuatrimestre),
+            key=lambda c: (c.nombre_materia, c.id)
+        )
+
+    def actualizar(self, curso: Curso) -> Curso:
+        if curso.id is None:
+            raise ValueError("El curso debe tener un ID para actualizarlo")
+
+        existente = self.conexion.obtener(TABLA, curso.id)
+        if existente is None:
+            raise CursoNoEncontradoException(f"No existe curso con ID {curso.id}")
+        existente.nombre_materia = curso.nombre_materia
+        existente.anio = curso.anio
+        existente.cuatrimestre = curso.cuatrimestre
+        existente.docente_responsable = curso.docente_responsable
+        self.conexion.reemplazar(TABLA, existente)
+        return curso
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
@@ -0,0 +1,83 @@
+"""
+Implementación en Memoria: EntregaTPRepository
+Sistema de Seguimiento de Alumnos
+
+(trabajo_practico_id, alumno_id) es un índice único: el upsert busca por
+esa clave y actualiza la entrega existente conservando su id.
+"""
+
+from typing import List, Optional
+from datetime import datetime, date
+
+from src.infrastructure.repositories.base.entrega_tp_repository_base import EntregaTPRepositoryBase
+from src.domain.entities.entrega_tp import EntregaTP
+
+TABLA = "entrega_tp"
+
+
+class EntregaTPRepositoryMemoria(EntregaTPRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear_o_actualizar(self, entrega: EntregaTP) -> EntregaTP:
+        # Mismas reglas que PostgreSQL: el estado define entregado y tardía
+        entregado = entrega.estado in ['entregado', 'tarde']
+        es_tardia = entrega.estado == 'tarde'
+        fecha_entrega = entrega.fecha_entrega_real or (date.today() if entregado else None)
+
+        guardada = self._upsert(self.conexion, EntregaTP.from_row((
+            None, entrega.trabajo_practico_id, entrega.alumno_id, fecha_entrega,
+            entregado, es_tardia, entrega.estado, entrega.nota, entrega.observaciones, datetime.now()
+        )))
+        entrega.id = guardada.id
+        entrega.fecha_registro = guardada.fecha_registro
+        entrega.entregado = entregado
+        entrega.es_tardia = es_tardia
+        entrega.fecha_entrega_real = fecha_entrega
+        return entrega
+
+    def crear_o_actualizar_lote(self, entregas: List[EntregaTP]) -> List[EntregaTP]:
+        if not entregas:
+            return []
+        ahora = datetime.now()
+        with self.conexion.atomico() as conexion:
+            return [
+                self._upsert(conexion, EntregaTP.from_row((
+                    None, entrega.trabajo_practico_id, entrega.alumno_id, entrega.fecha_entrega_real,
+                    entrega.entregado, entrega.es_tardia, entrega.estado, entrega.nota, entrega.observaciones, ahora
+                )))
+                for entrega in entregas
+            ]
+
+    def _upsert(self, conexion, fila: EntregaTP) -> EntregaTP:
+        """INSERT ... ON CONFLICT (trabajo_practico_id, alumno_id) DO UPDATE"""
+        with conexion.atomico() as conexion:
+            existente = conexion.obtener_unico(TABLA, "tp_alumno", (fila.trabajo_practico_id, fila.alumno_id))
+            if existente is None:
+                return conexion.insertar(TABLA, fila)
+            fila.id = existente.id
+            conexion.reemplazar(TABLA, fila)
+            return fila
+
+    def obtener_por_id(self, id: int) -> Optional[EntregaTP]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_tp(self, tp_id: int) -> List[EntregaTP]:
+        return self.conexion.buscar(TABLA, "trabajo_practico_id", tp_id)
+
+    def obtener_por_alumno_y_tp(self, alumno_id: int, tp_id: int) -> Optional[EntregaTP]:
+        return self.conexion.obtener_unico(TABLA, "tp_alumno", (tp_id, alumno_id))
+
+    def obtener_por_alumno_y_curso(self, alumno_id: int, curso_id: int) -> List[EntregaTP]:
+        tps = {tp.id: tp for tp in self.conexion.buscar("trabajo_practico", "curso_id", curso_id)}
+        entregas = [e for e in self.conexion.buscar(TABLA, "alumno_id", alumno_id) if e.trabajo_practico_id in tps]
+        # ORDER BY tp.fecha_entrega (NULL al final)
+        return sorted(entregas, key=lambda e: (
+            tps[e.trabajo_practico_id].fecha_entrega is None,
+            tps[e.trabajo_practico_id].fecha_entrega or date.min,
+            e.id
+        ))
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
@@ -0,0 +1,64 @@
+"""
+Implementación en Memoria: ExportRepository
+Sistema de Seguimiento de Alumnos
+
+Arma las mismas filas (y en el mismo orden) que QUERIES_EXPORT, uniendo
+las tablas del almacén por sus índices. Los datos ya están en memoria:
+se ordenan las filas del curso y se devuelven de a una.
+"""
+
+from datetime import date
+from typing import Iterator, Tuple
+
+from src.infrastructure.repositories.base.export_repository_base import ExportRepositoryBase, COLUMNAS_EXPORT
+
+
+class ExportRepositoryMemoria(ExportRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def iterar_filas(self, curso_id: int, tabla: str, tamano_lote: int = 1000) -> Iterator[Tuple]:
+        if tabla not in COLUMNAS_EXPORT:
+            raise ValueError(f"Tabla no exportable: {tabla}")
+        if tabla == "entregas":
+            return self._entregas(curso_id)
+        return self._registros_de_clase(curso_id, tabla)
+
+    def _registros_de_clase(self, curso_id: int, tabla: str) -> Iterator[Tuple]:
+        nombre_tabla = "registro_asistencia" if tabla == "asistencias" else "registro_participacion"
+        clases = self.conexion.buscar("clase", "curso_id", curso_id)
+        registros = [r for clase in clases for r in self.conexion.buscar(nombre_tabla, "clase_id", clase.id)]
+        alumnos = self.conexion.obtener_varios("alumno", {r.alumno_id for r in registros})
+        clases = {clase.id: clase for clase in clases}
+
+        # ORDER BY cl.fecha, cl.numero_clase, a.apellido, a.nombre
+        registros.sort(key=lambda r: (
+            clases[r.clase_id].fecha, clases[r.clase_id].numero_clase,
+            alumnos[r.alumno_id].apellido, alumnos[r.alumno_id].nombre, r.id
+        ))
+        for r in registros:
+            a, cl = alumnos[r.alumno_id], clases[r.clase_id]
+            if tabla == "asistencias":
+                yield (r.id, a.id, a.dni, a.apellido, a.nombre,
+                       cl.id, cl.numero_clase, cl.fecha, r.estado.value, r.fecha_registro)
+            else:
+                yield (r.id, a.id, a.dni, a.apellido, a.nombre,
+                       cl.id, cl.numero_clase, cl.fecha, r.nivel.value, r.comentario, r.fecha_registro)
+
+    def _entregas(self, curso_id: int) -> Iterator[Tuple]:
+        tps = {tp.id: tp for tp in self.conexion.buscar("trabajo_practico", "curso_id", curso_id)}
+        entregas = [e for tp_id in tps for e in self.conexion.buscar("entrega_tp", "trabajo_practico_id", tp_id)]
+        alumnos = self.conexion.obtener_varios("alumno", {e.alumno_id for e in entregas})
+
+        # ORDER BY tp.fecha_entrega, tp.id, a.apellido, a.nombre
+        entregas.sort(key=lambda e: (
+            tps[e.trabajo_practico_id].fecha_entrega is None,
+            tps[e.trabajo_practico_id].fecha_entrega or date.min,
+            e.trabajo_practico_id, alumnos[e.alumno_id].apellido, alumnos[e.alumno_id].nombre, e.id
+        ))
+        for e in entregas:
+            a, tp = alumnos[e.alumno_id], tps[e.trabajo_practico_id]
+            yield (e.id, a.id, a.dni, a.apellido, a.nombre,
+                   tp.id, tp.titulo, tp.fecha_entrega, e.fecha_entrega_real,
+                   e.entregado, e.es_tardia, e.estado, e.nota, e.observaciones, e.fecha_registro)
@@ -0,0 +1,84 @@
+"""
+Implementación en Memoria: InscripcionRepository
+Sistema de Seguimiento de Alumnos
+"""
+
+from typing import Iterable, List, Optional, Set, Tuple
+from datetime import datetime
+
+from src.infrastructure.repositories.base.inscripcion_repository_base import InscripcionRepositoryBase
+from src.infrastructure.database.almacen_memoria import ViolacionUnicidad
+from src.domain.entities.inscripcion import Inscripcion
+from src.domain.exceptions.domain_exceptions import InscripcionDuplicadaException
+
+TABLA = "inscripcion"
+
+
+class InscripcionRepositoryMemoria(InscripcionRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, inscripcion: Inscripcion) -> Inscripcion:
+        try:
+            guardada = self.conexion.insertar(TABLA, Inscripcion.from_row((
+                None, inscripcion.alumno_id, inscripcion.curso_id, inscripcion.fecha_inscripcion or datetime.now()
+            )))
+        except ViolacionUnicidad:
+            raise InscripcionDuplicadaException("El alumno ya está inscripto en este curso")
+        inscripcion.id = guardada.id
+        inscripcion.fecha_inscripcion = guardada.fecha_inscripcion
+        return inscripcion
+
+    def obtener_por_id(self, id: int) -> Optional[Inscripcion]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_alumno(self, alumno_id: int) -> List[Inscripcion]:
+        return self.conexion.buscar(TABLA, "alumno_id", alumno_id)
+
+    def obtener_por_curso(self, curso_id: int) -> List[Inscripcion]:
+        return self.conexion.buscar(TABLA, "curso_id", curso_id)
+
+    def existe(self, alumno_id: int, curso_id: int) -> bool:
+        return self.conexion.obtener_unico(TABLA, "alumno_curso", (alumno_id, curso_id)) is not None
+
+    def obtener_alumno_ids_por_curso(self, curso_id: int) -> List[int]:
+        return [inscripcion.alumno_id for inscripcion in self.conexion.buscar(TABLA, "curso_id", curso_id)]
+
+    def filtrar_inscriptos(self, curso_id: int, alumno_ids: Iterable[int]) -> Set[int]:
+        return {
+            alumno_id for alumno_id in set(alumno_ids)
+            if self.conexion.obtener_unico(TABLA, "alumno_curso", (alumno_id, curso_id)) is not None
+        }
+
+    def inscribir_pares(self, pares: Iterable[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+        pares = list(set(pares))
+        if not pares:
+            return 0, []
+        # Como los JOIN con alumno y curso: se descartan los inexistentes
+        validos = [
+            (alumno_id, curso_id) for alumno_id, curso_id in pares
+            if self.conexion.existe("alumno", alumno_id) and self.conexion.existe("curso", curso_id)
+        ]
+        return self._inscribir_masivo(validos)
+
+    def inscribir_cohorte(self, cohorte: int, curso_ids: Iterable[int]) -> Tuple[int, List[Tuple[int, int]]]:
+        curso_ids = [curso_id for curso_id in set(curso_ids) if self.conexion.existe("curso", curso_id)]
+        if not curso_ids:
+            return 0, []
+        alumnos = self.conexion.buscar("alumno", "cohorte", cohorte)
+        return self._inscribir_masivo([(alumno.id, curso_id) for alumno in alumnos for curso_id in curso_ids])
+
+    def _inscribir_masivo(self, validos: List[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+        """Inserta los pares que no existen (ON CONFLICT DO NOTHING): (candidatos, creados)"""
+        ahora = datetime.now()
+        creados = []
+        with self.conexion.atomico() as conexion:
+            for alumno_id, curso_id in validos:
+                if conexion.obtener_unico(TABLA, "alumno_curso", (alumno_id, curso_id)) is None:
+                    conexion.insertar(TABLA, Inscripcion.from_row((None, alumno_id, curso_id, ahora)))
+                    creados.append((alumno_id, curso_id))
+        return len(validos), creados
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
@@ -0,0 +1,69 @@
+"""
+Implementación en Memoria: RegistroParticipacionRepository
+Sistema de Seguimiento de Alumnos
+"""
+
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+from src.infrastructure.repositories.base.participacion_repository_base import RegistroParticipacionRepositoryBase
+from src.domain.entities.registro_participacion import RegistroParticipacion
+
+TABLA = "registro_participacion"
+
+
+class RegistroParticipacionRepositoryMemoria(RegistroParticipacionRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, registro: RegistroParticipacion) -> RegistroParticipacion:
+        guardado = self.conexion.insertar(TABLA, RegistroParticipacion.from_row((
+            None, registro.alumno_id, registro.clase_id, registro.nivel.value, registro.comentario, datetime.now()
+        )))
+        registro.id = guardado.id
+        registro.fecha_registro = guardado.fecha_registro
+        return registro
+
+    def crear_lote(
+        self,
+        clase_id: int,
+        registros: List[RegistroParticipacion],
+        reemplazar: bool = False
+    ) -> Tuple[List[RegistroParticipacion], int]:
+        ahora = datetime.now()
+        with self.conexion.atomico() as conexion:
+            reemplazados = conexion.eliminar_donde(TABLA, "clase_id", clase_id) if reemplazar else 0
+            creados = [
+                conexion.insertar(TABLA, RegistroParticipacion.from_row((
+                    None, registro.alumno_id, clase_id, registro.nivel.value, registro.comentario, ahora
+                )))
+                for registro in registros
+            ]
+        return creados, reemplazados
+
+    def obtener_por_id(self, id: int) -> Optional[RegistroParticipacion]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_clase(self, clase_id: int) -> List[RegistroParticipacion]:
+        return self.conexion.buscar(TABLA, "clase_id", clase_id)
+
+    def obtener_por_alumno_y_curso(self, alumno_id: int, curso_id: int) -> List[RegistroParticipacion]:
+        clases = {clase.id: clase for clase in self.conexion.buscar("clase", "curso_id", curso_id)}
+        registros = [r for r in self.conexion.buscar(TABLA, "alumno_id", alumno_id) if r.clase_id in clases]
+        return sorted(registros, key=lambda r: (clases[r.clase_id].fecha, r.id))
+
+    def actualizar(self, registro: RegistroParticipacion) -> RegistroParticipacion:
+        if registro.id is None:
+            raise ValueError("ID requerido para actualizar")
+
+        existente = self.conexion.obtener(TABLA, registro.id)
+        if existente is None:
+            raise ValueError(f"Participación {registro.id} no encontrada")
+        existente.nivel = registro.nivel
+        existente.comentario = registro.comentario
+        self.conexion.reemplazar(TABLA, existente)
+        return registro
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
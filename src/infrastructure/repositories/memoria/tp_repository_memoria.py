@@ -0,0 +1,58 @@
+"""
+Implementación en Memoria: TrabajoPracticoRepository
+Sistema de Seguimiento de Alumnos
+"""
+
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.infrastructure.repositories.base.tp_repository_base import TrabajoPracticoRepositoryBase
+from src.domain.entities.trabajo_practico import TrabajoPractico
+
+TABLA = "trabajo_practico"
+
+
+def _por_fecha_entrega(tp: TrabajoPractico):
+    # ORDER BY fecha_entrega: los NULL al final, como en PostgreSQL
+    return (tp.fecha_entrega is None, tp.fecha_entrega or date.min, tp.id)
+
+
+class TrabajoPracticoRepositoryMemoria(TrabajoPracticoRepositoryBase):
+
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def crear(self, tp: TrabajoPractico) -> TrabajoPractico:
+        guardado = self.conexion.insertar(TABLA, TrabajoPractico.from_row((
+            None, tp.curso_id, tp.titulo, tp.descripcion, tp.fecha_entrega, datetime.now()
+        )))
+        tp.id = guardado.id
+        tp.fecha_creacion = guardado.fecha_creacion
+        return tp
+
+    def obtener_por_id(self, id: int) -> Optional[TrabajoPractico]:
+        return self.conexion.obtener(TABLA, id)
+
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, TrabajoPractico]:
+        return self.conexion.obtener_varios(TABLA, ids)
+
+    def obtener_por_curso(self, curso_id: int) -> List[TrabajoPractico]:
+        return sorted(self.conexion.buscar(TABLA, "curso_id", curso_id), key=_por_fecha_entrega)
+
+    def obtener_todos(self) -> List[TrabajoPractico]:
+        return sorted(self.conexion.todos(TABLA), key=_por_fecha_entrega)
+
+    def actualizar(self, tp: TrabajoPractico) -> TrabajoPractico:
+        if tp.id is None:
+            raise ValueError("El TP debe tener un ID")
+
+        existente = self.conexion.obtener(TABLA, tp.id)
+        if existente is not None:
+            existente.titulo = tp.titulo
+            existente.descripcion = tp.descripcion
+            existente.fecha_entrega = tp.fecha_entrega
+            self.conexion.reemplazar(TABLA, existente)
+        return tp
+
+    def eliminar(self, id: int) -> bool:
+        return self.conexion.eliminar(TABLA, id)
@@ -5,7 +5,7 @@ Sistema de Seguimiento de Alumnos
 Compatible con pg8000 (pure Python driver).
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 from src.infrastructure.repositories.base.alumno_repository_base import AlumnoRepositoryBase
@@ -16,6 +16,10 @@ from src.domain.exceptions.domain_exceptions import (
 )
 
 
+# Filas por sentencia en la carga masiva (6 parámetros por fila, pg8000 admite 32767)
+TAMANO_LOTE_ALUMNOS = 1000
+
+
 class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
     """
     Implementación PostgreSQL del repositorio de Alumno.
@@ -62,6 +66,55 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
         finally:
             cursor.close()
 
+    def crear_lote(self, alumnos: List[Alumno], actualizar_existentes: bool = False) -> Tuple[List[Alumno], List[Alumno]]:
+        """
+        Carga masiva: INSERT ... VALUES (...), (...) ON CONFLICT (dni).
+        
+        Decisión de diseño: (xmax = 0) para distinguir altas de actualizaciones
+        - Una fila recién insertada no tiene xmax; una actualizada por el
+          DO UPDATE sí. Evita consultar antes qué DNIs ya existían
+        - Con DO NOTHING, RETURNING solo trae las filas insertadas
+        """
+        if not alumnos:
+            return [], []
+        
+        if actualizar_existentes:
+            conflicto = """
+                DO UPDATE SET
+                    nombre = EXCLUDED.nombre,
+                    apellido = EXCLUDED.apellido,
+                    email = EXCLUDED.email,
+                    cohorte = EXCLUDED.cohorte
+            """
+        else:
+            conflicto = "DO NOTHING"
+        ahora = datetime.now()
+        creados, actualizados = [], []
+        
+        cursor = self.conexion.cursor()
+        try:
+            for inicio in range(0, len(alumnos), TAMANO_LOTE_ALUMNOS):
+                lote = alumnos[inicio:inicio + TAMANO_LOTE_ALUMNOS]
+                query = f"""
+                    INSERT INTO alumno (nombre, apellido, dni, email, cohorte, fecha_creacion)
+                    VALUES {", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(lote))}
+                    ON CONFLICT (dni) {conflicto}
+                    RETURNING id, nombre, apellido, dni, email, cohorte, fecha_creacion, (xmax = 0)
+                """
+                params = []
+                for alumno in lote:
+                    params.extend((alumno.nombre, alumno.apellido, alumno.dni, alumno.email, alumno.cohorte, ahora))
+                cursor.execute(query, params)
+                for row in cursor.fetchall():
+                    (creados if row[7] else actualizados).append(self._row_to_alumno(row[:7]))
+            self.conexion.commit()
+            return creados, actualizados
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
+
     def obtener_por_id(self, id: int) -> Optional[Alumno]:
         """Obtiene un alumno por ID"""
         query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno WHERE id = %s"
@@ -75,6 +128,22 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
         finally:
             cursor.close()
 
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Alumno]:
+        """Obtiene varios alumnos por ID con una sola consulta (= ANY)"""
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno WHERE id = ANY(%s)"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (ids,))
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            return {row[0]: self._row_to_alumno(row) for row in rows}
+        finally:
+            cursor.close()
+
     def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
         """Obtiene un alumno por DNI"""
         query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno WHERE dni = %s"
@@ -90,7 +159,7 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
 
     def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Alumno]:
         """Obtiene todos los alumnos con paginación opcional"""
-        query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno ORDER BY apellido, nombre"
+        query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno ORDER BY apellido, nombre, id"
         
         if limite is not None:
             query += f" LIMIT {limite} OFFSET {offset}"
@@ -109,7 +178,7 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
         query = """
             SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno 
             WHERE LOWER(nombre) LIKE LOWER(%s) OR LOWER(apellido) LIKE LOWER(%s)
-            ORDER BY apellido, nombre
+            ORDER BY apellido, nombre, id
         """
         search_term = f"%{nombre}%"
         
@@ -124,7 +193,7 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
 
     def obtener_por_cohorte(self, cohorte: int) -> List[Alumno]:
         """Obtiene todos los alumnos de una cohorte específica"""
-        query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno WHERE cohorte = %s ORDER BY apellido, nombre"
+        query = "SELECT id, nombre, apellido, dni, email, cohorte, fecha_creacion FROM alumno WHERE cohorte = %s ORDER BY apellido, nombre, id"
         
         cursor = self.conexion.cursor()
         try:
@@ -140,7 +209,6 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
         if alumno.id is None:
             raise ValueError("El alumno debe tener un ID para actualizarlo")
         
-        check_query = "SELECT id FROM alumno WHERE id = %s"
         update_query = """
             UPDATE alumno 
             SET nombre = %s, apellido = %s, dni = %s, email = %s, cohorte = %s
@@ -157,11 +225,10 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
         
         cursor = self.conexion.cursor()
         try:
-            cursor.execute(check_query, (alumno.id,))
-            if not cursor.fetchone():
-                raise AlumnoNoEncontradoException(f"No existe alumno con ID {alumno.id}")
-            
+            # Un solo viaje: si no se actualizó ninguna fila, el alumno no existe
             cursor.execute(update_query, params)
+            if cursor.rowcount == 0:
+                raise AlumnoNoEncontradoException(f"No existe alumno con ID {alumno.id}")
             self.conexion.commit()
             return alumno
             
@@ -204,12 +271,5 @@ class AlumnoRepositoryPostgres(AlumnoRepositoryBase):
     def _row_to_alumno(self, row) -> Alumno:
         """Convierte una tupla de BD a una entidad Alumno"""
         # row es una tupla: (id, nombre, apellido, dni, email, cohorte, fecha_creacion)
-        return Alumno(
-            id=row[0],
-            nombre=row[1],
-            apellido=row[2],
-            dni=row[3],
-            email=row[4],
-            cohorte=row[5],
-            fecha_creacion=row[6] if len(row) > 6 else None
-        )
+        # Los datos vienen de la BD (ya validados), usamos el camino rápido sin revalidar
+        return Alumno.from_row(row)
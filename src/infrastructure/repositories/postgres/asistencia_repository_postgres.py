@@ -8,6 +8,7 @@ from datetime import datetime
 
 from src.infrastructure.repositories.base.asistencia_repository_base import RegistroAsistenciaRepositoryBase
 from src.domain.entities.registro_asistencia import RegistroAsistencia
+from src.domain.exceptions.domain_exceptions import AsistenciaYaRegistradaException
 
 
 class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
@@ -16,8 +17,8 @@ class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
         self.conexion = conexion
 
     def crear(self, registro: RegistroAsistencia) -> RegistroAsistencia:
-        # pg8000 no soporta ON CONFLICT, usamos delete+insert
-        delete_query = "DELETE FROM registro_asistencia WHERE alumno_id = %s AND clase_id = %s"
+        # Un duplicado (alumno, clase) es un error, como en SQLite: antes se
+        # borraba el registro anterior y la asistencia cambiaba de id
         insert_query = """
             INSERT INTO registro_asistencia (alumno_id, clase_id, estado, fecha_registro)
             VALUES (%s, %s, %s, %s)
@@ -32,7 +33,6 @@ class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
         
         cursor = self.conexion.cursor()
         try:
-            cursor.execute(delete_query, (registro.alumno_id, registro.clase_id))
             cursor.execute(insert_query, params)
             row = cursor.fetchone()
             self.conexion.commit()
@@ -42,6 +42,10 @@ class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
             return registro
         except Exception as e:
             self.conexion.rollback()
+            if 'unique' in str(e).lower() or 'duplicate' in str(e).lower():
+                raise AsistenciaYaRegistradaException(
+                    f"Ya existe registro de asistencia para alumno {registro.alumno_id} en clase {registro.clase_id}"
+                )
             raise e
         finally:
             cursor.close()
@@ -63,6 +67,7 @@ class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
             FROM registro_asistencia ra
             JOIN clase c ON ra.clase_id = c.id
             WHERE ra.alumno_id = %s AND c.curso_id = %s
+            ORDER BY c.fecha, ra.id
         """
         
         cursor = self.conexion.cursor()
@@ -85,7 +90,21 @@ class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
             cursor.close()
 
     def actualizar(self, registro: RegistroAsistencia) -> RegistroAsistencia:
-        return self.crear(registro)
+        if registro.id is None:
+            raise ValueError("ID requerido para actualizar")
+        
+        query = "UPDATE registro_asistencia SET estado = %s WHERE id = %s"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (registro.estado, registro.id))
+            self.conexion.commit()
+            return registro
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
 
     def obtener_por_id(self, id: int) -> Optional[RegistroAsistencia]:
         """Obtiene un registro de asistencia por ID"""
@@ -130,11 +149,5 @@ class RegistroAsistenciaRepositoryPostgres(RegistroAsistenciaRepositoryBase):
             cursor.close()
 
     def _row_to_asistencia(self, row) -> RegistroAsistencia:
-        return RegistroAsistencia(
-            id=row[0],
-            alumno_id=row[1],
-            clase_id=row[2],
-            estado=row[3],
-            fecha_registro=row[4] if len(row) > 4 else None
-        )
+        return RegistroAsistencia.from_row(row)
 
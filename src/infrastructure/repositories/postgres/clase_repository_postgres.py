@@ -3,7 +3,7 @@ Implementación PostgreSQL: ClaseRepository
 Compatible con pg8000.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
 from src.infrastructure.repositories.base.clase_repository_base import ClaseRepositoryBase
@@ -58,6 +58,20 @@ class ClaseRepositoryPostgres(ClaseRepositoryBase):
         finally:
             cursor.close()
 
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Clase]:
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        query = "SELECT id, curso_id, fecha, numero_clase, tema, fecha_creacion FROM clase WHERE id = ANY(%s)"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (ids,))
+            rows = cursor.fetchall()
+            return {row[0]: self._row_to_clase(row) for row in rows}
+        finally:
+            cursor.close()
+
     def obtener_por_curso(self, curso_id: int) -> List[Clase]:
         query = "SELECT id, curso_id, fecha, numero_clase, tema, fecha_creacion FROM clase WHERE curso_id = %s ORDER BY numero_clase"
         
@@ -82,6 +96,49 @@ class ClaseRepositoryPostgres(ClaseRepositoryBase):
         finally:
             cursor.close()
 
+    def obtener_recientes(self, limite: int, docente: Optional[str] = None) -> List[dict]:
+        # El LIMIT se aplica ANTES de agregar asistencias: con el índice
+        # (fecha DESC, id DESC) se leen solo las últimas `limite` clases
+        filtro = ""
+        params = []
+        if docente:
+            filtro = "WHERE LOWER(c.docente_responsable) LIKE LOWER(%s)"
+            params.append(f"%{docente}%")
+        params.append(limite)
+        
+        query = f"""
+            WITH recientes AS (
+                SELECT cl.id, cl.curso_id, cl.fecha, cl.numero_clase, cl.tema, cl.fecha_creacion,
+                       c.nombre_materia, c.anio
+                FROM clase cl
+                JOIN curso c ON c.id = cl.curso_id
+                {filtro}
+                ORDER BY cl.fecha DESC, cl.id DESC
+                LIMIT %s
+            )
+            SELECT r.id, r.curso_id, r.fecha, r.numero_clase, r.tema, r.fecha_creacion,
+                   r.nombre_materia, r.anio,
+                   COUNT(ra.id),
+                   COUNT(*) FILTER (WHERE ra.estado = 'Presente'),
+                   COUNT(*) FILTER (WHERE ra.estado = 'Ausente'),
+                   COUNT(*) FILTER (WHERE ra.estado = 'Tardanza'),
+                   COUNT(*) FILTER (WHERE ra.estado = 'Justificada')
+            FROM recientes r
+            LEFT JOIN registro_asistencia ra ON ra.clase_id = r.id
+            GROUP BY r.id, r.curso_id, r.fecha, r.numero_clase, r.tema, r.fecha_creacion,
+                     r.nombre_materia, r.anio
+            ORDER BY r.fecha DESC, r.id DESC
+        """
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, tuple(params))
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            return [self._row_to_reciente(row) for row in rows]
+        finally:
+            cursor.close()
+
     def actualizar(self, clase: Clase) -> Clase:
         if clase.id is None:
             raise ValueError("La clase debe tener un ID")
@@ -120,11 +177,16 @@ class ClaseRepositoryPostgres(ClaseRepositoryBase):
             cursor.close()
 
     def _row_to_clase(self, row) -> Clase:
-        return Clase(
-            id=row[0],
-            curso_id=row[1],
-            fecha=row[2],
-            numero_clase=row[3],
-            tema=row[4],
-            fecha_creacion=row[5] if len(row) > 5 else None
-        )
+        return Clase.from_row(row)
+
+    def _row_to_reciente(self, row) -> dict:
+        return {
+            "clase": Clase.from_row(row[:6]),
+            "curso_nombre": row[6],
+            "curso_anio": row[7],
+            "total_registros": row[8],
+            "presentes": row[9],
+            "ausentes": row[10],
+            "tardanzas": row[11],
+            "justificadas": row[12],
+        }
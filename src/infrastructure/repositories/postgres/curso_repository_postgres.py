@@ -5,7 +5,7 @@ Sistema de Seguimiento de Alumnos
 Compatible con pg8000 (pure Python driver).
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
 from src.infrastructure.repositories.base.curso_repository_base import CursoRepositoryBase
@@ -64,9 +64,25 @@ class CursoRepositoryPostgres(CursoRepositoryBase):
         finally:
             cursor.close()
 
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Curso]:
+        """Obtiene varios cursos por ID con una sola consulta (= ANY)"""
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso WHERE id = ANY(%s)"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (ids,))
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            return {row[0]: self._row_to_curso(row) for row in rows}
+        finally:
+            cursor.close()
+
     def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Curso]:
         """Obtiene todos los cursos"""
-        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso ORDER BY anio DESC, cuatrimestre DESC"
+        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso ORDER BY anio DESC, cuatrimestre DESC, nombre_materia, id"
         
         if limite is not None:
             query += f" LIMIT {limite} OFFSET {offset}"
@@ -82,7 +98,7 @@ class CursoRepositoryPostgres(CursoRepositoryBase):
 
     def obtener_por_anio(self, anio: int) -> List[Curso]:
         """Obtiene cursos de un año específico"""
-        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso WHERE anio = %s ORDER BY cuatrimestre"
+        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso WHERE anio = %s ORDER BY cuatrimestre, nombre_materia, id"
         
         cursor = self.conexion.cursor()
         try:
@@ -95,7 +111,7 @@ class CursoRepositoryPostgres(CursoRepositoryBase):
 
     def buscar_por_anio_y_cuatrimestre(self, anio: int, cuatrimestre: int) -> List[Curso]:
         """Obtiene cursos de un cuatrimestre específico"""
-        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso WHERE anio = %s AND cuatrimestre = %s ORDER BY nombre_materia"
+        query = "SELECT id, nombre_materia, anio, cuatrimestre, docente_responsable, fecha_creacion FROM curso WHERE anio = %s AND cuatrimestre = %s ORDER BY nombre_materia, id"
         
         cursor = self.conexion.cursor()
         try:
@@ -111,7 +127,6 @@ class CursoRepositoryPostgres(CursoRepositoryBase):
         if curso.id is None:
             raise ValueError("El curso debe tener un ID para actualizarlo")
         
-        check_query = "SELECT id FROM curso WHERE id = %s"
         update_query = """
             UPDATE curso 
             SET nombre_materia = %s, anio = %s, cuatrimestre = %s, docente_responsable = %s
@@ -127,11 +142,10 @@ class CursoRepositoryPostgres(CursoRepositoryBase):
         
         cursor = self.conexion.cursor()
         try:
-            cursor.execute(check_query, (curso.id,))
-            if not cursor.fetchone():
-                raise CursoNoEncontradoException(f"No existe curso con ID {curso.id}")
-            
+            # Un solo viaje: si no se actualizó ninguna fila, el curso no existe
             cursor.execute(update_query, params)
+            if cursor.rowcount == 0:
+                raise CursoNoEncontradoException(f"No existe curso con ID {curso.id}")
             self.conexion.commit()
             return curso
         except Exception as e:
@@ -158,11 +172,4 @@ class CursoRepositoryPostgres(CursoRepositoryBase):
 
     def _row_to_curso(self, row) -> Curso:
         """Convierte una tupla a Curso"""
-        return Curso(
-            id=row[0],
-            nombre_materia=row[1],
-            anio=row[2],
-            cuatrimestre=row[3],
-            docente_responsable=row[4],
-            fecha_creacion=row[5] if len(row) > 5 else None
-        )
+        return Curso.from_row(row)
@@ -10,6 +10,10 @@ from src.infrastructure.repositories.base.entrega_tp_repository_base import Entr
 from src.domain.entities.entrega_tp import EntregaTP
 
 
+# Filas por sentencia en el upsert masivo (9 parámetros por fila)
+TAMANO_LOTE_UPSERT = 1000
+
+
 class EntregaTPRepositoryPostgres(EntregaTPRepositoryBase):
     
     def __init__(self, conexion):
@@ -17,14 +21,21 @@ class EntregaTPRepositoryPostgres(EntregaTPRepositoryBase):
 
     def crear_o_actualizar(self, entrega: EntregaTP) -> EntregaTP:
         """Upsert: crea o actualiza una entrega de TP"""
-        # Usar delete+insert en lugar de ON CONFLICT (pg8000 compatible)
-        delete_query = "DELETE FROM entrega_tp WHERE trabajo_practico_id = %s AND alumno_id = %s"
-        insert_query = """
+        # ON CONFLICT DO UPDATE (como el upsert masivo): la entrega conserva su id
+        query = """
             INSERT INTO entrega_tp (
                 trabajo_practico_id, alumno_id, fecha_entrega_real, 
                 entregado, es_tardia, estado, nota, observaciones, fecha_registro
             )
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (trabajo_practico_id, alumno_id) DO UPDATE SET
+                fecha_entrega_real = EXCLUDED.fecha_entrega_real,
+                entregado = EXCLUDED.entregado,
+                es_tardia = EXCLUDED.es_tardia,
+                estado = EXCLUDED.estado,
+                nota = EXCLUDED.nota,
+                observaciones = EXCLUDED.observaciones,
+                fecha_registro = EXCLUDED.fecha_registro
             RETURNING id, fecha_registro
         """
         
@@ -47,8 +58,7 @@ class EntregaTPRepositoryPostgres(EntregaTPRepositoryBase):
         
         cursor = self.conexion.cursor()
         try:
-            cursor.execute(delete_query, (entrega.trabajo_practico_id, entrega.alumno_id))
-            cursor.execute(insert_query, params)
+            cursor.execute(query, params)
             row = cursor.fetchone()
             self.conexion.commit()
             
@@ -64,6 +74,66 @@ class EntregaTPRepositoryPostgres(EntregaTPRepositoryBase):
         finally:
             cursor.close()
 
+    def crear_o_actualizar_lote(self, entregas: List[EntregaTP]) -> List[EntregaTP]:
+        """
+        Upsert masivo: un INSERT ... VALUES (...), (...) ON CONFLICT DO UPDATE.
+        
+        Decisión de diseño: VALUES multi-fila en vez de unnest(arrays)
+        - pg8000 no puede inferir el tipo de un array con todos NULL
+          (ej: nadie tiene nota todavía); en VALUES cada NULL toma el tipo
+          de la columna destino
+        - Una sola sentencia y un solo commit para todo el TP
+        """
+        if not entregas:
+            return []
+        
+        columnas = """
+            trabajo_practico_id, alumno_id, fecha_entrega_real,
+            entregado, es_tardia, estado, nota, observaciones, fecha_registro
+        """
+        ahora = datetime.now()
+        resultado = []
+        
+        cursor = self.conexion.cursor()
+        try:
+            for inicio in range(0, len(entregas), TAMANO_LOTE_UPSERT):
+                lote = entregas[inicio:inicio + TAMANO_LOTE_UPSERT]
+                query = f"""
+                    INSERT INTO entrega_tp ({columnas})
+                    VALUES {", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(lote))}
+                    ON CONFLICT (trabajo_practico_id, alumno_id) DO UPDATE SET
+                        fecha_entrega_real = EXCLUDED.fecha_entrega_real,
+                        entregado = EXCLUDED.entregado,
+                        es_tardia = EXCLUDED.es_tardia,
+                        estado = EXCLUDED.estado,
+                        nota = EXCLUDED.nota,
+                        observaciones = EXCLUDED.observaciones,
+                        fecha_registro = EXCLUDED.fecha_registro
+                    RETURNING id, {columnas}
+                """
+                params = []
+                for entrega in lote:
+                    params.extend((
+                        entrega.trabajo_practico_id,
+                        entrega.alumno_id,
+                        entrega.fecha_entrega_real,
+                        entrega.entregado,
+                        entrega.es_tardia,
+                        entrega.estado,
+                        entrega.nota,
+                        entrega.observaciones,
+                        ahora
+                    ))
+                cursor.execute(query, params)
+                resultado.extend(self._row_to_entrega(row) for row in cursor.fetchall())
+            self.conexion.commit()
+            return resultado
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
+
     def obtener_por_id(self, id: int) -> Optional[EntregaTP]:
         query = """
             SELECT id, trabajo_practico_id, alumno_id, fecha_entrega_real, 
@@ -120,6 +190,7 @@ class EntregaTPRepositoryPostgres(EntregaTPRepositoryBase):
             FROM entrega_tp e
             JOIN trabajo_practico tp ON e.trabajo_practico_id = tp.id
             WHERE e.alumno_id = %s AND tp.curso_id = %s
+            ORDER BY tp.fecha_entrega, e.id
         """
         
         cursor = self.conexion.cursor()
@@ -147,16 +218,5 @@ class EntregaTPRepositoryPostgres(EntregaTPRepositoryBase):
             cursor.close()
 
     def _row_to_entrega(self, row) -> EntregaTP:
-        return EntregaTP(
-            id=row[0],
-            trabajo_practico_id=row[1],
-            alumno_id=row[2],
-            fecha_entrega_real=row[3],
-            entregado=bool(row[4]) if row[4] is not None else False,
-            es_tardia=bool(row[5]) if row[5] is not None else False,
-            estado=row[6] if len(row) > 6 and row[6] else 'pendiente',
-            nota=float(row[7]) if len(row) > 7 and row[7] is not None else None,
-            observaciones=row[8] if len(row) > 8 else None,
-            fecha_registro=row[9] if len(row) > 9 else None
-        )
+        return EntregaTP.from_row(row)
 
@@ -0,0 +1,80 @@
+"""
+Implementación PostgreSQL: ExportRepository
+Compatible con pg8000.
+
+Decisión de diseño: Cursor del lado del servidor (DECLARE / FETCH)
+- pg8000 lee el resultado completo de un execute() en memoria, aunque
+  después se use fetchmany(): para memoria constante hay que pedir los
+  lotes explícitamente al servidor con FETCH FORWARD
+- El cursor vive dentro de una transacción, por eso la conexión debe ser
+  exclusiva del export (ver crear_conexion)
+"""
+
+from typing import Iterator, Tuple
+
+from src.infrastructure.repositories.base.export_repository_base import ExportRepositoryBase, COLUMNAS_EXPORT
+
+
+# Tabla exportable -> query (filtrada por curso, ordenada cronológicamente)
+QUERIES_EXPORT = {
+    "asistencias": """
+        SELECT ra.id, a.id, a.dni, a.apellido, a.nombre,
+               cl.id, cl.numero_clase, cl.fecha, ra.estado, ra.fecha_registro
+        FROM registro_asistencia ra
+        JOIN clase cl ON cl.id = ra.clase_id
+        JOIN alumno a ON a.id = ra.alumno_id
+        WHERE cl.curso_id = %s
+        ORDER BY cl.fecha, cl.numero_clase, a.apellido, a.nombre
+    """,
+    "participaciones": """
+        SELECT rp.id, a.id, a.dni, a.apellido, a.nombre,
+               cl.id, cl.numero_clase, cl.fecha, rp.nivel, rp.comentario, rp.fecha_registro
+        FROM registro_participacion rp
+        JOIN clase cl ON cl.id = rp.clase_id
+        JOIN alumno a ON a.id = rp.alumno_id
+        WHERE cl.curso_id = %s
+        ORDER BY cl.fecha, cl.numero_clase, a.apellido, a.nombre
+    """,
+    "entregas": """
+        SELECT e.id, a.id, a.dni, a.apellido, a.nombre,
+               tp.id, tp.titulo, tp.fecha_entrega, e.fecha_entrega_real,
+               e.entregado, e.es_tardia, e.estado, e.nota, e.observaciones, e.fecha_registro
+        FROM entrega_tp e
+        JOIN trabajo_practico tp ON tp.id = e.trabajo_practico_id
+        JOIN alumno a ON a.id = e.alumno_id
+        WHERE tp.curso_id = %s
+        ORDER BY tp.fecha_entrega, tp.id, a.apellido, a.nombre
+    """,
+}
+
+
+class ExportRepositoryPostgres(ExportRepositoryBase):
+    
+    def __init__(self, conexion):
+        self.conexion = conexion
+
+    def iterar_filas(self, curso_id: int, tabla: str, tamano_lote: int = 1000) -> Iterator[Tuple]:
+        if tabla not in COLUMNAS_EXPORT:
+            raise ValueError(f"Tabla no exportable: {tabla}")
+        
+        nombre_cursor = f"export_{tabla}"
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(
+                f"DECLARE {nombre_cursor} NO SCROLL CURSOR FOR {QUERIES_EXPORT[tabla]}",
+                (curso_id,)
+            )
+            while True:
+                cursor.execute(f"FETCH FORWARD {int(tamano_lote)} FROM {nombre_cursor}")
+                filas = cursor.fetchall()
+                if not filas:
+                    break
+                yield from filas
+            cursor.execute(f"CLOSE {nombre_cursor}")
+            self.conexion.commit()
+        except BaseException:
+            # Incluye GeneratorExit (cliente cortó la descarga): liberar el cursor
+            self.conexion.rollback()
+            raise
+        finally:
+            cursor.close()
@@ -3,7 +3,7 @@ Implementación PostgreSQL: InscripcionRepository
 Compatible con pg8000.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from datetime import datetime, date
 
 from src.infrastructure.repositories.base.inscripcion_repository_base import InscripcionRepositoryBase
@@ -94,6 +94,96 @@ class InscripcionRepositoryPostgres(InscripcionRepositoryBase):
         finally:
             cursor.close()
 
+    def obtener_alumno_ids_por_curso(self, curso_id: int) -> List[int]:
+        query = "SELECT alumno_id FROM inscripcion WHERE curso_id = %s"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (curso_id,))
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            return [row[0] for row in rows]
+        finally:
+            cursor.close()
+
+    def filtrar_inscriptos(self, curso_id: int, alumno_ids: Iterable[int]) -> Set[int]:
+        ids = list(set(alumno_ids))
+        if not ids:
+            return set()
+        query = "SELECT alumno_id FROM inscripcion WHERE curso_id = %s AND alumno_id = ANY(%s)"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (curso_id, ids))
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            return {row[0] for row in rows}
+        finally:
+            cursor.close()
+
+    def inscribir_pares(self, pares: Iterable[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+        pares = list(set(pares))
+        if not pares:
+            return 0, []
+        # Los JOIN descartan alumnos/cursos inexistentes; ON CONFLICT, los ya inscriptos
+        query = """
+            WITH validos AS (
+                SELECT p.alumno_id, p.curso_id
+                FROM unnest(%s::int[], %s::int[]) AS p(alumno_id, curso_id)
+                JOIN alumno a ON a.id = p.alumno_id
+                JOIN curso c ON c.id = p.curso_id
+            ),
+            creados AS (
+                INSERT INTO inscripcion (alumno_id, curso_id, fecha_inscripcion)
+                SELECT alumno_id, curso_id, CURRENT_DATE FROM validos
+                ON CONFLICT (alumno_id, curso_id) DO NOTHING
+                RETURNING alumno_id, curso_id
+            )
+            SELECT (SELECT COUNT(*) FROM validos), NULL, NULL
+            UNION ALL
+            SELECT NULL, alumno_id, curso_id FROM creados
+        """
+        return self._inscribir_masivo(query, ([a for a, _ in pares], [c for _, c in pares]))
+
+    def inscribir_cohorte(self, cohorte: int, curso_ids: Iterable[int]) -> Tuple[int, List[Tuple[int, int]]]:
+        curso_ids = list(set(curso_ids))
+        if not curso_ids:
+            return 0, []
+        query = """
+            WITH validos AS (
+                SELECT a.id AS alumno_id, c.id AS curso_id
+                FROM alumno a
+                CROSS JOIN curso c
+                WHERE a.cohorte = %s AND c.id = ANY(%s)
+            ),
+            creados AS (
+                INSERT INTO inscripcion (alumno_id, curso_id, fecha_inscripcion)
+                SELECT alumno_id, curso_id, CURRENT_DATE FROM validos
+                ON CONFLICT (alumno_id, curso_id) DO NOTHING
+                RETURNING alumno_id, curso_id
+            )
+            SELECT (SELECT COUNT(*) FROM validos), NULL, NULL
+            UNION ALL
+            SELECT NULL, alumno_id, curso_id FROM creados
+        """
+        return self._inscribir_masivo(query, (cohorte, curso_ids))
+
+    def _inscribir_masivo(self, query: str, params) -> Tuple[int, List[Tuple[int, int]]]:
+        """Ejecuta un INSERT ... SELECT masivo: primera fila = candidatos, resto = creados"""
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            candidatos = next(row[0] for row in rows if row[0] is not None)
+            creados = [(row[1], row[2]) for row in rows if row[0] is None]
+            return candidatos, creados
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
+
     def eliminar(self, id: int) -> bool:
         query = "DELETE FROM inscripcion WHERE id = %s"
         
@@ -110,9 +200,4 @@ class InscripcionRepositoryPostgres(InscripcionRepositoryBase):
             cursor.close()
 
     def _row_to_inscripcion(self, row) -> Inscripcion:
-        return Inscripcion(
-            id=row[0],
-            alumno_id=row[1],
-            curso_id=row[2],
-            fecha_inscripcion=row[3]
-        )
+        return Inscripcion.from_row(row)
@@ -3,7 +3,7 @@ Implementación PostgreSQL: RegistroParticipacionRepository
 Compatible con pg8000.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from src.infrastructure.repositories.base.participacion_repository_base import RegistroParticipacionRepositoryBase
@@ -24,7 +24,7 @@ class RegistroParticipacionRepositoryPostgres(RegistroParticipacionRepositoryBas
         params = (
             registro.alumno_id,
             registro.clase_id,
-            registro.nivel,
+            registro.nivel.value,
             registro.comentario,
             datetime.now()
         )
@@ -44,6 +44,54 @@ class RegistroParticipacionRepositoryPostgres(RegistroParticipacionRepositoryBas
         finally:
             cursor.close()
 
+    def crear_lote(
+        self,
+        clase_id: int,
+        registros: List[RegistroParticipacion],
+        reemplazar: bool = False
+    ) -> Tuple[List[RegistroParticipacion], int]:
+        """DELETE opcional + un INSERT multi-fila, con un solo commit"""
+        ahora = datetime.now()
+        params = []
+        for registro in registros:
+            params.extend((registro.alumno_id, clase_id, registro.nivel.value, registro.comentario, ahora))
+        
+        cursor = self.conexion.cursor()
+        try:
+            reemplazados = 0
+            if reemplazar:
+                cursor.execute("DELETE FROM registro_participacion WHERE clase_id = %s", (clase_id,))
+                reemplazados = cursor.rowcount
+            
+            creados = []
+            if registros:
+                cursor.execute(f"""
+                    INSERT INTO registro_participacion (alumno_id, clase_id, nivel, comentario, fecha_registro)
+                    VALUES {", ".join(["(%s, %s, %s, %s, %s)"] * len(registros))}
+                    RETURNING id, alumno_id, clase_id, nivel, comentario, fecha_registro
+                """, params)
+                creados = [self._row_to_participacion(row) for row in cursor.fetchall()]
+            
+            self.conexion.commit()
+            return creados, reemplazados
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
+
+    def obtener_por_id(self, id: int) -> Optional[RegistroParticipacion]:
+        query = "SELECT id, alumno_id, clase_id, nivel, comentario, fecha_registro FROM registro_participacion WHERE id = %s"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (id,))
+            row = cursor.fetchone()
+            self.conexion.commit()
+            return self._row_to_participacion(row) if row else None
+        finally:
+            cursor.close()
+
     def obtener_por_clase(self, clase_id: int) -> List[RegistroParticipacion]:
         query = "SELECT id, alumno_id, clase_id, nivel, comentario, fecha_registro FROM registro_participacion WHERE clase_id = %s"
         
@@ -61,6 +109,7 @@ class RegistroParticipacionRepositoryPostgres(RegistroParticipacionRepositoryBas
             FROM registro_participacion rp
             JOIN clase c ON rp.clase_id = c.id
             WHERE rp.alumno_id = %s AND c.curso_id = %s
+            ORDER BY c.fecha, rp.id
         """
         
         cursor = self.conexion.cursor()
@@ -71,12 +120,39 @@ class RegistroParticipacionRepositoryPostgres(RegistroParticipacionRepositoryBas
         finally:
             cursor.close()
 
+    def actualizar(self, registro: RegistroParticipacion) -> RegistroParticipacion:
+        if registro.id is None:
+            raise ValueError("ID requerido para actualizar")
+        
+        query = "UPDATE registro_participacion SET nivel = %s, comentario = %s WHERE id = %s"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (registro.nivel.value, registro.comentario, registro.id))
+            if cursor.rowcount == 0:
+                raise ValueError(f"Participación {registro.id} no encontrada")
+            self.conexion.commit()
+            return registro
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
+
+    def eliminar(self, id: int) -> bool:
+        query = "DELETE FROM registro_participacion WHERE id = %s"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (id,))
+            deleted = cursor.rowcount > 0
+            self.conexion.commit()
+            return deleted
+        except Exception as e:
+            self.conexion.rollback()
+            raise e
+        finally:
+            cursor.close()
+
     def _row_to_participacion(self, row) -> RegistroParticipacion:
-        return RegistroParticipacion(
-            id=row[0],
-            alumno_id=row[1],
-            clase_id=row[2],
-            nivel=row[3],
-            comentario=row[4],
-            fecha_registro=row[5] if len(row) > 5 else None
-        )
+        return RegistroParticipacion.from_row(row)
@@ -3,7 +3,7 @@ Implementación PostgreSQL: TrabajoPracticoRepository
 Compatible con pg8000.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
 from src.infrastructure.repositories.base.tp_repository_base import TrabajoPracticoRepositoryBase
@@ -57,8 +57,23 @@ class TrabajoPracticoRepositoryPostgres(TrabajoPracticoRepositoryBase):
         finally:
             cursor.close()
 
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, TrabajoPractico]:
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        query = "SELECT id, curso_id, titulo, descripcion, fecha_entrega, fecha_creacion FROM trabajo_practico WHERE id = ANY(%s)"
+        
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(query, (ids,))
+            rows = cursor.fetchall()
+            self.conexion.commit()
+            return {row[0]: self._row_to_tp(row) for row in rows}
+        finally:
+            cursor.close()
+
     def obtener_por_curso(self, curso_id: int) -> List[TrabajoPractico]:
-        query = "SELECT id, curso_id, titulo, descripcion, fecha_entrega, fecha_creacion FROM trabajo_practico WHERE curso_id = %s ORDER BY fecha_entrega"
+        query = "SELECT id, curso_id, titulo, descripcion, fecha_entrega, fecha_creacion FROM trabajo_practico WHERE curso_id = %s ORDER BY fecha_entrega, id"
         
         cursor = self.conexion.cursor()
         try:
@@ -71,7 +86,7 @@ class TrabajoPracticoRepositoryPostgres(TrabajoPracticoRepositoryBase):
 
     def obtener_todos(self) -> List[TrabajoPractico]:
         """Obtiene todos los TPs"""
-        query = "SELECT id, curso_id, titulo, descripcion, fecha_entrega, fecha_creacion FROM trabajo_practico ORDER BY fecha_entrega"
+        query = "SELECT id, curso_id, titulo, descripcion, fecha_entrega, fecha_creacion FROM trabajo_practico ORDER BY fecha_entrega, id"
         
         cursor = self.conexion.cursor()
         try:
@@ -120,11 +135,4 @@ class TrabajoPracticoRepositoryPostgres(TrabajoPracticoRepositoryBase):
             cursor.close()
 
     def _row_to_tp(self, row) -> TrabajoPractico:
-        return TrabajoPractico(
-            id=row[0],
-            curso_id=row[1],
-            titulo=row[2],
-            descripcion=row[3],
-            fecha_entrega=row[4],
-            fecha_creacion=row[5] if len(row) > 5 else None
-        )
+        return TrabajoPractico.from_row(row)
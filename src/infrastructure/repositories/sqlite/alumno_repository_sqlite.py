@@ -9,8 +9,9 @@ Decisión de diseño: Implementación concreta con SQLite
 - Maneja errores de BD y los convierte a excepciones de dominio
 """
 
+import json
 import sqlite3
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 from src.infrastructure.repositories.base.alumno_repository_base import AlumnoRepositoryBase
@@ -84,6 +85,53 @@ class AlumnoRepositorySQLite(AlumnoRepositoryBase):
                 raise DNIDuplicadoException(f"Ya existe un alumno con DNI {alumno.dni}")
             raise  # Re-lanzar si es otro tipo de error de integridad
     
+    def crear_lote(self, alumnos: List[Alumno], actualizar_existentes: bool = False) -> Tuple[List[Alumno], List[Alumno]]:
+        """Carga masiva con INSERT ... ON CONFLICT(dni) ... RETURNING (SQLite >= 3.35)"""
+        if not alumnos:
+            return [], []
+        
+        if actualizar_existentes:
+            conflicto = """
+                DO UPDATE SET
+                    nombre = excluded.nombre,
+                    apellido = excluded.apellido,
+                    email = excluded.email,
+                    cohorte = excluded.cohorte
+            """
+        else:
+            conflicto = "DO NOTHING"
+        ahora = datetime.now()
+        creados, actualizados = [], []
+        
+        cursor = self.conexion.cursor()
+        try:
+            # SQLite no tiene xmax: los DNIs existentes se consultan antes
+            cursor.execute(
+                "SELECT dni FROM alumno WHERE dni IN (SELECT value FROM json_each(?))",
+                (json.dumps([alumno.dni for alumno in alumnos]),)
+            )
+            existentes = {row['dni'] for row in cursor.fetchall()}
+            
+            for inicio in range(0, len(alumnos), 1000):
+                lote = alumnos[inicio:inicio + 1000]
+                params = []
+                for alumno in lote:
+                    params.extend((alumno.nombre, alumno.apellido, alumno.dni, alumno.email, alumno.cohorte, ahora))
+                cursor.execute(f"""
+                    INSERT INTO alumno (nombre, apellido, dni, email, cohorte, fecha_creacion)
+                    VALUES {", ".join(["(?, ?, ?, ?, ?, ?)"] * len(lote))}
+                    ON CONFLICT(dni) {conflicto}
+                    RETURNING id, nombre, apellido, dni, email, cohorte, fecha_creacion
+                """, params)
+                for row in cursor.fetchall():
+                    alumno = self._row_to_alumno(row)
+                    (actualizados if alumno.dni in existentes else creados).append(alumno)
+            self.conexion.commit()
+            return creados, actualizados
+        except Exception:
+            self.conexion.rollback()
+            raise
+    
     def obtener_por_id(self, id: int) -> Optional[Alumno]:
         """Obtiene un alumno por ID"""
         cursor = self.conexion.cursor()
@@ -94,6 +142,18 @@ class AlumnoRepositorySQLite(AlumnoRepositoryBase):
             return self._row_to_alumno(row)
         return None
     
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Alumno]:
+        """Obtiene varios alumnos por ID con una sola consulta"""
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        cursor = self.conexion.cursor()
+        cursor.execute(
+            "SELECT * FROM alumno WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),)
+        )
+        return {row['id']: self._row_to_alumno(row) for row in cursor.fetchall()}
+    
     def obtener_por_dni(self, dni: str) -> Optional[Alumno]:
         """Obtiene un alumno por DNI"""
         cursor = self.conexion.cursor()
@@ -108,7 +168,7 @@ class AlumnoRepositorySQLite(AlumnoRepositoryBase):
         """Obtiene todos los alumnos con paginación opcional"""
         cursor = self.conexion.cursor()
         
-        query = "SELECT * FROM alumno ORDER BY apellido, nombre"
+        query = "SELECT * FROM alumno ORDER BY apellido, nombre, id"
         
         if limite is not None:
             query += f" LIMIT {limite} OFFSET {offset}"
@@ -130,7 +190,7 @@ class AlumnoRepositorySQLite(AlumnoRepositoryBase):
         cursor.execute("""
             SELECT * FROM alumno 
             WHERE nombre LIKE ? OR apellido LIKE ?
-            ORDER BY apellido, nombre
+            ORDER BY apellido, nombre, id
         """, (patron, patron))
         
         rows = cursor.fetchall()
@@ -142,7 +202,7 @@ class AlumnoRepositorySQLite(AlumnoRepositoryBase):
         cursor.execute("""
             SELECT * FROM alumno 
             WHERE cohorte = ?
-            ORDER BY apellido, nombre
+            ORDER BY apellido, nombre, id
         """, (cohorte,))
         
         rows = cursor.fetchall()
@@ -218,12 +278,12 @@ class AlumnoRepositorySQLite(AlumnoRepositoryBase):
         Returns:
             Alumno: Entidad de dominio
         """
-        return Alumno(
-            id=row['id'],
-            nombre=row['nombre'],
-            apellido=row['apellido'],
-            dni=row['dni'],
-            email=row['email'],
-            cohorte=row['cohorte'],
-            fecha_creacion=datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
-        )
+        return Alumno.from_row((
+            row['id'],
+            row['nombre'],
+            row['apellido'],
+            row['dni'],
+            row['email'],
+            row['cohorte'],
+            datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
+        ))
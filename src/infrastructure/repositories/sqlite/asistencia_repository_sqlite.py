@@ -9,7 +9,6 @@ from datetime import datetime
 
 from src.infrastructure.repositories.base.asistencia_repository_base import RegistroAsistenciaRepositoryBase
 from src.domain.entities.registro_asistencia import RegistroAsistencia
-from src.domain.value_objects.enums import EstadoAsistencia
 from src.domain.exceptions.domain_exceptions import AsistenciaYaRegistradaException
 
 class RegistroAsistenciaRepositorySQLite(RegistroAsistenciaRepositoryBase):
@@ -59,7 +58,7 @@ class RegistroAsistenciaRepositorySQLite(RegistroAsistenciaRepositoryBase):
             FROM registro_asistencia ra
             JOIN clase c ON ra.clase_id = c.id
             WHERE ra.alumno_id = ? AND c.curso_id = ?
-            ORDER BY c.fecha ASC
+            ORDER BY c.fecha ASC, ra.id ASC
         """, (alumno_id, curso_id))
         rows = cursor.fetchall()
         return [self._row_to_registro(row) for row in rows]
@@ -92,10 +91,10 @@ class RegistroAsistenciaRepositorySQLite(RegistroAsistenciaRepositoryBase):
         return cursor.rowcount > 0
 
     def _row_to_registro(self, row: sqlite3.Row) -> RegistroAsistencia:
-        return RegistroAsistencia(
-            id=row['id'],
-            alumno_id=row['alumno_id'],
-            clase_id=row['clase_id'],
-            estado=EstadoAsistencia(row['estado']),
-            fecha_registro=datetime.fromisoformat(row['fecha_registro']) if row['fecha_registro'] else None
-        )
+        return RegistroAsistencia.from_row((
+            row['id'],
+            row['alumno_id'],
+            row['clase_id'],
+            row['estado'],
+            datetime.fromisoformat(row['fecha_registro']) if row['fecha_registro'] else None
+        ))
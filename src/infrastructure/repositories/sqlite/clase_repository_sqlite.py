@@ -3,8 +3,9 @@ Implementación SQLite: ClaseRepository
 Sistema de Seguimiento de Alumnos
 """
 
+import json
 import sqlite3
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import date, datetime
 
 from src.infrastructure.repositories.base.clase_repository_base import ClaseRepositoryBase
@@ -47,6 +48,17 @@ class ClaseRepositorySQLite(ClaseRepositoryBase):
         row = cursor.fetchone()
         return self._row_to_clase(row) if row else None
     
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Clase]:
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        cursor = self.conexion.cursor()
+        cursor.execute(
+            "SELECT * FROM clase WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),)
+        )
+        return {row['id']: self._row_to_clase(row) for row in cursor.fetchall()}
+    
     def obtener_por_curso(self, curso_id: int) -> List[Clase]:
         cursor = self.conexion.cursor()
         cursor.execute("SELECT * FROM clase WHERE curso_id = ? ORDER BY numero_clase ASC", (curso_id,))
@@ -59,6 +71,49 @@ class ClaseRepositorySQLite(ClaseRepositoryBase):
         row = cursor.fetchone()
         return self._row_to_clase(row) if row else None
     
+    def obtener_recientes(self, limite: int, docente: Optional[str] = None) -> List[dict]:
+        filtro = ""
+        params = []
+        if docente:
+            filtro = "WHERE c.docente_responsable LIKE ?"
+            params.append(f"%{docente}%")
+        params.append(limite)
+        
+        cursor = self.conexion.cursor()
+        cursor.execute(f"""
+            WITH recientes AS (
+                SELECT cl.*, c.nombre_materia, c.anio
+                FROM clase cl
+                JOIN curso c ON c.id = cl.curso_id
+                {filtro}
+                ORDER BY cl.fecha DESC, cl.id DESC
+                LIMIT ?
+            )
+            SELECT r.*,
+                   COUNT(ra.id) AS total_registros,
+                   SUM(CASE WHEN ra.estado = 'Presente' THEN 1 ELSE 0 END) AS presentes,
+                   SUM(CASE WHEN ra.estado = 'Ausente' THEN 1 ELSE 0 END) AS ausentes,
+                   SUM(CASE WHEN ra.estado = 'Tardanza' THEN 1 ELSE 0 END) AS tardanzas,
+                   SUM(CASE WHEN ra.estado = 'Justificada' THEN 1 ELSE 0 END) AS justificadas
+            FROM recientes r
+            LEFT JOIN registro_asistencia ra ON ra.clase_id = r.id
+            GROUP BY r.id
+            ORDER BY r.fecha DESC, r.id DESC
+        """, tuple(params))
+        return [
+            {
+                "clase": self._row_to_clase(row),
+                "curso_nombre": row['nombre_materia'],
+                "curso_anio": row['anio'],
+                "total_registros": row['total_registros'],
+                "presentes": row['presentes'] or 0,
+                "ausentes": row['ausentes'] or 0,
+                "tardanzas": row['tardanzas'] or 0,
+                "justificadas": row['justificadas'] or 0,
+            }
+            for row in cursor.fetchall()
+        ]
+    
     def actualizar(self, clase: Clase) -> Clase:
         if clase.id is None:
             raise ValueError("ID requerido para actualizar")
@@ -95,11 +150,11 @@ class ClaseRepositorySQLite(ClaseRepositoryBase):
         return cursor.rowcount > 0
 
     def _row_to_clase(self, row: sqlite3.Row) -> Clase:
-        return Clase(
-            id=row['id'],
-            curso_id=row['curso_id'],
-            fecha=date.fromisoformat(row['fecha']),
-            numero_clase=row['numero_clase'],
-            tema=row['tema'],
-            fecha_creacion=datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
-        )
+        return Clase.from_row((
+            row['id'],
+            row['curso_id'],
+            date.fromisoformat(row['fecha']),
+            row['numero_clase'],
+            row['tema'],
+            datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
+        ))
@@ -3,8 +3,9 @@ Implementación SQLite: CursoRepository
 Sistema de Seguimiento de Alumnos
 """
 
+import json
 import sqlite3
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
 from src.infrastructure.repositories.base.curso_repository_base import CursoRepositoryBase
@@ -53,11 +54,23 @@ class CursoRepositorySQLite(CursoRepositoryBase):
             return self._row_to_curso(row)
         return None
     
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, Curso]:
+        """Obtiene varios cursos por ID con una sola consulta"""
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        cursor = self.conexion.cursor()
+        cursor.execute(
+            "SELECT * FROM curso WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),)
+        )
+        return {row['id']: self._row_to_curso(row) for row in cursor.fetchall()}
+    
     def obtener_todos(self, limite: Optional[int] = None, offset: int = 0) -> List[Curso]:
         """Obtiene todos los cursos con paginación opcional"""
         cursor = self.conexion.cursor()
         
-        query = "SELECT * FROM curso ORDER BY anio DESC, cuatrimestre DESC, nombre_materia ASC"
+        query = "SELECT * FROM curso ORDER BY anio DESC, cuatrimestre DESC, nombre_materia ASC, id ASC"
         
         if limite is not None:
             query += f" LIMIT {limite} OFFSET {offset}"
@@ -73,7 +86,7 @@ class CursoRepositorySQLite(CursoRepositoryBase):
         cursor.execute("""
             SELECT * FROM curso 
             WHERE anio = ? AND cuatrimestre = ?
-            ORDER BY nombre_materia ASC
+            ORDER BY nombre_materia ASC, id ASC
         """, (anio, cuatrimestre))
         
         rows = cursor.fetchall()
@@ -115,11 +128,11 @@ class CursoRepositorySQLite(CursoRepositoryBase):
     
     def _row_to_curso(self, row: sqlite3.Row) -> Curso:
         """Convierte una fila de SQLite a una entidad Curso"""
-        return Curso(
-            id=row['id'],
-            nombre_materia=row['nombre_materia'],
-            anio=row['anio'],
-            cuatrimestre=row['cuatrimestre'],
-            docente_responsable=row['docente_responsable'],
-            fecha_creacion=datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
-        )
+        return Curso.from_row((
+            row['id'],
+            row['nombre_materia'],
+            row['anio'],
+            row['cuatrimestre'],
+            row['docente_responsable'],
+            datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
+        ))
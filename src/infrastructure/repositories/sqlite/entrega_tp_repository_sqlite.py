@@ -10,6 +10,26 @@ from datetime import datetime, date
 from src.infrastructure.repositories.base.entrega_tp_repository_base import EntregaTPRepositoryBase
 from src.domain.entities.entrega_tp import EntregaTP
 
+# Filas por sentencia en el upsert masivo (9 parámetros por fila)
+TAMANO_LOTE_UPSERT = 1000
+
+_COLUMNAS = """
+    trabajo_practico_id, alumno_id, fecha_entrega_real,
+    entregado, es_tardia, estado, nota, observaciones, fecha_registro
+"""
+
+_ACTUALIZAR_SI_EXISTE = """
+    ON CONFLICT(trabajo_practico_id, alumno_id) DO UPDATE SET
+    fecha_entrega_real=excluded.fecha_entrega_real,
+    entregado=excluded.entregado,
+    es_tardia=excluded.es_tardia,
+    estado=excluded.estado,
+    nota=excluded.nota,
+    observaciones=excluded.observaciones,
+    fecha_registro=excluded.fecha_registro
+"""
+
+
 class EntregaTPRepositorySQLite(EntregaTPRepositoryBase):
     
     def __init__(self, conexion: sqlite3.Connection):
@@ -19,32 +39,72 @@ class EntregaTPRepositorySQLite(EntregaTPRepositoryBase):
     def crear_o_actualizar(self, entrega: EntregaTP) -> EntregaTP:
         # Decisión de Diseño: Implementar UPSERT
         # Si ya existe entrega para ese alumno y TP, actualizamos. Si no, creamos.
-        # SQLite tiene ON CONFLICT DO UPDATE
+        # SQLite tiene ON CONFLICT DO UPDATE (y RETURNING desde 3.35)
         
-        cursor = self.conexion.cursor()
+        # Mismas reglas que PostgreSQL: el estado define entregado y tardía
+        entregado = entrega.estado in ['entregado', 'tarde']
+        es_tardia = entrega.estado == 'tarde'
+        fecha_entrega = entrega.fecha_entrega_real or (date.today() if entregado else None)
         
-        cursor.execute("""
-            INSERT INTO entrega_tp (trabajo_practico_id, alumno_id, fecha_entrega_real, entregado, es_tardia, fecha_registro)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(trabajo_practico_id, alumno_id) DO UPDATE SET
-            fecha_entrega_real=excluded.fecha_entrega_real,
-            entregado=excluded.entregado,
-            es_tardia=excluded.es_tardia,
-            fecha_registro=excluded.fecha_registro
+        cursor = self.conexion.cursor()
+        cursor.execute(f"""
+            INSERT INTO entrega_tp ({_COLUMNAS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            {_ACTUALIZAR_SI_EXISTE}
+            RETURNING id, fecha_registro
         """, (
             entrega.trabajo_practico_id,
             entrega.alumno_id,
-            entrega.fecha_entrega_real.isoformat() if entrega.fecha_entrega_real else None,
-            entrega.entregado,
-            entrega.es_tardia,
+            fecha_entrega,
+            entregado,
+            es_tardia,
+            entrega.estado,
+            entrega.nota,
+            entrega.observaciones,
             datetime.now()
         ))
+        row = cursor.fetchone()
         self.conexion.commit()
         
-        # Recuperar el ID (si fue update lastrowid puede no ser confiable en versiones viejas de sqlite, pero en upsert suele funcionar)
-        # Para estar seguros, buscamos por unique key
-        entrega_bd = self.obtener_por_alumno_y_tp(entrega.alumno_id, entrega.trabajo_practico_id)
-        return entrega_bd
+        entrega.id = row['id']
+        entrega.fecha_registro = datetime.fromisoformat(row['fecha_registro'])
+        entrega.entregado = entregado
+        entrega.es_tardia = es_tardia
+        entrega.fecha_entrega_real = fecha_entrega
+        return entrega
+
+    def crear_o_actualizar_lote(self, entregas: List[EntregaTP]) -> List[EntregaTP]:
+        # Mismas columnas que crear_o_actualizar, una sentencia por lote
+        if not entregas:
+            return []
+        
+        ahora = datetime.now()
+        resultado = []
+        cursor = self.conexion.cursor()
+        for inicio in range(0, len(entregas), TAMANO_LOTE_UPSERT):
+            lote = entregas[inicio:inicio + TAMANO_LOTE_UPSERT]
+            params = []
+            for entrega in lote:
+                params.extend((
+                    entrega.trabajo_practico_id,
+                    entrega.alumno_id,
+                    entrega.fecha_entrega_real,
+                    entrega.entregado,
+                    entrega.es_tardia,
+                    entrega.estado,
+                    entrega.nota,
+                    entrega.observaciones,
+                    ahora
+                ))
+            cursor.execute(f"""
+                INSERT INTO entrega_tp ({_COLUMNAS})
+                VALUES {", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(lote))}
+                {_ACTUALIZAR_SI_EXISTE}
+                RETURNING id, {_COLUMNAS}
+            """, params)
+            resultado.extend(self._row_to_entrega(row) for row in cursor.fetchall())
+        self.conexion.commit()
+        return resultado
 
     def obtener_por_id(self, id: int) -> Optional[EntregaTP]:
         cursor = self.conexion.cursor()
@@ -71,7 +131,7 @@ class EntregaTPRepositorySQLite(EntregaTPRepositoryBase):
             FROM entrega_tp et
             JOIN trabajo_practico tp ON et.trabajo_practico_id = tp.id
             WHERE et.alumno_id = ? AND tp.curso_id = ?
-            ORDER BY tp.fecha_entrega ASC
+            ORDER BY tp.fecha_entrega IS NULL, tp.fecha_entrega ASC, et.id ASC
         """, (alumno_id, curso_id))
         rows = cursor.fetchall()
         return [self._row_to_entrega(row) for row in rows]
@@ -83,12 +143,15 @@ class EntregaTPRepositorySQLite(EntregaTPRepositoryBase):
         return cursor.rowcount > 0
 
     def _row_to_entrega(self, row: sqlite3.Row) -> EntregaTP:
-        return EntregaTP(
-            id=row['id'],
-            trabajo_practico_id=row['trabajo_practico_id'],
-            alumno_id=row['alumno_id'],
-            fecha_entrega_real=date.fromisoformat(row['fecha_entrega_real']) if row['fecha_entrega_real'] else None,
-            entregado=bool(row['entregado']),
-            es_tardia=bool(row['es_tardia']),
-            fecha_registro=datetime.fromisoformat(row['fecha_registro']) if row['fecha_registro'] else None
-        )
+        return EntregaTP.from_row((
+            row['id'],
+            row['trabajo_practico_id'],
+            row['alumno_id'],
+            date.fromisoformat(row['fecha_entrega_real']) if row['fecha_entrega_real'] else None,
+            row['entregado'],
+            row['es_tardia'],
+            row['estado'],
+            row['nota'],
+            row['observaciones'],
+            datetime.fromisoformat(row['fecha_registro']) if row['fecha_registro'] else None
+        ))
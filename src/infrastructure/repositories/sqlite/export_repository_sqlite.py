@@ -0,0 +1,46 @@
+"""
+Implementación SQLite: ExportRepository
+Sistema de Seguimiento de Alumnos
+
+Decisión de diseño: Iterar el cursor de sqlite3
+- sqlite3 avanza el resultado fila a fila a medida que se piden: con
+  fetchmany() la memoria queda acotada al lote, sin cursores del servidor
+- La lectura es una sola transacción de lectura (snapshot de WAL): el
+  export es consistente aunque haya escrituras en paralelo
+- Las queries son las mismas que en PostgreSQL (solo cambia el marcador)
+"""
+
+import sqlite3
+from typing import Iterator, Tuple
+
+from src.infrastructure.repositories.base.export_repository_base import ExportRepositoryBase, COLUMNAS_EXPORT
+from src.infrastructure.repositories.postgres.export_repository_postgres import QUERIES_EXPORT
+
+# Columnas guardadas como 0/1 que PostgreSQL devuelve como booleanos
+_BOOLEANAS = {"entregado", "es_tardia"}
+
+
+class ExportRepositorySQLite(ExportRepositoryBase):
+
+    def __init__(self, conexion: sqlite3.Connection):
+        self.conexion = conexion
+
+    def iterar_filas(self, curso_id: int, tabla: str, tamano_lote: int = 1000) -> Iterator[Tuple]:
+        if tabla not in COLUMNAS_EXPORT:
+            raise ValueError(f"Tabla no exportable: {tabla}")
+
+        booleanas = [i for i, columna in enumerate(COLUMNAS_EXPORT[tabla]) if columna in _BOOLEANAS]
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(QUERIES_EXPORT[tabla].replace("%s", "?"), (curso_id,))
+            while True:
+                filas = cursor.fetchmany(tamano_lote)
+                if not filas:
+                    break
+                for fila in filas:
+                    fila = tuple(fila)
+                    if booleanas:
+                        fila = tuple(bool(v) if i in booleanas else v for i, v in enumerate(fila))
+                    yield fila
+        finally:
+            cursor.close()
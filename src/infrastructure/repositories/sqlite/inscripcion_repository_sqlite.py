@@ -3,8 +3,9 @@ Implementación SQLite: InscripcionRepository
 Sistema de Seguimiento de Alumnos
 """
 
+import json
 import sqlite3
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
 from src.infrastructure.repositories.base.inscripcion_repository_base import InscripcionRepositoryBase
@@ -62,6 +63,66 @@ class InscripcionRepositorySQLite(InscripcionRepositoryBase):
         cursor.execute("SELECT 1 FROM inscripcion WHERE alumno_id = ? AND curso_id = ?", (alumno_id, curso_id))
         return cursor.fetchone() is not None
     
+    def obtener_alumno_ids_por_curso(self, curso_id: int) -> List[int]:
+        cursor = self.conexion.cursor()
+        cursor.execute("SELECT alumno_id FROM inscripcion WHERE curso_id = ?", (curso_id,))
+        return [row[0] for row in cursor.fetchall()]
+    
+    def filtrar_inscriptos(self, curso_id: int, alumno_ids: Iterable[int]) -> Set[int]:
+        ids = list(set(alumno_ids))
+        if not ids:
+            return set()
+        cursor = self.conexion.cursor()
+        # json_each evita armar un IN (?, ?, ...) y el límite de parámetros de SQLite
+        cursor.execute(
+            "SELECT alumno_id FROM inscripcion WHERE curso_id = ? "
+            "AND alumno_id IN (SELECT value FROM json_each(?))",
+            (curso_id, json.dumps(ids))
+        )
+        return {row[0] for row in cursor.fetchall()}
+    
+    def inscribir_pares(self, pares: Iterable[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+        pares = list(set(pares))
+        if not pares:
+            return 0, []
+        validos = """
+            SELECT a.id AS alumno_id, c.id AS curso_id
+            FROM json_each(?) p
+            JOIN alumno a ON a.id = json_extract(p.value, '$[0]')
+            JOIN curso c ON c.id = json_extract(p.value, '$[1]')
+        """
+        return self._inscribir_masivo(validos, (json.dumps(pares),))
+    
+    def inscribir_cohorte(self, cohorte: int, curso_ids: Iterable[int]) -> Tuple[int, List[Tuple[int, int]]]:
+        curso_ids = list(set(curso_ids))
+        if not curso_ids:
+            return 0, []
+        validos = """
+            SELECT a.id AS alumno_id, c.id AS curso_id
+            FROM alumno a
+            CROSS JOIN curso c
+            WHERE a.cohorte = ? AND c.id IN (SELECT value FROM json_each(?))
+        """
+        return self._inscribir_masivo(validos, (cohorte, json.dumps(curso_ids)))
+    
+    def _inscribir_masivo(self, validos: str, params) -> Tuple[int, List[Tuple[int, int]]]:
+        # SQLite no permite INSERT dentro de un WITH: contar y luego insertar
+        cursor = self.conexion.cursor()
+        try:
+            cursor.execute(f"SELECT COUNT(*) FROM ({validos})", params)
+            candidatos = cursor.fetchone()[0]
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO inscripcion (alumno_id, curso_id, fecha_inscripcion)
+                SELECT alumno_id, curso_id, ? FROM ({validos})
+                RETURNING alumno_id, curso_id
+            """, (datetime.now(),) + tuple(params))
+            creados = [(row[0], row[1]) for row in cursor.fetchall()]
+            self.conexion.commit()
+            return candidatos, creados
+        except Exception:
+            self.conexion.rollback()
+            raise
+    
     def eliminar(self, id: int) -> bool:
         cursor = self.conexion.cursor()
         cursor.execute("DELETE FROM inscripcion WHERE id = ?", (id,))
@@ -69,9 +130,9 @@ class InscripcionRepositorySQLite(InscripcionRepositoryBase):
         return cursor.rowcount > 0
 
     def _row_to_inscripcion(self, row: sqlite3.Row) -> Inscripcion:
-        return Inscripcion(
-            id=row['id'],
-            alumno_id=row['alumno_id'],
-            curso_id=row['curso_id'],
-            fecha_inscripcion=datetime.fromisoformat(row['fecha_inscripcion']) if row['fecha_inscripcion'] else None
-        )
+        return Inscripcion.from_row((
+            row['id'],
+            row['alumno_id'],
+            row['curso_id'],
+            datetime.fromisoformat(row['fecha_inscripcion']) if row['fecha_inscripcion'] else None
+        ))
@@ -4,12 +4,11 @@ Sistema de Seguimiento de Alumnos
 """
 
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from src.infrastructure.repositories.base.participacion_repository_base import RegistroParticipacionRepositoryBase
 from src.domain.entities.registro_participacion import RegistroParticipacion
-from src.domain.value_objects.enums import NivelParticipacion
 
 class RegistroParticipacionRepositorySQLite(RegistroParticipacionRepositoryBase):
     
@@ -35,6 +34,38 @@ class RegistroParticipacionRepositorySQLite(RegistroParticipacionRepositoryBase)
         registro.fecha_registro = datetime.now()
         return registro
 
+    def crear_lote(
+        self,
+        clase_id: int,
+        registros: List[RegistroParticipacion],
+        reemplazar: bool = False
+    ) -> Tuple[List[RegistroParticipacion], int]:
+        cursor = self.conexion.cursor()
+        try:
+            reemplazados = 0
+            if reemplazar:
+                cursor.execute("DELETE FROM registro_participacion WHERE clase_id = ?", (clase_id,))
+                reemplazados = cursor.rowcount
+            
+            creados = []
+            if registros:
+                ahora = datetime.now()
+                params = []
+                for registro in registros:
+                    params.extend((registro.alumno_id, clase_id, registro.nivel.value, registro.comentario, ahora))
+                cursor.execute(f"""
+                    INSERT INTO registro_participacion (alumno_id, clase_id, nivel, comentario, fecha_registro)
+                    VALUES {", ".join(["(?, ?, ?, ?, ?)"] * len(registros))}
+                    RETURNING id, alumno_id, clase_id, nivel, comentario, fecha_registro
+                """, params)
+                creados = [self._row_to_registro(row) for row in cursor.fetchall()]
+            
+            self.conexion.commit()
+            return creados, reemplazados
+        except Exception:
+            self.conexion.rollback()
+            raise
+    
     def obtener_por_id(self, id: int) -> Optional[RegistroParticipacion]:
         cursor = self.conexion.cursor()
         cursor.execute("SELECT * FROM registro_participacion WHERE id = ?", (id,))
@@ -54,7 +85,7 @@ class RegistroParticipacionRepositorySQLite(RegistroParticipacionRepositoryBase)
             FROM registro_participacion rp
             JOIN clase c ON rp.clase_id = c.id
             WHERE rp.alumno_id = ? AND c.curso_id = ?
-            ORDER BY c.fecha ASC
+            ORDER BY c.fecha ASC, rp.id ASC
         """, (alumno_id, curso_id))
         rows = cursor.fetchall()
         return [self._row_to_registro(row) for row in rows]
@@ -83,11 +114,11 @@ class RegistroParticipacionRepositorySQLite(RegistroParticipacionRepositoryBase)
         return cursor.rowcount > 0
 
     def _row_to_registro(self, row: sqlite3.Row) -> RegistroParticipacion:
-        return RegistroParticipacion(
-            id=row['id'],
-            alumno_id=row['alumno_id'],
-            clase_id=row['clase_id'],
-            nivel=NivelParticipacion(row['nivel']),
-            comentario=row['comentario'],
-            fecha_registro=datetime.fromisoformat(row['fecha_registro']) if row['fecha_registro'] else None
-        )
+        return RegistroParticipacion.from_row((
+            row['id'],
+            row['alumno_id'],
+            row['clase_id'],
+            row['nivel'],
+            row['comentario'],
+            datetime.fromisoformat(row['fecha_registro']) if row['fecha_registro'] else None
+        ))
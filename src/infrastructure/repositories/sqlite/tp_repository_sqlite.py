@@ -3,8 +3,9 @@ Implementación SQLite: TrabajoPracticoRepository
 Sistema de Seguimiento de Alumnos
 """
 
+import json
 import sqlite3
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime, date
 
 from src.infrastructure.repositories.base.tp_repository_base import TrabajoPracticoRepositoryBase
@@ -40,12 +41,28 @@ class TrabajoPracticoRepositorySQLite(TrabajoPracticoRepositoryBase):
         row = cursor.fetchone()
         return self._row_to_tp(row) if row else None
     
+    def obtener_por_ids(self, ids: Iterable[int]) -> Dict[int, TrabajoPractico]:
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        cursor = self.conexion.cursor()
+        cursor.execute(
+            "SELECT * FROM trabajo_practico WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(ids),)
+        )
+        return {row['id']: self._row_to_tp(row) for row in cursor.fetchall()}
+    
     def obtener_por_curso(self, curso_id: int) -> List[TrabajoPractico]:
         cursor = self.conexion.cursor()
         cursor.execute("SELECT * FROM trabajo_practico WHERE curso_id = ? ORDER BY fecha_entrega ASC", (curso_id,))
         rows = cursor.fetchall()
         return [self._row_to_tp(row) for row in rows]
     
+    def obtener_todos(self) -> List[TrabajoPractico]:
+        cursor = self.conexion.cursor()
+        cursor.execute("SELECT * FROM trabajo_practico ORDER BY fecha_entrega")
+        return [self._row_to_tp(row) for row in cursor.fetchall()]
+    
     def actualizar(self, tp: TrabajoPractico) -> TrabajoPractico:
         if tp.id is None:
              raise ValueError("ID requerido para actualizar")
@@ -71,11 +88,11 @@ class TrabajoPracticoRepositorySQLite(TrabajoPracticoRepositoryBase):
         return cursor.rowcount > 0
 
     def _row_to_tp(self, row: sqlite3.Row) -> TrabajoPractico:
-        return TrabajoPractico(
-            id=row['id'],
-            curso_id=row['curso_id'],
-            titulo=row['titulo'],
-            descripcion=row['descripcion'],
-            fecha_entrega=date.fromisoformat(row['fecha_entrega']),
-            fecha_creacion=datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
-        )
+        return TrabajoPractico.from_row((
+            row['id'],
+            row['curso_id'],
+            row['titulo'],
+            row['descripcion'],
+            date.fromisoformat(row['fecha_entrega']),
+            datetime.fromisoformat(row['fecha_creacion']) if row['fecha_creacion'] else None
+        ))
@@ -6,7 +6,8 @@ Este es el punto de entrada de la API.
 """
 
 import os
-from fastapi import FastAPI, Request
+from typing import Optional
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
@@ -41,16 +42,32 @@ async def lifespan(app: FastAPI):
     else:
         print("ℹ️ Entorno Vercel detectado - BD se inicializa bajo demanda")
     
+    # Invalidación de caches entre workers (LISTEN/NOTIFY)
+    # INVALIDACION_CACHE=0 la desactiva (ej: un solo worker). SQLite no
+    # tiene LISTEN/NOTIFY: ese backend se usa con un solo worker
+    from src.infrastructure.repositories.backends import backend_activo
+    escuchar_invalidaciones = (
+        os.environ.get("INVALIDACION_CACHE", "1") != "0" and backend_activo() == "postgres"
+    )
+    if escuchar_invalidaciones:
+        from src.infrastructure.cache.bus_invalidacion import iniciar_escucha
+        iniciar_escucha()
+    
     yield  # La aplicación está corriendo
     
     # Shutdown
     print("👋 Cerrando aplicación...")
+    if escuchar_invalidaciones:
+        from src.infrastructure.cache.bus_invalidacion import detener_escucha
+        detener_escucha()
 
 
 # ============================================================================
 # Crear aplicación FastAPI
 # ============================================================================
 
+from src.presentation.api.middleware.instrumentacion import InstrumentacionMiddleware, JSONResponseMedida
+
 app = FastAPI(
     title="Sistema de Seguimiento de Alumnos",
     description="""
@@ -85,8 +102,45 @@ app = FastAPI(
         "name": "MIT",
         "url": "https://opensource.org/licenses/MIT"
     },
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Mide la serialización JSON para el header Server-Timing
+    default_response_class=JSONResponseMedida
+)
+
+
+# ============================================================================
+# Compresión, GET condicional (ETag / 304) y mapa de identidad por request
+# ============================================================================
+
+# El último middleware agregado es el más externo:
+# CORS -> Perfilado -> Instrumentación -> Métricas -> Conexión por request -> ETag (puede cortar con 304)
+# -> Compresión -> Mapa de identidad -> rutas
+from src.presentation.api.middleware.compresion import CompresionMiddleware
+from src.presentation.api.middleware.conexion_request import ConexionPorRequestMiddleware
+from src.presentation.api.middleware.etag import ETagMiddleware
+from src.presentation.api.middleware.mapa_identidad import MapaIdentidadMiddleware
+from src.presentation.api.middleware.metricas import MetricasMiddleware
+
+app.add_middleware(MapaIdentidadMiddleware)
+app.add_middleware(
+    CompresionMiddleware,
+    minimo_bytes=int(os.environ.get("COMPRESION_MINIMO_BYTES", "1024")),
 )
+app.add_middleware(ETagMiddleware)
+# Afuera del ETag: su consulta de versiones usa la misma conexión que la ruta
+app.add_middleware(ConexionPorRequestMiddleware)
+# Latencias y requests en curso para /api/metrics; METRICAS=0 lo desactiva
+if os.environ.get("METRICAS", "1") != "0":
+    app.add_middleware(MetricasMiddleware)
+# Server-Timing / X-Query-Count por request; INSTRUMENTACION=0 la desactiva
+if os.environ.get("INSTRUMENTACION", "1") != "0":
+    app.add_middleware(InstrumentacionMiddleware)
+
+
+# Perfilado de requests con X-Profile: 1 (solo si se configura PERFIL_TOKEN)
+if os.environ.get("PERFIL_TOKEN"):
+    from src.presentation.api.middleware.perfilado import PerfiladoMiddleware
+    app.add_middleware(PerfiladoMiddleware, token=os.environ["PERFIL_TOKEN"])
 
 
 # ============================================================================
@@ -99,6 +153,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Query-Count", "Server-Timing", "X-Profile-Id"],
 )
 
 
@@ -127,18 +182,9 @@ app.include_router(entregas.router, prefix=api_prefix)
 from src.presentation.api.routers import alertas
 app.include_router(alertas.router, prefix=api_prefix)
 
-# ============================================================================
-# Servir Archivos Estáticos (Frontend)
-# ============================================================================
-
-# En Vercel, el frontend se sirve por separado o desde la raíz
-# Si estamos en local, servimos public desde aquí para facilitar pruebas
-if not os.environ.get("VERCEL"):
-    try:
-        app.mount("/", StaticFiles(directory="public", html=True), name="public")
-    except Exception as e:
-        print(f"⚠️ No se pudo montar directorio public: {e}")
-
+# Batch: varias requests en un solo viaje (ver routers/batch.py)
+from src.presentation.api.routers import batch
+app.include_router(batch.router, prefix=api_prefix)
 
 # ============================================================================
 # Endpoints de Health Check
@@ -170,10 +216,12 @@ def health_check():
     """Health check detallado"""
     try:
         from src.infrastructure.database.connection import get_db_connection
+        from src.infrastructure.repositories.backends import backend_activo
         conexion = get_db_connection()
-        # Verificar conexión simple
-        with conexion.cursor() as cursor:
-            cursor.execute("SELECT 1")
+        # Verificar conexión simple (el backend en memoria no tiene SQL)
+        if backend_activo() != "memoria":
+            with conexion.cursor() as cursor:
+                cursor.execute("SELECT 1")
         db_status = "healthy"
     except Exception as e:
         db_status = f"unhealthy: {str(e)}"
@@ -394,6 +442,10 @@ def seed_database():
                 finally:
                     cursor.close()
         
+        # Las inscripciones se insertaron por SQL directo: el índice no las conoce
+        from src.infrastructure.cache.repositorios_cacheados import limpiar_caches
+        limpiar_caches()
+        
         return {
             "status": "success",
             "message": "Datos de prueba cargados",
@@ -418,64 +470,14 @@ def clear_seed_database():
     """
     Borra los datos de prueba cargados previamente.
     Identifica los datos por DNIs y nombres conocidos.
-    """
-    from src.infrastructure.database.connection import get_db_connection
     
-    conn = get_db_connection()
-    results = {"alumnos": 0, "cursos": 0}
-    
-    # DNIs de prueba conocidos
-    test_dnis = ['12345678', '23456789', '34567890', '45678901', '56789012', '67890123', '78901234', '89012345']
-    # Nombres de cursos de prueba
-    test_cursos = ['Programación I', 'Matemática Discreta', 'Base de Datos', 'Programación II']
+    Una sola transacción con DELETE ... WHERE id = ANY(...) por tabla (ver
+    database/mantenimiento.py): si algo falla no queda nada a medio borrar.
+    """
+    from src.infrastructure.database.mantenimiento import borrar_datos_prueba
     
     try:
-        conn.rollback()
-        
-        # Borrar alumnos de prueba (por DNI)
-        for dni in test_dnis:
-            cursor = conn.cursor()
-            try:
-                # Primero obtener el ID del alumno
-                cursor.execute("SELECT id FROM alumno WHERE dni = %s", (dni,))
-                row = cursor.fetchone()
-                if row:
-                    alumno_id = row[0]
-                    # Borrar registros relacionados
-                    cursor.execute("DELETE FROM registro_asistencia WHERE alumno_id = %s", (alumno_id,))
-                    cursor.execute("DELETE FROM registro_participacion WHERE alumno_id = %s", (alumno_id,))
-                    cursor.execute("DELETE FROM entrega_tp WHERE alumno_id = %s", (alumno_id,))
-                    cursor.execute("DELETE FROM inscripcion WHERE alumno_id = %s", (alumno_id,))
-                    cursor.execute("DELETE FROM alumno WHERE id = %s", (alumno_id,))
-                    conn.commit()
-                    results["alumnos"] += 1
-            except Exception as e:
-                conn.rollback()
-                print(f"Error borrando alumno {dni}: {e}")
-            finally:
-                cursor.close()
-        
-        # Borrar cursos de prueba (por nombre)
-        for nombre in test_cursos:
-            cursor = conn.cursor()
-            try:
-                cursor.execute("SELECT id FROM curso WHERE nombre_materia = %s", (nombre,))
-                row = cursor.fetchone()
-                if row:
-                    curso_id = row[0]
-                    # Borrar registros relacionados
-                    cursor.execute("DELETE FROM trabajo_practico WHERE curso_id = %s", (curso_id,))
-                    cursor.execute("DELETE FROM clase WHERE curso_id = %s", (curso_id,))
-                    cursor.execute("DELETE FROM inscripcion WHERE curso_id = %s", (curso_id,))
-                    cursor.execute("DELETE FROM curso WHERE id = %s", (curso_id,))
-                    conn.commit()
-                    results["cursos"] += 1
-            except Exception as e:
-                conn.rollback()
-                print(f"Error borrando curso {nombre}: {e}")
-            finally:
-                cursor.close()
-        
+        results = borrar_datos_prueba()
         return {
             "status": "success",
             "message": "Datos de prueba eliminados",
@@ -491,6 +493,67 @@ def clear_seed_database():
         }
 
 
+@app.post(
+    "/api/seed/sintetico",
+    tags=["Admin"],
+    summary="Generar dataset sintético para pruebas de capacidad"
+)
+def seed_sintetico(
+    cohortes: int = Query(2, ge=1, le=20),
+    alumnos: int = Query(200, ge=0, le=100000),
+    cursos: int = Query(4, ge=0, le=500),
+    clases_por_curso: int = Query(16, ge=0, le=64),
+    tps_por_curso: int = Query(4, ge=0, le=20),
+    anio_inicial: int = Query(2023, ge=2000, le=2080),
+    semilla: int = Query(42),
+    tasa_participacion: float = Query(0.5, ge=0.0, le=1.0)
+):
+    """
+    Genera un dataset reproducible (misma semilla = mismos datos) con
+    rachas de ausencias y distribución de notas realistas, y lo carga en
+    una sola transacción (ver generador_datos.py). Con alumnos=3200,
+    cursos=4 y cohortes=2 se generan ~100.000 asistencias.
+    
+    Usa una conexión propia: la carga no bloquea la conexión compartida.
+    """
+    from src.infrastructure.database.connection import crear_conexion
+    from src.infrastructure.database.generador_datos import ParametrosDataset, generar_dataset
+    from src.infrastructure.cache.repositorios_cacheados import limpiar_caches
+    
+    parametros = ParametrosDataset(
+        cohortes=cohortes,
+        alumnos=alumnos,
+        cursos=cursos,
+        clases_por_curso=clases_por_curso,
+        tps_por_curso=tps_por_curso,
+        anio_inicial=anio_inicial,
+        semilla=semilla,
+        tasa_participacion=tasa_participacion
+    )
+    
+    conn = None
+    try:
+        parametros.validar()
+        conn = crear_conexion()
+        results = generar_dataset(conn, parametros)
+        limpiar_caches()
+        return {
+            "status": "success",
+            "message": "Dataset sintético cargado",
+            "results": results
+        }
+    except Exception as e:
+        import traceback
+        return {
+            "status": "error",
+            "message": str(e),
+            "traceback": traceback.format_exc()
+        }
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 @app.delete(
     "/api/clear-all",
     tags=["Admin"],
@@ -498,45 +561,23 @@ def clear_seed_database():
 )
 def clear_all_data():
     """
-    Borra TODOS los datos de todas las tablas.
+    Borra TODOS los datos de todas las tablas y reinicia los IDs.
     ¡Cuidado! Esta operación no se puede deshacer.
-    """
-    from src.infrastructure.database.connection import get_db_connection
-    
-    conn = get_db_connection()
-    results = {}
     
-    # Orden específico para respetar constraints de FK
-    tables = [
-        'entrega_tp',
-        'registro_participacion', 
-        'registro_asistencia',
-        'inscripcion',
-        'trabajo_practico',
-        'clase',
-        'alumno',
-        'curso'
-    ]
+    Es un TRUNCATE ... RESTART IDENTITY CASCADE en una transacción (en
+    SQLite, DELETE tabla por tabla). Toma un lock exclusivo de las tablas
+    por un instante: para borrar sin frenar las escrituras, usar
+    POST /api/purgas (por lotes, en segundo plano).
+    """
+    from src.infrastructure.database.mantenimiento import vaciar_todo
     
     try:
-        conn.rollback()
-        
-        for table in tables:
-            cursor = conn.cursor()
-            try:
-                cursor.execute(f"DELETE FROM {table}")
-                results[table] = cursor.rowcount
-                conn.commit()
-            except Exception as e:
-                conn.rollback()
-                results[table] = f"error: {str(e)}"
-            finally:
-                cursor.close()
-        
+        resultado = vaciar_todo()
         return {
             "status": "success",
             "message": "Todos los datos eliminados",
-            "results": results
+            "results": resultado["filas"],
+            "conteo": resultado["conteo"]
         }
         
     except Exception as e:
@@ -548,6 +589,181 @@ def clear_all_data():
         }
 
 
+@app.post(
+    "/api/purgas",
+    tags=["Admin"],
+    summary="Purgar datos por lotes en segundo plano",
+    status_code=202
+)
+def iniciar_purga(
+    alcance: str = Query("todo", pattern="^(todo|cohorte|anio)$"),
+    valor: Optional[int] = Query(None, description="Cohorte o año a purgar"),
+    tamano_lote: int = Query(1000, ge=100, le=10000)
+):
+    """
+    Borra todos los datos (alcance=todo), los alumnos de una cohorte
+    (alcance=cohorte&valor=2023) o los cursos de un año (alcance=anio&valor=2023),
+    con todo lo que dependa de ellos.
+    
+    Responde enseguida: la purga corre en un thread, de a tamano_lote filas
+    por transacción, y su progreso se consulta en GET /api/purgas/{id}.
+    Una purga a la vez por proceso (409 si ya hay otra).
+    """
+    from fastapi import HTTPException
+    from src.infrastructure.database.mantenimiento import PURGAS, PurgaEnCursoError
+    
+    try:
+        purga = PURGAS.iniciar(alcance, valor, tamano_lote)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PurgaEnCursoError as e:
+        raise HTTPException(status_code=409, detail=f"{e} (GET /api/purgas/{e.purga.id})")
+    return {
+        "status": "accepted",
+        "message": f"Purga {purga.id} iniciada",
+        "purga": purga.progreso(),
+        "progreso_url": f"/api/purgas/{purga.id}"
+    }
+
+
+@app.get(
+    "/api/purgas",
+    tags=["Admin"],
+    summary="Purgas recientes de este proceso"
+)
+def listar_purgas():
+    from src.infrastructure.database.mantenimiento import PURGAS
+    return {"purgas": PURGAS.listar()}
+
+
+@app.get(
+    "/api/purgas/{purga_id}",
+    tags=["Admin"],
+    summary="Progreso de una purga"
+)
+def obtener_purga(purga_id: str):
+    """
+    Estado (pendiente, en_curso, completada, error), porcentaje, filas
+    borradas y totales por tabla, lotes y duración.
+    """
+    from fastapi import HTTPException
+    from src.infrastructure.database.mantenimiento import PURGAS
+    purga = PURGAS.obtener(purga_id)
+    if purga is None:
+        raise HTTPException(status_code=404, detail=f"No existe la purga {purga_id}")
+    return purga.progreso()
+
+
+@app.get(
+    "/api/cache/stats",
+    tags=["Admin"],
+    summary="Estadísticas de los caches de entidades"
+)
+def cache_stats():
+    """
+    Hit rate, entradas, expiraciones y desalojos de cada cache
+    (cursos, clases, TPs, índice de inscripciones) de este proceso,
+    y el estado de la escucha de invalidaciones entre workers.
+    """
+    from src.infrastructure.cache.repositorios_cacheados import estadisticas_caches
+    from src.infrastructure.cache.bus_invalidacion import estadisticas_escucha
+    estadisticas = estadisticas_caches()
+    estadisticas["invalidacion"] = estadisticas_escucha()
+    return estadisticas
+
+
+@app.get(
+    "/api/metrics",
+    tags=["Admin"],
+    summary="Métricas en formato Prometheus"
+)
+def metrics():
+    """
+    Latencia por ruta y status (histogramas), requests en curso, consultas
+    SQL por ruta, espera y reconexiones de la conexión a la BD, aciertos de
+    los caches y reconexiones de la escucha de invalidaciones.
+    
+    No consulta la BD: se puede scrapear seguido sin cargarla.
+    """
+    from fastapi.responses import PlainTextResponse
+    from src.infrastructure.monitoreo.metricas import METRICAS
+    return PlainTextResponse(METRICAS.exponer(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get(
+    "/api/consultas-lentas",
+    tags=["Admin"],
+    summary="Consultas lentas recientes (con planes de ejecución)"
+)
+def consultas_lentas():
+    """
+    Últimas sentencias que superaron CONSULTA_LENTA_MS en este proceso, la
+    más reciente primero. SQL y parámetros van redactados (sin valores).
+    Una fracción trae el plan: EXPLAIN (ANALYZE, BUFFERS) para lecturas,
+    EXPLAIN para escrituras. Un "Seq Scan on registro_asistencia" en un
+    plan indica que falta un índice.
+    """
+    from src.infrastructure.monitoreo.consultas_lentas import CONSULTAS_LENTAS
+    return {
+        **CONSULTAS_LENTAS.estadisticas(),
+        "consultas": CONSULTAS_LENTAS.entradas(),
+    }
+
+
+@app.delete(
+    "/api/consultas-lentas",
+    tags=["Admin"],
+    summary="Vaciar el registro de consultas lentas"
+)
+def limpiar_consultas_lentas():
+    from src.infrastructure.monitoreo.consultas_lentas import CONSULTAS_LENTAS
+    CONSULTAS_LENTAS.limpiar()
+    return {"status": "success", "message": "Registro de consultas lentas vaciado"}
+
+
+def _verificar_token_perfilado(request: Request):
+    """404 si el perfilado no está configurado, 403 si el token no coincide"""
+    from fastapi import HTTPException
+    from src.presentation.api.middleware.perfilado import token_valido
+    token = os.environ.get("PERFIL_TOKEN")
+    if not token:
+        raise HTTPException(status_code=404, detail="Perfilado desactivado (configurar PERFIL_TOKEN)")
+    if not token_valido(token, request.scope["headers"]):
+        raise HTTPException(status_code=403, detail="X-Profile-Token inválido")
+
+
+@app.get(
+    "/api/perfiles",
+    tags=["Admin"],
+    summary="Perfiles de requests tomados con X-Profile"
+)
+def listar_perfiles(request: Request):
+    """Últimos perfiles de este proceso (ID, ruta, duración, muestras). Requiere X-Profile-Token."""
+    from src.infrastructure.monitoreo.perfilador import PERFILES
+    _verificar_token_perfilado(request)
+    return {"perfiles": PERFILES.resumen()}
+
+
+@app.get(
+    "/api/perfiles/{perfil_id}",
+    tags=["Admin"],
+    summary="Pilas de un perfil en formato folded (flame graph)"
+)
+def obtener_perfil(perfil_id: str, request: Request):
+    """
+    Una línea por pila ("hilo;marco;...;marco muestras"). Se abre con
+    speedscope o se convierte con flamegraph.pl. Requiere X-Profile-Token.
+    """
+    from fastapi import HTTPException
+    from fastapi.responses import PlainTextResponse
+    from src.infrastructure.monitoreo.perfilador import PERFILES
+    _verificar_token_perfilado(request)
+    perfil = PERFILES.obtener(perfil_id)
+    if perfil is None:
+        raise HTTPException(status_code=404, detail=f"No existe el perfil {perfil_id}")
+    return PlainTextResponse(perfil["folded"])
+
+
 # ============================================================================
 # Manejo de Errores Global
 # ============================================================================
@@ -571,6 +787,21 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+# ============================================================================
+# Servir Archivos Estáticos (Frontend)
+# ============================================================================
+
+# En Vercel, el frontend se sirve por separado o desde la raíz
+# Si estamos en local, servimos public desde aquí para facilitar pruebas.
+# Va al final: el mount en "/" atiende todo lo que llega hasta él, así que
+# las rutas /api/* de este archivo tienen que estar registradas antes
+if not os.environ.get("VERCEL"):
+    try:
+        app.mount("/", StaticFiles(directory="public", html=True), name="public")
+    except Exception as e:
+        print(f"⚠️ No se pudo montar directorio public: {e}")
+
+
 # ============================================================================
 # Ejecutar aplicación (solo para desarrollo local)
 # ============================================================================
@@ -0,0 +1,205 @@
+"""
+Middleware de Compresión de Respuestas
+Sistema de Seguimiento de Alumnos
+
+Comprime con brotli (si está instalado) o gzip las respuestas que superan
+un tamaño mínimo, según lo que acepte el cliente en Accept-Encoding.
+
+Decisión de diseño: Middleware ASGI puro (no BaseHTTPMiddleware)
+- Soporta respuestas en streaming comprimiendo chunk por chunk
+- Las respuestas chicas se envían tal cual (comprimir 200 bytes no ahorra nada)
+- brotli es opcional: sin el paquete se usa solo gzip (stdlib)
+"""
+
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
+
+
+# Tipos de contenido que vale la pena comprimir
+TIPOS_COMPRIMIBLES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def elegir_codificacion(accept_encoding: str) -> Optional[str]:
+    """
+    Elige la codificación a usar según el header Accept-Encoding.
+
+    Prefiere brotli (mejor ratio para JSON) y cae a gzip.
+    Respeta q=0 como "no aceptada".
+
+    Args:
+        accept_encoding: Valor del header Accept-Encoding
+
+    Returns:
+        Optional[str]: "br", "gzip" o None si no hay codificación en común
+    """
+    aceptadas = set()
+    for parte in accept_encoding.lower().split(","):
+        nombre, _, parametros = parte.strip().partition(";")
+        q = 1.0
+        parametros = parametros.strip()
+        if parametros.startswith("q="):
+            try:
+                q = float(parametros[2:])
+            except ValueError:
+                q = 0.0
+        if nombre and q > 0:
+            aceptadas.add(nombre)
+
+    if brotli is not None and "br" in aceptadas:
+        return "br"
+    if "gzip" in aceptadas or "*" in aceptadas:
+        return "gzip"
+    return None
+
+
+def agregar_vary(headers: MutableHeaders, valor: str) -> None:
+    """Agrega un valor al header Vary sin duplicarlo"""
+    actuales = [v.strip() for v in headers.get("vary", "").split(",") if v.strip()]
+    if valor.lower() not in (v.lower() for v in actuales):
+        headers["Vary"] = ", ".join(actuales + [valor])
+
+
+class _Compresor:
+    """Compresor incremental con la misma interfaz para gzip y brotli"""
+
+    def __init__(self, codificacion: str, nivel_gzip: int, calidad_brotli: int):
+        if codificacion == "br":
+            self._br = brotli.Compressor(quality=calidad_brotli)
+            self._gz = None
+        else:
+            self._br = None
+            # wbits=31 -> formato gzip (header + trailer CRC)
+            self._gz = zlib.compressobj(nivel_gzip, zlib.DEFLATED, 31)
+
+    def comprimir(self, datos: bytes) -> bytes:
+        """Comprime un chunk y fuerza el flush para poder enviarlo ya"""
+        if self._br is not None:
+            return self._br.process(datos) + self._br.flush()
+        return self._gz.compress(datos) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finalizar(self, datos: bytes = b"") -> bytes:
+        """Comprime el último chunk y cierra el stream"""
+        if self._br is not None:
+            return self._br.process(datos) + self._br.finish()
+        return self._gz.compress(datos) + self._gz.flush()
+
+
+class CompresionMiddleware:
+    """
+    Middleware ASGI que comprime respuestas grandes.
+
+    Args:
+        app: Aplicación ASGI envuelta
+        minimo_bytes: Tamaño mínimo de cuerpo para comprimir
+        nivel_gzip: Nivel de compresión gzip (1-9)
+        calidad_brotli: Calidad brotli (0-11); 4-5 es buen balance CPU/ratio
+    """
+
+    def __init__(self, app, minimo_bytes: int = 1024, nivel_gzip: int = 6, calidad_brotli: int = 4):
+        self.app = app
+        self.minimo_bytes = minimo_bytes
+        self.nivel_gzip = nivel_gzip
+        self.calidad_brotli = calidad_brotli
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        codificacion = elegir_codificacion(Headers(scope=scope).get("accept-encoding", ""))
+        if codificacion is None:
+            await self.app(scope, receive, send)
+            return
+
+        respuesta = _RespuestaComprimida(self, codificacion, send)
+        await self.app(scope, receive, respuesta.send)
+
+
+class _RespuestaComprimida:
+    """Estado de una respuesta en curso (decide en el primer chunk del body)"""
+
+    def __init__(self, middleware: CompresionMiddleware, codificacion: str, send):
+        self.middleware = middleware
+        self.codificacion = codificacion
+        self.send_original = send
+        self.mensaje_inicio = None
+        self.compresor = None
+        self.pasar_directo = False
+
+    async def send(self, message):
+        tipo = message["type"]
+
+        if tipo == "http.response.start":
+            # Retener el start hasta saber si vamos a comprimir
+            self.mensaje_inicio = message
+            headers = Headers(raw=message.get("headers", []))
+            tipo_contenido = headers.get("content-type", "")
+            self.pasar_directo = (
+                "content-encoding" in headers
+                or not tipo_contenido.startswith(TIPOS_COMPRIMIBLES)
+            )
+            return
+
+        if tipo != "http.response.body":
+            await self.send_original(message)
+            return
+
+        if self.pasar_directo:
+            if self.mensaje_inicio is not None:
+                await self.send_original(self.mensaje_inicio)
+                self.mensaje_inicio = None
+            await self.send_original(message)
+            return
+
+        cuerpo = message.get("body", b"")
+        hay_mas = message.get("more_body", False)
+
+        if self.compresor is None:
+            # Primer chunk: cuerpo completo y chico -> sin comprimir
+            if not hay_mas and len(cuerpo) < self.middleware.minimo_bytes:
+                self.pasar_directo = True
+                await self.send_original(self.mensaje_inicio)
+                self.mensaje_inicio = None
+                await self.send_original(message)
+                return
+
+            self.compresor = _Compresor(
+                self.codificacion, self.middleware.nivel_gzip, self.middleware.calidad_brotli
+            )
+            self.mensaje_inicio["headers"] = list(self.mensaje_inicio.get("headers", []))
+            headers = MutableHeaders(raw=self.mensaje_inicio["headers"])
+            headers["Content-Encoding"] = self.codificacion
+            agregar_vary(headers, "Accept-Encoding")
+
+            if not hay_mas:
+                # Respuesta completa: comprimir de una vez y fijar Content-Length
+                comprimido = self.compresor.finalizar(cuerpo)
+                headers["Content-Length"] = str(len(comprimido))
+                await self.send_original(self.mensaje_inicio)
+                await self.send_original({"type": "http.response.body", "body": comprimido})
+                return
+
+            # Streaming: el largo final no se conoce
+            del headers["Content-Length"]
+            await self.send_original(self.mensaje_inicio)
+            self.mensaje_inicio = None
+
+        if hay_mas:
+            datos = self.compresor.comprimir(cuerpo)
+            if datos:
+                await self.send_original({"type": "http.response.body", "body": datos, "more_body": True})
+        else:
+            await self.send_original({"type": "http.response.body", "body": self.compresor.finalizar(cuerpo)})
@@ -0,0 +1,34 @@
+"""
+Middleware de Conexión por Request
+Sistema de Seguimiento de Alumnos
+
+Le da a cada request HTTP su propia conexión PostgreSQL (ver
+conexion_por_request() en connection.py), tomada del pool al primer uso y
+devuelta al terminar la respuesta.
+
+Decisión de diseño: Por request y no por thread
+- FastAPI ejecuta la dependencia (get_*_service, que pide la conexión) y
+  el endpoint en llamadas separadas al threadpool, casi siempre en threads
+  distintos: una conexión por thread terminaría usada por dos requests
+- El ContextVar se hereda en el threadpool y en las tareas: la dependencia,
+  el endpoint y la consulta de versiones del ETag ven la misma conexión
+- Las conexiones abiertas son a lo sumo las requests en curso que usan la
+  base, y las que sobran vuelven al pool (DB_POOL_CONEXIONES)
+"""
+
+from src.infrastructure.database.connection import conexion_por_request
+
+
+class ConexionPorRequestMiddleware:
+    """Middleware ASGI que asigna una conexión a la base por request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with conexion_por_request():
+            await self.app(scope, receive, send)
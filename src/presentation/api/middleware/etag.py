@@ -0,0 +1,165 @@
+"""
+Middleware de ETag / GET Condicional
+Sistema de Seguimiento de Alumnos
+
+Para los listados y el dashboard, calcula un ETag fuerte a partir de la
+versión de las tablas involucradas (tabla_version) ANTES de ejecutar el
+endpoint. Si el cliente manda If-None-Match con ese ETag, responde 304 sin
+correr la consulta ni serializar el cuerpo.
+
+Decisión de diseño: ETag por versión de tabla, no por hash del cuerpo
+- Hashear el cuerpo obliga a generarlo: no ahorra la consulta
+- La versión se lee antes del endpoint: si hay una escritura concurrente,
+  en el peor caso el cliente recibe el dato nuevo con el ETag viejo y
+  vuelve a descargar en el siguiente pedido (nunca queda con datos viejos)
+- Incluye la codificación solo si el cuerpo salió comprimido: un ETag
+  fuerte identifica bytes exactos, y cada codificación produce bytes
+  distintos. Un cuerpo chico (bajo el mínimo de CompresionMiddleware) va
+  sin comprimir y lleva el mismo ETag para todos los clientes
+"""
+
+import hashlib
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from src.presentation.api.middleware.compresion import agregar_vary, elegir_codificacion
+
+
+# Rutas con GET condicional -> tablas de las que depende su respuesta
+RUTAS_VERSIONADAS: Dict[str, Tuple[str, ...]] = {
+    "/api/alumnos": ("alumno",),
+    "/api/tps": ("trabajo_practico",),
+    "/api/cursos/con-stats": ("curso", "inscripcion", "clase", "registro_asistencia"),
+    "/api/alertas": (
+        "curso", "alumno", "inscripcion", "clase",
+        "registro_asistencia", "trabajo_practico", "entrega_tp",
+    ),
+}
+
+
+def calcular_etag(ruta: str, query: bytes, versiones: Dict[str, int], codificacion: Optional[str]) -> str:
+    """
+    Calcula un ETag fuerte determinístico para una representación.
+
+    Args:
+        ruta: Path de la request
+        query: Query string cruda (los filtros cambian la respuesta)
+        versiones: {tabla: version}
+        codificacion: Codificación de contenido negociada (o None)
+
+    Returns:
+        str: ETag entre comillas, listo para el header
+    """
+    clave = "|".join([
+        ruta,
+        query.decode("latin-1"),
+        ",".join(f"{tabla}={versiones[tabla]}" for tabla in sorted(versiones)),
+        codificacion or "identity",
+    ])
+    return '"' + hashlib.blake2b(clave.encode("utf-8"), digest_size=12).hexdigest() + '"'
+
+
+def etag_coincide(if_none_match: str, etag: str) -> bool:
+    """
+    Compara If-None-Match con el ETag actual (comparación débil, RFC 9110).
+
+    Args:
+        if_none_match: Valor del header (lista separada por comas o "*")
+        etag: ETag actual
+
+    Returns:
+        bool: True si el cliente ya tiene esta representación
+    """
+    for candidato in if_none_match.split(","):
+        candidato = candidato.strip()
+        if candidato == "*":
+            return True
+        if candidato.startswith("W/"):
+            candidato = candidato[2:]
+        if candidato == etag:
+            return True
+    return False
+
+
+class ETagMiddleware:
+    """
+    Middleware ASGI de GET condicional basado en versión de tablas.
+
+    Args:
+        app: Aplicación ASGI envuelta
+        rutas: {path sin barra final: tablas}
+        obtener_versiones: Función sync tablas -> {tabla: version}
+    """
+
+    def __init__(
+        self,
+        app,
+        rutas: Optional[Dict[str, Tuple[str, ...]]] = None,
+        obtener_versiones: Optional[Callable[[Iterable[str]], Dict[str, int]]] = None,
+    ):
+        self.app = app
+        self.rutas = rutas if rutas is not None else RUTAS_VERSIONADAS
+        if obtener_versiones is None:
+            from src.infrastructure.database.versiones import obtener_versiones
+        self.obtener_versiones = obtener_versiones
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        ruta = scope["path"]
+        tablas = self.rutas.get(ruta.rstrip("/"))
+        if tablas is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            versiones = await run_in_threadpool(self.obtener_versiones, tablas)
+        except Exception as e:
+            # Sin versión no hay ETag confiable: responder normal
+            print(f"⚠️ No se pudo obtener versión de tablas para ETag: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        query = scope.get("query_string", b"")
+        etag_identidad = calcular_etag(ruta, query, versiones, None)
+        codificacion = elegir_codificacion(headers.get("accept-encoding", ""))
+        etag_codificado = calcular_etag(ruta, query, versiones, codificacion) if codificacion else etag_identidad
+
+        # Con la misma versión el cuerpo es el mismo, y CompresionMiddleware
+        # toma la misma decisión: sirve cualquiera de los dos validadores
+        if_none_match = headers.get("if-none-match")
+        etag = next(
+            (e for e in (etag_codificado, etag_identidad) if if_none_match and etag_coincide(if_none_match, e)),
+            None
+        )
+        if etag is not None:
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [
+                    (b"etag", etag.encode("latin-1")),
+                    (b"cache-control", b"no-cache"),
+                    (b"vary", b"Accept-Encoding"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_con_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message["headers"] = list(message.get("headers", []))
+                headers_respuesta = MutableHeaders(raw=message["headers"])
+                # CompresionMiddleware (más adentro) ya decidió si comprime
+                comprimido = "content-encoding" in headers_respuesta
+                headers_respuesta["ETag"] = etag_codificado if comprimido else etag_identidad
+                # no-cache = guardar pero revalidar siempre (fetch manda If-None-Match solo)
+                headers_respuesta["Cache-Control"] = "no-cache"
+                agregar_vary(headers_respuesta, "Accept-Encoding")
+            await send(message)
+
+        await self.app(scope, receive, send_con_etag)
@@ -0,0 +1,103 @@
+"""
+Middleware de Instrumentación (Server-Timing / X-Query-Count)
+Sistema de Seguimiento de Alumnos
+
+Abre las métricas de la request (ver infrastructure/database/instrumentacion.py)
+y, al enviar los headers de la respuesta, agrega:
+- X-Query-Count: sentencias SQL ejecutadas
+- Server-Timing: db (tiempo total en la BD), db-max (la sentencia más
+  lenta), ser (serialización JSON) y app (total hasta los headers)
+
+Las DevTools del navegador muestran Server-Timing en la pestaña Timing de
+cada request: un bucle N+1 aparece como cientos de consultas.
+
+Decisión de diseño: Middleware ASGI puro, afuera de ETag y compresión
+- Cuenta también la consulta de versiones del ETag y lo que tarda comprimir
+- La compresión retiene los headers hasta tener el cuerpo: cuando llegan
+  aquí el endpoint ya terminó y las métricas están completas (salvo en
+  respuestas en streaming, como el export, que siguen consultando después)
+- Con LOG_CONSULTAS=1 escribe además una línea JSON por request, con el SQL
+  de la sentencia más lenta (que nunca va en los headers)
+"""
+
+import json
+import os
+import time
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+
+from src.infrastructure.database.instrumentacion import MetricasRequest, medir_request, metricas_actuales
+
+
+def formatear_server_timing(metricas: MetricasRequest, segundos_total: float) -> str:
+    """Valor del header Server-Timing (duraciones en milisegundos)"""
+    return ", ".join([
+        f'db;dur={metricas.segundos_bd * 1000:.1f};desc="{metricas.consultas} consultas"',
+        f"db-max;dur={metricas.segundos_mas_lenta * 1000:.1f}",
+        f"ser;dur={metricas.segundos_serializacion * 1000:.1f}",
+        f"app;dur={segundos_total * 1000:.1f}",
+    ])
+
+
+class JSONResponseMedida(JSONResponse):
+    """JSONResponse que registra cuánto tarda en serializar el contenido"""
+
+    def render(self, content) -> bytes:
+        inicio = time.perf_counter()
+        try:
+            return super().render(content)
+        finally:
+            metricas = metricas_actuales()
+            if metricas is not None:
+                metricas.registrar_serializacion(time.perf_counter() - inicio)
+
+
+class InstrumentacionMiddleware:
+    """
+    Middleware ASGI que mide consultas y tiempos de cada request.
+
+    Args:
+        app: Aplicación ASGI
+        log_estructurado: Escribir una línea JSON por request
+    """
+
+    def __init__(self, app, log_estructurado: bool = os.environ.get("LOG_CONSULTAS") == "1"):
+        self.app = app
+        self.log_estructurado = log_estructurado
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        inicio = time.perf_counter()
+        estado = {"status": None}
+
+        with medir_request() as metricas:
+            metricas.ruta = f"{scope['method']} {scope['path']}"
+
+            async def send_instrumentado(message):
+                if message["type"] == "http.response.start":
+                    estado["status"] = message["status"]
+                    message["headers"] = list(message.get("headers", []))
+                    headers = MutableHeaders(raw=message["headers"])
+                    headers["Server-Timing"] = formatear_server_timing(metricas, time.perf_counter() - inicio)
+                    headers["X-Query-Count"] = str(metricas.consultas)
+                await send(message)
+
+            await self.app(scope, receive, send_instrumentado)
+
+        if self.log_estructurado:
+            print(json.dumps({
+                "evento": "request",
+                "metodo": scope["method"],
+                "ruta": scope["path"],
+                "status": estado["status"],
+                "ms": round((time.perf_counter() - inicio) * 1000, 1),
+                "consultas": metricas.consultas,
+                "bd_ms": round(metricas.segundos_bd * 1000, 1),
+                "serializacion_ms": round(metricas.segundos_serializacion * 1000, 1),
+                "mas_lenta_ms": round(metricas.segundos_mas_lenta * 1000, 1),
+                "mas_lenta_sql": " ".join((metricas.sql_mas_lenta or "").split())[:300] or None,
+            }, ensure_ascii=False), flush=True)
@@ -0,0 +1,30 @@
+"""
+Middleware de Mapa de Identidad por Request
+Sistema de Seguimiento de Alumnos
+
+Abre un MapaIdentidad nuevo para cada request HTTP: los repositorios con
+cache lo usan para no releer la misma fila dos veces en la misma request.
+
+Decisión de diseño: Middleware ASGI puro
+- Setea el ContextVar antes de llamar a la app y lo restaura al terminar:
+  el endpoint, sus dependencias y el threadpool heredan el mismo mapa
+- Las sub-requests de /api/batch se despachan dentro de la request externa
+  y comparten su mapa (el mismo curso se lee una vez para todo el batch)
+"""
+
+from src.infrastructure.cache.mapa_identidad import mapa_identidad
+
+
+class MapaIdentidadMiddleware:
+    """Middleware ASGI que abre un mapa de identidad por request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with mapa_identidad():
+            await self.app(scope, receive, send)
@@ -0,0 +1,73 @@
+"""
+Middleware de Métricas (Prometheus)
+Sistema de Seguimiento de Alumnos
+
+Registra por request la latencia (histograma por plantilla de ruta, método
+y status), las requests en curso y las sentencias SQL ejecutadas. Se
+exponen en GET /api/metrics (ver infrastructure/monitoreo/metricas.py).
+
+Decisión de diseño: Etiquetar por plantilla de ruta, no por path
+- "/api/alumnos/{alumno_id}" y no "/api/alumnos/123": una serie por
+  endpoint en vez de una por ID
+- El router deja la ruta que atendió en el scope (ver plantilla_ruta); lo
+  que no matchea ninguna (404, archivos estáticos) va a "sin_ruta"
+- Va adentro del middleware de instrumentación para leer las consultas de
+  la request antes de que se cierren sus métricas
+"""
+
+import time
+
+from src.infrastructure.database.instrumentacion import metricas_actuales
+from src.infrastructure.monitoreo.metricas import METRICAS, RegistroMetricas
+
+
+def plantilla_ruta(scope) -> str:
+    """Plantilla completa de la ruta que atendió la request ("sin_ruta" si ninguna)"""
+    # FastAPI >= 0.120 deja en scope["route"] el path relativo al router
+    # incluido; el completo (con el prefijo /api) está en el contexto efectivo
+    contexto = (scope.get("fastapi") or {}).get("effective_route_context")
+    ruta = getattr(contexto, "path", None) or getattr(scope.get("route"), "path", None)
+    return ruta or "sin_ruta"
+
+
+class MetricasMiddleware:
+    """
+    Middleware ASGI que alimenta las métricas del proceso.
+
+    Args:
+        app: Aplicación ASGI
+        registro: Registro donde se acumulan las métricas
+    """
+
+    def __init__(self, app, registro: RegistroMetricas = METRICAS):
+        self.app = app
+        self.registro = registro
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        inicio = time.perf_counter()
+        en_curso = (("metodo", scope["method"]),)
+        estado = {"status": 500}
+
+        async def send_medido(message):
+            if message["type"] == "http.response.start":
+                estado["status"] = message["status"]
+            await send(message)
+
+        self.registro.incrementar("http_requests_en_curso", en_curso)
+        try:
+            await self.app(scope, receive, send_medido)
+        finally:
+            self.registro.incrementar("http_requests_en_curso", en_curso, -1)
+            ruta = plantilla_ruta(scope)
+            self.registro.observar(
+                "http_request_duracion_segundos",
+                time.perf_counter() - inicio,
+                (("metodo", scope["method"]), ("ruta", ruta), ("status", str(estado["status"]))),
+            )
+            metricas = metricas_actuales()
+            if metricas is not None and metricas.consultas:
+                self.registro.incrementar("http_consultas_sql_total", (("ruta", ruta),), metricas.consultas)
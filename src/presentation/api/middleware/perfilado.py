@@ -0,0 +1,97 @@
+"""
+Middleware de Perfilado por Request (X-Profile)
+Sistema de Seguimiento de Alumnos
+
+Una request con los headers
+    X-Profile: 1
+    X-Profile-Token: <PERFIL_TOKEN>
+corre con el perfilador por muestreo activo (ver
+infrastructure/monitoreo/perfilador.py). La respuesta es la normal, con:
+- X-Profile-Id: ID del perfil, que se baja en GET /api/perfiles/{id}
+  (pilas en formato folded, para flamegraph.pl o speedscope)
+- Server-Timing: entrada "prof" con la cantidad de muestras
+
+Decisión de diseño: Solo existe si se configura PERFIL_TOKEN
+- Sin la variable el middleware ni se registra: cero costo y nada que
+  explotar en producción
+- Con la variable, una request sin X-Profile paga solo buscar el header
+- El token se compara en tiempo constante (hmac.compare_digest)
+- Un perfil a la vez: si ya hay uno en curso, la request corre normal y
+  responde X-Profile: ocupado
+"""
+
+import asyncio
+import hmac
+import time
+
+from starlette.datastructures import MutableHeaders
+
+from src.infrastructure.monitoreo.perfilador import PERFILES, PerfiladorMuestreo, RegistroPerfiles
+
+
+def token_valido(token_esperado: str, headers) -> bool:
+    """True si los headers traen el token de perfilado correcto"""
+    recibido = next((valor for nombre, valor in headers if nombre == b"x-profile-token"), b"")
+    return hmac.compare_digest(recibido, token_esperado.encode())
+
+
+class PerfiladoMiddleware:
+    """
+    Middleware ASGI que perfila las requests que lo piden.
+
+    Args:
+        app: Aplicación ASGI
+        token: Valor que debe traer X-Profile-Token
+        registro: Dónde se guardan los perfiles
+        intervalo_segundos: Tiempo entre muestras
+    """
+
+    def __init__(self, app, token: str, registro: RegistroPerfiles = PERFILES, intervalo_segundos: float = 0.001):
+        self.app = app
+        self.token = token
+        self.registro = registro
+        self.intervalo_segundos = intervalo_segundos
+        self._en_curso = asyncio.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            nombre == b"x-profile" and valor == b"1" for nombre, valor in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not token_valido(self.token, scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        if self._en_curso.locked():
+            await self.app(scope, receive, self._agregar_headers(send, {"X-Profile": "ocupado"}))
+            return
+
+        async with self._en_curso:
+            id = self.registro.nuevo_id()
+            perfilador = PerfiladorMuestreo(self.intervalo_segundos)
+            inicio = time.perf_counter()
+            perfilador.iniciar()
+            try:
+                await self.app(scope, receive, self._agregar_headers(send, {"X-Profile-Id": id}, perfilador))
+            finally:
+                # join() del muestreador: fuera del event loop
+                folded = await asyncio.to_thread(perfilador.detener)
+                self.registro.guardar(
+                    id, f"{scope['method']} {scope['path']}",
+                    time.perf_counter() - inicio, perfilador.muestras, folded,
+                )
+
+    @staticmethod
+    def _agregar_headers(send, valores, perfilador: PerfiladorMuestreo = None):
+        async def send_con_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", []))
+                headers = MutableHeaders(raw=message["headers"])
+                for nombre, valor in valores.items():
+                    headers[nombre] = valor
+                if perfilador is not None:
+                    headers.append("Server-Timing", f'prof;desc="{perfilador.muestras} muestras"')
+            await send(message)
+        return send_con_headers
@@ -6,6 +6,7 @@ Endpoint optimizado que calcula alertas en el servidor
 para evitar múltiples llamadas desde el frontend.
 """
 
+from datetime import date
 from fastapi import APIRouter, Depends
 from typing import List, Dict, Any
 from src.infrastructure.database.connection import get_db_connection
@@ -15,6 +16,87 @@ router = APIRouter(
     tags=["Alertas"],
 )
 
+# Última racha de 2 ausencias consecutivas de cada alumno en cada curso.
+# La secuencia es la de todas las clases del curso por fecha: una clase sin
+# registro corta la racha igual que una presencia.
+SQL_AUSENCIAS_CONSECUTIVAS = """
+    WITH secuencia AS (
+        SELECT
+            i.curso_id,
+            i.alumno_id,
+            cl.fecha,
+            LOWER(ra.estado) AS estado,
+            LAG(cl.fecha) OVER w AS fecha_anterior,
+            LAG(LOWER(ra.estado)) OVER w AS estado_anterior,
+            ROW_NUMBER() OVER w AS orden
+        FROM inscripcion i
+        JOIN clase cl ON cl.curso_id = i.curso_id
+        LEFT JOIN registro_asistencia ra
+               ON ra.clase_id = cl.id AND ra.alumno_id = i.alumno_id
+        WINDOW w AS (PARTITION BY i.curso_id, i.alumno_id ORDER BY cl.fecha, cl.id)
+    ),
+    rachas AS (
+        SELECT
+            curso_id, alumno_id, fecha_anterior, fecha,
+            ROW_NUMBER() OVER (PARTITION BY curso_id, alumno_id ORDER BY orden DESC) AS desde_el_final
+        FROM secuencia
+        WHERE estado = 'ausente' AND estado_anterior = 'ausente'
+    )
+    SELECT curso_id, alumno_id, fecha_anterior, fecha
+    FROM rachas
+    WHERE desde_el_final = 1
+"""
+
+# Último par de TPs consecutivos (por fecha de entrega) no entregados o
+# desaprobados de cada alumno en cada curso. Sin fila en entrega_tp cuenta
+# como no entregado.
+SQL_TPS_CONSECUTIVOS = """
+    WITH secuencia AS (
+        SELECT
+            i.curso_id,
+            i.alumno_id,
+            tp.titulo,
+            COALESCE(e.entregado, FALSE) AS entregado,
+            e.nota,
+            CASE
+                WHEN NOT COALESCE(e.entregado, FALSE) THEN 1
+                WHEN e.nota < 6 THEN 1
+                ELSE 0
+            END AS problematico,
+            ROW_NUMBER() OVER w AS orden
+        FROM inscripcion i
+        JOIN trabajo_practico tp ON tp.curso_id = i.curso_id
+        LEFT JOIN entrega_tp e
+               ON e.trabajo_practico_id = tp.id AND e.alumno_id = i.alumno_id
+        WINDOW w AS (PARTITION BY i.curso_id, i.alumno_id ORDER BY tp.fecha_entrega, tp.id)
+    ),
+    pares AS (
+        SELECT
+            curso_id, alumno_id,
+            LAG(titulo) OVER w AS titulo_anterior,
+            LAG(entregado) OVER w AS entregado_anterior,
+            LAG(nota) OVER w AS nota_anterior,
+            LAG(problematico) OVER w AS problematico_anterior,
+            titulo, entregado, nota, problematico, orden
+        FROM secuencia
+        WINDOW w AS (PARTITION BY curso_id, alumno_id ORDER BY orden)
+    ),
+    rachas AS (
+        SELECT
+            curso_id, alumno_id,
+            titulo_anterior, entregado_anterior, nota_anterior,
+            titulo, entregado, nota,
+            ROW_NUMBER() OVER (PARTITION BY curso_id, alumno_id ORDER BY orden DESC) AS desde_el_final
+        FROM pares
+        WHERE problematico = 1 AND problematico_anterior = 1
+    )
+    SELECT curso_id, alumno_id, titulo_anterior, entregado_anterior, nota_anterior,
+           titulo, entregado, nota
+    FROM rachas
+    WHERE desde_el_final = 1
+"""
+
+
 @router.get(
     "/",
     summary="Obtener alertas de riesgo",
@@ -27,6 +109,13 @@ def obtener_alertas():
     Criterios:
     - 2 ausencias consecutivas
     - 2 TPs consecutivos no entregados o desaprobados (nota < 6)
+    
+    Decisión de diseño: Rachas con funciones de ventana
+    - LAG() sobre la secuencia de clases (y de TPs) de cada alumno en cada
+      curso encuentra los pares consecutivos en la BD
+    - Una consulta por criterio y otra para los nombres: siempre 3
+      sentencias, sin importar cuántos cursos, alumnos o clases haya
+      (antes eran 3 por curso más una por alumno y clase)
     """
     conn = get_db_connection()
     alertas = []
@@ -34,77 +123,44 @@ def obtener_alertas():
     try:
         cursor = conn.cursor()
         
-        # Obtener todos los cursos
-        cursor.execute("SELECT id, nombre_materia, anio, cuatrimestre FROM curso")
-        cursos = cursor.fetchall()
+        cursor.execute(SQL_AUSENCIAS_CONSECUTIVAS)
+        motivos_por_inscripcion: Dict[tuple, list] = {}
+        for curso_id, alumno_id, fecha_anterior, fecha in cursor.fetchall():
+            motivos_por_inscripcion.setdefault((curso_id, alumno_id), []).append(
+                motivo_ausencias(fecha_anterior, fecha)
+            )
         
-        for curso in cursos:
-            curso_id, nombre_materia, anio, cuatrimestre = curso
-            curso_info = {
-                "id": curso_id,
-                "nombre_materia": nombre_materia,
-                "anio": anio,
-                "cuatrimestre": cuatrimestre
-            }
-            
-            # Obtener alumnos inscriptos en el curso
-            cursor.execute("""
-                SELECT a.id, a.nombre, a.apellido 
-                FROM alumno a
-                JOIN inscripcion i ON a.id = i.alumno_id
-                WHERE i.curso_id = %s
-            """, (curso_id,))
-            alumnos = cursor.fetchall()
-            
-            # Obtener clases del curso ordenadas por fecha
-            cursor.execute("""
-                SELECT id, fecha FROM clase 
-                WHERE curso_id = %s 
-                ORDER BY fecha ASC
-            """, (curso_id,))
-            clases = cursor.fetchall()
-            
-            # Obtener TPs del curso ordenados por fecha
+        cursor.execute(SQL_TPS_CONSECUTIVOS)
+        for curso_id, alumno_id, *par in cursor.fetchall():
+            motivos_por_inscripcion.setdefault((curso_id, alumno_id), []).append(motivo_tps(*par))
+        
+        if motivos_por_inscripcion:
             cursor.execute("""
-                SELECT id, titulo, fecha_entrega FROM trabajo_practico 
-                WHERE curso_id = %s 
-                ORDER BY fecha_entrega ASC
-            """, (curso_id,))
-            tps = cursor.fetchall()
-            
-            # Analizar cada alumno
-            for alumno in alumnos:
-                alumno_id, nombre, apellido = alumno
-                alumno_info = {
-                    "id": alumno_id,
-                    "nombre_completo": f"{apellido}, {nombre}"
-                }
-                motivos = []
-                
-                # Verificar ausencias consecutivas
-                if len(clases) >= 2:
-                    ausencias_consecutivas = verificar_ausencias_consecutivas(
-                        cursor, alumno_id, clases
-                    )
-                    if ausencias_consecutivas:
-                        motivos.append(ausencias_consecutivas)
-                
-                # Verificar TPs problemáticos consecutivos
-                if len(tps) >= 2:
-                    tps_problematicos = verificar_tps_consecutivos(
-                        cursor, alumno_id, tps
-                    )
-                    if tps_problematicos:
-                        motivos.append(tps_problematicos)
-                
-                # Si hay motivos, crear alerta
-                if motivos:
-                    alertas.append({
-                        "alumno": alumno_info,
-                        "curso": curso_info,
-                        "motivos": motivos,
-                        "nivel": "high" if len(motivos) >= 2 else "medium"
-                    })
+                SELECT i.curso_id, c.nombre_materia, c.anio, c.cuatrimestre,
+                       a.id, a.nombre, a.apellido
+                FROM inscripcion i
+                JOIN curso c ON c.id = i.curso_id
+                JOIN alumno a ON a.id = i.alumno_id
+                ORDER BY c.id, a.apellido, a.nombre
+            """)
+            for curso_id, nombre_materia, anio, cuatrimestre, alumno_id, nombre, apellido in cursor.fetchall():
+                motivos = motivos_por_inscripcion.get((curso_id, alumno_id))
+                if not motivos:
+                    continue
+                alertas.append({
+                    "alumno": {
+                        "id": alumno_id,
+                        "nombre_completo": f"{apellido}, {nombre}"
+                    },
+                    "curso": {
+                        "id": curso_id,
+                        "nombre_materia": nombre_materia,
+                        "anio": anio,
+                        "cuatrimestre": cuatrimestre
+                    },
+                    "motivos": motivos,
+                    "nivel": "high" if len(motivos) >= 2 else "medium"
+                })
         
         conn.commit()
         cursor.close()
@@ -132,77 +188,39 @@ def obtener_alertas():
         }
 
 
-def verificar_ausencias_consecutivas(cursor, alumno_id: int, clases: list) -> dict:
-    """Verifica si el alumno tiene 2 ausencias consecutivas"""
-    asistencias = []
-    
-    for clase in clases:
-        clase_id, fecha = clase
-        cursor.execute("""
-            SELECT estado FROM registro_asistencia 
-            WHERE alumno_id = %s AND clase_id = %s
-        """, (alumno_id, clase_id))
-        row = cursor.fetchone()
-        estado = row[0] if row else "Sin registro"
-        asistencias.append({"clase_id": clase_id, "fecha": fecha, "estado": estado})
-    
-    # Buscar 2 ausencias consecutivas (desde las más recientes)
-    for i in range(len(asistencias) - 1, 0, -1):
-        estado_actual = (asistencias[i]["estado"] or "").lower()
-        estado_anterior = (asistencias[i-1]["estado"] or "").lower()
-        if estado_actual == "ausente" and estado_anterior == "ausente":
-            fecha1 = asistencias[i-1]["fecha"].strftime("%d/%m/%Y") if hasattr(asistencias[i-1]["fecha"], 'strftime') else str(asistencias[i-1]["fecha"])
-            fecha2 = asistencias[i]["fecha"].strftime("%d/%m/%Y") if hasattr(asistencias[i]["fecha"], 'strftime') else str(asistencias[i]["fecha"])
-            return {
-                "tipo": "asistencia",
-                "mensaje": f"2 ausencias consecutivas ({fecha1} y {fecha2})",
-                "icono": "❌"
-            }
-    
-    return None
+def formatear_fecha(fecha) -> str:
+    """dd/mm/aaaa (SQLite devuelve texto ISO en columnas calculadas con LAG)"""
+    if isinstance(fecha, str):
+        try:
+            fecha = date.fromisoformat(fecha[:10])
+        except ValueError:
+            return fecha
+    return fecha.strftime("%d/%m/%Y") if hasattr(fecha, 'strftime') else str(fecha)
 
 
-def verificar_tps_consecutivos(cursor, alumno_id: int, tps: list) -> dict:
-    """Verifica si el alumno tiene 2 TPs problemáticos consecutivos"""
-    entregas = []
-    
-    for tp in tps:
-        tp_id, titulo, fecha_entrega = tp
-        cursor.execute("""
-            SELECT entregado, nota, estado FROM entrega_tp 
-            WHERE alumno_id = %s AND trabajo_practico_id = %s
-        """, (alumno_id, tp_id))
-        row = cursor.fetchone()
-        
-        es_problematico = False
-        motivo = ""
-        
-        if not row:
-            es_problematico = True
-            motivo = "No entregado"
-        else:
-            entregado, nota, estado = row
-            if not entregado:
-                es_problematico = True
-                motivo = "No entregado"
-            elif nota is not None and nota < 6:
-                es_problematico = True
-                motivo = f"Desaprobado ({nota})"
-        
-        entregas.append({
-            "tp_id": tp_id,
-            "titulo": titulo,
-            "es_problematico": es_problematico,
-            "motivo": motivo
-        })
-    
-    # Buscar 2 TPs problemáticos consecutivos (desde los más recientes)
-    for i in range(len(entregas) - 1, 0, -1):
-        if entregas[i]["es_problematico"] and entregas[i-1]["es_problematico"]:
-            return {
-                "tipo": "tp",
-                "mensaje": f"2 TPs con problemas: {entregas[i-1]['titulo']} ({entregas[i-1]['motivo']}) y {entregas[i]['titulo']} ({entregas[i]['motivo']})",
-                "icono": "📝"
-            }
-    
-    return None
+def motivo_ausencias(fecha_anterior, fecha) -> dict:
+    """Motivo de alerta por 2 ausencias consecutivas"""
+    return {
+        "tipo": "asistencia",
+        "mensaje": f"2 ausencias consecutivas ({formatear_fecha(fecha_anterior)} y {formatear_fecha(fecha)})",
+        "icono": "❌"
+    }
+
+
+def describir_entrega(entregado, nota) -> str:
+    """Por qué una entrega cuenta como problemática"""
+    if not entregado:
+        return "No entregado"
+    return f"Desaprobado ({nota})"
+
+
+def motivo_tps(titulo_anterior, entregado_anterior, nota_anterior, titulo, entregado, nota) -> dict:
+    """Motivo de alerta por 2 TPs problemáticos consecutivos"""
+    return {
+        "tipo": "tp",
+        "mensaje": (
+            f"2 TPs con problemas: {titulo_anterior} ({describir_entrega(entregado_anterior, nota_anterior)})"
+            f" y {titulo} ({describir_entrega(entregado, nota)})"
+        ),
+        "icono": "📝"
+    }
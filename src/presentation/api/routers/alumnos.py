@@ -8,15 +8,18 @@ Decisión de diseño: Separación de routers
 - Permite versionar la API fácilmente
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import io
+
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, UploadFile
 from typing import Optional
 
-from src.application.services.alumno_service import AlumnoService
+from src.application.services.alumno_service import AlumnoService, POLITICAS_CONFLICTO
 from src.presentation.api.schemas.alumno_schema import (
     AlumnoCreateSchema,
     AlumnoUpdateSchema,
     AlumnoResponseSchema,
-    AlumnoListResponseSchema
+    AlumnoListResponseSchema,
+    AlumnoImportResponseSchema
 )
 from src.domain.exceptions.domain_exceptions import (
     AlumnoNoEncontradoException,
@@ -55,10 +58,11 @@ def get_alumno_service() -> AlumnoService:
     - Implementar retry logic
     """
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.alumno_repository_postgres import AlumnoRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import AlumnoRepositoryCache
     
     conexion = get_db_connection()
-    alumno_repo = AlumnoRepositoryPostgres(conexion)
+    alumno_repo = AlumnoRepositoryCache(crear_repositorio("alumno", conexion))
     return AlumnoService(alumno_repo)
 
 
@@ -128,6 +132,66 @@ def crear_alumno(
         )
 
 
+@router.post(
+    "/import",
+    response_model=AlumnoImportResponseSchema,
+    summary="Importar alumnos desde CSV",
+    description=(
+        "Carga masiva desde un CSV con columnas nombre, apellido, dni, email, cohorte "
+        "(separadas por ',' o ';'). Devuelve el detalle de las filas rechazadas."
+    )
+)
+def importar_alumnos(
+    archivo: UploadFile = File(..., description="CSV con encabezado"),
+    politica: str = Query(
+        "omitir",
+        description=f"Qué hacer si el DNI ya existe: {', '.join(POLITICAS_CONFLICTO)}"
+    ),
+    tamano_lote: int = Query(500, ge=1, le=1000, description="Alumnos por INSERT"),
+    encoding: str = Query("utf-8-sig", description="Codificación del archivo (ej: latin-1 para Excel)"),
+    alumno_service: AlumnoService = Depends(get_alumno_service)
+):
+    """
+    Endpoint: POST /alumnos/import
+    
+    Decisión de diseño: El archivo se lee como stream
+    - UploadFile ya está en un archivo temporal; se envuelve en modo texto
+      y el servicio lo recorre línea a línea, sin cargarlo entero en memoria
+    - Endpoint sync: el servicio y los repositorios son sync y FastAPI lo
+      corre en el threadpool
+    """
+    texto = None
+    try:
+        texto = io.TextIOWrapper(archivo.file, encoding=encoding, newline="")
+        resultado = alumno_service.importar_csv(texto, politica=politica, tamano_lote=tamano_lote)
+        return AlumnoImportResponseSchema(**resultado)
+    
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Codificación desconocida: {encoding}"
+        )
+    
+    except ValueError as e:
+        # Incluye UnicodeDecodeError (archivo en otra codificación)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        print(f"Error inesperado al importar alumnos: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error interno del servidor"
+        )
+    
+    finally:
+        if texto is not None:
+            # Que el wrapper no cierre el archivo de UploadFile (lo cierra FastAPI)
+            texto.detach()
+
+
 @router.get(
     "/{alumno_id}",
     response_model=AlumnoResponseSchema,
@@ -29,14 +29,13 @@ router = APIRouter(
 
 def get_asistencia_service() -> AsistenciaService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.asistencia_repository_postgres import RegistroAsistenciaRepositoryPostgres
-    from src.infrastructure.repositories.postgres.clase_repository_postgres import ClaseRepositoryPostgres
-    from src.infrastructure.repositories.postgres.inscripcion_repository_postgres import InscripcionRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import ClaseRepositoryCache, InscripcionRepositoryIndexada
     
     conexion = get_db_connection()
-    asistencia_repo = RegistroAsistenciaRepositoryPostgres(conexion)
-    clase_repo = ClaseRepositoryPostgres(conexion)
-    inscripcion_repo = InscripcionRepositoryPostgres(conexion)
+    asistencia_repo = crear_repositorio("asistencia", conexion)
+    clase_repo = ClaseRepositoryCache(crear_repositorio("clase", conexion))
+    inscripcion_repo = InscripcionRepositoryIndexada(crear_repositorio("inscripcion", conexion))
     
     return AsistenciaService(asistencia_repo, clase_repo, inscripcion_repo)
 
@@ -0,0 +1,158 @@
+"""
+Router de FastAPI para Batch
+Sistema de Seguimiento de Alumnos
+
+Ejecuta varias requests de la API en un solo viaje HTTP.
+
+Decisión de diseño: Despachar contra la tabla de rutas en el mismo proceso
+- Cada sub-request pasa por el mismo routing, validación y dependencias
+  que una request normal (no hay lógica duplicada)
+- Los GET anteriores a la primera escritura no tienen nada propio que
+  ver: corren en paralelo, fuera de la transacción y cada uno con su
+  propia conexión (conexion_por_request). Un batch solo de GET no abre
+  transacción
+- Desde la primera escritura, todas comparten UNA transacción
+  (transaccion_async): si una escritura falla, se revierte el batch
+  completo y las siguientes no se ejecutan
+- Dentro de la transacción se despachan de a una, cada una en su
+  SAVEPOINT: en paralelo sobre la misma conexión, un error SQL de una
+  abortaría la transacción debajo de las demás
+- Si una sub-request capturó un error SQL y aun así respondió 2xx, la
+  transacción queda abortada: se vuelve a su SAVEPOINT (ver
+  cerrar_savepoint) y, si era una escritura, cuenta como fallida
+"""
+
+import asyncio
+import json
+from typing import List
+
+from fastapi import APIRouter, Request
+
+from src.infrastructure.database.connection import conexion_por_request, transaccion_async
+from src.presentation.api.schemas.batch_schema import (
+    BatchRequestSchema,
+    BatchResponseSchema,
+    SubRequestSchema,
+    SubResponseSchema
+)
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["Batch"],
+)
+
+# Claves del scope de la request externa que las sub-requests necesitan
+# (app para dependencias, handlers de excepciones de Starlette, etc.)
+_CLAVES_SCOPE_HEREDADAS = (
+    "app", "state", "starlette.exception_handlers", "fastapi_middleware_astack",
+    "server", "client", "scheme", "http_version", "root_path",
+)
+
+
+async def _despachar(request: Request, sub: SubRequestSchema) -> SubResponseSchema:
+    """Ejecuta una sub-request contra el router de la app y captura la respuesta"""
+    ruta, _, query = sub.path.partition("?")
+    if ruta.rstrip("/") == "/api/batch":
+        return SubResponseSchema(id=sub.id, status=400, body={"detail": "No se permite anidar batch"})
+
+    cuerpo = json.dumps(sub.body).encode("utf-8") if sub.body is not None else b""
+    scope = {k: request.scope[k] for k in _CLAVES_SCOPE_HEREDADAS if k in request.scope}
+    scope.update({
+        "type": "http",
+        "method": sub.method,
+        "path": ruta,
+        "raw_path": ruta.encode("utf-8"),
+        "query_string": query.encode("utf-8"),
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(cuerpo)).encode("latin-1")),
+        ],
+    })
+
+    enviado = False
+
+    async def receive():
+        nonlocal enviado
+        if not enviado:
+            enviado = True
+            return {"type": "http.request", "body": cuerpo, "more_body": False}
+        # Nunca hay desconexión real: esperar hasta que la respuesta termine
+        await asyncio.Event().wait()
+
+    status_code = 500
+    partes: List[bytes] = []
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            partes.append(message.get("body", b""))
+
+    try:
+        await request.app.router(scope, receive, send)
+    except Exception as e:
+        print(f"Error inesperado en sub-request {sub.method} {sub.path}: {e}")
+        return SubResponseSchema(id=sub.id, status=500, body={"detail": "Error interno del servidor"})
+
+    contenido = b"".join(partes)
+    try:
+        body = json.loads(contenido) if contenido else None
+    except ValueError:
+        body = contenido.decode("utf-8", errors="replace")
+
+    return SubResponseSchema(id=sub.id, status=status_code, body=body)
+
+
+async def _despachar_lectura(request: Request, sub: SubRequestSchema) -> SubResponseSchema:
+    """GET fuera de la transacción del batch, con su propia conexión"""
+    async with conexion_por_request():
+        return await _despachar(request, sub)
+
+
+@router.post(
+    "",
+    response_model=BatchResponseSchema,
+    summary="Ejecutar varias requests en una",
+    description="Ejecuta hasta 50 sub-requests: los GET iniciales en paralelo, el resto en orden y en una única transacción"
+)
+async def ejecutar_batch(batch: BatchRequestSchema, request: Request):
+    """
+    Endpoint: POST /api/batch
+
+    - Los GET anteriores a la primera escritura se ejecutan en paralelo;
+      desde ahí, en orden y de a una
+    - Una escritura con status >= 400 revierte todo el batch y las
+      siguientes sub-requests se devuelven con 424 sin ejecutarse
+    """
+    subs = batch.requests
+    primera_escritura = next((i for i, sub in enumerate(subs) if sub.method != "GET"), len(subs))
+    respuestas: List[SubResponseSchema] = list(
+        await asyncio.gather(*(_despachar_lectura(request, sub) for sub in subs[:primera_escritura]))
+    )
+    if primera_escritura == len(subs):
+        return BatchResponseSchema(responses=respuestas, confirmado=True)
+
+    async with transaccion_async() as conexion:
+        for i, sub in enumerate(subs[primera_escritura:], start=primera_escritura):
+            savepoint = await asyncio.to_thread(conexion.crear_savepoint)
+            respuesta = await _despachar(request, sub)
+            intacta = await asyncio.to_thread(conexion.cerrar_savepoint, savepoint)
+            if not intacta and sub.method != "GET" and respuesta.status < 400:
+                print(f"Error SQL descartado en sub-request {sub.method} {sub.path}")
+                respuesta = SubResponseSchema(id=sub.id, status=500, body={"detail": "Error interno del servidor"})
+            respuestas.append(respuesta)
+
+            if sub.method != "GET" and respuesta.status >= 400:
+                conexion.revertir_al_final = True
+                respuestas.extend(
+                    SubResponseSchema(
+                        id=s.id,
+                        status=424,
+                        body={"detail": "No ejecutada: una escritura anterior del batch falló"}
+                    )
+                    for s in subs[i + 1:]
+                )
+                break
+
+    return BatchResponseSchema(responses=respuestas, confirmado=not conexion.revertir_al_final)
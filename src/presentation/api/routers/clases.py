@@ -3,14 +3,15 @@ Router de FastAPI para Clases
 Sistema de Seguimiento de Alumnos
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional
 
 from src.application.services.clase_service import ClaseService
 from src.presentation.api.schemas.clase_schema import (
     ClaseCreateSchema,
     ClaseUpdateSchema,
-    ClaseResponseSchema
+    ClaseResponseSchema,
+    ClaseRecienteSchema
 )
 from src.domain.exceptions.domain_exceptions import (
     ClaseNoEncontradaException,
@@ -29,12 +30,12 @@ router = APIRouter(
 
 def get_clase_service() -> ClaseService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.clase_repository_postgres import ClaseRepositoryPostgres
-    from src.infrastructure.repositories.postgres.curso_repository_postgres import CursoRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import CursoRepositoryCache, ClaseRepositoryCache
     
     conexion = get_db_connection()
-    clase_repo = ClaseRepositoryPostgres(conexion)
-    curso_repo = CursoRepositoryPostgres(conexion)
+    clase_repo = ClaseRepositoryCache(crear_repositorio("clase", conexion))
+    curso_repo = CursoRepositoryCache(crear_repositorio("curso", conexion))
     
     return ClaseService(clase_repo, curso_repo)
 
@@ -89,6 +90,25 @@ def listar_clases_curso(
         print(f"Error inesperado al listar clases: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
 
+# IMPORTANTE: Esta ruta debe estar ANTES de /{clase_id} para que "recientes" no se interprete como ID
+@router.get(
+    "/recientes",
+    response_model=List[ClaseRecienteSchema],
+    summary="Últimas clases de todos los cursos",
+    description="Clases más recientes con nombre/año del curso y conteos de asistencia, en una sola consulta"
+)
+def listar_clases_recientes(
+    limite: int = Query(10, ge=1, le=100, description="Cantidad de clases"),
+    docente: Optional[str] = Query(None, min_length=1, description="Filtrar por docente responsable"),
+    service: ClaseService = Depends(get_clase_service)
+):
+    try:
+        recientes = service.listar_clases_recientes(limite=limite, docente=docente)
+        return [ClaseRecienteSchema.from_reciente(r) for r in recientes]
+    except Exception as e:
+        print(f"Error inesperado al listar clases recientes: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
+
 @router.get(
     "/{clase_id}",
     response_model=ClaseResponseSchema,
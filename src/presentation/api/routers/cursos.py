@@ -3,10 +3,15 @@ Router de FastAPI para Cursos
 Sistema de Seguimiento de Alumnos
 """
 
+import csv
+import io
+import json
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import Iterator, List, Optional
 
 from src.application.services.curso_service import CursoService
+from src.infrastructure.repositories.base.export_repository_base import COLUMNAS_EXPORT
 from src.presentation.api.schemas.curso_schema import (
     CursoCreateSchema,
     CursoUpdateSchema,
@@ -18,6 +23,9 @@ from src.domain.exceptions.domain_exceptions import (
     CuatrimestreInvalidoException
 )
 
+# Filas por viaje a la BD (y por chunk enviado) al exportar
+TAMANO_LOTE_EXPORT = 1000
+
 router = APIRouter(
     prefix="/cursos",
     tags=["Cursos"],
@@ -78,98 +86,91 @@ def listar_cursos_con_stats():
     """
     Endpoint optimizado que devuelve cursos con estadísticas calculadas.
     Usado por el dashboard.
+    
+    Decisión de diseño: Una sola consulta, sin importar cuántos cursos haya
+    - Asistencia, última clase y alumnos en riesgo se agregan por curso en
+      CTEs con GROUP BY y se unen al listado de cursos
+    - Alumnos en riesgo: LAG() sobre las clases del curso ordenadas por fecha
+      detecta 2 ausencias consecutivas (antes, una consulta por alumno y clase)
     """
     from src.infrastructure.database.connection import get_db_connection
+    from src.presentation.api.routers.alertas import formatear_fecha
     
     conn = get_db_connection()
     try:
         cursor = conn.cursor()
         
-        # Obtener cursos con estadísticas en queries eficientes
         cursor.execute("""
+            WITH inscriptos AS (
+                SELECT curso_id, COUNT(*) AS total
+                FROM inscripcion
+                GROUP BY curso_id
+            ),
+            clases AS (
+                SELECT curso_id, COUNT(*) AS total, MAX(fecha) AS ultima
+                FROM clase
+                GROUP BY curso_id
+            ),
+            asistencia AS (
+                SELECT
+                    cl.curso_id,
+                    COUNT(CASE WHEN LOWER(ra.estado) IN ('presente', 'tarde', 'tardanza') THEN 1 END) AS presentes,
+                    COUNT(*) AS total
+                FROM registro_asistencia ra
+                JOIN clase cl ON ra.clase_id = cl.id
+                GROUP BY cl.curso_id
+            ),
+            secuencia AS (
+                SELECT
+                    i.curso_id,
+                    i.alumno_id,
+                    LOWER(ra.estado) AS estado,
+                    LAG(LOWER(ra.estado)) OVER (
+                        PARTITION BY i.curso_id, i.alumno_id ORDER BY cl.fecha, cl.id
+                    ) AS estado_anterior
+                FROM inscripcion i
+                JOIN clase cl ON cl.curso_id = i.curso_id
+                LEFT JOIN registro_asistencia ra
+                       ON ra.clase_id = cl.id AND ra.alumno_id = i.alumno_id
+            ),
+            riesgo AS (
+                SELECT curso_id, COUNT(DISTINCT alumno_id) AS alumnos
+                FROM secuencia
+                WHERE estado = 'ausente' AND estado_anterior = 'ausente'
+                GROUP BY curso_id
+            )
             SELECT 
                 c.id,
                 c.nombre_materia,
                 c.anio,
                 c.cuatrimestre,
                 c.docente_responsable,
-                (SELECT COUNT(*) FROM inscripcion i WHERE i.curso_id = c.id) as total_alumnos,
-                (SELECT COUNT(*) FROM clase cl WHERE cl.curso_id = c.id) as total_clases
+                COALESCE(ins.total, 0) AS total_alumnos,
+                COALESCE(cla.total, 0) AS total_clases,
+                cla.ultima,
+                COALESCE(asi.presentes, 0) AS presentes,
+                COALESCE(asi.total, 0) AS registros,
+                COALESCE(rie.alumnos, 0) AS alumnos_en_riesgo
             FROM curso c
+            LEFT JOIN inscriptos ins ON ins.curso_id = c.id
+            LEFT JOIN clases cla ON cla.curso_id = c.id
+            LEFT JOIN asistencia asi ON asi.curso_id = c.id
+            LEFT JOIN riesgo rie ON rie.curso_id = c.id
             ORDER BY c.anio DESC, c.cuatrimestre DESC, c.nombre_materia
         """)
         
         cursos = []
         for row in cursor.fetchall():
-            curso_id, nombre, anio, cuatri, docente, total_alumnos, total_clases = row
+            (curso_id, nombre, anio, cuatri, docente, total_alumnos, total_clases,
+             ultima, presentes, registros, alumnos_en_riesgo) = row
             
-            # Calcular asistencia promedio
             asistencia_promedio = 0
-            if total_clases > 0 and total_alumnos > 0:
-                cursor.execute("""
-                    SELECT 
-                        COUNT(CASE WHEN LOWER(ra.estado) IN ('presente', 'tarde', 'tardanza') THEN 1 END) as presentes,
-                        COUNT(*) as total
-                    FROM registro_asistencia ra
-                    JOIN clase cl ON ra.clase_id = cl.id
-                    WHERE cl.curso_id = %s
-                """, (curso_id,))
-                stats_row = cursor.fetchone()
-                if stats_row and stats_row[1] > 0:
-                    asistencia_promedio = round((stats_row[0] / stats_row[1]) * 100)
+            if total_clases > 0 and total_alumnos > 0 and registros > 0:
+                asistencia_promedio = round((presentes / registros) * 100)
             
-            # Obtener última clase
             ultima_clase = None
-            cursor.execute("""
-                SELECT fecha FROM clase 
-                WHERE curso_id = %s 
-                ORDER BY fecha DESC LIMIT 1
-            """, (curso_id,))
-            fecha_row = cursor.fetchone()
-            if fecha_row:
-                ultima_clase = fecha_row[0].strftime("%d/%m/%Y") if hasattr(fecha_row[0], 'strftime') else str(fecha_row[0])
-            
-            # Calcular alumnos en riesgo (simplificado)
-            alumnos_en_riesgo = 0
-            try:
-                # Obtener alumnos inscriptos
-                cursor.execute("""
-                    SELECT alumno_id FROM inscripcion WHERE curso_id = %s
-                """, (curso_id,))
-                alumnos_inscritos = [r[0] for r in cursor.fetchall()]
-                
-                # Obtener clases ordenadas
-                cursor.execute("""
-                    SELECT id FROM clase WHERE curso_id = %s ORDER BY fecha ASC
-                """, (curso_id,))
-                clases_ids = [r[0] for r in cursor.fetchall()]
-                
-                for alumno_id in alumnos_inscritos:
-                    es_riesgo = False
-                    
-                    # Verificar 2 ausencias consecutivas
-                    if len(clases_ids) >= 2:
-                        asistencias = []
-                        for clase_id in clases_ids:
-                            cursor.execute("""
-                                SELECT estado FROM registro_asistencia 
-                                WHERE alumno_id = %s AND clase_id = %s
-                            """, (alumno_id, clase_id))
-                            r = cursor.fetchone()
-                            asistencias.append(r[0] if r else None)
-                        
-                        # Buscar 2 ausencias consecutivas
-                        for i in range(len(asistencias) - 1, 0, -1):
-                            estado_actual = (asistencias[i] or '').lower()
-                            estado_anterior = (asistencias[i-1] or '').lower()
-                            if estado_actual == 'ausente' and estado_anterior == 'ausente':
-                                es_riesgo = True
-                                break
-                    
-                    if es_riesgo:
-                        alumnos_en_riesgo += 1
-            except:
-                pass  # En caso de error, dejamos en 0
+            if ultima is not None:
+                ultima_clase = formatear_fecha(ultima)
             
             cursos.append({
                 "id": curso_id,
@@ -198,10 +199,11 @@ def listar_cursos_con_stats():
 
 def get_curso_service() -> CursoService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.curso_repository_postgres import CursoRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import CursoRepositoryCache
     
     conexion = get_db_connection()
-    curso_repo = CursoRepositoryPostgres(conexion)
+    curso_repo = CursoRepositoryCache(crear_repositorio("curso", conexion))
     return CursoService(curso_repo)
 
 @router.post(
@@ -283,6 +285,104 @@ def listar_cursos(
         print(f"Error inesperado al listar cursos: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
 
+def _valor_export(valor):
+    """Convierte un valor de BD a algo serializable (fechas a ISO 8601)"""
+    if hasattr(valor, "isoformat"):
+        return valor.isoformat()
+    return valor
+
+
+def _generar_export(curso_id: int, tablas: List[str], formato: str) -> Iterator[bytes]:
+    """
+    Genera el archivo de export por lotes.
+
+    Abre su propia conexión: el generador corre en el threadpool mientras
+    se envía la respuesta, y el cursor del servidor necesita una transacción
+    que nadie más toque.
+
+    CSV: una sección por tabla, cada una con su fila de encabezado; la
+    primera columna ("tabla") permite filtrar las secciones.
+    NDJSON: un objeto JSON por línea con la clave "tabla".
+    """
+    from src.infrastructure.database.connection import crear_conexion
+    from src.infrastructure.repositories.backends import crear_repositorio
+
+    conexion = crear_conexion()
+    try:
+        repo = crear_repositorio("export", conexion)
+        for tabla in tablas:
+            columnas = COLUMNAS_EXPORT[tabla]
+            buffer = io.StringIO()
+            escritor = csv.writer(buffer)
+            if formato == "csv":
+                escritor.writerow(("tabla",) + columnas)
+                # El encabezado sale antes de abrir el cursor (primer byte inmediato)
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+            for i, fila in enumerate(repo.iterar_filas(curso_id, tabla, TAMANO_LOTE_EXPORT), start=1):
+                if formato == "csv":
+                    escritor.writerow([tabla] + [_valor_export(v) for v in fila])
+                else:
+                    registro = {"tabla": tabla}
+                    registro.update(zip(columnas, map(_valor_export, fila)))
+                    buffer.write(json.dumps(registro, ensure_ascii=False))
+                    buffer.write("\n")
+
+                # Enviar cada lote apenas está listo (memoria acotada al lote)
+                if i % TAMANO_LOTE_EXPORT == 0:
+                    yield buffer.getvalue().encode("utf-8")
+                    buffer.seek(0)
+                    buffer.truncate()
+
+            if buffer.tell():
+                yield buffer.getvalue().encode("utf-8")
+    finally:
+        conexion.close()
+
+
+@router.get(
+    "/{curso_id}/export",
+    summary="Exportar datos de un curso",
+    description="Descarga asistencias, participaciones y/o entregas del curso en CSV o NDJSON (streaming)"
+)
+def exportar_curso(
+    curso_id: int,
+    formato: str = Query("csv", pattern="^(csv|ndjson)$", description="csv o ndjson"),
+    tablas: str = Query(
+        "asistencias,participaciones,entregas",
+        description="Tablas separadas por coma: asistencias, participaciones, entregas"
+    ),
+    curso_service: CursoService = Depends(get_curso_service)
+):
+    """
+    Exporta los datos del curso con memoria constante.
+
+    Las filas se leen con un cursor del servidor y se envían a medida que
+    llegan: el primer byte sale antes de que termine la consulta.
+    """
+    tablas_pedidas = [t.strip() for t in tablas.split(",") if t.strip()]
+    invalidas = [t for t in tablas_pedidas if t not in COLUMNAS_EXPORT]
+    if not tablas_pedidas or invalidas:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tablas inválidas: {invalidas}. Opciones: {list(COLUMNAS_EXPORT)}"
+        )
+
+    # Validar el curso ANTES de empezar el stream (después ya no se puede devolver 404)
+    try:
+        curso_service.obtener_curso(curso_id)
+    except CursoNoEncontradoException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    media_type = "text/csv; charset=utf-8" if formato == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _generar_export(curso_id, tablas_pedidas, formato),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="curso_{curso_id}.{formato}"'}
+    )
+
 @router.put(
     "/{curso_id}",
     response_model=CursoResponseSchema,
@@ -3,12 +3,14 @@ Router de FastAPI para Entregas de TP
 Sistema de Seguimiento de Alumnos
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
 from typing import List
 
 from src.application.services.entrega_service import EntregaTPService
 from src.presentation.api.schemas.entrega_schema import (
     EntregaCreateSchema,
+    EntregaMasivaItemSchema,
+    EntregaMasivaResponseSchema,
     EntregaResponseSchema
 )
 from src.domain.exceptions.domain_exceptions import (
@@ -26,14 +28,13 @@ router = APIRouter(
 
 def get_entrega_service() -> EntregaTPService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.entrega_repository_postgres import EntregaTPRepositoryPostgres
-    from src.infrastructure.repositories.postgres.tp_repository_postgres import TrabajoPracticoRepositoryPostgres
-    from src.infrastructure.repositories.postgres.inscripcion_repository_postgres import InscripcionRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import TrabajoPracticoRepositoryCache, InscripcionRepositoryIndexada
     
     conexion = get_db_connection()
-    entrega_repo = EntregaTPRepositoryPostgres(conexion)
-    tp_repo = TrabajoPracticoRepositoryPostgres(conexion)
-    inscripcion_repo = InscripcionRepositoryPostgres(conexion)
+    entrega_repo = crear_repositorio("entrega", conexion)
+    tp_repo = TrabajoPracticoRepositoryCache(crear_repositorio("tp", conexion))
+    inscripcion_repo = InscripcionRepositoryIndexada(crear_repositorio("inscripcion", conexion))
     
     return EntregaTPService(entrega_repo, tp_repo, inscripcion_repo)
 
@@ -66,6 +67,40 @@ def registrar_entrega(
         print(f"Error inesperado al registrar entrega: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
 
+@router.post(
+    "/tp/{tp_id}/bulk",
+    response_model=EntregaMasivaResponseSchema,
+    summary="Registrar entregas de muchos alumnos",
+    description="Registra o corrige las entregas/notas de un TP para muchos alumnos en una sola operación"
+)
+def registrar_entregas_masivo(
+    tp_id: int,
+    data: List[EntregaMasivaItemSchema] = Body(..., min_length=1, max_length=500),
+    service: EntregaTPService = Depends(get_entrega_service)
+):
+    """
+    Endpoint: POST /api/entregas/tp/{tp_id}/bulk
+    
+    - Todo o nada: si un alumno no está inscripto o una fila es inválida,
+      no se guarda ninguna
+    - Reemplaza las entregas existentes de esos alumnos para el TP
+    """
+    try:
+        entregas = service.registrar_entregas_masivo(tp_id, [item.model_dump() for item in data])
+        return EntregaMasivaResponseSchema(
+            trabajo_practico_id=tp_id,
+            total=len(entregas),
+            tardias=sum(1 for e in entregas if e.es_tardia),
+            entregas=[EntregaResponseSchema.from_entity(e) for e in entregas]
+        )
+    except TrabajoPracticoNoEncontradoException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (AlumnoNoInscriptoException, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        print(f"Error inesperado al registrar entregas masivas: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
+
 @router.get(
     "/tp/{tp_id}",
     response_model=List[EntregaResponseSchema],
@@ -9,6 +9,8 @@ from typing import List
 from src.application.services.inscripcion_service import InscripcionService
 from src.presentation.api.schemas.inscripcion_schema import (
     InscripcionCreateSchema,
+    InscripcionMasivaSchema,
+    InscripcionMasivaResponseSchema,
     InscripcionResponseSchema
 )
 from src.domain.exceptions.domain_exceptions import (
@@ -29,14 +31,13 @@ router = APIRouter(
 
 def get_inscripcion_service() -> InscripcionService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.inscripcion_repository_postgres import InscripcionRepositoryPostgres
-    from src.infrastructure.repositories.postgres.alumno_repository_postgres import AlumnoRepositoryPostgres
-    from src.infrastructure.repositories.postgres.curso_repository_postgres import CursoRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import CursoRepositoryCache, InscripcionRepositoryIndexada, AlumnoRepositoryCache
     
     conexion = get_db_connection()
-    inscripcion_repo = InscripcionRepositoryPostgres(conexion)
-    alumno_repo = AlumnoRepositoryPostgres(conexion)
-    curso_repo = CursoRepositoryPostgres(conexion)
+    inscripcion_repo = InscripcionRepositoryIndexada(crear_repositorio("inscripcion", conexion))
+    alumno_repo = AlumnoRepositoryCache(crear_repositorio("alumno", conexion))
+    curso_repo = CursoRepositoryCache(crear_repositorio("curso", conexion))
     
     return InscripcionService(inscripcion_repo, alumno_repo, curso_repo)
 
@@ -63,6 +64,39 @@ def inscribir_alumno(
         print(f"Error inesperado al inscribir: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
 
+@router.post(
+    "/bulk",
+    response_model=InscripcionMasivaResponseSchema,
+    summary="Inscripción masiva (pares o cohorte)"
+)
+def inscribir_masivo(
+    data: InscripcionMasivaSchema,
+    service: InscripcionService = Depends(get_inscripcion_service)
+):
+    """
+    Inscribe una lista de pares alumno-curso, o a todos los alumnos de una
+    cohorte en varios cursos, con un solo INSERT ... SELECT ... ON CONFLICT
+    DO NOTHING. Las inscripciones que ya existían se informan en 'existentes'.
+    """
+    try:
+        if data.inscripciones is not None:
+            resultado = service.matricular_masivo(
+                pares=[(i.alumno_id, i.curso_id) for i in data.inscripciones]
+            )
+        else:
+            resultado = service.matricular_masivo(
+                cohorte=data.cohorte.cohorte,
+                curso_ids=data.cohorte.curso_ids
+            )
+        return InscripcionMasivaResponseSchema(**resultado)
+    except AlumnoNoEncontradoException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except CursoNoEncontradoException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        print(f"Error inesperado en inscripción masiva: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
+
 @router.get(
     "/alumno/{alumno_id}",
     response_model=List[InscripcionResponseSchema],
@@ -9,6 +9,8 @@ from typing import List
 from src.application.services.participacion_service import ParticipacionService
 from src.presentation.api.schemas.participacion_schema import (
     ParticipacionCreateSchema,
+    ParticipacionMasivaSchema,
+    ParticipacionMasivaResponseSchema,
     ParticipacionUpdateSchema,
     ParticipacionResponseSchema
 )
@@ -28,14 +30,13 @@ router = APIRouter(
 
 def get_participacion_service() -> ParticipacionService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.participacion_repository_postgres import RegistroParticipacionRepositoryPostgres
-    from src.infrastructure.repositories.postgres.clase_repository_postgres import ClaseRepositoryPostgres
-    from src.infrastructure.repositories.postgres.inscripcion_repository_postgres import InscripcionRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import ClaseRepositoryCache, InscripcionRepositoryIndexada
     
     conexion = get_db_connection()
-    participacion_repo = RegistroParticipacionRepositoryPostgres(conexion)
-    clase_repo = ClaseRepositoryPostgres(conexion)
-    inscripcion_repo = InscripcionRepositoryPostgres(conexion)
+    participacion_repo = crear_repositorio("participacion", conexion)
+    clase_repo = ClaseRepositoryCache(crear_repositorio("clase", conexion))
+    inscripcion_repo = InscripcionRepositoryIndexada(crear_repositorio("inscripcion", conexion))
     
     return ParticipacionService(participacion_repo, clase_repo, inscripcion_repo)
 
@@ -67,6 +68,43 @@ def registrar_participacion(
         print(f"Error inesperado al registrar participacion: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
 
+@router.post(
+    "/clase/{clase_id}/bulk",
+    response_model=ParticipacionMasivaResponseSchema,
+    status_code=status.HTTP_201_CREATED,
+    summary="Registrar participación de toda la clase",
+    description="Registra la participación de muchos alumnos en una transacción; con reemplazar=true borra antes lo cargado para la clase"
+)
+def registrar_participaciones_masivo(
+    clase_id: int,
+    data: ParticipacionMasivaSchema,
+    service: ParticipacionService = Depends(get_participacion_service)
+):
+    """
+    Endpoint: POST /api/participaciones/clase/{clase_id}/bulk
+    
+    Responde cuántos registros se insertaron y cuántos se reemplazaron.
+    """
+    try:
+        creados, reemplazados = service.registrar_participaciones_masivo(
+            clase_id=clase_id,
+            items=[{"alumno_id": p.alumno_id, "nivel": p.nivel.value, "comentario": p.comentario} for p in data.participaciones],
+            reemplazar=data.reemplazar
+        )
+        return ParticipacionMasivaResponseSchema(
+            clase_id=clase_id,
+            insertados=len(creados),
+            reemplazados=reemplazados,
+            participaciones=[ParticipacionResponseSchema.from_entity(r) for r in creados]
+        )
+    except ClaseNoEncontradaException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (AlumnoNoInscriptoException, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        print(f"Error inesperado al registrar participaciones masivas: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor")
+
 @router.get(
     "/clase/{clase_id}",
     response_model=List[ParticipacionResponseSchema],
@@ -27,12 +27,12 @@ router = APIRouter(
 
 def get_tp_service() -> TrabajoPracticoService:
     from src.infrastructure.database.connection import get_db_connection
-    from src.infrastructure.repositories.postgres.tp_repository_postgres import TrabajoPracticoRepositoryPostgres
-    from src.infrastructure.repositories.postgres.curso_repository_postgres import CursoRepositoryPostgres
+    from src.infrastructure.repositories.backends import crear_repositorio
+    from src.infrastructure.cache.repositorios_cacheados import CursoRepositoryCache, TrabajoPracticoRepositoryCache
     
     conexion = get_db_connection()
-    tp_repo = TrabajoPracticoRepositoryPostgres(conexion)
-    curso_repo = CursoRepositoryPostgres(conexion)
+    tp_repo = TrabajoPracticoRepositoryCache(crear_repositorio("tp", conexion))
+    curso_repo = CursoRepositoryCache(crear_repositorio("curso", conexion))
     
     return TrabajoPracticoService(tp_repo, curso_repo)
 
@@ -243,3 +243,38 @@ class AlumnoListResponseSchema(BaseModel):
                 ]
             }
         }
+
+
+class AlumnoImportErrorSchema(BaseModel):
+    """Fila del CSV que no se pudo importar."""
+    
+    fila: int = Field(..., description="Número de fila en el archivo (la 1 es el encabezado)")
+    dni: Optional[str] = Field(None, description="DNI de la fila, si se pudo leer")
+    error: str = Field(..., description="Motivo del rechazo")
+
+
+class AlumnoImportResponseSchema(BaseModel):
+    """
+    Schema para el resultado de POST /alumnos/import.
+    
+    filas = creados + actualizados + omitidos + len(errores)
+    """
+    
+    filas: int = Field(..., description="Filas de datos leídas (sin contar vacías)")
+    creados: int = Field(..., description="Alumnos nuevos")
+    actualizados: int = Field(..., description="Alumnos existentes actualizados (política 'actualizar')")
+    omitidos: int = Field(..., description="DNIs existentes que no se modificaron (política 'omitir')")
+    errores: list[AlumnoImportErrorSchema] = Field(..., description="Filas rechazadas")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "filas": 3,
+                "creados": 1,
+                "actualizados": 0,
+                "omitidos": 1,
+                "errores": [
+                    {"fila": 4, "dni": None, "error": "Email inválido: juan@"}
+                ]
+            }
+        }
@@ -0,0 +1,29 @@
+"""
+Schemas de Pydantic para Batch
+Sistema de Seguimiento de Alumnos
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, List, Literal, Optional
+
+class SubRequestSchema(BaseModel):
+    """Una request dentro del batch."""
+    id: Optional[str] = Field(None, description="Identificador opcional para correlacionar la respuesta")
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = Field("GET", description="Método HTTP")
+    path: str = Field(..., pattern=r"^/api/", description="Path absoluto, ej: /api/clases/curso/1?limite=5")
+    body: Optional[Any] = Field(None, description="Cuerpo JSON (para POST/PUT/PATCH)")
+
+class BatchRequestSchema(BaseModel):
+    """Schema para ejecutar varias requests en un solo viaje."""
+    requests: List[SubRequestSchema] = Field(..., min_length=1, max_length=50)
+
+class SubResponseSchema(BaseModel):
+    """Resultado de una sub-request."""
+    id: Optional[str]
+    status: int
+    body: Optional[Any]
+
+class BatchResponseSchema(BaseModel):
+    """Schema de respuesta del batch."""
+    responses: List[SubResponseSchema]
+    confirmado: bool = Field(..., description="False si alguna escritura falló y se revirtió todo el batch")
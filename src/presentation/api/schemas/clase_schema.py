@@ -39,3 +39,27 @@ class ClaseResponseSchema(BaseModel):
     
     class Config:
         from_attributes = True
+
+class ClaseRecienteSchema(ClaseResponseSchema):
+    """Clase con datos del curso y conteos de asistencia (feed del dashboard)."""
+    curso_nombre: str
+    curso_anio: int
+    total_registros: int
+    presentes: int
+    ausentes: int
+    tardanzas: int
+    justificadas: int
+
+    @classmethod
+    def from_reciente(cls, reciente: dict) -> 'ClaseRecienteSchema':
+        base = ClaseResponseSchema.from_entity(reciente["clase"])
+        return cls(
+            **base.model_dump(),
+            curso_nombre=reciente["curso_nombre"],
+            curso_anio=reciente["curso_anio"],
+            total_registros=reciente["total_registros"],
+            presentes=reciente["presentes"],
+            ausentes=reciente["ausentes"],
+            tardanzas=reciente["tardanzas"],
+            justificadas=reciente["justificadas"]
+        )
@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 
 class EntregaCreateSchema(BaseModel):
@@ -16,6 +16,14 @@ class EntregaCreateSchema(BaseModel):
     nota: Optional[float] = Field(None, ge=1, le=10)
     observaciones: Optional[str] = None
 
+class EntregaMasivaItemSchema(BaseModel):
+    """Una fila de la carga masiva (el TP va en la URL)"""
+    alumno_id: int = Field(..., gt=0)
+    estado: str = 'entregado'
+    nota: Optional[float] = Field(None, ge=1, le=10)
+    fecha_entrega_real: Optional[date] = None
+    observaciones: Optional[str] = None
+
 class EntregaResponseSchema(BaseModel):
     id: int
     trabajo_practico_id: int
@@ -45,3 +53,9 @@ class EntregaResponseSchema(BaseModel):
     
     class Config:
         from_attributes = True
+
+class EntregaMasivaResponseSchema(BaseModel):
+    trabajo_practico_id: int
+    total: int
+    tardias: int
+    entregas: List[EntregaResponseSchema]
@@ -3,14 +3,36 @@ Schemas de Pydantic para Inscripcion
 Sistema de Seguimiento de Alumnos
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 
 class InscripcionCreateSchema(BaseModel):
     """Schema para inscribir un alumno a un curso."""
     alumno_id: int = Field(..., gt=0, description="ID del alumno")
     curso_id: int = Field(..., gt=0, description="ID del curso")
 
+class InscripcionCohorteSchema(BaseModel):
+    """Regla: todos los alumnos de una cohorte en los cursos indicados."""
+    cohorte: int = Field(..., ge=2000, le=2100, description="Año de cohorte de los alumnos")
+    curso_ids: List[int] = Field(..., min_length=1, max_length=100, description="Cursos en los que inscribirlos")
+
+class InscripcionMasivaSchema(BaseModel):
+    """Schema para inscripción masiva: pares explícitos o una cohorte."""
+    inscripciones: Optional[List[InscripcionCreateSchema]] = Field(None, min_length=1, max_length=5000)
+    cohorte: Optional[InscripcionCohorteSchema] = None
+
+    @model_validator(mode="after")
+    def validar_una_regla(self) -> 'InscripcionMasivaSchema':
+        if (self.inscripciones is None) == (self.cohorte is None):
+            raise ValueError("Indicar 'inscripciones' o 'cohorte' (solo uno de los dos)")
+        return self
+
+class InscripcionMasivaResponseSchema(BaseModel):
+    """Resultado de una inscripción masiva."""
+    solicitadas: int = Field(..., description="Pares alumno-curso válidos pedidos")
+    creadas: int = Field(..., description="Inscripciones nuevas")
+    existentes: int = Field(..., description="Pares que ya estaban inscriptos")
+
 class InscripcionResponseSchema(BaseModel):
     """Schema para respuesta de inscripción."""
     id: int
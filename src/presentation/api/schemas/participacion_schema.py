@@ -4,7 +4,7 @@ Sistema de Seguimiento de Alumnos
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from src.domain.value_objects.enums import NivelParticipacion
 
 class ParticipacionCreateSchema(BaseModel):
@@ -17,6 +17,16 @@ class ParticipacionUpdateSchema(BaseModel):
     nivel: Optional[NivelParticipacion] = None
     comentario: Optional[str] = None
 
+class ParticipacionMasivaItemSchema(BaseModel):
+    """Una fila de la carga masiva (la clase va en la URL)"""
+    alumno_id: int = Field(..., gt=0)
+    nivel: NivelParticipacion
+    comentario: Optional[str] = None
+
+class ParticipacionMasivaSchema(BaseModel):
+    participaciones: List[ParticipacionMasivaItemSchema] = Field(..., max_length=500)
+    reemplazar: bool = Field(False, description="Borrar antes las participaciones ya cargadas para la clase")
+
 class ParticipacionResponseSchema(BaseModel):
     id: int
     alumno_id: int
@@ -39,3 +49,9 @@ class ParticipacionResponseSchema(BaseModel):
     class Config:
         from_attributes = True
         use_enum_values = True
+
+class ParticipacionMasivaResponseSchema(BaseModel):
+    clase_id: int
+    insertados: int
+    reemplazados: int
+    participaciones: List[ParticipacionResponseSchema]
@@ -8,9 +8,7 @@ import os
 sys.path.append(os.getcwd())
 
 from src.infrastructure.database.connection import get_db_connection, inicializar_base_de_datos
-from src.infrastructure.repositories.postgres.curso_repository_postgres import CursoRepositoryPostgres
-from src.infrastructure.repositories.postgres.alumno_repository_postgres import AlumnoRepositoryPostgres
-from src.infrastructure.repositories.postgres.inscripcion_repository_postgres import InscripcionRepositoryPostgres
+from src.infrastructure.repositories.backends import crear_repositorio
 from src.domain.entities.curso import Curso
 from src.domain.entities.alumno import Alumno
 from src.domain.entities.inscripcion import Inscripcion
@@ -28,9 +26,9 @@ def seed():
     conn = get_db_connection()
     
     # Repos
-    curso_repo = CursoRepositoryPostgres(conn)
-    alumno_repo = AlumnoRepositoryPostgres(conn)
-    inscripcion_repo = InscripcionRepositoryPostgres(conn)
+    curso_repo = crear_repositorio("curso", conn)
+    alumno_repo = crear_repositorio("alumno", conn)
+    inscripcion_repo = crear_repositorio("inscripcion", conn)
     
     # 1. Crear Cursos
     cursos_data = [